@@ -0,0 +1,118 @@
+"""Compares ways of copying a mesh's positions and features into contiguous arrays.
+
+The mesh is synthesised in memory, so no game assets are needed. Positions can
+be fetched with one `ZkMesh_getPosition` call per element, which is what
+`Mesh.positions_array()` does, or with a single `ZkMesh_enumeratePositions`
+call whose callback receives every position by value. Features are compared the
+same way against `ZkMesh_enumerateVertices`, which passes a pointer instead.
+
+Absolute timings depend on the machine and the Python build, so only compare
+numbers measured back to back on the same machine.
+
+Usage: python benchmarks/mesh_arrays.py [--count N] [--runs N]
+"""
+
+import argparse
+import struct
+import sys
+import timeit
+from ctypes import CFUNCTYPE
+from ctypes import c_int
+from ctypes import c_void_p
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from zenkit import Mesh
+from zenkit._core import DLL
+from zenkit._core import Vec3f
+from zenkit.mesh import Feature
+
+_PositionEnumerator = CFUNCTYPE(c_int, c_void_p, Vec3f)
+
+
+def _chunk(kind: int, data: bytes) -> bytes:
+    return struct.pack("<HI", kind, len(data)) + data
+
+
+def _mesh(count: int) -> bytes:
+    header = struct.pack("<H", 265) + struct.pack("<IHHHHHH", 2024, 1, 1, 0, 0, 0, 0) + b"BENCHMARK\n"
+    positions = b"".join(struct.pack("<3f", i, i + 0.5, -i) for i in range(count))
+    features = b"".join(struct.pack("<2fI3f", i * 0.1, i * 0.2, i, 0, 1, 0) for i in range(count))
+    return (
+        _chunk(0xB000, header)
+        + _chunk(0xB030, struct.pack("<I", count) + positions)
+        + _chunk(0xB040, struct.pack("<I", count) + features)
+        + _chunk(0xB060, b"")
+    )
+
+
+def _positions_list(mesh: Mesh) -> Any:
+    return mesh.positions
+
+
+def _positions_getter(mesh: Mesh) -> Any:
+    return mesh.positions_array()
+
+
+def _positions_enumerator(mesh: Mesh) -> Any:
+    count = DLL.ZkMesh_getPositionCount(mesh.handle)
+    items = (Vec3f * count)()
+    indices = iter(range(count))
+
+    def _enumerate(_: Any, position: Vec3f) -> int:
+        items[next(indices)] = position
+        return 0
+
+    DLL.ZkMesh_enumeratePositions(mesh.handle, _PositionEnumerator(_enumerate), None)
+    return items
+
+
+def _features_getter(mesh: Mesh) -> Any:
+    count = DLL.ZkMesh_getVertexCount(mesh.handle)
+    items = (Feature * count)()
+
+    for i in range(count):
+        items[i] = DLL.ZkMesh_getVertex(mesh.handle, i)
+
+    return items
+
+
+def _features_enumerator(mesh: Mesh) -> Any:
+    return mesh.features_array()
+
+
+_CASES = {
+    "positions (list)": _positions_list,
+    "positions (getter loop)": _positions_getter,
+    "positions (enumerator)": _positions_enumerator,
+    "features (getter loop)": _features_getter,
+    "features (enumerator)": _features_enumerator,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    mesh = Mesh.load(_mesh(args.count))
+    expected_positions = bytes(_positions_getter(mesh))
+    expected_features = bytes(_features_enumerator(mesh))
+
+    print(f"{'case':<24} {'best':>10}")
+    for name, case in _CASES.items():
+        if not name.endswith("(list)"):
+            expected = expected_positions if name.startswith("positions") else expected_features
+            if bytes(case(mesh)) != expected:
+                error = f"{name} returned different data"
+                raise AssertionError(error)
+
+        best = min(timeit.repeat(lambda case=case: case(mesh), number=1, repeat=args.runs))
+        print(f"{name:<24} {best * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measures how long a fresh interpreter takes to make parts of zenkit usable.
+
+`import zenkit` only sets up the lazy package. Wrapper modules are imported on
+first attribute access, and native signatures are bound on first call. The
+`everything` scenario forces all wrapper modules in, which is what every
+`import zenkit` cost before lazy loading.
+
+Absolute timings depend heavily on the machine, the Python build and how warm
+the file system cache is, so only compare numbers measured back to back on the
+same machine. Point `--src` at another checkout to measure it the same way.
+
+Usage: python benchmarks/startup.py [--runs N] [--src PATH]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+
+_SCENARIOS = {
+    "import zenkit": "import zenkit",
+    "vfs + texture": "import zenkit; zenkit.Vfs(); zenkit.Texture",
+    "everything": "from zenkit import *; Vfs()",
+}
+
+_TEMPLATE = """
+import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def _measure(code: str, runs: int, src: Path) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _TEMPLATE.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=src,
+        )
+        samples.append(float(out.stdout.strip()) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--src", type=Path, default=_SRC, help="the source directory of the checkout to measure")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<16} {'median':>10} {'min':>10}")
+    for name, code in _SCENARIOS.items():
+        samples = _measure(code, args.runs, args.src)
+        print(f"{name:<16} {statistics.median(samples):>8.1f}ms {min(samples):>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
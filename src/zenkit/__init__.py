@@ -1,13 +1,25 @@
 __all__ = [
+    "AssetCache",
+    "AssetCacheInfo",
+    "DecodedAsset",
+    "DecodedAssetCache",
+    "VdfWriter",
     "Vfs",
+    "VfsConflict",
+    "VfsEntry",
+    "VfsFileHash",
+    "VfsIndexCache",
+    "VfsManifest",
     "VfsNode",
     "VfsOverwriteBehavior",
     "LogLevel",
     "set_logger",
     "set_logger_default",
+    "set_load_executor",
     "TextureBuilder",
     "TextureFormat",
     "Texture",
+    "TextureInfo",
     "Read",
     "Write",
     "Font",
@@ -16,6 +28,7 @@ __all__ = [
     "CutsceneLibrary",
     "CutsceneBlock",
     "ModelAnimation",
+    "ModelAnimationInfo",
     "AnimationSample",
     "Color",
     "Quat",
@@ -28,6 +41,7 @@ __all__ = [
     "ModelHierarchy",
     "ModelHierarchyNode",
     "MultiResolutionMesh",
+    "MultiResolutionMeshInfo",
     "SubMesh",
     "MeshEdge",
     "MeshPlane",
@@ -49,6 +63,9 @@ __all__ = [
     "SoftSkinWedgeNormal",
     "Model",
     "Mesh",
+    "PolygonFlag",
+    "PolygonTable",
+    "RenderBatch",
     "World",
     "WayNet",
     "WayEdge",
@@ -163,164 +180,389 @@ __all__ = [
     "ModelScript",
 ]
 
-from zenkit._core import AxisAlignedBoundingBox
-from zenkit._core import Color
-from zenkit._core import GameVersion
-from zenkit._core import Mat3x3
-from zenkit._core import Mat4x4
-from zenkit._core import Quat
-from zenkit._core import Vec2f
-from zenkit._core import Vec3f
-from zenkit._core import Vec4f
-from zenkit.cutscene_library import CutsceneBlock
-from zenkit.cutscene_library import CutsceneLibrary
-from zenkit.cutscene_library import CutsceneMessage
-from zenkit.daedalus.base import DaedalusInstance
-from zenkit.daedalus.base import DaedalusInstanceType
-from zenkit.daedalus.camera import CameraInstance
-from zenkit.daedalus.effect_base import EffectBaseInstance
-from zenkit.daedalus.fightai import FightAiInstance
-from zenkit.daedalus.focus import FocusInstance
-from zenkit.daedalus.guildvalues import GuildValuesInstance
-from zenkit.daedalus.info import InfoInstance
-from zenkit.daedalus.item import ItemInstance
-from zenkit.daedalus.item_react import ItemReactInstance
-from zenkit.daedalus.menu import MenuInstance
-from zenkit.daedalus.menu_item import MenuItemInstance
-from zenkit.daedalus.mission import MissionInstance
-from zenkit.daedalus.music_jingle import MusicJingleInstance
-from zenkit.daedalus.music_system import MusicSystemInstance
-from zenkit.daedalus.music_theme import MusicThemeInstance
-from zenkit.daedalus.npc import NpcInstance
-from zenkit.daedalus.particle_effect import ParticleEffectInstance
-from zenkit.daedalus.particle_effect_emit_key import ParticleEffectEmitKeyInstance
-from zenkit.daedalus.sound_effect import SoundEffectInstance
-from zenkit.daedalus.sound_system import SoundSystemInstance
-from zenkit.daedalus.spell_instance import SpellInstance
-from zenkit.daedalus.svm import SvmInstance
-from zenkit.daedalus_script import DaedalusDataType
-from zenkit.daedalus_script import DaedalusInstruction
-from zenkit.daedalus_script import DaedalusOpcode
-from zenkit.daedalus_script import DaedalusScript
-from zenkit.daedalus_script import DaedalusSymbol
-from zenkit.daedalus_vm import DaedalusType
-from zenkit.daedalus_vm import DaedalusVm
-from zenkit.font import Font
-from zenkit.font import FontGlyph
-from zenkit.logger import LogLevel
-from zenkit.logger import set_logger
-from zenkit.logger import set_logger_default
-from zenkit.material import AlphaFunction
-from zenkit.material import AnimationMapping
-from zenkit.material import Material
-from zenkit.material import MaterialGroup
-from zenkit.material import WaveMode
-from zenkit.material import WaveSpeed
-from zenkit.mesh import Mesh
-from zenkit.model import Model
-from zenkit.model_animation import AnimationSample
-from zenkit.model_animation import ModelAnimation
-from zenkit.model_hierarchy import ModelHierarchy
-from zenkit.model_hierarchy import ModelHierarchyNode
-from zenkit.model_mesh import ModelMesh
-from zenkit.model_script import Animation
-from zenkit.model_script import AnimationAlias
-from zenkit.model_script import AnimationBlend
-from zenkit.model_script import AnimationCombine
-from zenkit.model_script import AnimationDirection
-from zenkit.model_script import AnimationFlags
-from zenkit.model_script import EventCameraTremor
-from zenkit.model_script import EventMorphAnimation
-from zenkit.model_script import EventParticleEffect
-from zenkit.model_script import EventParticleEffectStop
-from zenkit.model_script import EventSoundEffect
-from zenkit.model_script import EventSoundEffectGround
-from zenkit.model_script import EventTag
-from zenkit.model_script import EventType
-from zenkit.model_script import FightMode
-from zenkit.model_script import ModelScript
-from zenkit.morph_mesh import MorphAnimation
-from zenkit.morph_mesh import MorphMesh
-from zenkit.morph_mesh import MorphSource
-from zenkit.multi_resolution_mesh import MeshEdge
-from zenkit.multi_resolution_mesh import MeshPlane
-from zenkit.multi_resolution_mesh import MeshTriangle
-from zenkit.multi_resolution_mesh import MeshTriangleEdge
-from zenkit.multi_resolution_mesh import MeshWedge
-from zenkit.multi_resolution_mesh import MultiResolutionMesh
-from zenkit.multi_resolution_mesh import SubMesh
-from zenkit.soft_skin_mesh import SoftSkinMesh
-from zenkit.soft_skin_mesh import SoftSkinWedgeNormal
-from zenkit.soft_skin_mesh import SoftSkinWeight
-from zenkit.stream import Read
-from zenkit.stream import Write
-from zenkit.texture import Texture
-from zenkit.texture import TextureBuilder
-from zenkit.texture import TextureFormat
-from zenkit.vfs import Vfs
-from zenkit.vfs import VfsNode
-from zenkit.vfs import VfsOverwriteBehavior
-from zenkit.vob.cutscene_camera import CameraLerpType
-from zenkit.vob.cutscene_camera import CameraLoopType
-from zenkit.vob.cutscene_camera import CameraMotion
-from zenkit.vob.cutscene_camera import CameraTrajectory
-from zenkit.vob.cutscene_camera import CameraTrajectoryFrame
-from zenkit.vob.cutscene_camera import CutsceneCamera
-from zenkit.vob.light import Light
-from zenkit.vob.light import LightQuality
-from zenkit.vob.light import LightType
-from zenkit.vob.misc import Animate
-from zenkit.vob.misc import CodeMaster
-from zenkit.vob.misc import Earthquake
-from zenkit.vob.misc import Item
-from zenkit.vob.misc import LensFlare
-from zenkit.vob.misc import MessageFilter
-from zenkit.vob.misc import MessageFilterAction
-from zenkit.vob.misc import MoverController
-from zenkit.vob.misc import MoverMessageType
-from zenkit.vob.misc import ParticleEffectController
-from zenkit.vob.misc import TouchCollisionType
-from zenkit.vob.misc import TouchDamage
-from zenkit.vob.movable_object import Container
-from zenkit.vob.movable_object import Door
-from zenkit.vob.movable_object import Fire
-from zenkit.vob.movable_object import InteractiveObject
-from zenkit.vob.movable_object import MovableObject
-from zenkit.vob.movable_object import SoundMaterialType
-from zenkit.vob.sound import Sound
-from zenkit.vob.sound import SoundDaytime
-from zenkit.vob.trigger import Mover
-from zenkit.vob.trigger import MoverBehavior
-from zenkit.vob.trigger import MoverLerpType
-from zenkit.vob.trigger import MoverSpeedType
-from zenkit.vob.trigger import Trigger
-from zenkit.vob.trigger import TriggerBatchMode
-from zenkit.vob.trigger import TriggerChangeLevel
-from zenkit.vob.trigger import TriggerList
-from zenkit.vob.trigger import TriggerListTarget
-from zenkit.vob.trigger import TriggerScript
-from zenkit.vob.trigger import TriggerUntouch
-from zenkit.vob.trigger import TriggerWorldStart
-from zenkit.vob.virtual_object import AiHuman
-from zenkit.vob.virtual_object import AiMove
-from zenkit.vob.virtual_object import AiType
-from zenkit.vob.virtual_object import AnimationType
-from zenkit.vob.virtual_object import EventManager
-from zenkit.vob.virtual_object import ShadowType
-from zenkit.vob.virtual_object import SpriteAlignment
-from zenkit.vob.virtual_object import VirtualObject
-from zenkit.vob.virtual_object import Visual
-from zenkit.vob.virtual_object import VisualDecal
-from zenkit.vob.virtual_object import VisualType
-from zenkit.vob.virtual_object import VobType
-from zenkit.vob.zone import ZoneFarPlane
-from zenkit.vob.zone import ZoneFog
-from zenkit.vob.zone import ZoneMusic
-from zenkit.world.bsp_tree import BspNode
-from zenkit.world.bsp_tree import BspSector
-from zenkit.world.bsp_tree import BspTree
-from zenkit.world.bsp_tree import BspTreeType
-from zenkit.world.way_net import WayEdge
-from zenkit.world.way_net import WayNet
-from zenkit.world.way_net import WayPoint
-from zenkit.world.world import World
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from zenkit._core import AxisAlignedBoundingBox
+    from zenkit._core import Color
+    from zenkit._core import GameVersion
+    from zenkit._core import Mat3x3
+    from zenkit._core import Mat4x4
+    from zenkit._core import Quat
+    from zenkit._core import Vec2f
+    from zenkit._core import Vec3f
+    from zenkit._core import Vec4f
+    from zenkit._native import set_load_executor
+    from zenkit.asset_cache import AssetCache
+    from zenkit.asset_cache import AssetCacheInfo
+    from zenkit.asset_cache import DecodedAsset
+    from zenkit.asset_cache import DecodedAssetCache
+    from zenkit.cutscene_library import CutsceneBlock
+    from zenkit.cutscene_library import CutsceneLibrary
+    from zenkit.cutscene_library import CutsceneMessage
+    from zenkit.daedalus.base import DaedalusInstance
+    from zenkit.daedalus.base import DaedalusInstanceType
+    from zenkit.daedalus.camera import CameraInstance
+    from zenkit.daedalus.effect_base import EffectBaseInstance
+    from zenkit.daedalus.fightai import FightAiInstance
+    from zenkit.daedalus.focus import FocusInstance
+    from zenkit.daedalus.guildvalues import GuildValuesInstance
+    from zenkit.daedalus.info import InfoInstance
+    from zenkit.daedalus.item import ItemInstance
+    from zenkit.daedalus.item_react import ItemReactInstance
+    from zenkit.daedalus.menu import MenuInstance
+    from zenkit.daedalus.menu_item import MenuItemInstance
+    from zenkit.daedalus.mission import MissionInstance
+    from zenkit.daedalus.music_jingle import MusicJingleInstance
+    from zenkit.daedalus.music_system import MusicSystemInstance
+    from zenkit.daedalus.music_theme import MusicThemeInstance
+    from zenkit.daedalus.npc import NpcInstance
+    from zenkit.daedalus.particle_effect import ParticleEffectInstance
+    from zenkit.daedalus.particle_effect_emit_key import ParticleEffectEmitKeyInstance
+    from zenkit.daedalus.sound_effect import SoundEffectInstance
+    from zenkit.daedalus.sound_system import SoundSystemInstance
+    from zenkit.daedalus.spell_instance import SpellInstance
+    from zenkit.daedalus.svm import SvmInstance
+    from zenkit.daedalus_script import DaedalusDataType
+    from zenkit.daedalus_script import DaedalusInstruction
+    from zenkit.daedalus_script import DaedalusOpcode
+    from zenkit.daedalus_script import DaedalusScript
+    from zenkit.daedalus_script import DaedalusSymbol
+    from zenkit.daedalus_vm import DaedalusType
+    from zenkit.daedalus_vm import DaedalusVm
+    from zenkit.font import Font
+    from zenkit.font import FontGlyph
+    from zenkit.logger import LogLevel
+    from zenkit.logger import set_logger
+    from zenkit.logger import set_logger_default
+    from zenkit.material import AlphaFunction
+    from zenkit.material import AnimationMapping
+    from zenkit.material import Material
+    from zenkit.material import MaterialGroup
+    from zenkit.material import WaveMode
+    from zenkit.material import WaveSpeed
+    from zenkit.mesh import Mesh
+    from zenkit.mesh import PolygonFlag
+    from zenkit.mesh import PolygonTable
+    from zenkit.mesh import RenderBatch
+    from zenkit.model import Model
+    from zenkit.model_animation import AnimationSample
+    from zenkit.model_animation import ModelAnimation
+    from zenkit.model_animation import ModelAnimationInfo
+    from zenkit.model_hierarchy import ModelHierarchy
+    from zenkit.model_hierarchy import ModelHierarchyNode
+    from zenkit.model_mesh import ModelMesh
+    from zenkit.model_script import Animation
+    from zenkit.model_script import AnimationAlias
+    from zenkit.model_script import AnimationBlend
+    from zenkit.model_script import AnimationCombine
+    from zenkit.model_script import AnimationDirection
+    from zenkit.model_script import AnimationFlags
+    from zenkit.model_script import EventCameraTremor
+    from zenkit.model_script import EventMorphAnimation
+    from zenkit.model_script import EventParticleEffect
+    from zenkit.model_script import EventParticleEffectStop
+    from zenkit.model_script import EventSoundEffect
+    from zenkit.model_script import EventSoundEffectGround
+    from zenkit.model_script import EventTag
+    from zenkit.model_script import EventType
+    from zenkit.model_script import FightMode
+    from zenkit.model_script import ModelScript
+    from zenkit.morph_mesh import MorphAnimation
+    from zenkit.morph_mesh import MorphMesh
+    from zenkit.morph_mesh import MorphSource
+    from zenkit.multi_resolution_mesh import MeshEdge
+    from zenkit.multi_resolution_mesh import MeshPlane
+    from zenkit.multi_resolution_mesh import MeshTriangle
+    from zenkit.multi_resolution_mesh import MeshTriangleEdge
+    from zenkit.multi_resolution_mesh import MeshWedge
+    from zenkit.multi_resolution_mesh import MultiResolutionMesh
+    from zenkit.multi_resolution_mesh import MultiResolutionMeshInfo
+    from zenkit.multi_resolution_mesh import SubMesh
+    from zenkit.soft_skin_mesh import SoftSkinMesh
+    from zenkit.soft_skin_mesh import SoftSkinWedgeNormal
+    from zenkit.soft_skin_mesh import SoftSkinWeight
+    from zenkit.stream import Read
+    from zenkit.stream import Write
+    from zenkit.texture import Texture
+    from zenkit.texture import TextureBuilder
+    from zenkit.texture import TextureFormat
+    from zenkit.texture import TextureInfo
+    from zenkit.vfs import VdfWriter
+    from zenkit.vfs import Vfs
+    from zenkit.vfs import VfsConflict
+    from zenkit.vfs import VfsEntry
+    from zenkit.vfs import VfsFileHash
+    from zenkit.vfs import VfsIndexCache
+    from zenkit.vfs import VfsManifest
+    from zenkit.vfs import VfsNode
+    from zenkit.vfs import VfsOverwriteBehavior
+    from zenkit.vob.cutscene_camera import CameraLerpType
+    from zenkit.vob.cutscene_camera import CameraLoopType
+    from zenkit.vob.cutscene_camera import CameraMotion
+    from zenkit.vob.cutscene_camera import CameraTrajectory
+    from zenkit.vob.cutscene_camera import CameraTrajectoryFrame
+    from zenkit.vob.cutscene_camera import CutsceneCamera
+    from zenkit.vob.light import Light
+    from zenkit.vob.light import LightQuality
+    from zenkit.vob.light import LightType
+    from zenkit.vob.misc import Animate
+    from zenkit.vob.misc import CodeMaster
+    from zenkit.vob.misc import Earthquake
+    from zenkit.vob.misc import Item
+    from zenkit.vob.misc import LensFlare
+    from zenkit.vob.misc import MessageFilter
+    from zenkit.vob.misc import MessageFilterAction
+    from zenkit.vob.misc import MoverController
+    from zenkit.vob.misc import MoverMessageType
+    from zenkit.vob.misc import ParticleEffectController
+    from zenkit.vob.misc import TouchCollisionType
+    from zenkit.vob.misc import TouchDamage
+    from zenkit.vob.movable_object import Container
+    from zenkit.vob.movable_object import Door
+    from zenkit.vob.movable_object import Fire
+    from zenkit.vob.movable_object import InteractiveObject
+    from zenkit.vob.movable_object import MovableObject
+    from zenkit.vob.movable_object import SoundMaterialType
+    from zenkit.vob.sound import Sound
+    from zenkit.vob.sound import SoundDaytime
+    from zenkit.vob.trigger import Mover
+    from zenkit.vob.trigger import MoverBehavior
+    from zenkit.vob.trigger import MoverLerpType
+    from zenkit.vob.trigger import MoverSpeedType
+    from zenkit.vob.trigger import Trigger
+    from zenkit.vob.trigger import TriggerBatchMode
+    from zenkit.vob.trigger import TriggerChangeLevel
+    from zenkit.vob.trigger import TriggerList
+    from zenkit.vob.trigger import TriggerListTarget
+    from zenkit.vob.trigger import TriggerScript
+    from zenkit.vob.trigger import TriggerUntouch
+    from zenkit.vob.trigger import TriggerWorldStart
+    from zenkit.vob.virtual_object import AiHuman
+    from zenkit.vob.virtual_object import AiMove
+    from zenkit.vob.virtual_object import AiType
+    from zenkit.vob.virtual_object import AnimationType
+    from zenkit.vob.virtual_object import EventManager
+    from zenkit.vob.virtual_object import ShadowType
+    from zenkit.vob.virtual_object import SpriteAlignment
+    from zenkit.vob.virtual_object import VirtualObject
+    from zenkit.vob.virtual_object import Visual
+    from zenkit.vob.virtual_object import VisualDecal
+    from zenkit.vob.virtual_object import VisualType
+    from zenkit.vob.virtual_object import VobType
+    from zenkit.vob.zone import ZoneFarPlane
+    from zenkit.vob.zone import ZoneFog
+    from zenkit.vob.zone import ZoneMusic
+    from zenkit.world.bsp_tree import BspNode
+    from zenkit.world.bsp_tree import BspSector
+    from zenkit.world.bsp_tree import BspTree
+    from zenkit.world.bsp_tree import BspTreeType
+    from zenkit.world.way_net import WayEdge
+    from zenkit.world.way_net import WayNet
+    from zenkit.world.way_net import WayPoint
+    from zenkit.world.world import World
+
+_MODULES: dict[str, str] = {
+    "AssetCache": "zenkit.asset_cache",
+    "AssetCacheInfo": "zenkit.asset_cache",
+    "DecodedAsset": "zenkit.asset_cache",
+    "DecodedAssetCache": "zenkit.asset_cache",
+    "AxisAlignedBoundingBox": "zenkit._core",
+    "Color": "zenkit._core",
+    "GameVersion": "zenkit._core",
+    "Mat3x3": "zenkit._core",
+    "Mat4x4": "zenkit._core",
+    "Quat": "zenkit._core",
+    "Vec2f": "zenkit._core",
+    "Vec3f": "zenkit._core",
+    "Vec4f": "zenkit._core",
+    "CutsceneBlock": "zenkit.cutscene_library",
+    "CutsceneLibrary": "zenkit.cutscene_library",
+    "CutsceneMessage": "zenkit.cutscene_library",
+    "DaedalusInstance": "zenkit.daedalus.base",
+    "DaedalusInstanceType": "zenkit.daedalus.base",
+    "CameraInstance": "zenkit.daedalus.camera",
+    "EffectBaseInstance": "zenkit.daedalus.effect_base",
+    "FightAiInstance": "zenkit.daedalus.fightai",
+    "FocusInstance": "zenkit.daedalus.focus",
+    "GuildValuesInstance": "zenkit.daedalus.guildvalues",
+    "InfoInstance": "zenkit.daedalus.info",
+    "ItemInstance": "zenkit.daedalus.item",
+    "ItemReactInstance": "zenkit.daedalus.item_react",
+    "MenuInstance": "zenkit.daedalus.menu",
+    "MenuItemInstance": "zenkit.daedalus.menu_item",
+    "MissionInstance": "zenkit.daedalus.mission",
+    "MusicJingleInstance": "zenkit.daedalus.music_jingle",
+    "MusicSystemInstance": "zenkit.daedalus.music_system",
+    "MusicThemeInstance": "zenkit.daedalus.music_theme",
+    "NpcInstance": "zenkit.daedalus.npc",
+    "ParticleEffectInstance": "zenkit.daedalus.particle_effect",
+    "ParticleEffectEmitKeyInstance": "zenkit.daedalus.particle_effect_emit_key",
+    "SoundEffectInstance": "zenkit.daedalus.sound_effect",
+    "SoundSystemInstance": "zenkit.daedalus.sound_system",
+    "SpellInstance": "zenkit.daedalus.spell_instance",
+    "SvmInstance": "zenkit.daedalus.svm",
+    "DaedalusDataType": "zenkit.daedalus_script",
+    "DaedalusInstruction": "zenkit.daedalus_script",
+    "DaedalusOpcode": "zenkit.daedalus_script",
+    "DaedalusScript": "zenkit.daedalus_script",
+    "DaedalusSymbol": "zenkit.daedalus_script",
+    "DaedalusType": "zenkit.daedalus_vm",
+    "DaedalusVm": "zenkit.daedalus_vm",
+    "Font": "zenkit.font",
+    "FontGlyph": "zenkit.font",
+    "LogLevel": "zenkit.logger",
+    "set_logger": "zenkit.logger",
+    "set_logger_default": "zenkit.logger",
+    "set_load_executor": "zenkit._native",
+    "AlphaFunction": "zenkit.material",
+    "AnimationMapping": "zenkit.material",
+    "Material": "zenkit.material",
+    "MaterialGroup": "zenkit.material",
+    "WaveMode": "zenkit.material",
+    "WaveSpeed": "zenkit.material",
+    "Mesh": "zenkit.mesh",
+    "PolygonFlag": "zenkit.mesh",
+    "PolygonTable": "zenkit.mesh",
+    "RenderBatch": "zenkit.mesh",
+    "Model": "zenkit.model",
+    "AnimationSample": "zenkit.model_animation",
+    "ModelAnimation": "zenkit.model_animation",
+    "ModelAnimationInfo": "zenkit.model_animation",
+    "ModelHierarchy": "zenkit.model_hierarchy",
+    "ModelHierarchyNode": "zenkit.model_hierarchy",
+    "ModelMesh": "zenkit.model_mesh",
+    "Animation": "zenkit.model_script",
+    "AnimationAlias": "zenkit.model_script",
+    "AnimationBlend": "zenkit.model_script",
+    "AnimationCombine": "zenkit.model_script",
+    "AnimationDirection": "zenkit.model_script",
+    "AnimationFlags": "zenkit.model_script",
+    "EventCameraTremor": "zenkit.model_script",
+    "EventMorphAnimation": "zenkit.model_script",
+    "EventParticleEffect": "zenkit.model_script",
+    "EventParticleEffectStop": "zenkit.model_script",
+    "EventSoundEffect": "zenkit.model_script",
+    "EventSoundEffectGround": "zenkit.model_script",
+    "EventTag": "zenkit.model_script",
+    "EventType": "zenkit.model_script",
+    "FightMode": "zenkit.model_script",
+    "ModelScript": "zenkit.model_script",
+    "MorphAnimation": "zenkit.morph_mesh",
+    "MorphMesh": "zenkit.morph_mesh",
+    "MorphSource": "zenkit.morph_mesh",
+    "MeshEdge": "zenkit.multi_resolution_mesh",
+    "MeshPlane": "zenkit.multi_resolution_mesh",
+    "MeshTriangle": "zenkit.multi_resolution_mesh",
+    "MeshTriangleEdge": "zenkit.multi_resolution_mesh",
+    "MeshWedge": "zenkit.multi_resolution_mesh",
+    "MultiResolutionMesh": "zenkit.multi_resolution_mesh",
+    "MultiResolutionMeshInfo": "zenkit.multi_resolution_mesh",
+    "SubMesh": "zenkit.multi_resolution_mesh",
+    "SoftSkinMesh": "zenkit.soft_skin_mesh",
+    "SoftSkinWedgeNormal": "zenkit.soft_skin_mesh",
+    "SoftSkinWeight": "zenkit.soft_skin_mesh",
+    "Read": "zenkit.stream",
+    "Write": "zenkit.stream",
+    "Texture": "zenkit.texture",
+    "TextureBuilder": "zenkit.texture",
+    "TextureFormat": "zenkit.texture",
+    "TextureInfo": "zenkit.texture",
+    "VdfWriter": "zenkit.vfs",
+    "Vfs": "zenkit.vfs",
+    "VfsConflict": "zenkit.vfs",
+    "VfsEntry": "zenkit.vfs",
+    "VfsFileHash": "zenkit.vfs",
+    "VfsIndexCache": "zenkit.vfs",
+    "VfsManifest": "zenkit.vfs",
+    "VfsNode": "zenkit.vfs",
+    "VfsOverwriteBehavior": "zenkit.vfs",
+    "CameraLerpType": "zenkit.vob.cutscene_camera",
+    "CameraLoopType": "zenkit.vob.cutscene_camera",
+    "CameraMotion": "zenkit.vob.cutscene_camera",
+    "CameraTrajectory": "zenkit.vob.cutscene_camera",
+    "CameraTrajectoryFrame": "zenkit.vob.cutscene_camera",
+    "CutsceneCamera": "zenkit.vob.cutscene_camera",
+    "Light": "zenkit.vob.light",
+    "LightQuality": "zenkit.vob.light",
+    "LightType": "zenkit.vob.light",
+    "Animate": "zenkit.vob.misc",
+    "CodeMaster": "zenkit.vob.misc",
+    "Earthquake": "zenkit.vob.misc",
+    "Item": "zenkit.vob.misc",
+    "LensFlare": "zenkit.vob.misc",
+    "MessageFilter": "zenkit.vob.misc",
+    "MessageFilterAction": "zenkit.vob.misc",
+    "MoverController": "zenkit.vob.misc",
+    "MoverMessageType": "zenkit.vob.misc",
+    "ParticleEffectController": "zenkit.vob.misc",
+    "TouchCollisionType": "zenkit.vob.misc",
+    "TouchDamage": "zenkit.vob.misc",
+    "Container": "zenkit.vob.movable_object",
+    "Door": "zenkit.vob.movable_object",
+    "Fire": "zenkit.vob.movable_object",
+    "InteractiveObject": "zenkit.vob.movable_object",
+    "MovableObject": "zenkit.vob.movable_object",
+    "SoundMaterialType": "zenkit.vob.movable_object",
+    "Sound": "zenkit.vob.sound",
+    "SoundDaytime": "zenkit.vob.sound",
+    "Mover": "zenkit.vob.trigger",
+    "MoverBehavior": "zenkit.vob.trigger",
+    "MoverLerpType": "zenkit.vob.trigger",
+    "MoverSpeedType": "zenkit.vob.trigger",
+    "Trigger": "zenkit.vob.trigger",
+    "TriggerBatchMode": "zenkit.vob.trigger",
+    "TriggerChangeLevel": "zenkit.vob.trigger",
+    "TriggerList": "zenkit.vob.trigger",
+    "TriggerListTarget": "zenkit.vob.trigger",
+    "TriggerScript": "zenkit.vob.trigger",
+    "TriggerUntouch": "zenkit.vob.trigger",
+    "TriggerWorldStart": "zenkit.vob.trigger",
+    "AiHuman": "zenkit.vob.virtual_object",
+    "AiMove": "zenkit.vob.virtual_object",
+    "AiType": "zenkit.vob.virtual_object",
+    "AnimationType": "zenkit.vob.virtual_object",
+    "EventManager": "zenkit.vob.virtual_object",
+    "ShadowType": "zenkit.vob.virtual_object",
+    "SpriteAlignment": "zenkit.vob.virtual_object",
+    "VirtualObject": "zenkit.vob.virtual_object",
+    "Visual": "zenkit.vob.virtual_object",
+    "VisualDecal": "zenkit.vob.virtual_object",
+    "VisualType": "zenkit.vob.virtual_object",
+    "VobType": "zenkit.vob.virtual_object",
+    "ZoneFarPlane": "zenkit.vob.zone",
+    "ZoneFog": "zenkit.vob.zone",
+    "ZoneMusic": "zenkit.vob.zone",
+    "BspNode": "zenkit.world.bsp_tree",
+    "BspSector": "zenkit.world.bsp_tree",
+    "BspTree": "zenkit.world.bsp_tree",
+    "BspTreeType": "zenkit.world.bsp_tree",
+    "WayEdge": "zenkit.world.way_net",
+    "WayNet": "zenkit.world.way_net",
+    "WayPoint": "zenkit.world.way_net",
+    "World": "zenkit.world.world",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is not None:
+        value = getattr(import_module(module), name)
+    else:
+        try:
+            value = import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+
+            error = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(error) from None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -15,22 +15,29 @@ __all__ = [
 ]
 
 import platform
+from collections.abc import Callable
 from ctypes import CDLL
 from ctypes import Structure
-from ctypes import c_size_t
 from ctypes import c_uint16
 from ctypes import c_uint32
 from ctypes import c_void_p
 from datetime import datetime
 from datetime import timezone
 from enum import IntEnum
+from importlib import import_module
 from os import PathLike
 from pathlib import Path
+from threading import Lock
+from types import TracebackType
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import BinaryIO
 from typing import ClassVar
 from typing import Final
+from typing import TypeVar
 from typing import Union
+from weakref import WeakSet
+from weakref import finalize
 
 from .core.color import Color
 from .core.matrix import Mat3x3
@@ -51,9 +58,111 @@ _NAME = {
 }[platform.system()]
 
 _PATH = Path(__file__).parent / "native" / _NAME
-DLL: Final[CDLL] = CDLL(str(_PATH))
 
-PathOrFileLike = Union[str, PathLike, "Read", bytes, bytearray, "VfsNode"]
+
+class _NativeLibrary(CDLL):
+    _signatures: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+
+        # The signature table is only loaded once the first native function is used. The module is kept
+        # around so that finalizers running during interpreter shutdown can still bind their functions.
+        if _NativeLibrary._signatures is None:
+            _NativeLibrary._signatures = import_module("zenkit._signatures")
+
+        fn = self[name]
+        self._signatures.bind(fn)
+        setattr(self, name, fn)
+        return fn
+
+
+DLL: Final[CDLL] = _NativeLibrary(str(_PATH))
+
+
+class _ClosedHandle:
+    # Replaces the native handle of closed objects. Passing it to a native function or reading its address raises,
+    # instead of handing freed memory to the native library.
+    __slots__ = ()
+
+    @property
+    def value(self) -> int:
+        error = "Operation on a closed object"
+        raise ValueError(error)
+
+    @property
+    def _as_parameter_(self) -> int:
+        return self.value
+
+    def __repr__(self) -> str:
+        return "<closed>"
+
+
+CLOSED: Final = _ClosedHandle()
+
+# Objects pointing into native memory owned by another object, by the owner's `id`. Only weak references to the
+# dependents are held, and an owner's entry is dropped once it is freed.
+_DEPENDENTS: dict[int, WeakSet[Any]] = {}
+_DEPENDENTS_LOCK = Lock()
+
+
+def depend(dependent: Any, owner: Any) -> Any:
+    if owner is not DLL and owner is not None:
+        dependents = _DEPENDENTS.get(id(owner))
+        if dependents is None:
+            with _DEPENDENTS_LOCK:
+                dependents = _DEPENDENTS.get(id(owner))
+                if dependents is None:
+                    dependents = _DEPENDENTS[id(owner)] = WeakSet()
+                    finalize(owner, _DEPENDENTS.pop, id(owner), None)
+        dependents.add(dependent)
+    return owner
+
+
+def release(obj: Any, delete: Callable[[Any], Any] | None = None) -> None:
+    handle = getattr(obj, "_handle", CLOSED)
+    if handle is CLOSED:
+        return
+
+    # Everything pointing into the object's memory is closed first, so none of it outlives the memory it points to.
+    for dependent in list(_DEPENDENTS.pop(id(obj), ())):
+        close = getattr(dependent, "close", None)
+        if close is not None:
+            close()
+        else:
+            release(dependent)
+
+    if delete is not None and getattr(obj, "_delete", True):
+        delete(handle)
+
+    obj._handle = CLOSED  # noqa: SLF001 / same package
+    if getattr(obj, "_delete", False):
+        obj._delete = False  # noqa: SLF001 / same package
+
+
+_CloseableT = TypeVar("_CloseableT", bound="Closeable")
+
+
+class Closeable:
+    __slots__ = ()
+
+    def close(self) -> None:
+        release(self)
+
+    def __enter__(self: _CloseableT) -> _CloseableT:  # noqa: PYI019 / `typing.Self` requires Python 3.11
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+PathOrFileLike = Union[str, PathLike, "Read", bytes, bytearray, memoryview, BinaryIO, "VfsNode"]
 
 
 class GameVersion(IntEnum):
@@ -109,38 +218,35 @@ class AxisAlignedBoundingBox(Structure):
 
 
 class OrientedBoundingBox:
-    __slots__ = ("_handle",)
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def center(self) -> Vec3f:
-        DLL.ZkOrientedBoundingBox_getCenter.restype = Vec3f
         return DLL.ZkOrientedBoundingBox_getCenter(self._handle)
 
     @property
     def axis(self) -> Vec3f:
-        DLL.ZkOrientedBoundingBox_getAxis.restype = Vec3f
         return DLL.ZkOrientedBoundingBox_getAxis(self._handle)
 
     @property
     def half_width(self) -> Vec3f:
-        DLL.ZkOrientedBoundingBox_getHalfWidth.restype = Vec3f
         return DLL.ZkOrientedBoundingBox_getHalfWidth(self._handle)
 
     @property
     def children(self) -> list["OrientedBoundingBox"]:
-        DLL.ZkOrientedBoundingBox_getChildCount.restype = c_size_t
         count = DLL.ZkOrientedBoundingBox_getChildCount(self._handle)
 
-        DLL.ZkOrientedBoundingBox_getChild.restype = c_void_p
         return [
-            OrientedBoundingBox(_handle=c_void_p(DLL.ZkOrientedBoundingBox_getChild(self._handle, i)))
+            OrientedBoundingBox(
+                _handle=c_void_p(DLL.ZkOrientedBoundingBox_getChild(self._handle, i)), _keepalive=self._keepalive
+            )
             for i in range(count)
         ]
 
     def to_aabb(self) -> AxisAlignedBoundingBox:
-        DLL.ZkOrientedBoundingBox_toAabb.restype = AxisAlignedBoundingBox
         return DLL.ZkOrientedBoundingBox_toAabb(self._handle)
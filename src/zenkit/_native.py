@@ -1,14 +1,38 @@
-__all__ = ["ZkString", "ZkPointer", "load"]
+__all__ = ["ZkString", "ZkPointer", "load", "load_async", "peek", "set_load_executor"]
 
+from collections.abc import Callable
 from ctypes import c_char_p
 from ctypes import c_void_p
+from ctypes import create_string_buffer
+from io import IOBase
+from os import PathLike
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import TypeVar
+from weakref import WeakKeyDictionary
 
 from zenkit._core import DLL
 from zenkit._core import PathOrFileLike
 from zenkit.stream import Read
 from zenkit.vfs import VfsNode
 
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+    from asyncio import Semaphore
+    from concurrent.futures import Executor
+
+_T = TypeVar("_T")
+
+# Asynchronous loads run on the configured executor, or on a thread pool created on first use. Native loads release
+# the GIL, so threads parse in parallel. Concurrency limits are enforced per event loop, before a load is submitted.
+_LOAD_LOCK = Lock()
+_LOAD_EXECUTOR: "Executor | None" = None
+_LOAD_EXECUTOR_OWNED = False
+_LOAD_MAX_CONCURRENCY: int | None = None
+_LOAD_LIMITS: "WeakKeyDictionary[AbstractEventLoop, Semaphore]" = WeakKeyDictionary()
+
 
 class ZkString(c_char_p):
     @property
@@ -37,9 +61,82 @@ def load(load: str, src: PathOrFileLike, *args: Any) -> c_void_p:
         rd = src.open()
     elif isinstance(src, Read):
         rd = src
+    elif isinstance(src, IOBase):
+        rd = Read.from_fileobj(src)
     else:
         rd = Read(src)
 
-    fn = getattr(DLL, load)
-    fn.restype = c_void_p
-    return c_void_p(fn(rd.handle, *args))
+    return c_void_p(getattr(DLL, load)(rd.handle, *args))
+
+
+def peek(src: PathOrFileLike, size: int) -> bytes:
+    if isinstance(src, VfsNode):
+        src = src.open()
+
+    if isinstance(src, Read):
+        data = create_string_buffer(min(size, src.size))
+        DLL.ZkRead_getBytes(src.handle, data, len(data))
+        return data.raw
+
+    if isinstance(src, str | PathLike):
+        with Path(src).open("rb") as file:
+            return file.read(size)
+
+    if isinstance(src, IOBase):
+        position = src.tell()
+        data = src.read(size)
+        src.seek(position)
+        return data
+
+    with memoryview(src) as view:
+        return view.cast("B")[:size].tobytes()
+
+
+def set_load_executor(executor: "Executor | None" = None, *, max_concurrency: int | None = None) -> None:
+    if max_concurrency is not None and max_concurrency <= 0:
+        error = "The maximum concurrency must be positive."
+        raise ValueError(error)
+
+    global _LOAD_EXECUTOR, _LOAD_EXECUTOR_OWNED, _LOAD_MAX_CONCURRENCY  # noqa: PLW0603 / process-wide configuration
+    with _LOAD_LOCK:
+        previous = _LOAD_EXECUTOR if _LOAD_EXECUTOR_OWNED else None
+        _LOAD_EXECUTOR = executor
+        _LOAD_EXECUTOR_OWNED = False
+        _LOAD_MAX_CONCURRENCY = max_concurrency
+        _LOAD_LIMITS.clear()
+
+    # Loads already running on the default pool finish in the background.
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def _load_executor() -> "Executor":
+    global _LOAD_EXECUTOR, _LOAD_EXECUTOR_OWNED  # noqa: PLW0603 / process-wide configuration
+    with _LOAD_LOCK:
+        if _LOAD_EXECUTOR is None:
+            # Only imported once needed, `concurrent.futures` is slow to import.
+            from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415 / lazy import
+
+            _LOAD_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="zenkit-load")
+            _LOAD_EXECUTOR_OWNED = True
+        return _LOAD_EXECUTOR
+
+
+async def load_async(load: Callable[..., _T], *args: Any) -> _T:
+    # Only imported once needed, `asyncio` is slow to import. Callers already have it loaded.
+    from asyncio import Semaphore  # noqa: PLC0415 / lazy import
+    from asyncio import get_running_loop  # noqa: PLC0415 / lazy import
+
+    loop = get_running_loop()
+    limit = None
+    if _LOAD_MAX_CONCURRENCY is not None:
+        limit = _LOAD_LIMITS.get(loop)
+        if limit is None:
+            limit = _LOAD_LIMITS[loop] = Semaphore(_LOAD_MAX_CONCURRENCY)
+
+    # Cancelling a load that is still waiting for its turn or queued in the executor keeps it from running at all.
+    # Native parsers can't be interrupted, so a load that has already started is finished and its result dropped.
+    if limit is None:
+        return await loop.run_in_executor(_load_executor(), load, *args)
+    async with limit:
+        return await loop.run_in_executor(_load_executor(), load, *args)
@@ -0,0 +1,2120 @@
+__all__ = [
+    "SIGNATURES",
+    "bind",
+]
+
+from ctypes import POINTER
+from ctypes import c_char_p
+from ctypes import c_float
+from ctypes import c_int
+from ctypes import c_int16
+from ctypes import c_int32
+from ctypes import c_long
+from ctypes import c_size_t
+from ctypes import c_uint
+from ctypes import c_uint8
+from ctypes import c_uint16
+from ctypes import c_uint32
+from ctypes import c_void_p
+from importlib import import_module
+from typing import Any
+from typing import Final
+
+from zenkit._core import AxisAlignedBoundingBox
+from zenkit._core import Color
+from zenkit._core import Date
+from zenkit._core import Mat3x3
+from zenkit._core import Mat4x4
+from zenkit._core import Vec2f
+from zenkit._core import Vec3f
+from zenkit._native import ZkPointer
+from zenkit._native import ZkString
+
+
+class _Ref:
+    """A structure type owned by one of the wrapper modules, looked up when its function is first bound."""
+
+    __slots__ = ("_module", "_name", "_pointer")
+
+    def __init__(self, module: str, name: str, *, pointer: bool = False) -> None:
+        self._module = module
+        self._name = name
+        self._pointer = pointer
+
+    def resolve(self) -> Any:
+        typ = getattr(import_module(self._module), self._name)
+        return POINTER(typ) if self._pointer else typ
+
+
+# Maps every native symbol used by the wrappers to its `(restype, argtypes)` pair.
+SIGNATURES: Final[dict[str, tuple[Any, tuple[Any, ...]]]] = {
+    "ZkAi_del": (None, (c_void_p,)),
+    "ZkAi_getType": (c_int, (c_void_p,)),
+    "ZkAi_new": (ZkPointer, (c_int,)),
+    "ZkAiHuman_getActionMode": (c_int, (c_void_p,)),
+    "ZkAiHuman_getCeilY": (c_float, (c_void_p,)),
+    "ZkAiHuman_getChangeWeapon": (c_int, (c_void_p,)),
+    "ZkAiHuman_getFallDistY": (c_float, (c_void_p,)),
+    "ZkAiHuman_getFallStartY": (c_float, (c_void_p,)),
+    "ZkAiHuman_getFeetY": (c_float, (c_void_p,)),
+    "ZkAiHuman_getFloorY": (c_float, (c_void_p,)),
+    "ZkAiHuman_getHeadY": (c_float, (c_void_p,)),
+    "ZkAiHuman_getNpc": (ZkPointer, (c_void_p,)),
+    "ZkAiHuman_getWalkMode": (c_int, (c_void_p,)),
+    "ZkAiHuman_getWaterLevel": (c_int, (c_void_p,)),
+    "ZkAiHuman_getWaterY": (c_float, (c_void_p,)),
+    "ZkAiHuman_getWeaponMode": (c_int, (c_void_p,)),
+    "ZkAiHuman_getWmodeAst": (c_int, (c_void_p,)),
+    "ZkAiHuman_getWmodeSelect": (c_int, (c_void_p,)),
+    "ZkAiHuman_setActionMode": (None, (c_void_p, c_int)),
+    "ZkAiHuman_setCeilY": (None, (c_void_p, c_float)),
+    "ZkAiHuman_setChangeWeapon": (None, (c_void_p, c_int)),
+    "ZkAiHuman_setFallDistY": (None, (c_void_p, c_float)),
+    "ZkAiHuman_setFallStartY": (None, (c_void_p, c_float)),
+    "ZkAiHuman_setFeetY": (None, (c_void_p, c_float)),
+    "ZkAiHuman_setFloorY": (None, (c_void_p, c_float)),
+    "ZkAiHuman_setHeadY": (None, (c_void_p, c_float)),
+    "ZkAiHuman_setNpc": (None, (c_void_p, c_void_p)),
+    "ZkAiHuman_setWalkMode": (None, (c_void_p, c_int)),
+    "ZkAiHuman_setWaterLevel": (None, (c_void_p, c_int)),
+    "ZkAiHuman_setWaterY": (None, (c_void_p, c_float)),
+    "ZkAiHuman_setWeaponMode": (None, (c_void_p, c_int)),
+    "ZkAiHuman_setWmodeAst": (None, (c_void_p, c_int)),
+    "ZkAiHuman_setWmodeSelect": (None, (c_void_p, c_int)),
+    "ZkAiMove_getOwner": (ZkPointer, (c_void_p,)),
+    "ZkAiMove_getVob": (ZkPointer, (c_void_p,)),
+    "ZkAiMove_setOwner": (None, (c_void_p, c_void_p)),
+    "ZkAiMove_setVob": (None, (c_void_p, c_void_p)),
+    "ZkAnimate_getIsRunning": (c_int, (c_void_p,)),
+    "ZkAnimate_getStartOn": (c_int, (c_void_p,)),
+    "ZkAnimate_setIsRunning": (None, (c_void_p, c_int)),
+    "ZkAnimate_setStartOn": (None, (c_void_p, c_int)),
+    "ZkAnimation_getBlendIn": (c_float, (c_void_p,)),
+    "ZkAnimation_getBlendOut": (c_float, (c_void_p,)),
+    "ZkAnimation_getCameraTremor": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkAnimation_getCameraTremorCount": (c_size_t, (c_void_p,)),
+    "ZkAnimation_getCollisionVolumeScale": (c_float, (c_void_p,)),
+    "ZkAnimation_getDirection": (c_int, (c_void_p,)),
+    "ZkAnimation_getEventTag": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkAnimation_getEventTagCount": (c_size_t, (c_void_p,)),
+    "ZkAnimation_getFirstFrame": (c_int32, (c_void_p,)),
+    "ZkAnimation_getFlags": (c_int, (c_void_p,)),
+    "ZkAnimation_getFps": (c_float, (c_void_p,)),
+    "ZkAnimation_getLastFrame": (c_int32, (c_void_p,)),
+    "ZkAnimation_getLayer": (c_uint32, (c_void_p,)),
+    "ZkAnimation_getModel": (ZkString, (c_void_p,)),
+    "ZkAnimation_getMorphAnimation": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkAnimation_getMorphAnimationCount": (c_size_t, (c_void_p,)),
+    "ZkAnimation_getName": (ZkString, (c_void_p,)),
+    "ZkAnimation_getNext": (ZkString, (c_void_p,)),
+    "ZkAnimation_getParticleEffect": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkAnimation_getParticleEffectCount": (c_size_t, (c_void_p,)),
+    "ZkAnimation_getParticleEffectStop": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkAnimation_getParticleEffectStopCount": (c_size_t, (c_void_p,)),
+    "ZkAnimation_getSoundEffect": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkAnimation_getSoundEffectCount": (c_size_t, (c_void_p,)),
+    "ZkAnimation_getSoundEffectGround": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkAnimation_getSoundEffectGroundCount": (c_size_t, (c_void_p,)),
+    "ZkAnimation_getSpeed": (c_float, (c_void_p,)),
+    "ZkAnimationAlias_getAlias": (ZkString, (c_void_p,)),
+    "ZkAnimationAlias_getBlendIn": (c_float, (c_void_p,)),
+    "ZkAnimationAlias_getBlendOut": (c_float, (c_void_p,)),
+    "ZkAnimationAlias_getDirection": (c_int, (c_void_p,)),
+    "ZkAnimationAlias_getFlags": (c_int, (c_void_p,)),
+    "ZkAnimationAlias_getLayer": (c_uint32, (c_void_p,)),
+    "ZkAnimationAlias_getName": (ZkString, (c_void_p,)),
+    "ZkAnimationAlias_getNext": (ZkString, (c_void_p,)),
+    "ZkAnimationBlend_getBlendIn": (c_float, (c_void_p,)),
+    "ZkAnimationBlend_getBlendOut": (c_float, (c_void_p,)),
+    "ZkAnimationBlend_getName": (ZkString, (c_void_p,)),
+    "ZkAnimationBlend_getNext": (ZkString, (c_void_p,)),
+    "ZkAnimationCombine_getBlendIn": (c_float, (c_void_p,)),
+    "ZkAnimationCombine_getBlendOut": (c_float, (c_void_p,)),
+    "ZkAnimationCombine_getFlags": (c_int, (c_void_p,)),
+    "ZkAnimationCombine_getLastFrame": (c_int32, (c_void_p,)),
+    "ZkAnimationCombine_getLayer": (c_uint32, (c_void_p,)),
+    "ZkAnimationCombine_getModel": (ZkString, (c_void_p,)),
+    "ZkAnimationCombine_getName": (ZkString, (c_void_p,)),
+    "ZkAnimationCombine_getNext": (ZkString, (c_void_p,)),
+    "ZkBspSector_getName": (ZkString, (c_void_p,)),
+    "ZkBspSector_getNodeIndices": (POINTER(c_uint32), (c_void_p, POINTER(c_size_t))),
+    "ZkBspSector_getPortalPolygonIndices": (POINTER(c_uint32), (c_void_p, POINTER(c_size_t))),
+    "ZkBspTree_getLeafPolygonIndices": (POINTER(c_uint32), (c_void_p, POINTER(c_size_t))),
+    "ZkBspTree_getLightPoint": (Vec3f, (c_void_p, c_size_t)),
+    "ZkBspTree_getLightPointCount": (c_size_t, (c_void_p,)),
+    "ZkBspTree_getNode": (_Ref("zenkit.world.bsp_tree", "BspNode"), (c_void_p, c_size_t)),
+    "ZkBspTree_getNodeCount": (c_size_t, (c_void_p,)),
+    "ZkBspTree_getPolygonIndices": (POINTER(c_uint32), (c_void_p, POINTER(c_size_t))),
+    "ZkBspTree_getPortalPolygonIndices": (POINTER(c_uint32), (c_void_p, POINTER(c_size_t))),
+    "ZkBspTree_getSector": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkBspTree_getSectorCount": (c_size_t, (c_void_p,)),
+    "ZkBspTree_getType": (c_int, (c_void_p,)),
+    "ZkCameraInstance_getBestAzimuth": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getBestElevation": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getBestRange": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getBestRotZ": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getCollision": (c_int32, (c_void_p,)),
+    "ZkCameraInstance_getMaxAzimuth": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getMaxElevation": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getMaxRange": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getMaxRotZ": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getMinAzimuth": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getMinElevation": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getMinRange": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getMinRotZ": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getRotOffsetX": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getRotOffsetY": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getRotOffsetZ": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getRotate": (c_int32, (c_void_p,)),
+    "ZkCameraInstance_getTargetOffsetX": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getTargetOffsetY": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getTargetOffsetZ": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getTranslate": (c_int32, (c_void_p,)),
+    "ZkCameraInstance_getVeloRot": (c_float, (c_void_p,)),
+    "ZkCameraInstance_getVeloTrans": (c_float, (c_void_p,)),
+    "ZkCameraInstance_setBestAzimuth": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setBestElevation": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setBestRange": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setBestRotZ": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setCollision": (None, (c_void_p, c_int32)),
+    "ZkCameraInstance_setMaxAzimuth": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setMaxElevation": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setMaxRange": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setMaxRotZ": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setMinAzimuth": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setMinElevation": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setMinRange": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setMinRotZ": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setRotOffsetX": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setRotOffsetY": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setRotOffsetZ": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setRotate": (None, (c_void_p, c_int32)),
+    "ZkCameraInstance_setTargetOffsetX": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setTargetOffsetY": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setTargetOffsetZ": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setTranslate": (None, (c_void_p, c_int32)),
+    "ZkCameraInstance_setVeloRot": (None, (c_void_p, c_float)),
+    "ZkCameraInstance_setVeloTrans": (None, (c_void_p, c_float)),
+    "ZkCameraTrajectoryFrame_getCamBias": (c_float, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getContinuity": (c_float, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getFovScale": (c_float, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getMotionType": (c_int, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getMotionTypeFov": (c_int, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getMotionTypeRoll": (c_int, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getMotionTypeTimeScale": (c_int, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getOriginalPose": (Mat4x4, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getRollAngle": (c_float, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getTension": (c_float, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getTime": (c_float, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getTimeFixed": (c_int, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_getTimeScale": (c_float, (c_void_p,)),
+    "ZkCameraTrajectoryFrame_setCamBias": (None, (c_void_p, c_float)),
+    "ZkCameraTrajectoryFrame_setContinuity": (None, (c_void_p, c_float)),
+    "ZkCameraTrajectoryFrame_setFovScale": (None, (c_void_p, c_float)),
+    "ZkCameraTrajectoryFrame_setMotionType": (None, (c_void_p, c_int)),
+    "ZkCameraTrajectoryFrame_setMotionTypeFov": (None, (c_void_p, c_int)),
+    "ZkCameraTrajectoryFrame_setMotionTypeRoll": (None, (c_void_p, c_int)),
+    "ZkCameraTrajectoryFrame_setMotionTypeTimeScale": (None, (c_void_p, c_int)),
+    "ZkCameraTrajectoryFrame_setOriginalPose": (None, (c_void_p, Mat4x4)),
+    "ZkCameraTrajectoryFrame_setRollAngle": (None, (c_void_p, c_float)),
+    "ZkCameraTrajectoryFrame_setTension": (None, (c_void_p, c_float)),
+    "ZkCameraTrajectoryFrame_setTime": (None, (c_void_p, c_float)),
+    "ZkCameraTrajectoryFrame_setTimeFixed": (None, (c_void_p, c_int)),
+    "ZkCameraTrajectoryFrame_setTimeScale": (None, (c_void_p, c_float)),
+    "ZkCodeMaster_addSlave": (None, (c_void_p, c_char_p)),
+    "ZkCodeMaster_getFailureTarget": (ZkString, (c_void_p,)),
+    "ZkCodeMaster_getFirstFalseIsFailure": (c_int, (c_void_p,)),
+    "ZkCodeMaster_getOrdered": (c_int, (c_void_p,)),
+    "ZkCodeMaster_getSlave": (ZkString, (c_void_p, c_size_t)),
+    "ZkCodeMaster_getSlaveCount": (c_size_t, (c_void_p,)),
+    "ZkCodeMaster_getTarget": (ZkString, (c_void_p,)),
+    "ZkCodeMaster_getUntriggeredCancels": (c_int, (c_void_p,)),
+    "ZkCodeMaster_removeSlave": (None, (c_void_p, c_size_t)),
+    "ZkCodeMaster_setFailureTarget": (None, (c_void_p, c_char_p)),
+    "ZkCodeMaster_setFirstFalseIsFailure": (None, (c_void_p, c_int)),
+    "ZkCodeMaster_setOrdered": (None, (c_void_p, c_int)),
+    "ZkCodeMaster_setTarget": (None, (c_void_p, c_char_p)),
+    "ZkCodeMaster_setUntriggeredCancels": (None, (c_void_p, c_int)),
+    "ZkContainer_addItem": (None, (c_void_p, c_void_p)),
+    "ZkContainer_getContents": (ZkString, (c_void_p,)),
+    "ZkContainer_getIsLocked": (c_int, (c_void_p,)),
+    "ZkContainer_getItem": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkContainer_getItemCount": (c_size_t, (c_void_p,)),
+    "ZkContainer_getKey": (ZkString, (c_void_p,)),
+    "ZkContainer_getPickString": (ZkString, (c_void_p,)),
+    "ZkContainer_removeItem": (None, (c_void_p, c_size_t)),
+    "ZkContainer_setContents": (None, (c_void_p, c_char_p)),
+    "ZkContainer_setIsLocked": (None, (c_void_p, c_int)),
+    "ZkContainer_setKey": (None, (c_void_p, c_char_p)),
+    "ZkContainer_setPickString": (None, (c_void_p, c_char_p)),
+    "ZkCutsceneBlock_getMessage": (ZkPointer, (c_void_p,)),
+    "ZkCutsceneBlock_getName": (ZkString, (c_void_p,)),
+    "ZkCutsceneCamera_getAdapt": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getAutoFocusVob": (ZkString, (c_void_p,)),
+    "ZkCutsceneCamera_getAutoPlayerMovable": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getAutoUntriggerLast": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getAutoUntriggerLastDelay": (c_float, (c_void_p,)),
+    "ZkCutsceneCamera_getEaseFirst": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getEaseLast": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getFrame": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkCutsceneCamera_getFrameCount": (c_size_t, (c_void_p,)),
+    "ZkCutsceneCamera_getGotoTimeMode": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getIgnoreFORVobRotation": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getIgnoreFORVobRotationTarget": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getIsPaused": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getIsStarted": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getLerpMode": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getLoopMode": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getPositionCount": (c_int32, (c_void_p,)),
+    "ZkCutsceneCamera_getTargetCount": (c_int32, (c_void_p,)),
+    "ZkCutsceneCamera_getTargetTrajectoryFOR": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_getTime": (c_float, (c_void_p,)),
+    "ZkCutsceneCamera_getTotalDuration": (c_float, (c_void_p,)),
+    "ZkCutsceneCamera_getTrajectoryFOR": (c_int, (c_void_p,)),
+    "ZkCutsceneCamera_setAdapt": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setAutoFocusVob": (None, (c_void_p, c_char_p)),
+    "ZkCutsceneCamera_setAutoPlayerMovable": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setAutoUntriggerLast": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setAutoUntriggerLastDelay": (None, (c_void_p, c_float)),
+    "ZkCutsceneCamera_setEaseFirst": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setEaseLast": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setGotoTimeMode": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setIgnoreFORVobRotation": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setIgnoreFORVobRotationTarget": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setIsPaused": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setIsStarted": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setLerpMode": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setLoopMode": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setTargetTrajectoryFOR": (None, (c_void_p, c_int)),
+    "ZkCutsceneCamera_setTime": (None, (c_void_p, c_float)),
+    "ZkCutsceneCamera_setTotalDuration": (None, (c_void_p, c_float)),
+    "ZkCutsceneCamera_setTrajectoryFOR": (None, (c_void_p, c_int)),
+    "ZkCutsceneLibrary_del": (None, (c_void_p,)),
+    "ZkCutsceneLibrary_getBlock": (ZkPointer, (c_void_p, c_char_p)),
+    "ZkCutsceneLibrary_getBlockByIndex": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkCutsceneLibrary_getBlockCount": (c_size_t, (c_void_p,)),
+    "ZkCutsceneLibrary_load": (c_void_p, (c_void_p,)),
+    "ZkCutsceneMessage_getName": (ZkString, (c_void_p,)),
+    "ZkCutsceneMessage_getText": (ZkString, (c_void_p,)),
+    "ZkCutsceneMessage_getType": (c_uint, (c_void_p,)),
+    "ZkDaedalusInstance_getIndex": (c_uint32, (c_void_p,)),
+    "ZkDaedalusInstance_getType": (c_int, (c_void_p,)),
+    "ZkDaedalusScript_del": (None, (c_void_p,)),
+    "ZkDaedalusScript_getInstruction": (_Ref("zenkit.daedalus_script", "DaedalusInstruction"), (c_void_p, c_size_t)),
+    "ZkDaedalusScript_getSymbolByAddress": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkDaedalusScript_getSymbolByIndex": (ZkPointer, (c_void_p, c_uint32)),
+    "ZkDaedalusScript_getSymbolByName": (ZkPointer, (c_void_p, c_char_p)),
+    "ZkDaedalusScript_getSymbolCount": (c_uint32, (c_void_p,)),
+    "ZkDaedalusScript_load": (c_void_p, (c_void_p,)),
+    "ZkDaedalusSymbol_getAddress": (c_int32, (c_void_p,)),
+    "ZkDaedalusSymbol_getFloat": (c_float, (c_void_p, c_uint16, c_void_p)),
+    "ZkDaedalusSymbol_getHasReturn": (c_int, (c_void_p,)),
+    "ZkDaedalusSymbol_getIndex": (c_uint32, (c_void_p,)),
+    "ZkDaedalusSymbol_getInstance": (ZkPointer, (c_void_p,)),
+    "ZkDaedalusSymbol_getInt": (c_int32, (c_void_p, c_uint16, c_void_p)),
+    "ZkDaedalusSymbol_getIsConst": (c_int, (c_void_p,)),
+    "ZkDaedalusSymbol_getIsExternal": (c_int, (c_void_p,)),
+    "ZkDaedalusSymbol_getIsGenerated": (c_int, (c_void_p,)),
+    "ZkDaedalusSymbol_getIsMember": (c_int, (c_void_p,)),
+    "ZkDaedalusSymbol_getIsMerged": (c_int, (c_void_p,)),
+    "ZkDaedalusSymbol_getName": (ZkString, (c_void_p,)),
+    "ZkDaedalusSymbol_getParent": (c_int32, (c_void_p,)),
+    "ZkDaedalusSymbol_getReturnType": (c_int, (c_void_p,)),
+    "ZkDaedalusSymbol_getSize": (c_int32, (c_void_p,)),
+    "ZkDaedalusSymbol_getString": (ZkString, (c_void_p, c_uint16, c_void_p)),
+    "ZkDaedalusSymbol_getType": (c_int, (c_void_p,)),
+    "ZkDaedalusSymbol_setFloat": (None, (c_void_p, c_float, c_uint16, c_void_p)),
+    "ZkDaedalusSymbol_setInt": (None, (c_void_p, c_int32, c_uint16, c_void_p)),
+    "ZkDaedalusSymbol_setString": (None, (c_void_p, c_char_p, c_uint16, c_void_p)),
+    "ZkDaedalusVm_allocInstance": (ZkPointer, (c_void_p, c_void_p, c_int)),
+    "ZkDaedalusVm_callFunction": (None, (c_void_p, c_void_p)),
+    "ZkDaedalusVm_del": (None, (c_void_p,)),
+    "ZkDaedalusVm_getGlobalHero": (ZkPointer, (c_void_p,)),
+    "ZkDaedalusVm_getGlobalItem": (ZkPointer, (c_void_p,)),
+    "ZkDaedalusVm_getGlobalOther": (ZkPointer, (c_void_p,)),
+    "ZkDaedalusVm_getGlobalSelf": (ZkPointer, (c_void_p,)),
+    "ZkDaedalusVm_getGlobalVictim": (ZkPointer, (c_void_p,)),
+    "ZkDaedalusVm_initInstance": (ZkPointer, (c_void_p, c_void_p, c_int)),
+    "ZkDaedalusVm_initInstanceDirect": (None, (c_void_p, c_void_p)),
+    "ZkDaedalusVm_load": (c_void_p, (c_void_p,)),
+    "ZkDaedalusVm_popFloat": (c_float, (c_void_p,)),
+    "ZkDaedalusVm_popInstance": (ZkPointer, (c_void_p,)),
+    "ZkDaedalusVm_popInt": (c_int32, (c_void_p,)),
+    "ZkDaedalusVm_popString": (ZkString, (c_void_p,)),
+    "ZkDaedalusVm_printStackTrace": (None, (c_void_p,)),
+    "ZkDaedalusVm_pushFloat": (None, (c_void_p, c_float)),
+    "ZkDaedalusVm_pushInstance": (None, (c_void_p, c_void_p)),
+    "ZkDaedalusVm_pushInt": (None, (c_void_p, c_int32)),
+    "ZkDaedalusVm_pushString": (None, (c_void_p, c_char_p)),
+    "ZkDaedalusVm_registerExternal": (None, (c_void_p, c_void_p, c_void_p, c_void_p)),
+    "ZkDaedalusVm_registerExternalDefault": (None, (c_void_p, c_void_p, c_void_p)),
+    "ZkDaedalusVm_setGlobalHero": (None, (c_void_p, c_void_p)),
+    "ZkDaedalusVm_setGlobalItem": (None, (c_void_p, c_void_p)),
+    "ZkDaedalusVm_setGlobalOther": (None, (c_void_p, c_void_p)),
+    "ZkDaedalusVm_setGlobalSelf": (None, (c_void_p, c_void_p)),
+    "ZkDaedalusVm_setGlobalVictim": (None, (c_void_p, c_void_p)),
+    "ZkDoor_getIsLocked": (c_int, (c_void_p,)),
+    "ZkDoor_getKey": (ZkString, (c_void_p,)),
+    "ZkDoor_getPickString": (ZkString, (c_void_p,)),
+    "ZkDoor_setIsLocked": (None, (c_void_p, c_int)),
+    "ZkDoor_setKey": (None, (c_void_p, c_char_p)),
+    "ZkDoor_setPickString": (None, (c_void_p, c_char_p)),
+    "ZkEarthquake_getAmplitude": (Vec3f, (c_void_p,)),
+    "ZkEarthquake_getDuration": (c_float, (c_void_p,)),
+    "ZkEarthquake_getRadius": (c_float, (c_void_p,)),
+    "ZkEarthquake_setAmplitude": (None, (c_void_p, Vec3f)),
+    "ZkEarthquake_setDuration": (None, (c_void_p, c_float)),
+    "ZkEarthquake_setRadius": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_getEmActionCollDynS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmActionCollStatS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmAdjustShpToOrigin": (c_int32, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmCheckCollision": (c_int32, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFlyGravity": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxCollDynAlignS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxCollDynPercS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxCollDynS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxCollStatAlignS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxCollStatS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxCreateDownTrj": (c_int32, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxCreateS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxInvestOriginS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxInvestTargetS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxLifespan": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmFxTriggerDelay": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmInvestNextKeyDuration": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmSelfRotVelS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjAngleElevVar": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjAngleHeadVar": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjDynUpdateDelay": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjDynUpdateTargetOnly": (c_int32, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjEaseFuncS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjEaseVel": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjKeyDistVar": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjLoopModeS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjModeS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjNumKeys": (c_int32, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjNumKeysVar": (c_int32, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjOriginNode": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjTargetAzi": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjTargetElev": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjTargetNode": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getEmTrjTargetRange": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getLightPresetName": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getSecsPerDamage": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getSendAssessMagic": (c_int32, (c_void_p,)),
+    "ZkEffectBaseInstance_getSfxId": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getSfxIsAmbient": (c_int32, (c_void_p,)),
+    "ZkEffectBaseInstance_getUserString": (ZkString, (c_void_p, c_size_t)),
+    "ZkEffectBaseInstance_getVisAlpha": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getVisAlphaBlendFuncS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getVisNameS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getVisSizeS": (ZkString, (c_void_p,)),
+    "ZkEffectBaseInstance_getVisTexAniFps": (c_float, (c_void_p,)),
+    "ZkEffectBaseInstance_getVisTexAniIsLooping": (c_int32, (c_void_p,)),
+    "ZkEffectBaseInstance_setEmActionCollDynS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmActionCollStatS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmAdjustShpToOrigin": (None, (c_void_p, c_int32)),
+    "ZkEffectBaseInstance_setEmCheckCollision": (None, (c_void_p, c_int32)),
+    "ZkEffectBaseInstance_setEmFlyGravity": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmFxCollDynAlignS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmFxCollDynPercS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmFxCollDynS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmFxCollStatAlignS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmFxCollStatS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmFxCreateDownTrj": (None, (c_void_p, c_int32)),
+    "ZkEffectBaseInstance_setEmFxCreateS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmFxInvestOriginS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmFxInvestTargetS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmFxLifespan": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmFxTriggerDelay": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmInvestNextKeyDuration": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmSelfRotVelS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmTrjAngleElevVar": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmTrjAngleHeadVar": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmTrjDynUpdateDelay": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmTrjDynUpdateTargetOnly": (None, (c_void_p, c_int32)),
+    "ZkEffectBaseInstance_setEmTrjEaseFuncS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmTrjEaseVel": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmTrjKeyDistVar": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmTrjLoopModeS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmTrjModeS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmTrjNumKeys": (None, (c_void_p, c_int32)),
+    "ZkEffectBaseInstance_setEmTrjNumKeysVar": (None, (c_void_p, c_int32)),
+    "ZkEffectBaseInstance_setEmTrjOriginNode": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmTrjTargetAzi": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmTrjTargetElev": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setEmTrjTargetNode": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setEmTrjTargetRange": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setLightPresetName": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setSecsPerDamage": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setSendAssessMagic": (None, (c_void_p, c_int32)),
+    "ZkEffectBaseInstance_setSfxId": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setSfxIsAmbient": (None, (c_void_p, c_int32)),
+    "ZkEffectBaseInstance_setUserString": (None, (c_void_p, c_size_t, c_char_p)),
+    "ZkEffectBaseInstance_setVisAlpha": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setVisAlphaBlendFuncS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setVisNameS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setVisSizeS": (None, (c_void_p, c_char_p)),
+    "ZkEffectBaseInstance_setVisTexAniFps": (None, (c_void_p, c_float)),
+    "ZkEffectBaseInstance_setVisTexAniIsLooping": (None, (c_void_p, c_int32)),
+    "ZkEventCameraTremor_getField1": (c_int32, (c_void_p,)),
+    "ZkEventCameraTremor_getField2": (c_int32, (c_void_p,)),
+    "ZkEventCameraTremor_getField3": (c_int32, (c_void_p,)),
+    "ZkEventCameraTremor_getField4": (c_int32, (c_void_p,)),
+    "ZkEventCameraTremor_getFrame": (c_int32, (c_void_p,)),
+    "ZkEventManager_del": (None, (c_void_p,)),
+    "ZkEventManager_getActive": (c_int, (c_void_p,)),
+    "ZkEventManager_getCleared": (c_int, (c_void_p,)),
+    "ZkEventManager_new": (ZkPointer, ()),
+    "ZkEventManager_setActive": (None, (c_void_p, c_int)),
+    "ZkEventManager_setCleared": (None, (c_void_p, c_int)),
+    "ZkEventParticleEffect_getFrame": (c_int32, (c_void_p,)),
+    "ZkEventParticleEffect_getIndex": (c_int32, (c_void_p,)),
+    "ZkEventParticleEffect_getIsAttached": (c_int, (c_void_p,)),
+    "ZkEventParticleEffect_getName": (ZkString, (c_void_p,)),
+    "ZkEventParticleEffect_getPosition": (ZkString, (c_void_p,)),
+    "ZkEventParticleEffectStop_getFrame": (c_int32, (c_void_p,)),
+    "ZkEventParticleEffectStop_getIndex": (c_int32, (c_void_p,)),
+    "ZkEventSoundEffect_getEmptySlot": (c_int, (c_void_p,)),
+    "ZkEventSoundEffect_getFrame": (c_int32, (c_void_p,)),
+    "ZkEventSoundEffect_getName": (ZkString, (c_void_p,)),
+    "ZkEventSoundEffect_getRange": (c_float, (c_void_p,)),
+    "ZkEventSoundEffectGround_getEmptySlot": (c_int, (c_void_p,)),
+    "ZkEventSoundEffectGround_getFrame": (c_int32, (c_void_p,)),
+    "ZkEventSoundEffectGround_getName": (ZkString, (c_void_p,)),
+    "ZkEventSoundEffectGround_getRange": (c_float, (c_void_p,)),
+    "ZkEventTag_getFightMode": (c_int, (c_void_p,)),
+    "ZkEventTag_getFrame": (c_int32, (c_void_p,)),
+    "ZkEventTag_getFrames": (POINTER(c_int32), (c_void_p, POINTER(c_size_t))),
+    "ZkEventTag_getIsAttached": (c_int, (c_void_p,)),
+    "ZkEventTag_getItem": (ZkString, (c_void_p,)),
+    "ZkEventTag_getSlot": (ZkString, (c_void_p,)),
+    "ZkEventTag_getType": (c_int, (c_void_p,)),
+    "ZkFightAiInstance_getMove": (c_int, (c_void_p, c_size_t)),
+    "ZkFightAiInstance_setMove": (None, (c_void_p, c_size_t, c_int)),
+    "ZkFire_getSlot": (ZkString, (c_void_p,)),
+    "ZkFire_getVobTree": (ZkString, (c_void_p,)),
+    "ZkFire_setSlot": (None, (c_void_p, c_char_p)),
+    "ZkFire_setVobTree": (None, (c_void_p, c_char_p)),
+    "ZkFocusInstance_getItemAzi": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getItemElevdo": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getItemElevup": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getItemPrio": (c_int32, (c_void_p,)),
+    "ZkFocusInstance_getItemRange1": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getItemRange2": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getMobAzi": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getMobElevdo": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getMobElevup": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getMobPrio": (c_int32, (c_void_p,)),
+    "ZkFocusInstance_getMobRange1": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getMobRange2": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getNpcAzi": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getNpcElevdo": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getNpcElevup": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getNpcLongrange": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getNpcPrio": (c_int32, (c_void_p,)),
+    "ZkFocusInstance_getNpcRange1": (c_float, (c_void_p,)),
+    "ZkFocusInstance_getNpcRange2": (c_float, (c_void_p,)),
+    "ZkFocusInstance_setItemAzi": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setItemElevdo": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setItemElevup": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setItemPrio": (None, (c_void_p, c_int32)),
+    "ZkFocusInstance_setItemRange1": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setItemRange2": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setMobAzi": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setMobElevdo": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setMobElevup": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setMobPrio": (None, (c_void_p, c_int32)),
+    "ZkFocusInstance_setMobRange1": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setMobRange2": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setNpcAzi": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setNpcElevdo": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setNpcElevup": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setNpcLongrange": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setNpcPrio": (None, (c_void_p, c_int32)),
+    "ZkFocusInstance_setNpcRange1": (None, (c_void_p, c_float)),
+    "ZkFocusInstance_setNpcRange2": (None, (c_void_p, c_float)),
+    "ZkFont_del": (None, (c_void_p,)),
+    "ZkFont_getGlyph": (_Ref("zenkit.font", "FontGlyph"), (c_void_p, c_size_t)),
+    "ZkFont_getGlyphCount": (c_size_t, (c_void_p,)),
+    "ZkFont_getHeight": (c_uint, (c_void_p,)),
+    "ZkFont_getName": (ZkString, (c_void_p,)),
+    "ZkFont_load": (c_void_p, (c_void_p,)),
+    "ZkGuildValuesInstance_getBloodAmount": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getBloodDisabled": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getBloodEmitter": (ZkString, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getBloodFlow": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getBloodMaxDistance": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getBloodTexture": (ZkString, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getClimbGroundAngle": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getClimbHeadingAngle": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getClimbHorizAngle": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getDisableAutoRoll": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getDiveTime": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getFallDownDamage": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getFallDownHeight": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getFightRange1Ha": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getFightRange1Hs": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getFightRange2Ha": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getFightRange2Hs": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getFightRangeBase": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getFightRangeFist": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getFightRangeG": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getJumpLowHeight": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getJumpMidHeight": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getJumpUpHeight": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getSlideAngle": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getSlideAngle2": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getStepHeight": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getSurfaceAlign": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getSwimTime": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getTurnSpeed": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getWaterDepthChest": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_getWaterDepthKnee": (c_int32, (c_void_p, c_size_t)),
+    "ZkGuildValuesInstance_setBloodAmount": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setBloodDisabled": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setBloodEmitter": (None, (c_void_p, c_size_t, c_char_p)),
+    "ZkGuildValuesInstance_setBloodFlow": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setBloodMaxDistance": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setBloodTexture": (None, (c_void_p, c_size_t, c_char_p)),
+    "ZkGuildValuesInstance_setClimbGroundAngle": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setClimbHeadingAngle": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setClimbHorizAngle": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setDisableAutoRoll": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setDiveTime": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setFallDownDamage": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setFallDownHeight": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setFightRange1Ha": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setFightRange1Hs": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setFightRange2Ha": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setFightRange2Hs": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setFightRangeBase": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setFightRangeFist": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setFightRangeG": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setJumpLowHeight": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setJumpMidHeight": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setJumpUpHeight": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setSlideAngle": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setSlideAngle2": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setStepHeight": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setSurfaceAlign": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setSwimTime": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setTurnSpeed": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setWaterDepthChest": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkGuildValuesInstance_setWaterDepthKnee": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkInfoInstance_getCondition": (c_int32, (c_void_p,)),
+    "ZkInfoInstance_getDescription": (ZkString, (c_void_p,)),
+    "ZkInfoInstance_getImportant": (c_int32, (c_void_p,)),
+    "ZkInfoInstance_getInformation": (c_int32, (c_void_p,)),
+    "ZkInfoInstance_getNpc": (c_int32, (c_void_p,)),
+    "ZkInfoInstance_getNr": (c_int32, (c_void_p,)),
+    "ZkInfoInstance_getPermanent": (c_int32, (c_void_p,)),
+    "ZkInfoInstance_getTrade": (c_int32, (c_void_p,)),
+    "ZkInfoInstance_setCondition": (None, (c_void_p, c_int32)),
+    "ZkInfoInstance_setDescription": (None, (c_void_p, c_char_p)),
+    "ZkInfoInstance_setImportant": (None, (c_void_p, c_int32)),
+    "ZkInfoInstance_setInformation": (None, (c_void_p, c_int32)),
+    "ZkInfoInstance_setNpc": (None, (c_void_p, c_int32)),
+    "ZkInfoInstance_setNr": (None, (c_void_p, c_int32)),
+    "ZkInfoInstance_setPermanent": (None, (c_void_p, c_int32)),
+    "ZkInfoInstance_setTrade": (None, (c_void_p, c_int32)),
+    "ZkInteractiveObject_getConditionFunction": (ZkString, (c_void_p,)),
+    "ZkInteractiveObject_getItem": (ZkString, (c_void_p,)),
+    "ZkInteractiveObject_getOnStateChangeFunction": (ZkString, (c_void_p,)),
+    "ZkInteractiveObject_getRewind": (c_int, (c_void_p,)),
+    "ZkInteractiveObject_getState": (c_int32, (c_void_p,)),
+    "ZkInteractiveObject_getTarget": (ZkString, (c_void_p,)),
+    "ZkInteractiveObject_setConditionFunction": (None, (c_void_p, c_char_p)),
+    "ZkInteractiveObject_setItem": (None, (c_void_p, c_char_p)),
+    "ZkInteractiveObject_setOnStateChangeFunction": (None, (c_void_p, c_char_p)),
+    "ZkInteractiveObject_setRewind": (None, (c_void_p, c_int)),
+    "ZkInteractiveObject_setState": (None, (c_void_p, c_int32)),
+    "ZkInteractiveObject_setTarget": (None, (c_void_p, c_char_p)),
+    "ZkItem_getAmount": (c_int, (c_void_p,)),
+    "ZkItem_getFlags": (c_int, (c_void_p,)),
+    "ZkItem_getInstance": (ZkString, (c_void_p,)),
+    "ZkItem_setAmount": (None, (c_void_p, c_int)),
+    "ZkItem_setFlags": (None, (c_void_p, c_int)),
+    "ZkItem_setInstance": (None, (c_void_p, c_char_p)),
+    "ZkItemInstance_getChangeAtr": (c_int32, (c_void_p, c_int)),
+    "ZkItemInstance_getChangeValue": (c_int32, (c_void_p, c_int)),
+    "ZkItemInstance_getCondAtr": (c_int32, (c_void_p, c_int)),
+    "ZkItemInstance_getCondValue": (c_int32, (c_void_p, c_int)),
+    "ZkItemInstance_getCount": (c_int32, (c_void_p, c_int)),
+    "ZkItemInstance_getDamage": (c_int32, (c_void_p, c_int)),
+    "ZkItemInstance_getDamageTotal": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getDamageType": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getDescription": (ZkString, (c_void_p,)),
+    "ZkItemInstance_getDisguiseGuild": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getEffect": (ZkString, (c_void_p,)),
+    "ZkItemInstance_getFlags": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getHp": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getHpMax": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getId": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getInvAnimate": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getInvRotX": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getInvRotY": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getInvRotZ": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getInvZBias": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getMagCircle": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getMagic": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getMainFlag": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getMaterial": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getMunition": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getName": (ZkString, (c_void_p,)),
+    "ZkItemInstance_getNameId": (ZkString, (c_void_p,)),
+    "ZkItemInstance_getNutrition": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getOnEquip": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getOnState": (c_int32, (c_void_p, c_int)),
+    "ZkItemInstance_getOnUnequip": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getOwner": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getOwnerGuild": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getProtection": (c_int32, (c_void_p, c_int)),
+    "ZkItemInstance_getRange": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getSchemeName": (ZkString, (c_void_p,)),
+    "ZkItemInstance_getSpell": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getText": (ZkString, (c_void_p, c_int)),
+    "ZkItemInstance_getValue": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getVisual": (ZkString, (c_void_p,)),
+    "ZkItemInstance_getVisualChange": (ZkString, (c_void_p,)),
+    "ZkItemInstance_getVisualSkin": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getWear": (c_int32, (c_void_p,)),
+    "ZkItemInstance_getWeight": (c_int32, (c_void_p,)),
+    "ZkItemInstance_setChangeAtr": (None, (c_void_p, c_int, c_int32)),
+    "ZkItemInstance_setChangeValue": (None, (c_void_p, c_int, c_int32)),
+    "ZkItemInstance_setCondAtr": (None, (c_void_p, c_int, c_int32)),
+    "ZkItemInstance_setCondValue": (None, (c_void_p, c_int, c_int32)),
+    "ZkItemInstance_setCount": (None, (c_void_p, c_int, c_int32)),
+    "ZkItemInstance_setDamage": (None, (c_void_p, c_int, c_int32)),
+    "ZkItemInstance_setDamageTotal": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setDamageType": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setDescription": (None, (c_void_p, c_char_p)),
+    "ZkItemInstance_setDisguiseGuild": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setEffect": (None, (c_void_p, c_char_p)),
+    "ZkItemInstance_setFlags": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setHp": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setHpMax": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setId": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setInvAnimate": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setInvRotX": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setInvRotY": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setInvRotZ": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setInvZBias": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setMagCircle": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setMagic": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setMainFlag": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setMaterial": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setMunition": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setName": (None, (c_void_p, c_char_p)),
+    "ZkItemInstance_setNameId": (None, (c_void_p, c_char_p)),
+    "ZkItemInstance_setNutrition": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setOnEquip": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setOnState": (None, (c_void_p, c_int, c_int32)),
+    "ZkItemInstance_setOnUnequip": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setOwner": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setOwnerGuild": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setProtection": (None, (c_void_p, c_int, c_int32)),
+    "ZkItemInstance_setRange": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setSchemeName": (None, (c_void_p, c_char_p)),
+    "ZkItemInstance_setSpell": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setText": (None, (c_void_p, c_int, c_char_p)),
+    "ZkItemInstance_setValue": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setVisual": (None, (c_void_p, c_char_p)),
+    "ZkItemInstance_setVisualChange": (None, (c_void_p, c_char_p)),
+    "ZkItemInstance_setVisualSkin": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setWear": (None, (c_void_p, c_int32)),
+    "ZkItemInstance_setWeight": (None, (c_void_p, c_int32)),
+    "ZkItemReactInstance_getNpc": (c_int32, (c_void_p,)),
+    "ZkItemReactInstance_getReaction": (c_int32, (c_void_p,)),
+    "ZkItemReactInstance_getRequestedAmount": (c_int32, (c_void_p,)),
+    "ZkItemReactInstance_getRequestedCategory": (c_int32, (c_void_p,)),
+    "ZkItemReactInstance_getRequestedItem": (c_int32, (c_void_p,)),
+    "ZkItemReactInstance_getTradeAmount": (c_int32, (c_void_p,)),
+    "ZkItemReactInstance_getTradeItem": (c_int32, (c_void_p,)),
+    "ZkItemReactInstance_setNpc": (None, (c_void_p, c_int32)),
+    "ZkItemReactInstance_setReaction": (None, (c_void_p, c_int32)),
+    "ZkItemReactInstance_setRequestedAmount": (None, (c_void_p, c_int32)),
+    "ZkItemReactInstance_setRequestedCategory": (None, (c_void_p, c_int32)),
+    "ZkItemReactInstance_setRequestedItem": (None, (c_void_p, c_int32)),
+    "ZkItemReactInstance_setTradeAmount": (None, (c_void_p, c_int32)),
+    "ZkItemReactInstance_setTradeItem": (None, (c_void_p, c_int32)),
+    "ZkLensFlare_getEffect": (ZkString, (c_void_p,)),
+    "ZkLensFlare_setEffect": (None, (c_void_p, c_char_p)),
+    "ZkLight_getCanMove": (c_int, (c_void_p,)),
+    "ZkLight_getColor": (Color, (c_void_p,)),
+    "ZkLight_getColorAnimationCount": (c_int, (c_void_p,)),
+    "ZkLight_getColorAnimationFps": (c_float, (c_void_p,)),
+    "ZkLight_getColorAnimationItem": (Color, (c_void_p, c_size_t)),
+    "ZkLight_getColorAnimationSmooth": (c_int, (c_void_p,)),
+    "ZkLight_getConeAngle": (c_float, (c_void_p,)),
+    "ZkLight_getIsStatic": (c_int, (c_void_p,)),
+    "ZkLight_getLensflareFx": (ZkString, (c_void_p,)),
+    "ZkLight_getLightType": (c_int, (c_void_p,)),
+    "ZkLight_getOn": (c_int, (c_void_p,)),
+    "ZkLight_getPreset": (ZkString, (c_void_p,)),
+    "ZkLight_getQuality": (c_int, (c_void_p,)),
+    "ZkLight_getRange": (c_float, (c_void_p,)),
+    "ZkLight_getRangeAnimationFps": (c_float, (c_void_p,)),
+    "ZkLight_getRangeAnimationScale": (POINTER(c_float), (c_void_p, POINTER(c_size_t))),
+    "ZkLight_getRangeAnimationSmooth": (c_int, (c_void_p,)),
+    "ZkLight_setCanMove": (None, (c_void_p, c_int)),
+    "ZkLight_setColor": (None, (c_void_p, Color)),
+    "ZkLight_setColorAnimationFps": (None, (c_void_p, c_float)),
+    "ZkLight_setColorAnimationSmooth": (None, (c_void_p, c_int)),
+    "ZkLight_setConeAngle": (None, (c_void_p, c_float)),
+    "ZkLight_setIsStatic": (None, (c_void_p, c_int)),
+    "ZkLight_setLensflareFx": (None, (c_void_p, c_char_p)),
+    "ZkLight_setLightType": (None, (c_void_p, c_int)),
+    "ZkLight_setOn": (None, (c_void_p, c_int)),
+    "ZkLight_setPreset": (None, (c_void_p, c_char_p)),
+    "ZkLight_setQuality": (None, (c_void_p, c_int)),
+    "ZkLight_setRange": (None, (c_void_p, c_float)),
+    "ZkLight_setRangeAnimationFps": (None, (c_void_p, c_float)),
+    "ZkLight_setRangeAnimationScale": (None, (c_void_p, POINTER(c_float), c_size_t)),
+    "ZkLight_setRangeAnimationSmooth": (None, (c_void_p, c_int)),
+    "ZkLightMap_getImage": (ZkPointer, (c_void_p,)),
+    "ZkLightMap_getNormal": (Vec3f, (c_void_p, c_size_t)),
+    "ZkLightMap_getOrigin": (Vec3f, (c_void_p,)),
+    "ZkLogger_set": (None, (c_int, c_void_p, c_void_p)),
+    "ZkLogger_setDefault": (None, (c_int,)),
+    "ZkMaterial_getAlphaFunction": (c_int, (c_void_p,)),
+    "ZkMaterial_getColor": (Color, (c_void_p,)),
+    "ZkMaterial_getDefaultMapping": (Vec2f, (c_void_p,)),
+    "ZkMaterial_getDetailObject": (ZkString, (c_void_p,)),
+    "ZkMaterial_getDetailObjectScale": (c_float, (c_void_p,)),
+    "ZkMaterial_getDisableCollision": (c_int, (c_void_p,)),
+    "ZkMaterial_getDisableLightmap": (c_int, (c_void_p,)),
+    "ZkMaterial_getDontCollapse": (c_int, (c_void_p,)),
+    "ZkMaterial_getEnvironmentMapping": (c_int, (c_void_p,)),
+    "ZkMaterial_getEnvironmentMappingStrength": (c_float, (c_void_p,)),
+    "ZkMaterial_getForceOccluder": (c_int, (c_void_p,)),
+    "ZkMaterial_getGroup": (c_int, (c_void_p,)),
+    "ZkMaterial_getIgnoreSun": (c_int, (c_void_p,)),
+    "ZkMaterial_getName": (ZkString, (c_void_p,)),
+    "ZkMaterial_getSmoothAngle": (c_float, (c_void_p,)),
+    "ZkMaterial_getTexture": (ZkString, (c_void_p,)),
+    "ZkMaterial_getTextureAnimationFps": (c_float, (c_void_p,)),
+    "ZkMaterial_getTextureAnimationMapping": (c_int, (c_void_p,)),
+    "ZkMaterial_getTextureAnimationMappingDirection": (Vec2f, (c_void_p,)),
+    "ZkMaterial_getTextureScale": (Vec2f, (c_void_p,)),
+    "ZkMaterial_getWaveAmplitude": (c_float, (c_void_p,)),
+    "ZkMaterial_getWaveGridSize": (c_float, (c_void_p,)),
+    "ZkMaterial_getWaveMode": (c_int, (c_void_p,)),
+    "ZkMaterial_getWaveSpeed": (c_int, (c_void_p,)),
+    "ZkMenuInstance_getAlpha": (c_int32, (c_void_p,)),
+    "ZkMenuInstance_getBackPic": (ZkString, (c_void_p,)),
+    "ZkMenuInstance_getBackWorld": (ZkString, (c_void_p,)),
+    "ZkMenuInstance_getDefaultIngame": (c_int32, (c_void_p,)),
+    "ZkMenuInstance_getDefaultOutgame": (c_int32, (c_void_p,)),
+    "ZkMenuInstance_getDimX": (c_int32, (c_void_p,)),
+    "ZkMenuInstance_getDimY": (c_int32, (c_void_p,)),
+    "ZkMenuInstance_getEventTimerMsec": (c_int32, (c_void_p,)),
+    "ZkMenuInstance_getFlags": (c_int32, (c_void_p,)),
+    "ZkMenuInstance_getItem": (ZkString, (c_void_p, c_size_t)),
+    "ZkMenuInstance_getMusicTheme": (ZkString, (c_void_p,)),
+    "ZkMenuInstance_getPosX": (c_int32, (c_void_p,)),
+    "ZkMenuInstance_getPosY": (c_int32, (c_void_p,)),
+    "ZkMenuInstance_setAlpha": (None, (c_void_p, c_int32)),
+    "ZkMenuInstance_setBackPic": (None, (c_void_p, c_char_p)),
+    "ZkMenuInstance_setBackWorld": (None, (c_void_p, c_char_p)),
+    "ZkMenuInstance_setDefaultIngame": (None, (c_void_p, c_int32)),
+    "ZkMenuInstance_setDefaultOutgame": (None, (c_void_p, c_int32)),
+    "ZkMenuInstance_setDimX": (None, (c_void_p, c_int32)),
+    "ZkMenuInstance_setDimY": (None, (c_void_p, c_int32)),
+    "ZkMenuInstance_setEventTimerMsec": (None, (c_void_p, c_int32)),
+    "ZkMenuInstance_setFlags": (None, (c_void_p, c_int32)),
+    "ZkMenuInstance_setItem": (None, (c_void_p, c_size_t, c_char_p)),
+    "ZkMenuInstance_setMusicTheme": (None, (c_void_p, c_char_p)),
+    "ZkMenuInstance_setPosX": (None, (c_void_p, c_int32)),
+    "ZkMenuInstance_setPosY": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_getAlpha": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getAlphaMode": (ZkString, (c_void_p,)),
+    "ZkMenuItemInstance_getBackpic": (ZkString, (c_void_p,)),
+    "ZkMenuItemInstance_getDimX": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getDimY": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getFlags": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getFontName": (ZkString, (c_void_p,)),
+    "ZkMenuItemInstance_getFramePosX": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getFramePosY": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getFrameSizeX": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getFrameSizeY": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getHideIfOptionSectionSet": (ZkString, (c_void_p,)),
+    "ZkMenuItemInstance_getHideIfOptionSet": (ZkString, (c_void_p,)),
+    "ZkMenuItemInstance_getHideOnValue": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getOnChgSetOption": (ZkString, (c_void_p,)),
+    "ZkMenuItemInstance_getOnChgSetOptionSection": (ZkString, (c_void_p,)),
+    "ZkMenuItemInstance_getOnEventAction": (c_int32, (c_void_p, c_size_t)),
+    "ZkMenuItemInstance_getOnSelAction": (c_int32, (c_void_p, c_size_t)),
+    "ZkMenuItemInstance_getOnSelActionS": (ZkString, (c_void_p, c_size_t)),
+    "ZkMenuItemInstance_getOpenDelayTime": (c_float, (c_void_p,)),
+    "ZkMenuItemInstance_getOpenDuration": (c_float, (c_void_p,)),
+    "ZkMenuItemInstance_getPosX": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getPosY": (c_int32, (c_void_p,)),
+    "ZkMenuItemInstance_getSizeStartScale": (c_float, (c_void_p,)),
+    "ZkMenuItemInstance_getText": (ZkString, (c_void_p, c_size_t)),
+    "ZkMenuItemInstance_getType": (c_int, (c_void_p,)),
+    "ZkMenuItemInstance_getUserFloat": (c_float, (c_void_p, c_size_t)),
+    "ZkMenuItemInstance_getUserString": (ZkString, (c_void_p, c_size_t)),
+    "ZkMenuItemInstance_setAlpha": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setAlphaMode": (None, (c_void_p, c_char_p)),
+    "ZkMenuItemInstance_setBackpic": (None, (c_void_p, c_char_p)),
+    "ZkMenuItemInstance_setDimX": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setDimY": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setFlags": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setFontName": (None, (c_void_p, c_char_p)),
+    "ZkMenuItemInstance_setFramePosX": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setFramePosY": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setFrameSizeX": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setFrameSizeY": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setHideIfOptionSectionSet": (None, (c_void_p, c_char_p)),
+    "ZkMenuItemInstance_setHideIfOptionSet": (None, (c_void_p, c_char_p)),
+    "ZkMenuItemInstance_setHideOnValue": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setOnChgSetOption": (None, (c_void_p, c_char_p)),
+    "ZkMenuItemInstance_setOnChgSetOptionSection": (None, (c_void_p, c_char_p)),
+    "ZkMenuItemInstance_setOnEventAction": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkMenuItemInstance_setOnSelAction": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkMenuItemInstance_setOnSelActionS": (None, (c_void_p, c_size_t, c_char_p)),
+    "ZkMenuItemInstance_setOpenDelayTime": (None, (c_void_p, c_float)),
+    "ZkMenuItemInstance_setOpenDuration": (None, (c_void_p, c_float)),
+    "ZkMenuItemInstance_setPosX": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setPosY": (None, (c_void_p, c_int32)),
+    "ZkMenuItemInstance_setSizeStartScale": (None, (c_void_p, c_float)),
+    "ZkMenuItemInstance_setText": (None, (c_void_p, c_size_t, c_char_p)),
+    "ZkMenuItemInstance_setType": (None, (c_void_p, c_int)),
+    "ZkMenuItemInstance_setUserFloat": (None, (c_void_p, c_size_t, c_float)),
+    "ZkMenuItemInstance_setUserString": (None, (c_void_p, c_size_t, c_char_p)),
+    "ZkMesh_del": (None, (c_void_p,)),
+    "ZkMesh_enumeratePolygons": (None, (c_void_p, c_void_p, c_void_p)),
+    "ZkMesh_enumeratePositions": (None, (c_void_p, c_void_p, c_void_p)),
+    "ZkMesh_enumerateVertices": (None, (c_void_p, c_void_p, c_void_p)),
+    "ZkMesh_getBoundingBox": (AxisAlignedBoundingBox, (c_void_p,)),
+    "ZkMesh_getLightMap": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkMesh_getLightMapCount": (c_size_t, (c_void_p,)),
+    "ZkMesh_getMaterial": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkMesh_getMaterialCount": (c_size_t, (c_void_p,)),
+    "ZkMesh_getName": (ZkString, (c_void_p,)),
+    "ZkMesh_getOrientedBoundingBox": (ZkPointer, (c_void_p,)),
+    "ZkMesh_getPolygon": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkMesh_getPolygonCount": (c_size_t, (c_void_p,)),
+    "ZkMesh_getPosition": (Vec3f, (c_void_p, c_size_t)),
+    "ZkMesh_getPositionCount": (c_size_t, (c_void_p,)),
+    "ZkMesh_getSourceDate": (Date, (c_void_p,)),
+    "ZkMesh_getVertex": (_Ref("zenkit.mesh", "Feature"), (c_void_p, c_size_t)),
+    "ZkMesh_getVertexCount": (c_size_t, (c_void_p,)),
+    "ZkMesh_load": (c_void_p, (c_void_p,)),
+    "ZkMessageFilter_getOnTrigger": (c_int, (c_void_p,)),
+    "ZkMessageFilter_getOnUntrigger": (c_int, (c_void_p,)),
+    "ZkMessageFilter_getTarget": (ZkString, (c_void_p,)),
+    "ZkMessageFilter_setOnTrigger": (None, (c_void_p, c_int)),
+    "ZkMessageFilter_setOnUntrigger": (None, (c_void_p, c_int)),
+    "ZkMessageFilter_setTarget": (None, (c_void_p, c_char_p)),
+    "ZkMissionInstance_getDescription": (ZkString, (c_void_p,)),
+    "ZkMissionInstance_getDuration": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_getFailure": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_getFailureConditions": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_getImportant": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_getName": (ZkString, (c_void_p,)),
+    "ZkMissionInstance_getObsolete": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_getObsoleteConditions": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_getOffer": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_getOfferConditions": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_getRunning": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_getSuccess": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_getSuccessConditions": (c_int32, (c_void_p,)),
+    "ZkMissionInstance_setDescription": (None, (c_void_p, c_char_p)),
+    "ZkMissionInstance_setDuration": (None, (c_void_p, c_int32)),
+    "ZkMissionInstance_setFailure": (None, (c_void_p, c_int32)),
+    "ZkMissionInstance_setFailureConditions": (None, (c_void_p, c_int32)),
+    "ZkMissionInstance_setImportant": (None, (c_void_p, c_int32)),
+    "ZkMissionInstance_setName": (None, (c_void_p, c_char_p)),
+    "ZkMissionInstance_setObsolete": (None, (c_void_p, c_int32)),
+    "ZkMissionInstance_setObsoleteConditions": (None, (c_void_p, c_int32)),
+    "ZkMissionInstance_setOffer": (None, (c_void_p, c_int32)),
+    "ZkMissionInstance_setOfferConditions": (None, (c_void_p, c_int32)),
+    "ZkMissionInstance_setRunning": (None, (c_void_p, c_int32)),
+    "ZkMissionInstance_setSuccess": (None, (c_void_p, c_int32)),
+    "ZkMissionInstance_setSuccessConditions": (None, (c_void_p, c_int32)),
+    "ZkModel_del": (None, (c_void_p,)),
+    "ZkModel_getHierarchy": (ZkPointer, (c_void_p,)),
+    "ZkModel_getMesh": (ZkPointer, (c_void_p,)),
+    "ZkModel_load": (c_void_p, (c_void_p,)),
+    "ZkModelAnimation_del": (None, (c_void_p,)),
+    "ZkModelAnimation_getBbox": (AxisAlignedBoundingBox, (c_void_p,)),
+    "ZkModelAnimation_getChecksum": (c_uint, (c_void_p,)),
+    "ZkModelAnimation_getFps": (c_float, (c_void_p,)),
+    "ZkModelAnimation_getFpsSource": (c_float, (c_void_p,)),
+    "ZkModelAnimation_getFrameCount": (c_uint, (c_void_p,)),
+    "ZkModelAnimation_getLayer": (c_uint, (c_void_p,)),
+    "ZkModelAnimation_getName": (ZkString, (c_void_p,)),
+    "ZkModelAnimation_getNext": (ZkString, (c_void_p,)),
+    "ZkModelAnimation_getNodeCount": (c_uint, (c_void_p,)),
+    "ZkModelAnimation_getNodeIndices": (POINTER(c_uint32), (c_void_p, POINTER(c_size_t))),
+    "ZkModelAnimation_getSample": (_Ref("zenkit.model_animation", "AnimationSample"), (c_void_p, c_size_t)),
+    "ZkModelAnimation_getSampleCount": (c_size_t, (c_void_p,)),
+    "ZkModelAnimation_getSourceDate": (Date, (c_void_p,)),
+    "ZkModelAnimation_getSourcePath": (ZkString, (c_void_p,)),
+    "ZkModelAnimation_getSourceScript": (ZkString, (c_void_p,)),
+    "ZkModelAnimation_load": (c_void_p, (c_void_p,)),
+    "ZkModelHierarchy_del": (None, (c_void_p,)),
+    "ZkModelHierarchy_getBbox": (AxisAlignedBoundingBox, (c_void_p,)),
+    "ZkModelHierarchy_getChecksum": (c_uint, (c_void_p,)),
+    "ZkModelHierarchy_getCollisionBbox": (AxisAlignedBoundingBox, (c_void_p,)),
+    "ZkModelHierarchy_getNode": (_Ref("zenkit.model_hierarchy", "ModelHierarchyNode"), (c_void_p, c_size_t)),
+    "ZkModelHierarchy_getNodeCount": (c_size_t, (c_void_p,)),
+    "ZkModelHierarchy_getRootTranslation": (Vec3f, (c_void_p,)),
+    "ZkModelHierarchy_getSourceDate": (Date, (c_void_p,)),
+    "ZkModelHierarchy_getSourcePath": (ZkString, (c_void_p,)),
+    "ZkModelHierarchy_load": (c_void_p, (c_void_p,)),
+    "ZkModelMesh_del": (None, (c_void_p,)),
+    "ZkModelMesh_enumerateAttachments": (None, (c_void_p, c_void_p, c_void_p)),
+    "ZkModelMesh_getChecksum": (c_uint, (c_void_p,)),
+    "ZkModelMesh_getMesh": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkModelMesh_getMeshCount": (c_size_t, (c_void_p,)),
+    "ZkModelMesh_load": (c_void_p, (c_void_p,)),
+    "ZkModelScript_del": (None, (c_void_p,)),
+    "ZkModelScript_getAnimation": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkModelScript_getAnimationAlias": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkModelScript_getAnimationAliasCount": (c_size_t, (c_void_p,)),
+    "ZkModelScript_getAnimationBlend": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkModelScript_getAnimationBlendCount": (c_size_t, (c_void_p,)),
+    "ZkModelScript_getAnimationCombine": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkModelScript_getAnimationCombineCount": (c_size_t, (c_void_p,)),
+    "ZkModelScript_getAnimationCount": (c_size_t, (c_void_p,)),
+    "ZkModelScript_getDisabledAnimation": (ZkString, (c_void_p, c_size_t)),
+    "ZkModelScript_getDisabledAnimationsCount": (c_size_t, (c_void_p,)),
+    "ZkModelScript_getMesh": (ZkString, (c_void_p, c_size_t)),
+    "ZkModelScript_getMeshCount": (c_size_t, (c_void_p,)),
+    "ZkModelScript_getModelTag": (ZkString, (c_void_p, c_size_t)),
+    "ZkModelScript_getModelTagCount": (c_size_t, (c_void_p,)),
+    "ZkModelScript_getSkeletonMeshDisabled": (c_int, (c_void_p,)),
+    "ZkModelScript_getSkeletonName": (ZkString, (c_void_p,)),
+    "ZkModelScript_load": (c_void_p, (c_void_p,)),
+    "ZkMorphAnimation_getAnimation": (ZkString, (c_void_p,)),
+    "ZkMorphAnimation_getBlendIn": (c_float, (c_void_p,)),
+    "ZkMorphAnimation_getBlendOut": (c_float, (c_void_p,)),
+    "ZkMorphAnimation_getDuration": (c_float, (c_void_p,)),
+    "ZkMorphAnimation_getFlags": (c_uint8, (c_void_p,)),
+    "ZkMorphAnimation_getFrame": (c_int32, (c_void_p,)),
+    "ZkMorphAnimation_getFrameCount": (c_size_t, (c_void_p,)),
+    "ZkMorphAnimation_getLayer": (c_int, (c_void_p,)),
+    "ZkMorphAnimation_getName": (ZkString, (c_void_p,)),
+    "ZkMorphAnimation_getNode": (ZkString, (c_void_p,)),
+    "ZkMorphAnimation_getSample": (Vec3f, (c_void_p, c_size_t)),
+    "ZkMorphAnimation_getSampleCount": (c_size_t, (c_void_p,)),
+    "ZkMorphAnimation_getSpeed": (c_float, (c_void_p,)),
+    "ZkMorphAnimation_getVertices": (POINTER(c_uint32), (c_void_p, POINTER(c_size_t))),
+    "ZkMorphMesh_del": (None, (c_void_p,)),
+    "ZkMorphMesh_getAnimation": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkMorphMesh_getAnimationCount": (c_size_t, (c_void_p,)),
+    "ZkMorphMesh_getMesh": (ZkPointer, (c_void_p,)),
+    "ZkMorphMesh_getMorphPosition": (Vec3f, (c_void_p, c_size_t)),
+    "ZkMorphMesh_getMorphPositionCount": (c_size_t, (c_void_p,)),
+    "ZkMorphMesh_getName": (ZkString, (c_void_p,)),
+    "ZkMorphMesh_getSource": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkMorphMesh_getSourceCount": (c_size_t, (c_void_p,)),
+    "ZkMorphMesh_load": (c_void_p, (c_void_p,)),
+    "ZkMorphSource_getFileDate": (Date, (c_void_p,)),
+    "ZkMorphSource_getFileName": (ZkString, (c_void_p,)),
+    "ZkMovableObject_getDamage": (c_int32, (c_void_p,)),
+    "ZkMovableObject_getDestroyed": (c_int, (c_void_p,)),
+    "ZkMovableObject_getFocusOverride": (c_int, (c_void_p,)),
+    "ZkMovableObject_getHp": (c_int32, (c_void_p,)),
+    "ZkMovableObject_getMaterial": (c_int, (c_void_p,)),
+    "ZkMovableObject_getMovable": (c_int, (c_void_p,)),
+    "ZkMovableObject_getName": (ZkString, (c_void_p,)),
+    "ZkMovableObject_getOwner": (ZkString, (c_void_p,)),
+    "ZkMovableObject_getOwnerGuild": (ZkString, (c_void_p,)),
+    "ZkMovableObject_getTakable": (c_int, (c_void_p,)),
+    "ZkMovableObject_getVisualDestroyed": (ZkString, (c_void_p,)),
+    "ZkMovableObject_setDamage": (None, (c_void_p, c_int32)),
+    "ZkMovableObject_setDestroyed": (None, (c_void_p, c_int)),
+    "ZkMovableObject_setFocusOverride": (None, (c_void_p, c_int)),
+    "ZkMovableObject_setHp": (None, (c_void_p, c_int32)),
+    "ZkMovableObject_setMaterial": (None, (c_void_p, c_int)),
+    "ZkMovableObject_setMovable": (None, (c_void_p, c_int)),
+    "ZkMovableObject_setName": (None, (c_void_p, c_char_p)),
+    "ZkMovableObject_setOwner": (None, (c_void_p, c_char_p)),
+    "ZkMovableObject_setOwnerGuild": (None, (c_void_p, c_char_p)),
+    "ZkMovableObject_setTakable": (None, (c_void_p, c_int)),
+    "ZkMovableObject_setVisualDestroyed": (None, (c_void_p, c_char_p)),
+    "ZkMover_getActKeyPosDelta": (Vec3f, (c_void_p,)),
+    "ZkMover_getActKeyframe": (c_int, (c_void_p,)),
+    "ZkMover_getActKeyframeF": (c_float, (c_void_p,)),
+    "ZkMover_getAdvanceDir": (c_float, (c_void_p,)),
+    "ZkMover_getAutoLink": (c_int, (c_void_p,)),
+    "ZkMover_getAutoRotate": (c_int, (c_void_p,)),
+    "ZkMover_getBehavior": (c_int, (c_void_p,)),
+    "ZkMover_getIsLocked": (c_int, (c_void_p,)),
+    "ZkMover_getKeyframe": (_Ref("zenkit.model_animation", "AnimationSample"), (c_void_p, c_size_t)),
+    "ZkMover_getKeyframeCount": (c_size_t, (c_void_p,)),
+    "ZkMover_getLerpType": (c_int, (c_void_p,)),
+    "ZkMover_getMoveSpeedUnit": (c_float, (c_void_p,)),
+    "ZkMover_getMoverState": (c_uint32, (c_void_p,)),
+    "ZkMover_getNextKeyframe": (c_int, (c_void_p,)),
+    "ZkMover_getSfxCloseEnd": (ZkString, (c_void_p,)),
+    "ZkMover_getSfxCloseStart": (ZkString, (c_void_p,)),
+    "ZkMover_getSfxLock": (ZkString, (c_void_p,)),
+    "ZkMover_getSfxOpenEnd": (ZkString, (c_void_p,)),
+    "ZkMover_getSfxOpenStart": (ZkString, (c_void_p,)),
+    "ZkMover_getSfxTransitioning": (ZkString, (c_void_p,)),
+    "ZkMover_getSfxUnlock": (ZkString, (c_void_p,)),
+    "ZkMover_getSfxUseLocked": (ZkString, (c_void_p,)),
+    "ZkMover_getSpeed": (c_float, (c_void_p,)),
+    "ZkMover_getSpeedType": (c_int, (c_void_p,)),
+    "ZkMover_getStayOpenTimeDest": (c_float, (c_void_p,)),
+    "ZkMover_getStayOpenTimeSeconds": (c_float, (c_void_p,)),
+    "ZkMover_getTouchBlockerDamage": (c_float, (c_void_p,)),
+    "ZkMover_getTriggerEventCount": (c_int, (c_void_p,)),
+    "ZkMover_setActKeyPosDelta": (None, (c_void_p, Vec3f)),
+    "ZkMover_setActKeyframe": (None, (c_void_p, c_int)),
+    "ZkMover_setActKeyframeF": (None, (c_void_p, c_float)),
+    "ZkMover_setAdvanceDir": (None, (c_void_p, c_float)),
+    "ZkMover_setAutoLink": (None, (c_void_p, c_int)),
+    "ZkMover_setAutoRotate": (None, (c_void_p, c_int)),
+    "ZkMover_setBehavior": (None, (c_void_p, c_int)),
+    "ZkMover_setIsLocked": (None, (c_void_p, c_int)),
+    "ZkMover_setLerpType": (None, (c_void_p, c_int)),
+    "ZkMover_setMoveSpeedUnit": (None, (c_void_p, c_float)),
+    "ZkMover_setMoverState": (None, (c_void_p, c_uint32)),
+    "ZkMover_setNextKeyframe": (None, (c_void_p, c_int)),
+    "ZkMover_setSfxCloseEnd": (None, (c_void_p, c_char_p)),
+    "ZkMover_setSfxCloseStart": (None, (c_void_p, c_char_p)),
+    "ZkMover_setSfxLock": (None, (c_void_p, c_char_p)),
+    "ZkMover_setSfxOpenEnd": (None, (c_void_p, c_char_p)),
+    "ZkMover_setSfxOpenStart": (None, (c_void_p, c_char_p)),
+    "ZkMover_setSfxTransitioning": (None, (c_void_p, c_char_p)),
+    "ZkMover_setSfxUnlock": (None, (c_void_p, c_char_p)),
+    "ZkMover_setSfxUseLocked": (None, (c_void_p, c_char_p)),
+    "ZkMover_setSpeed": (None, (c_void_p, c_float)),
+    "ZkMover_setSpeedType": (None, (c_void_p, c_int)),
+    "ZkMover_setStayOpenTimeDest": (None, (c_void_p, c_float)),
+    "ZkMover_setStayOpenTimeSeconds": (None, (c_void_p, c_float)),
+    "ZkMover_setTouchBlockerDamage": (None, (c_void_p, c_float)),
+    "ZkMover_setTriggerEventCount": (None, (c_void_p, c_int)),
+    "ZkMoverController_getKey": (c_int32, (c_void_p,)),
+    "ZkMoverController_getMessage": (c_int, (c_void_p,)),
+    "ZkMoverController_getTarget": (ZkString, (c_void_p,)),
+    "ZkMoverController_setKey": (None, (c_void_p, c_int32)),
+    "ZkMoverController_setMessage": (None, (c_void_p, c_int)),
+    "ZkMoverController_setTarget": (None, (c_void_p, c_char_p)),
+    "ZkMultiResolutionMesh_del": (None, (c_void_p,)),
+    "ZkMultiResolutionMesh_getAlphaTest": (c_int, (c_void_p,)),
+    "ZkMultiResolutionMesh_getBbox": (AxisAlignedBoundingBox, (c_void_p,)),
+    "ZkMultiResolutionMesh_getMaterial": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkMultiResolutionMesh_getMaterialCount": (c_size_t, (c_void_p,)),
+    "ZkMultiResolutionMesh_getNormal": (Vec3f, (c_void_p, c_size_t)),
+    "ZkMultiResolutionMesh_getNormalCount": (c_size_t, (c_void_p,)),
+    "ZkMultiResolutionMesh_getOrientedBbox": (ZkPointer, (c_void_p,)),
+    "ZkMultiResolutionMesh_getPosition": (Vec3f, (c_void_p, c_size_t)),
+    "ZkMultiResolutionMesh_getPositionCount": (c_size_t, (c_void_p,)),
+    "ZkMultiResolutionMesh_getSubMesh": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkMultiResolutionMesh_getSubMeshCount": (c_size_t, (c_void_p,)),
+    "ZkMultiResolutionMesh_load": (c_void_p, (c_void_p,)),
+    "ZkMusicJingleInstance_getLoop": (c_int32, (c_void_p,)),
+    "ZkMusicJingleInstance_getName": (ZkString, (c_void_p,)),
+    "ZkMusicJingleInstance_getTranssubtype": (c_int32, (c_void_p,)),
+    "ZkMusicJingleInstance_getVol": (c_float, (c_void_p,)),
+    "ZkMusicJingleInstance_setLoop": (None, (c_void_p, c_int32)),
+    "ZkMusicJingleInstance_setName": (None, (c_void_p, c_char_p)),
+    "ZkMusicJingleInstance_setTranssubtype": (None, (c_void_p, c_int32)),
+    "ZkMusicJingleInstance_setVol": (None, (c_void_p, c_float)),
+    "ZkMusicSystemInstance_getBitResolution": (c_int32, (c_void_p,)),
+    "ZkMusicSystemInstance_getGlobalReverbEnabled": (c_int32, (c_void_p,)),
+    "ZkMusicSystemInstance_getNumChannels": (c_int32, (c_void_p,)),
+    "ZkMusicSystemInstance_getReverbBufferSize": (c_int32, (c_void_p,)),
+    "ZkMusicSystemInstance_getSampleRate": (c_int32, (c_void_p,)),
+    "ZkMusicSystemInstance_getVolume": (c_float, (c_void_p,)),
+    "ZkMusicSystemInstance_setBitResolution": (None, (c_void_p, c_int32)),
+    "ZkMusicSystemInstance_setGlobalReverbEnabled": (None, (c_void_p, c_int32)),
+    "ZkMusicSystemInstance_setNumChannels": (None, (c_void_p, c_int32)),
+    "ZkMusicSystemInstance_setReverbBufferSize": (None, (c_void_p, c_int32)),
+    "ZkMusicSystemInstance_setSampleRate": (None, (c_void_p, c_int32)),
+    "ZkMusicSystemInstance_setVolume": (None, (c_void_p, c_float)),
+    "ZkMusicThemeInstance_getFile": (ZkString, (c_void_p,)),
+    "ZkMusicThemeInstance_getLoop": (c_int32, (c_void_p,)),
+    "ZkMusicThemeInstance_getReverbmix": (c_float, (c_void_p,)),
+    "ZkMusicThemeInstance_getReverbtime": (c_float, (c_void_p,)),
+    "ZkMusicThemeInstance_getTranssubtype": (c_int, (c_void_p,)),
+    "ZkMusicThemeInstance_getTranstype": (c_int, (c_void_p,)),
+    "ZkMusicThemeInstance_getVol": (c_float, (c_void_p,)),
+    "ZkMusicThemeInstance_setFile": (None, (c_void_p, c_char_p)),
+    "ZkMusicThemeInstance_setLoop": (None, (c_void_p, c_int32)),
+    "ZkMusicThemeInstance_setReverbmix": (None, (c_void_p, c_float)),
+    "ZkMusicThemeInstance_setReverbtime": (None, (c_void_p, c_float)),
+    "ZkMusicThemeInstance_setTranssubtype": (None, (c_void_p, c_int)),
+    "ZkMusicThemeInstance_setTranstype": (None, (c_void_p, c_int)),
+    "ZkMusicThemeInstance_setVol": (None, (c_void_p, c_float)),
+    "ZkNpcInstance_getAiVar": (c_int32, (c_void_p, c_size_t)),
+    "ZkNpcInstance_getAttribute": (c_int32, (c_void_p, c_int)),
+    "ZkNpcInstance_getBodyMass": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getBodyStateInterruptableOverride": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getDailyRoutine": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getDamage": (c_int32, (c_void_p, c_int)),
+    "ZkNpcInstance_getDamageType": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getEffect": (ZkString, (c_void_p,)),
+    "ZkNpcInstance_getExp": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getExpNext": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getFightTactic": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getFlags": (c_uint32, (c_void_p,)),
+    "ZkNpcInstance_getGuild": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getHitChance": (c_int32, (c_void_p, c_int)),
+    "ZkNpcInstance_getId": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getLevel": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getLp": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getMission": (c_int32, (c_void_p, c_int)),
+    "ZkNpcInstance_getName": (ZkString, (c_void_p, c_int)),
+    "ZkNpcInstance_getNoFocus": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getProtection": (c_int32, (c_void_p, c_int)),
+    "ZkNpcInstance_getSenses": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getSensesRange": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getSlot": (ZkString, (c_void_p,)),
+    "ZkNpcInstance_getSpawnDelay": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getSpawnPoint": (ZkString, (c_void_p,)),
+    "ZkNpcInstance_getStartAiState": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getType": (c_int, (c_void_p,)),
+    "ZkNpcInstance_getVoice": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getVoicePitch": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getWeapon": (c_int32, (c_void_p,)),
+    "ZkNpcInstance_getWp": (ZkString, (c_void_p,)),
+    "ZkNpcInstance_setAiVar": (None, (c_void_p, c_size_t, c_int32)),
+    "ZkNpcInstance_setAttribute": (None, (c_void_p, c_int, c_int32)),
+    "ZkNpcInstance_setBodyMass": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setBodyStateInterruptableOverride": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setDailyRoutine": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setDamage": (None, (c_void_p, c_int, c_int32)),
+    "ZkNpcInstance_setDamageType": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setEffect": (None, (c_void_p, c_char_p)),
+    "ZkNpcInstance_setExp": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setExpNext": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setFightTactic": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setFlags": (None, (c_void_p, c_uint32)),
+    "ZkNpcInstance_setGuild": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setHitChance": (None, (c_void_p, c_int, c_int32)),
+    "ZkNpcInstance_setId": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setLevel": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setLp": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setMission": (None, (c_void_p, c_int, c_int32)),
+    "ZkNpcInstance_setName": (None, (c_void_p, c_int, c_char_p)),
+    "ZkNpcInstance_setNoFocus": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setProtection": (None, (c_void_p, c_int, c_int32)),
+    "ZkNpcInstance_setSenses": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setSensesRange": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setSlot": (None, (c_void_p, c_char_p)),
+    "ZkNpcInstance_setSpawnDelay": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setSpawnPoint": (None, (c_void_p, c_char_p)),
+    "ZkNpcInstance_setStartAiState": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setType": (None, (c_void_p, c_int)),
+    "ZkNpcInstance_setVoice": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setVoicePitch": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setWeapon": (None, (c_void_p, c_int32)),
+    "ZkNpcInstance_setWp": (None, (c_void_p, c_char_p)),
+    "ZkObject_takeRef": (ZkPointer, (c_void_p,)),
+    "ZkOrientedBoundingBox_getAxis": (Vec3f, (c_void_p,)),
+    "ZkOrientedBoundingBox_getCenter": (Vec3f, (c_void_p,)),
+    "ZkOrientedBoundingBox_getChild": (c_void_p, (c_void_p, c_size_t)),
+    "ZkOrientedBoundingBox_getChildCount": (c_size_t, (c_void_p,)),
+    "ZkOrientedBoundingBox_getHalfWidth": (Vec3f, (c_void_p,)),
+    "ZkOrientedBoundingBox_toAabb": (AxisAlignedBoundingBox, (c_void_p,)),
+    "ZkParticleEffectController_getEffectName": (ZkString, (c_void_p,)),
+    "ZkParticleEffectController_getInitiallyRunning": (c_int, (c_void_p,)),
+    "ZkParticleEffectController_getKillWhenDone": (c_int, (c_void_p,)),
+    "ZkParticleEffectController_setEffectName": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectController_setInitiallyRunning": (None, (c_void_p, c_int)),
+    "ZkParticleEffectController_setKillWhenDone": (None, (c_void_p, c_int)),
+    "ZkParticleEffectEmitKeyInstance_getEmCheckCollision": (c_int32, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getEmCreateFxId": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getEmFlyGravity": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getEmFxLifespan": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getEmSelfRotVelS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getEmTrjEaseVel": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getEmTrjModeS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getLightPresetName": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getLightRange": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxDirForS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxDirModeS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxDirModeTargetForS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxDirModeTargetPosS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxFlyGravityS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxLspPartAvg": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxPpsIsLoopingChg": (c_int32, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxPpsIsSmoothChg": (c_int32, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxPpsValue": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxScTime": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxShpDimS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxShpDistribTypeS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxShpDistribWalksPeed": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxShpIsVolumeChg": (c_int32, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxShpOffsetVecS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxShpScaleFps": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxVelAvg": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getPfxVisAlphaStart": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getScaleDuration": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getSfxId": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getSfxIsAmbient": (c_int32, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getVisNameS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_getVisSizeScale": (c_float, (c_void_p,)),
+    "ZkParticleEffectEmitKeyInstance_setEmCheckCollision": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectEmitKeyInstance_setEmCreateFxId": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setEmFlyGravity": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setEmFxLifespan": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setEmSelfRotVelS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setEmTrjEaseVel": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setEmTrjModeS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setLightPresetName": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setLightRange": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setPfxDirForS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setPfxDirModeS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setPfxDirModeTargetForS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setPfxDirModeTargetPosS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setPfxFlyGravityS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setPfxLspPartAvg": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setPfxPpsIsLoopingChg": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectEmitKeyInstance_setPfxPpsIsSmoothChg": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectEmitKeyInstance_setPfxPpsValue": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setPfxScTime": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setPfxShpDimS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setPfxShpDistribTypeS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setPfxShpDistribWalksPeed": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setPfxShpIsVolumeChg": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectEmitKeyInstance_setPfxShpOffsetVecS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setPfxShpScaleFps": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setPfxVelAvg": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setPfxVisAlphaStart": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setScaleDuration": (None, (c_void_p, c_float)),
+    "ZkParticleEffectEmitKeyInstance_setSfxId": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setSfxIsAmbient": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectEmitKeyInstance_setVisNameS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectEmitKeyInstance_setVisSizeScale": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_getDirAngleElev": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getDirAngleElevVar": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getDirAngleHead": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getDirAngleHeadVar": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getDirForS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getDirModeS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getDirModeTargetForS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getDirModeTargetPosS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getFlockMode": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getFlockStrength": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getFlyColldetB": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_getFlyGravityS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getLspPartAvg": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getLspPartVar": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getMBiasAmbientPfx": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_getMrkFadesPeed": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getMrkSize": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getMrktExtureS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getPpsCreateEmDelay": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getPpsCreateEmS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getPpsFps": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getPpsIsLooping": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_getPpsIsSmooth": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_getPpsScaleKeysS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getPpsValue": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpDimS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpDistribTypeS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpDistribWalkSpeed": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpForS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpIsVolume": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpMeshRenderB": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpMeshS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpOffsetVecS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpScaleFps": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpScaleIsLooping": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpScaleIsSmooth": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpScaleKeysS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getShpTypeS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getTimeStartEndS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getTrlFadeSpeed": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getTrlTextureS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getTrlWidth": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getUseEmittersFor": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_getVelAvg": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getVelVar": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisAlphaEnd": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisAlphaFuncS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisAlphaStart": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisNameS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisOrientationS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisSizeEndScale": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisSizeStartS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisTexAniFps": (c_float, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisTexAniIsLooping": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisTexColorEndS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisTexColorStartS": (ZkString, (c_void_p,)),
+    "ZkParticleEffectInstance_getVisTexIsQuadpoly": (c_int32, (c_void_p,)),
+    "ZkParticleEffectInstance_setDirAngleElev": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setDirAngleElevVar": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setDirAngleHead": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setDirAngleHeadVar": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setDirForS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setDirModeS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setDirModeTargetForS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setDirModeTargetPosS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setFlockMode": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setFlockStrength": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setFlyColldetB": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectInstance_setFlyGravityS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setLspPartAvg": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setLspPartVar": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setMBiasAmbientPfx": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectInstance_setMrkFadesPeed": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setMrkSize": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setMrktExtureS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setPpsCreateEmDelay": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setPpsCreateEmS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setPpsFps": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setPpsIsLooping": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectInstance_setPpsIsSmooth": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectInstance_setPpsScaleKeysS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setPpsValue": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setShpDimS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setShpDistribTypeS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setShpDistribWalkSpeed": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setShpForS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setShpIsVolume": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectInstance_setShpMeshRenderB": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectInstance_setShpMeshS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setShpOffsetVecS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setShpScaleFps": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setShpScaleIsLooping": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectInstance_setShpScaleIsSmooth": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectInstance_setShpScaleKeysS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setShpTypeS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setTimeStartEndS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setTrlFadeSpeed": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setTrlTextureS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setTrlWidth": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setUseEmittersFor": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectInstance_setVelAvg": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setVelVar": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setVisAlphaEnd": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setVisAlphaFuncS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setVisAlphaStart": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setVisNameS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setVisOrientationS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setVisSizeEndScale": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setVisSizeStartS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setVisTexAniFps": (None, (c_void_p, c_float)),
+    "ZkParticleEffectInstance_setVisTexAniIsLooping": (None, (c_void_p, c_int32)),
+    "ZkParticleEffectInstance_setVisTexColorEndS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setVisTexColorStartS": (None, (c_void_p, c_char_p)),
+    "ZkParticleEffectInstance_setVisTexIsQuadpoly": (None, (c_void_p, c_int32)),
+    "ZkPolygon_getFeatureIndices": (POINTER(c_uint32), (c_void_p, c_void_p, POINTER(c_size_t))),
+    "ZkPolygon_getIsDynamicallyLit": (c_int, (c_void_p,)),
+    "ZkPolygon_getIsGhostOccluder": (c_int, (c_void_p,)),
+    "ZkPolygon_getIsLod": (c_int, (c_void_p,)),
+    "ZkPolygon_getIsOccluder": (c_int, (c_void_p,)),
+    "ZkPolygon_getIsOutdoor": (c_int, (c_void_p,)),
+    "ZkPolygon_getIsPortal": (c_int, (c_void_p,)),
+    "ZkPolygon_getIsSector": (c_int, (c_void_p,)),
+    "ZkPolygon_getLightMapIndex": (c_int32, (c_void_p,)),
+    "ZkPolygon_getMaterialIndex": (c_uint32, (c_void_p,)),
+    "ZkPolygon_getNormalAxis": (c_uint8, (c_void_p,)),
+    "ZkPolygon_getPositionIndices": (POINTER(c_uint32), (c_void_p, c_void_p, POINTER(c_size_t))),
+    "ZkPolygon_getSectorIndex": (c_int16, (c_void_p,)),
+    "ZkPolygon_getShouldRelight": (c_int, (c_void_p,)),
+    "ZkRead_del": (None, (c_void_p,)),
+    "ZkRead_getBytes": (c_size_t, (c_void_p, c_void_p, c_size_t)),
+    "ZkRead_getSize": (c_size_t, (c_void_p,)),
+    "ZkRead_newExt": (c_void_p, (c_void_p, _Ref("zenkit.stream", "_ReadExt"))),
+    "ZkRead_newMem": (c_void_p, (c_void_p, c_size_t)),
+    "ZkRead_newPath": (c_void_p, (c_char_p,)),
+    "ZkSoftSkinMesh_getBbox": (ZkPointer, (c_void_p,)),
+    "ZkSoftSkinMesh_getMesh": (ZkPointer, (c_void_p,)),
+    "ZkSoftSkinMesh_getNodeCount": (c_size_t, (c_void_p,)),
+    "ZkSoftSkinMesh_getNodes": (POINTER(c_int), (c_void_p, POINTER(c_size_t))),
+    "ZkSoftSkinMesh_getWedgeNormal": (_Ref("zenkit.soft_skin_mesh", "SoftSkinWedgeNormal"), (c_void_p, c_size_t)),
+    "ZkSoftSkinMesh_getWedgeNormalCount": (c_size_t, (c_void_p,)),
+    "ZkSoftSkinMesh_getWeight": (_Ref("zenkit.soft_skin_mesh", "SoftSkinWeight"), (c_void_p, c_size_t, c_size_t)),
+    "ZkSoftSkinMesh_getWeightCount": (c_size_t, (c_void_p, c_size_t)),
+    "ZkSoftSkinMesh_getWeightTotal": (c_size_t, (c_void_p,)),
+    "ZkSound_getAmbient3d": (c_int, (c_void_p,)),
+    "ZkSound_getConeAngle": (c_float, (c_void_p,)),
+    "ZkSound_getInitiallyPlaying": (c_int, (c_void_p,)),
+    "ZkSound_getIsAllowedToRun": (c_int, (c_void_p,)),
+    "ZkSound_getIsRunning": (c_int, (c_void_p,)),
+    "ZkSound_getMode": (c_int, (c_void_p,)),
+    "ZkSound_getObstruction": (c_int, (c_void_p,)),
+    "ZkSound_getRadius": (c_float, (c_void_p,)),
+    "ZkSound_getRandomDelay": (c_float, (c_void_p,)),
+    "ZkSound_getRandomDelayVar": (c_float, (c_void_p,)),
+    "ZkSound_getSoundName": (ZkString, (c_void_p,)),
+    "ZkSound_getVolume": (c_float, (c_void_p,)),
+    "ZkSound_getVolumeType": (c_int, (c_void_p,)),
+    "ZkSound_setAmbient3d": (None, (c_void_p, c_int)),
+    "ZkSound_setConeAngle": (None, (c_void_p, c_float)),
+    "ZkSound_setInitiallyPlaying": (None, (c_void_p, c_int)),
+    "ZkSound_setIsAllowedToRun": (None, (c_void_p, c_int)),
+    "ZkSound_setIsRunning": (None, (c_void_p, c_int)),
+    "ZkSound_setMode": (None, (c_void_p, c_int)),
+    "ZkSound_setObstruction": (None, (c_void_p, c_int)),
+    "ZkSound_setRadius": (None, (c_void_p, c_float)),
+    "ZkSound_setRandomDelay": (None, (c_void_p, c_float)),
+    "ZkSound_setRandomDelayVar": (None, (c_void_p, c_float)),
+    "ZkSound_setSoundName": (None, (c_void_p, c_char_p)),
+    "ZkSound_setVolume": (None, (c_void_p, c_float)),
+    "ZkSound_setVolumeType": (None, (c_void_p, c_int)),
+    "ZkSoundDaytime_getEndTime": (c_float, (c_void_p,)),
+    "ZkSoundDaytime_getSoundNameDaytime": (ZkString, (c_void_p,)),
+    "ZkSoundDaytime_getStartTime": (c_float, (c_void_p,)),
+    "ZkSoundDaytime_setEndTime": (None, (c_void_p, c_float)),
+    "ZkSoundDaytime_setSoundNameDaytime": (None, (c_void_p, c_char_p)),
+    "ZkSoundDaytime_setStartTime": (None, (c_void_p, c_float)),
+    "ZkSoundEffectInstance_getFile": (ZkString, (c_void_p,)),
+    "ZkSoundEffectInstance_getLoop": (c_int32, (c_void_p,)),
+    "ZkSoundEffectInstance_getLoopEndOffset": (c_int32, (c_void_p,)),
+    "ZkSoundEffectInstance_getLoopStartOffset": (c_int32, (c_void_p,)),
+    "ZkSoundEffectInstance_getPfxName": (ZkString, (c_void_p,)),
+    "ZkSoundEffectInstance_getPitchOff": (c_int32, (c_void_p,)),
+    "ZkSoundEffectInstance_getPitchVar": (c_int32, (c_void_p,)),
+    "ZkSoundEffectInstance_getReverbLevel": (c_float, (c_void_p,)),
+    "ZkSoundEffectInstance_getVolume": (c_int32, (c_void_p,)),
+    "ZkSoundEffectInstance_setFile": (None, (c_void_p, c_char_p)),
+    "ZkSoundEffectInstance_setLoop": (None, (c_void_p, c_int32)),
+    "ZkSoundEffectInstance_setLoopEndOffset": (None, (c_void_p, c_int32)),
+    "ZkSoundEffectInstance_setLoopStartOffset": (None, (c_void_p, c_int32)),
+    "ZkSoundEffectInstance_setPfxName": (None, (c_void_p, c_char_p)),
+    "ZkSoundEffectInstance_setPitchOff": (None, (c_void_p, c_int32)),
+    "ZkSoundEffectInstance_setPitchVar": (None, (c_void_p, c_int32)),
+    "ZkSoundEffectInstance_setReverbLevel": (None, (c_void_p, c_float)),
+    "ZkSoundEffectInstance_setVolume": (None, (c_void_p, c_int32)),
+    "ZkSoundSystemInstance_getBitResolution": (c_int32, (c_void_p,)),
+    "ZkSoundSystemInstance_getNumSfxChannels": (c_int32, (c_void_p,)),
+    "ZkSoundSystemInstance_getSampleRate": (c_int32, (c_void_p,)),
+    "ZkSoundSystemInstance_getUseStereo": (c_int32, (c_void_p,)),
+    "ZkSoundSystemInstance_getUsed3DProviderName": (ZkString, (c_void_p,)),
+    "ZkSoundSystemInstance_getVolume": (c_float, (c_void_p,)),
+    "ZkSoundSystemInstance_setBitResolution": (None, (c_void_p, c_int32)),
+    "ZkSoundSystemInstance_setNumSfxChannels": (None, (c_void_p, c_int32)),
+    "ZkSoundSystemInstance_setSampleRate": (None, (c_void_p, c_int32)),
+    "ZkSoundSystemInstance_setUseStereo": (None, (c_void_p, c_int32)),
+    "ZkSoundSystemInstance_setUsed3DProviderName": (None, (c_void_p, c_char_p)),
+    "ZkSoundSystemInstance_setVolume": (None, (c_void_p, c_float)),
+    "ZkSpellInstance_getCanChangeTargetDuringInvest": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getCanTurnDuringInvest": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getDamagePerLevel": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getDamageType": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getIsMultiEffect": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getSpellType": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getTargetCollectAlgo": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getTargetCollectAzi": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getTargetCollectElevation": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getTargetCollectRange": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getTargetCollectType": (c_int32, (c_void_p,)),
+    "ZkSpellInstance_getTimePerMana": (c_float, (c_void_p,)),
+    "ZkSpellInstance_setCanChangeTargetDuringInvest": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setCanTurnDuringInvest": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setDamagePerLevel": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setDamageType": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setIsMultiEffect": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setSpellType": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setTargetCollectAlgo": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setTargetCollectAzi": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setTargetCollectElevation": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setTargetCollectRange": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setTargetCollectType": (None, (c_void_p, c_int32)),
+    "ZkSpellInstance_setTimePerMana": (None, (c_void_p, c_float)),
+    "ZkSubMesh_getColors": (POINTER(c_float), (c_void_p, POINTER(c_size_t))),
+    "ZkSubMesh_getEdgeScores": (POINTER(c_float), (c_void_p, POINTER(c_size_t))),
+    "ZkSubMesh_getEdges": (
+        _Ref("zenkit.multi_resolution_mesh", "MeshEdge", pointer=True),
+        (c_void_p, POINTER(c_size_t)),
+    ),
+    "ZkSubMesh_getMaterial": (ZkPointer, (c_void_p,)),
+    "ZkSubMesh_getTriangleEdges": (
+        _Ref("zenkit.multi_resolution_mesh", "MeshTriangleEdge", pointer=True),
+        (c_void_p, POINTER(c_size_t)),
+    ),
+    "ZkSubMesh_getTrianglePlane": (_Ref("zenkit.multi_resolution_mesh", "MeshPlane"), (c_void_p, c_size_t)),
+    "ZkSubMesh_getTrianglePlaneCount": (c_size_t, (c_void_p,)),
+    "ZkSubMesh_getTrianglePlaneIndices": (POINTER(c_uint16), (c_void_p, POINTER(c_size_t))),
+    "ZkSubMesh_getTriangles": (
+        _Ref("zenkit.multi_resolution_mesh", "MeshTriangle", pointer=True),
+        (c_void_p, POINTER(c_size_t)),
+    ),
+    "ZkSubMesh_getWedge": (_Ref("zenkit.multi_resolution_mesh", "MeshWedge"), (c_void_p, c_size_t)),
+    "ZkSubMesh_getWedgeCount": (c_size_t, (c_void_p,)),
+    "ZkSubMesh_getWedgeMap": (POINTER(c_uint16), (c_void_p, POINTER(c_size_t))),
+    "ZkSvmInstance_getAargh1": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAargh2": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAargh3": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAbsCommander": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAbsFarm": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAbsGood": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAbsMonastery": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonAncientGhostNotNear": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonDieBandit": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonDieMonster": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonDieMonster2": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonDirtyPirate": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonGoldDescription": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonMonsterKilled": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonMonsterKilled2": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonNoArmorBdt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonOpenAdanosTemple": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonSummonAncientGhost": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonThisLittleBastard": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonWrongArmor": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonWrongArmorKdf": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonWrongArmorMil": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAddonWrongArmorSld": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAlGreetings": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAlarm": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAttackCrime": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAttentatAddonContra": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAttentatAddonDescription": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAttentatAddonDescription2": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAttentatAddonPro": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getAwake": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getBehindYou": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getBerzerk": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getCantReadThis": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getCantUnderstandThis": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getCheerFight": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getCheerFriend": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getCheerFriend01": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getCheerFriend02": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getCheerFriend03": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getCityCrime": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getCough": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getDead": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getDieEnemy": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getDieMonster": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getDieMortalEnemy": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getDieStupidBeast": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getDirtyThief": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getDoesntMork": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getDontKnow": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getEnemyKilled": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getFarmCrime": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getFoundTreasure": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getFriendlyGreetings": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGalgen": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGalgen2Kaserne": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGalgen2Markt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGalgen2Tempel": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGetOutOfHere": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGetOutOfMyBed": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGetThingsRight": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGetUpAndBegone": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGiveItTome": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold10": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold100": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold1000": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold150": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold20": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold200": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold250": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold30": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold300": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold350": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold40": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold400": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold450": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold50": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold500": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold550": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold60": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold600": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold650": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold70": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold700": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold750": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold80": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold800": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold850": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold90": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold900": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGold950": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGoodKill": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGoodMonsterKill": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGoodVictory": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getGuards": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHafen": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHafen2Unterstadt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHandsOff": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHeDefeatedhim": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHeDeservEdit": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHeKilledHim": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHealLastShrine": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHealShrine": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHelp": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHeyHeyHey": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHeyYou": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getHui": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getIGetYouStill": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getISaidStopMagic": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getISaidWeaponDown": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getISaidWhatDoYouWant": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getITakeYourWeapon": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getITookYourGold": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getITookYourOre": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getIWillTeachYouRespectForForeignProperty": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getIntruderAlert": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getIrdorathThereYouAre": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getItWasAGoodFight": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getKaserne": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getKaserne2Galgen": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getKaserne2Markt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getKeyMissing": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getKillEnemy": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getKillMurderer": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getLetsForgetOurLittleFight": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getLookAway": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getLookingForTroubleAgain": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMageGreetings": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMakeWay": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMarkt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMarkt2Galgen": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMarkt2Kaserne": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMarkt2Tempel": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMilCityCrime": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMilGreetings": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMineAddonDescription": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMissingItem": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMonaCrime": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMonsterKilled": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getMurderCrime": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNeedKey": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNeverEnterRoomAgain": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNeverHitMeAgain": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNeverOpen": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNeverTryThatAgain": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNextTimeYoureInForIt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNoLearnNoPoints": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNoLearnOverMax": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNoLearnOverPersonalMax": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNoLearnYouAlreadyKnow": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNoLearnYoureBetter": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNoMorePicks": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNoPickLockTalent": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNoSweeping": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNotBad": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNotNow": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNothingToGet": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNothingToGet02": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNothingToGet03": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNowWait": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getNowWaitIntruder": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOberstadt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOberstadt2Unterstadt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOcCrime": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOhMyGodHesDown": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOhMyGodItsAFight": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOhMyHead": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOkayKeepIt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOm": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOoh": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOoh01": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOoh02": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOoh03": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getOutOfMyWay": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getPalCityCrime": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getPalGreetings": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getPickBroke": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getPickLockMissing": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getPickLockOrKeyMissing": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getRumfummlerDown": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getRunAway": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getRunCoward": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getScHeyTurnAround": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getScHeyTurnAround02": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getScHeyTurnAround03": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getScHeyTurnAround04": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getScHeyWaitASecond": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getScOpensIrdorathBook": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getScOpensLastDoor": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSectGreetings": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSheepAttackerDown": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSheepKiller": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSheepKillerCrime": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSheepKillerMonster": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getShitNoGold": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getShitNoOre": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getShitWhatAMonster": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk01": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk02": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk03": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk04": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk05": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk06": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk07": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk08": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk09": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk10": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk11": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk12": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk13": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk14": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk15": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk16": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk17": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk18": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk19": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk20": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk21": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk22": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk23": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk24": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk25": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk26": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk27": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk28": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk29": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSmalltalk30": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSpareMe": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getStoleUromMage": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getStoneplate1": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getStoneplate2": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getStoneplate3": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getStopMagic": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getStrange": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getStupidBeastKilled": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSuckerDefeatedEbr": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSuckerDefeatedGur": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSuckerDefeatedMage": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSuckerDefeatedNovGuard": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSuckerDefeatedVlkGuard": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getSuckerGotSome": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getTempel": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getTempel2Galgen": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getTempel2Markt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getTempel2Unterstadt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getThatsMyWeapon": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getTheftCrime": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getThenIBeatYouOutOfHere": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getThereHeIs": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getThereIsNoFightingHere": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getTheresAFight": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getTheyKilledMyFriend": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getThiefDown": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getToughguyAttackLost": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getToughguyAttackWon": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getToughguyPlayerAttack": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getTrade1": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getTrade2": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getTrade3": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getUnterstadt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getUnterstadt2Hafen": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getUnterstadt2Oberstadt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getUnterstadt2Tempel": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getVerstehe": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWatchYourAim": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWatchYourAimAngry": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWeWillMeetAgain": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWeaponDown": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWeather": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWhatAreYouDoing": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWhatDidYouDoInThere": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWhatDidYouInThere": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWhatDoYouWant": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWhatWasThat": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWhatsThat": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWhatsThisSupposedToBe": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWhereto": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWhyAreYouInHere": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWillYouStopFighting": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getWiseMove": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYeahWellDone": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYesGoOutOfHere": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYesYes": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouAskedForIt": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouAttackedMyCharge": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouBetterShouldHaveListened": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouCanKeepTheCrap": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouDareHitMe": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouDeafOrWhat": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouDefeatedMeWell": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouDefeatedMyComrade": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouDefeatedNovGuard": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouDefeatedVlkGuard": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouDisturbedMySlumber": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouKilledEbr": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouKilledGur": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouKilledMage": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouKilledNcFolk": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouKilledOcFolk": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouKilledOneOfUs": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouKilledPsiFolk": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouKilledmyfriend": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouLearnedSomething": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouMurderer": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouStillNotHaveEnough": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouStoleFromEbr": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouStoleFromGur": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouStoleFromMe": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouStoleFromUs": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouViolatedForbiddenTerritory": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYouWannaFoolMe": (ZkString, (c_void_p,)),
+    "ZkSvmInstance_getYoullBeSorryForThis": (ZkString, (c_void_p,)),
+    "ZkTexture_del": (None, (c_void_p,)),
+    "ZkTexture_enumeratePaletteItems": (None, (c_void_p, c_void_p, c_void_p)),
+    "ZkTexture_getAverageColor": (c_uint, (c_void_p,)),
+    "ZkTexture_getFormat": (c_int, (c_void_p,)),
+    "ZkTexture_getHeight": (c_uint, (c_void_p,)),
+    "ZkTexture_getHeightMipmap": (c_uint, (c_void_p, c_size_t)),
+    "ZkTexture_getHeightRef": (c_uint, (c_void_p,)),
+    "ZkTexture_getMipmapCount": (c_size_t, (c_void_p,)),
+    "ZkTexture_getMipmapRaw": (c_void_p, (c_void_p, c_size_t, POINTER(c_size_t))),
+    "ZkTexture_getMipmapRgba": (c_size_t, (c_void_p, c_size_t, c_void_p, c_size_t)),
+    "ZkTexture_getPaletteItem": (c_uint, (c_void_p, c_size_t)),
+    "ZkTexture_getPaletteSize": (c_size_t, (c_void_p,)),
+    "ZkTexture_getWidth": (c_uint, (c_void_p,)),
+    "ZkTexture_getWidthMipmap": (c_uint, (c_void_p, c_size_t)),
+    "ZkTexture_getWidthRef": (c_uint, (c_void_p,)),
+    "ZkTexture_load": (c_void_p, (c_void_p,)),
+    "ZkTextureBuilder_addMipmap": (c_int, (c_void_p, c_void_p, c_size_t, c_int)),
+    "ZkTextureBuilder_build": (ZkPointer, (c_void_p, c_int)),
+    "ZkTextureBuilder_del": (None, (c_void_p,)),
+    "ZkTextureBuilder_new": (ZkPointer, (c_size_t, c_size_t)),
+    "ZkTouchDamage_getCollisionType": (c_int, (c_void_p,)),
+    "ZkTouchDamage_getDamage": (c_float, (c_void_p,)),
+    "ZkTouchDamage_getIsBarrier": (c_int, (c_void_p,)),
+    "ZkTouchDamage_getIsBlunt": (c_int, (c_void_p,)),
+    "ZkTouchDamage_getIsEdge": (c_int, (c_void_p,)),
+    "ZkTouchDamage_getIsFall": (c_int, (c_void_p,)),
+    "ZkTouchDamage_getIsFire": (c_int, (c_void_p,)),
+    "ZkTouchDamage_getIsFly": (c_int, (c_void_p,)),
+    "ZkTouchDamage_getIsMagic": (c_int, (c_void_p,)),
+    "ZkTouchDamage_getIsPoint": (c_int, (c_void_p,)),
+    "ZkTouchDamage_getRepeatDelaySeconds": (c_float, (c_void_p,)),
+    "ZkTouchDamage_getVolumeScale": (c_float, (c_void_p,)),
+    "ZkTouchDamage_setCollisionType": (None, (c_void_p, c_int)),
+    "ZkTouchDamage_setDamage": (None, (c_void_p, c_float)),
+    "ZkTouchDamage_setIsBarrier": (None, (c_void_p, c_int)),
+    "ZkTouchDamage_setIsBlunt": (None, (c_void_p, c_int)),
+    "ZkTouchDamage_setIsEdge": (None, (c_void_p, c_int)),
+    "ZkTouchDamage_setIsFall": (None, (c_void_p, c_int)),
+    "ZkTouchDamage_setIsFire": (None, (c_void_p, c_int)),
+    "ZkTouchDamage_setIsFly": (None, (c_void_p, c_int)),
+    "ZkTouchDamage_setIsMagic": (None, (c_void_p, c_int)),
+    "ZkTouchDamage_setIsPoint": (None, (c_void_p, c_int)),
+    "ZkTouchDamage_setRepeatDelaySeconds": (None, (c_void_p, c_float)),
+    "ZkTouchDamage_setVolumeScale": (None, (c_void_p, c_float)),
+    "ZkTrigger_getCountCanBeActivated": (c_int, (c_void_p,)),
+    "ZkTrigger_getDamageThreshold": (c_float, (c_void_p,)),
+    "ZkTrigger_getFireDelaySeconds": (c_float, (c_void_p,)),
+    "ZkTrigger_getIsEnabled": (c_int, (c_void_p,)),
+    "ZkTrigger_getMaxActivationCount": (c_int32, (c_void_p,)),
+    "ZkTrigger_getNextTimeTriggerable": (c_float, (c_void_p,)),
+    "ZkTrigger_getOtherVob": (ZkPointer, (c_void_p,)),
+    "ZkTrigger_getReactToOnDamage": (c_int, (c_void_p,)),
+    "ZkTrigger_getReactToOnTouch": (c_int, (c_void_p,)),
+    "ZkTrigger_getReactToOnTrigger": (c_int, (c_void_p,)),
+    "ZkTrigger_getRespondToNPC": (c_int, (c_void_p,)),
+    "ZkTrigger_getRespondToObject": (c_int, (c_void_p,)),
+    "ZkTrigger_getRespondToPC": (c_int, (c_void_p,)),
+    "ZkTrigger_getRetriggerDelaySeconds": (c_float, (c_void_p,)),
+    "ZkTrigger_getSendUntrigger": (c_int, (c_void_p,)),
+    "ZkTrigger_getStartEnabled": (c_int, (c_void_p,)),
+    "ZkTrigger_getTarget": (ZkString, (c_void_p,)),
+    "ZkTrigger_getVobTarget": (ZkString, (c_void_p,)),
+    "ZkTrigger_setCountCanBeActivated": (None, (c_void_p, c_int)),
+    "ZkTrigger_setDamageThreshold": (None, (c_void_p, c_float)),
+    "ZkTrigger_setFireDelaySeconds": (None, (c_void_p, c_float)),
+    "ZkTrigger_setIsEnabled": (None, (c_void_p, c_int)),
+    "ZkTrigger_setMaxActivationCount": (None, (c_void_p, c_int32)),
+    "ZkTrigger_setNextTimeTriggerable": (None, (c_void_p, c_float)),
+    "ZkTrigger_setOtherVob": (None, (c_void_p, c_void_p)),
+    "ZkTrigger_setReactToOnDamage": (None, (c_void_p, c_int)),
+    "ZkTrigger_setReactToOnTouch": (None, (c_void_p, c_int)),
+    "ZkTrigger_setReactToOnTrigger": (None, (c_void_p, c_int)),
+    "ZkTrigger_setRespondToNPC": (None, (c_void_p, c_int)),
+    "ZkTrigger_setRespondToObject": (None, (c_void_p, c_int)),
+    "ZkTrigger_setRespondToPC": (None, (c_void_p, c_int)),
+    "ZkTrigger_setRetriggerDelaySeconds": (None, (c_void_p, c_float)),
+    "ZkTrigger_setSendUntrigger": (None, (c_void_p, c_int)),
+    "ZkTrigger_setStartEnabled": (None, (c_void_p, c_int)),
+    "ZkTrigger_setTarget": (None, (c_void_p, c_char_p)),
+    "ZkTrigger_setVobTarget": (None, (c_void_p, c_char_p)),
+    "ZkTriggerChangeLevel_getLevelName": (ZkString, (c_void_p,)),
+    "ZkTriggerChangeLevel_getStartVob": (ZkString, (c_void_p,)),
+    "ZkTriggerChangeLevel_setLevelName": (None, (c_void_p, c_char_p)),
+    "ZkTriggerChangeLevel_setStartVob": (None, (c_void_p, c_char_p)),
+    "ZkTriggerList_getActTarget": (c_uint8, (c_void_p,)),
+    "ZkTriggerList_getMode": (c_int, (c_void_p,)),
+    "ZkTriggerList_getSendOnTrigger": (c_int, (c_void_p,)),
+    "ZkTriggerList_getTarget": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkTriggerList_getTargetCount": (c_size_t, (c_void_p,)),
+    "ZkTriggerList_setActTarget": (None, (c_void_p, c_uint8)),
+    "ZkTriggerList_setMode": (None, (c_void_p, c_int)),
+    "ZkTriggerList_setSendOnTrigger": (None, (c_void_p, c_int)),
+    "ZkTriggerListTarget_getDelaySeconds": (c_float, (c_void_p,)),
+    "ZkTriggerListTarget_getName": (ZkString, (c_void_p,)),
+    "ZkTriggerScript_getFunction": (ZkString, (c_void_p,)),
+    "ZkTriggerScript_setFunction": (None, (c_void_p, c_char_p)),
+    "ZkTriggerUntouch_getTarget": (ZkString, (c_void_p,)),
+    "ZkTriggerUntouch_setTarget": (None, (c_void_p, c_char_p)),
+    "ZkTriggerWorldStart_getFireOnce": (c_int, (c_void_p,)),
+    "ZkTriggerWorldStart_getHasFired": (c_int, (c_void_p,)),
+    "ZkTriggerWorldStart_getTarget": (ZkString, (c_void_p,)),
+    "ZkTriggerWorldStart_setFireOnce": (None, (c_void_p, c_int)),
+    "ZkTriggerWorldStart_setHasFired": (None, (c_void_p, c_int)),
+    "ZkTriggerWorldStart_setTarget": (None, (c_void_p, c_char_p)),
+    "ZkVfs_del": (None, (c_void_p,)),
+    "ZkVfs_findNode": (c_void_p, (c_void_p, c_char_p)),
+    "ZkVfs_getRoot": (c_void_p, (c_void_p,)),
+    "ZkVfs_mkdir": (c_void_p, (c_void_p, c_char_p)),
+    "ZkVfs_mountDiskHost": (None, (c_void_p, c_char_p, c_int)),
+    "ZkVfs_mountHost": (None, (c_void_p, c_char_p, c_char_p, c_int)),
+    "ZkVfs_new": (c_void_p, ()),
+    "ZkVfs_remove": (c_int, (c_void_p, c_char_p)),
+    "ZkVfs_resolvePath": (c_void_p, (c_void_p, c_char_p)),
+    "ZkVfs_save": (None, (c_void_p, c_char_p, c_int, c_int)),
+    "ZkVfsNode_create": (c_void_p, (c_void_p, c_void_p)),
+    "ZkVfsNode_del": (None, (c_void_p,)),
+    "ZkVfsNode_enumerateChildren": (None, (c_void_p, c_void_p, c_void_p)),
+    "ZkVfsNode_getChild": (c_void_p, (c_void_p, c_char_p)),
+    "ZkVfsNode_getName": (c_char_p, (c_void_p,)),
+    "ZkVfsNode_getTime": (c_long, (c_void_p,)),
+    "ZkVfsNode_isDir": (c_int, (c_void_p,)),
+    "ZkVfsNode_isFile": (c_int, (c_void_p,)),
+    "ZkVfsNode_newDir": (c_void_p, (c_char_p, c_long)),
+    "ZkVfsNode_newFile": (c_void_p, (c_char_p, c_void_p, c_size_t, c_long)),
+    "ZkVfsNode_open": (c_void_p, (c_void_p,)),
+    "ZkVfsNode_remove": (c_int, (c_void_p, c_char_p)),
+    "ZkVirtualObject_addChild": (None, (c_void_p, c_void_p)),
+    "ZkVirtualObject_del": (None, (c_void_p,)),
+    "ZkVirtualObject_getAi": (ZkPointer, (c_void_p,)),
+    "ZkVirtualObject_getAmbient": (c_int, (c_void_p,)),
+    "ZkVirtualObject_getAnimMode": (c_int, (c_void_p,)),
+    "ZkVirtualObject_getAnimStrength": (c_float, (c_void_p,)),
+    "ZkVirtualObject_getBbox": (AxisAlignedBoundingBox, (c_void_p,)),
+    "ZkVirtualObject_getBias": (c_int32, (c_void_p,)),
+    "ZkVirtualObject_getCdDynamic": (c_int, (c_void_p,)),
+    "ZkVirtualObject_getCdStatic": (c_int, (c_void_p,)),
+    "ZkVirtualObject_getChild": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkVirtualObject_getChildCount": (c_size_t, (c_void_p,)),
+    "ZkVirtualObject_getDynamicShadows": (c_int, (c_void_p,)),
+    "ZkVirtualObject_getEventManager": (ZkPointer, (c_void_p,)),
+    "ZkVirtualObject_getFarClipScale": (c_float, (c_void_p,)),
+    "ZkVirtualObject_getId": (c_uint32, (c_void_p,)),
+    "ZkVirtualObject_getName": (ZkString, (c_void_p,)),
+    "ZkVirtualObject_getNextOnTimer": (c_float, (c_void_p,)),
+    "ZkVirtualObject_getPhysicsEnabled": (c_int, (c_void_p,)),
+    "ZkVirtualObject_getPosition": (Vec3f, (c_void_p,)),
+    "ZkVirtualObject_getPresetName": (ZkString, (c_void_p,)),
+    "ZkVirtualObject_getRotation": (Mat3x3, (c_void_p,)),
+    "ZkVirtualObject_getShowVisual": (c_int, (c_void_p,)),
+    "ZkVirtualObject_getSleepMode": (c_uint8, (c_void_p,)),
+    "ZkVirtualObject_getSpriteCameraFacingMode": (c_int, (c_void_p,)),
+    "ZkVirtualObject_getType": (c_int, (c_void_p,)),
+    "ZkVirtualObject_getVisual": (ZkPointer, (c_void_p,)),
+    "ZkVirtualObject_getVobStatic": (c_int, (c_void_p,)),
+    "ZkVirtualObject_new": (ZkPointer, (c_int,)),
+    "ZkVirtualObject_removeChild": (None, (c_void_p, c_size_t)),
+    "ZkVirtualObject_setAi": (None, (c_void_p, c_void_p)),
+    "ZkVirtualObject_setAmbient": (None, (c_void_p, c_int)),
+    "ZkVirtualObject_setAnimMode": (None, (c_void_p, c_int)),
+    "ZkVirtualObject_setAnimStrength": (None, (c_void_p, c_float)),
+    "ZkVirtualObject_setBbox": (None, (c_void_p, AxisAlignedBoundingBox)),
+    "ZkVirtualObject_setBias": (None, (c_void_p, c_int32)),
+    "ZkVirtualObject_setCdDynamic": (None, (c_void_p, c_int)),
+    "ZkVirtualObject_setCdStatic": (None, (c_void_p, c_int)),
+    "ZkVirtualObject_setDynamicShadows": (None, (c_void_p, c_int)),
+    "ZkVirtualObject_setEventManager": (None, (c_void_p, c_void_p)),
+    "ZkVirtualObject_setFarClipScale": (None, (c_void_p, c_float)),
+    "ZkVirtualObject_setName": (None, (c_void_p, c_char_p)),
+    "ZkVirtualObject_setNextOnTimer": (None, (c_void_p, c_float)),
+    "ZkVirtualObject_setPhysicsEnabled": (None, (c_void_p, c_int)),
+    "ZkVirtualObject_setPosition": (None, (c_void_p, Vec3f)),
+    "ZkVirtualObject_setPresetName": (None, (c_void_p, c_char_p)),
+    "ZkVirtualObject_setRotation": (None, (c_void_p, Mat3x3)),
+    "ZkVirtualObject_setShowVisual": (None, (c_void_p, c_int)),
+    "ZkVirtualObject_setSleepMode": (None, (c_void_p, c_uint8)),
+    "ZkVirtualObject_setSpriteCameraFacingMode": (None, (c_void_p, c_int)),
+    "ZkVirtualObject_setVisual": (None, (c_void_p, c_void_p)),
+    "ZkVirtualObject_setVobStatic": (None, (c_void_p, c_int)),
+    "ZkVisual_del": (None, (c_void_p,)),
+    "ZkVisual_getName": (ZkString, (c_void_p,)),
+    "ZkVisual_getType": (c_int, (c_void_p,)),
+    "ZkVisual_new": (ZkPointer, (c_int,)),
+    "ZkVisual_setName": (None, (c_void_p, c_char_p)),
+    "ZkVisualDecal_getAlphaFunc": (c_int, (c_void_p,)),
+    "ZkVisualDecal_getAlphaWeight": (c_uint8, (c_void_p,)),
+    "ZkVisualDecal_getDimension": (Vec2f, (c_void_p,)),
+    "ZkVisualDecal_getIgnoreDaylight": (c_int, (c_void_p,)),
+    "ZkVisualDecal_getName": (ZkString, (c_void_p,)),
+    "ZkVisualDecal_getOffset": (Vec2f, (c_void_p,)),
+    "ZkVisualDecal_getTextureAnimFps": (c_float, (c_void_p,)),
+    "ZkVisualDecal_getTwoSided": (c_int, (c_void_p,)),
+    "ZkVisualDecal_setAlphaFunc": (None, (c_void_p, c_int)),
+    "ZkVisualDecal_setAlphaWeight": (None, (c_void_p, c_uint8)),
+    "ZkVisualDecal_setDimension": (None, (c_void_p, Vec2f)),
+    "ZkVisualDecal_setIgnoreDaylight": (None, (c_void_p, c_int)),
+    "ZkVisualDecal_setName": (None, (c_void_p, c_char_p)),
+    "ZkVisualDecal_setOffset": (None, (c_void_p, Vec2f)),
+    "ZkVisualDecal_setTextureAnimFps": (None, (c_void_p, c_float)),
+    "ZkVisualDecal_setTwoSided": (None, (c_void_p, c_int)),
+    "ZkWayNet_getEdges": (_Ref("zenkit.world.way_net", "WayEdge", pointer=True), (c_void_p, POINTER(c_size_t))),
+    "ZkWayNet_getPoint": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkWayNet_getPointCount": (c_size_t, (c_void_p,)),
+    "ZkWayPoint_getDirection": (Vec3f, (c_void_p,)),
+    "ZkWayPoint_getFreePoint": (c_int, (c_void_p,)),
+    "ZkWayPoint_getName": (ZkString, (c_void_p,)),
+    "ZkWayPoint_getPosition": (Vec3f, (c_void_p,)),
+    "ZkWayPoint_getUnderWater": (c_int, (c_void_p,)),
+    "ZkWayPoint_getWaterDepth": (c_int, (c_void_p,)),
+    "ZkWorld_addRootObject": (None, (c_void_p, c_void_p)),
+    "ZkWorld_clearRootObjects": (None, (c_void_p,)),
+    "ZkWorld_del": (None, (c_void_p,)),
+    "ZkWorld_getBspTree": (ZkPointer, (c_void_p,)),
+    "ZkWorld_getMesh": (ZkPointer, (c_void_p,)),
+    "ZkWorld_getRootObject": (ZkPointer, (c_void_p, c_size_t)),
+    "ZkWorld_getRootObjectCount": (c_size_t, (c_void_p,)),
+    "ZkWorld_getWayNet": (ZkPointer, (c_void_p,)),
+    "ZkWorld_load": (c_void_p, (c_void_p,)),
+    "ZkWorld_loadVersioned": (c_void_p, (c_void_p, c_int)),
+    "ZkWorld_save": (None, (c_void_p, c_void_p, c_int)),
+    "ZkWrite_del": (None, (c_void_p,)),
+    "ZkWrite_newExt": (c_void_p, (c_void_p, _Ref("zenkit.stream", "_WriteExt"))),
+    "ZkWrite_newPath": (c_void_p, (c_char_p,)),
+    "ZkZoneFarPlane_getInnerRangePercentage": (c_float, (c_void_p,)),
+    "ZkZoneFarPlane_getVobFarPlaneZ": (c_float, (c_void_p,)),
+    "ZkZoneFarPlane_setInnerRangePercentage": (None, (c_void_p, c_float)),
+    "ZkZoneFarPlane_setVobFarPlaneZ": (None, (c_void_p, c_float)),
+    "ZkZoneFog_getColor": (Color, (c_void_p,)),
+    "ZkZoneFog_getFadeOutSky": (c_int, (c_void_p,)),
+    "ZkZoneFog_getInnerRangePercentage": (c_float, (c_void_p,)),
+    "ZkZoneFog_getOverrideColor": (c_int, (c_void_p,)),
+    "ZkZoneFog_getRangeCenter": (c_float, (c_void_p,)),
+    "ZkZoneFog_setColor": (None, (c_void_p, Color)),
+    "ZkZoneFog_setFadeOutSky": (None, (c_void_p, c_int)),
+    "ZkZoneFog_setInnerRangePercentage": (None, (c_void_p, c_float)),
+    "ZkZoneFog_setOverrideColor": (None, (c_void_p, c_int)),
+    "ZkZoneFog_setRangeCenter": (None, (c_void_p, c_float)),
+    "ZkZoneMusic_getDayEntranceDone": (c_int, (c_void_p,)),
+    "ZkZoneMusic_getIsEllipsoid": (c_int, (c_void_p,)),
+    "ZkZoneMusic_getIsEnabled": (c_int, (c_void_p,)),
+    "ZkZoneMusic_getIsLoop": (c_int, (c_void_p,)),
+    "ZkZoneMusic_getLocalEnabled": (c_int, (c_void_p,)),
+    "ZkZoneMusic_getNightEntranceDone": (c_int, (c_void_p,)),
+    "ZkZoneMusic_getPriority": (c_int32, (c_void_p,)),
+    "ZkZoneMusic_getReverb": (c_float, (c_void_p,)),
+    "ZkZoneMusic_getVolume": (c_float, (c_void_p,)),
+    "ZkZoneMusic_setDayEntranceDone": (None, (c_void_p, c_int)),
+    "ZkZoneMusic_setIsEllipsoid": (None, (c_void_p, c_int)),
+    "ZkZoneMusic_setIsEnabled": (None, (c_void_p, c_int)),
+    "ZkZoneMusic_setIsLoop": (None, (c_void_p, c_int)),
+    "ZkZoneMusic_setLocalEnabled": (None, (c_void_p, c_int)),
+    "ZkZoneMusic_setNightEntranceDone": (None, (c_void_p, c_int)),
+    "ZkZoneMusic_setPriority": (None, (c_void_p, c_int32)),
+    "ZkZoneMusic_setReverb": (None, (c_void_p, c_float)),
+    "ZkZoneMusic_setVolume": (None, (c_void_p, c_float)),
+}
+
+
+def _resolve(typ: Any) -> Any:
+    return typ.resolve() if isinstance(typ, _Ref) else typ
+
+
+def bind(fn: Any) -> None:
+    # Without a signature, ctypes would pass every argument as an `int` and truncate pointer results.
+    signature = SIGNATURES.get(fn.__name__)
+    if signature is None:
+        error = f"No signature for native function {fn.__name__!r}"
+        raise AttributeError(error)
+
+    restype, argtypes = signature
+    fn.restype = _resolve(restype)
+    fn.argtypes = tuple(_resolve(typ) for typ in argtypes)
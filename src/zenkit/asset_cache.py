@@ -0,0 +1,478 @@
+__all__ = [
+    "AssetCache",
+    "AssetCacheInfo",
+    "DecodedAsset",
+    "DecodedAssetCache",
+]
+
+import os
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from ctypes import c_uint16
+from dataclasses import dataclass
+from hashlib import blake2b
+from hashlib import sha256
+from mmap import ACCESS_READ
+from mmap import mmap
+from os import PathLike
+from pathlib import Path
+from struct import Struct
+from threading import Lock
+from threading import get_ident
+from typing import Any
+from typing import TypeVar
+
+from zenkit import _native
+from zenkit._core import Vec2f
+from zenkit._core import Vec3f
+from zenkit.font import Font
+from zenkit.mesh import Mesh
+from zenkit.model import Model
+from zenkit.model_animation import AnimationSample
+from zenkit.model_animation import ModelAnimation
+from zenkit.model_hierarchy import ModelHierarchy
+from zenkit.model_mesh import ModelMesh
+from zenkit.morph_mesh import MorphMesh
+from zenkit.multi_resolution_mesh import MultiResolutionMesh
+from zenkit.stream import Read
+from zenkit.texture import Texture
+from zenkit.vfs import Vfs
+from zenkit.vfs import VfsNode
+from zenkit.vfs import _index_key
+from zenkit.world.world import World
+
+_T = TypeVar("_T")
+
+_DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+_LOADERS: dict[type, str] = {
+    Font: "ZkFont_load",
+    Mesh: "ZkMesh_load",
+    Model: "ZkModel_load",
+    ModelAnimation: "ZkModelAnimation_load",
+    ModelHierarchy: "ZkModelHierarchy_load",
+    ModelMesh: "ZkModelMesh_load",
+    MorphMesh: "ZkMorphMesh_load",
+    MultiResolutionMesh: "ZkMultiResolutionMesh_load",
+    Texture: "ZkTexture_load",
+    World: "ZkWorld_load",
+}
+
+_DECODED_HEADER = Struct("<4sI32sI")
+_DECODED_ARRAY = Struct("<32s2sHQQ3Q")
+_DECODED_MAGIC = b"ZKDA"
+_DECODED_VERSION = 1
+_DECODED_ALIGNMENT = 64
+
+# An asset's type, the address of the node it was loaded from and the generation of the file system it was resolved in.
+_AssetKey = tuple[type, int, int]
+
+
+@dataclass(slots=True)
+class AssetCacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    count: int
+    size: int
+    max_size: int
+
+
+# Decoded arrays by name: their struct format character, shape and contents.
+_Arrays = dict[str, tuple[str, tuple[int, ...], Any]]
+
+
+@dataclass(slots=True)
+class DecodedAsset:
+    kind: str
+    path: str
+    arrays: dict[str, memoryview]
+
+    def __getitem__(self, name: str) -> memoryview:
+        return self.arrays[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.arrays
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Views into a mapping can't be pickled, so their contents are sent instead.
+        arrays = {name: (view.format, view.shape, view.tobytes()) for name, view in self.arrays.items()}
+        return _decoded_asset, (self.kind, self.path, arrays)
+
+
+def _decoded_asset(kind: str, path: str, arrays: _Arrays) -> DecodedAsset:
+    views = {}
+    for name, (fmt, shape, data) in arrays.items():
+        view = memoryview(data).cast("B")
+        views[name] = view.cast(fmt, shape) if view.nbytes else view.cast(fmt)
+    return DecodedAsset(kind, path, views)
+
+
+def _texture_arrays(texture: Texture) -> _Arrays:
+    arrays = {}
+    for level in range(texture.mipmap_count):
+        width, height = texture.width_mipmap(level), texture.height_mipmap(level)
+        data = bytearray(width * height * 4)
+        texture.mipmap_rgba_into(level, data)
+        arrays[f"rgba{level}"] = ("B", (height, width, 4), data)
+    return arrays
+
+
+def _mrm_arrays(mesh: MultiResolutionMesh) -> _Arrays:
+    positions = mesh.positions
+    normals = mesh.normals
+    arrays = {
+        "positions": ("f", (len(positions), 3), (Vec3f * len(positions))(*positions)),
+        "normals": ("f", (len(normals), 3), (Vec3f * len(normals))(*normals)),
+    }
+
+    for i, submesh in enumerate(mesh.submeshes):
+        triangles = submesh.triangles
+        wedges = submesh.wedges
+        arrays[f"triangles{i}"] = ("H", (len(triangles), 3), b"".join(map(bytes, triangles)))
+        arrays[f"wedge_positions{i}"] = ("H", (len(wedges),), (c_uint16 * len(wedges))(*(w.index for w in wedges)))
+        arrays[f"wedge_normals{i}"] = ("f", (len(wedges), 3), (Vec3f * len(wedges))(*(w.normal for w in wedges)))
+        arrays[f"wedge_uvs{i}"] = ("f", (len(wedges), 2), (Vec2f * len(wedges))(*(w.texture for w in wedges)))
+    return arrays
+
+
+def _mesh_arrays(mesh: Mesh) -> _Arrays:
+    positions = mesh.positions_array()
+    table = mesh.polygon_table()
+    return {
+        "positions": ("f", (len(positions), 3), positions),
+        "material_indices": ("I", (len(table.material_indices),), table.material_indices),
+        "vertex_offsets": ("I", (len(table.vertex_offsets),), table.vertex_offsets),
+        "position_indices": ("I", (len(table.position_indices),), table.position_indices),
+    }
+
+
+def _animation_arrays(animation: ModelAnimation) -> _Arrays:
+    # Every sample is its position (x, y, z) followed by its rotation (w, x, y, z).
+    samples = animation.samples
+    nodes = animation.node_indices
+    return {
+        "samples": ("f", (len(samples), 7), (AnimationSample * len(samples))(*samples)),
+        "node_indices": ("I", (len(nodes),), b"".join(node.to_bytes(4, "little") for node in nodes)),
+    }
+
+
+def _world_arrays(world: World) -> _Arrays:
+    return _mesh_arrays(world.mesh)
+
+
+def _source_version(vfs: Vfs, path: str | PathLike, node: VfsNode) -> bytes:
+    # Files stored in a mounted archive are identified by where they are stored. As long as the archive is unchanged
+    # since it was mounted, it holds the same bytes at the same offset. Only files without such a source, like ones
+    # created in memory, are versioned by hashing their contents.
+    entry = vfs._index().get(_index_key(path))  # noqa: SLF001 / same package
+    stamps = {source: (size, mtime) for source, _, size, mtime in vfs._mounts or []}  # noqa: SLF001 / same package
+    if entry is not None and entry[4] in stamps:
+        _, _, size, _, source, offset = entry
+        try:
+            stat = Path(source).stat()
+        except OSError:
+            stat = None
+
+        if stat is not None and (stat.st_size, stat.st_mtime_ns) == stamps[source]:
+            return repr((str(Path(source).resolve()), *stamps[source], offset, size)).encode()
+
+    return blake2b(node.view(), digest_size=16).digest()
+
+
+# For every kind of decoded asset: its type and how its arrays are decoded.
+_DECODERS: dict[str, tuple[type, Callable[[Any], _Arrays]]] = {
+    "texture": (Texture, _texture_arrays),
+    "mrm": (MultiResolutionMesh, _mrm_arrays),
+    "mesh": (Mesh, _mesh_arrays),
+    "animation": (ModelAnimation, _animation_arrays),
+    "world": (World, _world_arrays),
+}
+
+
+def _load(kind: type[_T], source: VfsNode | Read, path: str | PathLike | VfsNode) -> tuple[_T, int]:
+    stream = source.open() if isinstance(source, VfsNode) else source
+    handle = _native.load(_LOADERS[kind], stream)
+    if not handle.value:
+        error = f"Failed to load {kind.__name__} {path!r}; see log"
+        raise ValueError(error)
+
+    # ZenKit keeps decoded assets in about the layout they are stored in, so the size of the source is a fair estimate
+    # of the native memory an asset holds.
+    return kind(_handle=handle, _delete=True), stream.size
+
+
+class AssetCache:
+    __slots__ = (
+        "_assets",
+        "_evictions",
+        "_generation",
+        "_hits",
+        "_loading",
+        "_lock",
+        "_max_size",
+        "_misses",
+        "_size",
+        "_vfs",
+    )
+
+    def __init__(self, vfs: Vfs, max_size: int = _DEFAULT_MAX_SIZE) -> None:
+        if max_size < 0:
+            error = "The maximum cache size can't be negative."
+            raise ValueError(error)
+
+        self._vfs = vfs
+        self._max_size = max_size
+        self._lock = Lock()
+
+        # Cached assets and their estimated sizes from least to most recently used, and assets still being loaded.
+        self._assets: OrderedDict[_AssetKey, tuple[Any, int]] = OrderedDict()
+        self._loading: dict[_AssetKey, Future] = {}
+        self._size = 0
+        self._generation = vfs._generation  # noqa: SLF001 / same package
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def texture(self, path: str | PathLike | VfsNode) -> Texture:
+        return self.load(Texture, path)
+
+    def mrm(self, path: str | PathLike | VfsNode) -> MultiResolutionMesh:
+        return self.load(MultiResolutionMesh, path)
+
+    def model(self, path: str | PathLike | VfsNode) -> Model:
+        return self.load(Model, path)
+
+    def model_hierarchy(self, path: str | PathLike | VfsNode) -> ModelHierarchy:
+        return self.load(ModelHierarchy, path)
+
+    def model_mesh(self, path: str | PathLike | VfsNode) -> ModelMesh:
+        return self.load(ModelMesh, path)
+
+    def model_animation(self, path: str | PathLike | VfsNode) -> ModelAnimation:
+        return self.load(ModelAnimation, path)
+
+    def morph_mesh(self, path: str | PathLike | VfsNode) -> MorphMesh:
+        return self.load(MorphMesh, path)
+
+    def mesh(self, path: str | PathLike | VfsNode) -> Mesh:
+        return self.load(Mesh, path)
+
+    def font(self, path: str | PathLike | VfsNode) -> Font:
+        return self.load(Font, path)
+
+    def world(self, path: str | PathLike | VfsNode) -> World:
+        return self.load(World, path)
+
+    def load(self, kind: type[_T], path: str | PathLike | VfsNode) -> _T:
+        if kind not in _LOADERS:
+            error = f"Unsupported asset type: {kind.__name__}"
+            raise ValueError(error)
+
+        with self._lock:
+            node = path if isinstance(path, VfsNode) else self._vfs.resolve(path)
+            if node is None or not node.handle.value:
+                error = f"File not found: {path}"
+                raise ValueError(error)
+
+            # Nodes are identified by their address, which is only meaningful until the file system changes.
+            generation = self._vfs._generation  # noqa: SLF001 / same package
+            if generation != self._generation:
+                self._clear()
+                self._generation = generation
+
+            key = (kind, node.handle.value, generation)
+            asset = self._assets.get(key)
+            if asset is not None:
+                self._assets.move_to_end(key)
+                self._hits += 1
+                return asset[0]
+
+            # Concurrent requests for an asset that is being loaded wait for that load rather than parsing it again.
+            future = self._loading.get(key)
+            if future is not None:
+                self._hits += 1
+            else:
+                self._misses += 1
+                self._loading[key] = Future()
+
+        if future is not None:
+            return future.result()
+
+        # Native loads release the GIL, so different assets are loaded in parallel.
+        try:
+            asset, size = _load(kind, node, path)
+        except BaseException as exc:
+            with self._lock:
+                future = self._loading.pop(key)
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            future = self._loading.pop(key)
+            if generation == self._generation:
+                self._store(key, asset, size)
+        future.set_result(asset)
+        return asset
+
+    async def load_async(self, kind: type[_T], path: str | PathLike | VfsNode) -> _T:
+        return await _native.load_async(self.load, kind, path)
+
+    def info(self) -> AssetCacheInfo:
+        with self._lock:
+            return AssetCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                count=len(self._assets),
+                size=self._size,
+                max_size=self._max_size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def _store(self, key: _AssetKey, asset: Any, size: int) -> None:
+        # Assets larger than the whole cache are handed out without being kept.
+        if size > self._max_size:
+            return
+
+        self._assets[key] = (asset, size)
+        self._size += size
+
+        while self._size > self._max_size:
+            _, (_, evicted) = self._assets.popitem(last=False)
+            self._size -= evicted
+            self._evictions += 1
+
+    def _clear(self) -> None:
+        self._assets.clear()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def __repr__(self) -> str:
+        return f"<AssetCache count={len(self._assets)} size={self._size} max_size={self._max_size}>"
+
+
+class DecodedAssetCache:
+    __slots__ = ("_directory", "_vfs")
+
+    def __init__(self, directory: str | PathLike, vfs: Vfs) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._vfs = vfs
+
+    def texture(self, path: str | PathLike) -> DecodedAsset:
+        return self.load("texture", path)
+
+    def mrm(self, path: str | PathLike) -> DecodedAsset:
+        return self.load("mrm", path)
+
+    def mesh(self, path: str | PathLike) -> DecodedAsset:
+        return self.load("mesh", path)
+
+    def animation(self, path: str | PathLike) -> DecodedAsset:
+        return self.load("animation", path)
+
+    def world(self, path: str | PathLike) -> DecodedAsset:
+        return self.load("world", path)
+
+    def load(self, kind: str, path: str | PathLike) -> DecodedAsset:
+        decoder = _DECODERS.get(kind)
+        if decoder is None:
+            error = f"Unsupported asset kind: {kind!r}"
+            raise ValueError(error)
+
+        node = self._vfs.resolve(path)
+        if node is None or not node.handle.value:
+            error = f"File not found: {path}"
+            raise ValueError(error)
+
+        # Entries are identified by the asset's path and the version of its source. Checksums recorded in assets can't
+        # be used instead. The one in an animation's header identifies the model hierarchy it animates, not its data.
+        cls, decode = decoder
+        key = sha256(b"\0".join([kind.encode(), _index_key(path).encode(), _source_version(self._vfs, path, node)]))
+        file = self._directory / kind / f"{key.hexdigest()}.bin"
+
+        arrays = self._read(file, key.digest())
+        if arrays is None:
+            asset, _ = _load(cls, node, path)
+            self._write(file, key.digest(), decode(asset))
+            arrays = self._read(file, key.digest())
+        return DecodedAsset(kind, str(path), arrays)
+
+    async def load_async(self, kind: str, path: str | PathLike) -> DecodedAsset:
+        return await _native.load_async(self.load, kind, path)
+
+    def clear(self) -> None:
+        for file in self._directory.glob("*/*.bin"):
+            file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _read(file: Path, key: bytes) -> dict[str, memoryview] | None:
+        try:
+            with file.open("rb") as f:
+                data = mmap(f.fileno(), 0, access=ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        if len(data) < _DECODED_HEADER.size:
+            return None
+        magic, version, cached_key, count = _DECODED_HEADER.unpack_from(data)
+        if (
+            magic != _DECODED_MAGIC
+            or version != _DECODED_VERSION
+            or cached_key != key
+            or len(data) < _DECODED_HEADER.size + count * _DECODED_ARRAY.size
+        ):
+            return None
+
+        # The arrays are views straight into the mapping, which stays open as long as any of them is in use.
+        arrays = {}
+        view = memoryview(data)
+        for i in range(count):
+            name, fmt, ndim, offset, size, *shape = _DECODED_ARRAY.unpack_from(
+                data, _DECODED_HEADER.size + i * _DECODED_ARRAY.size
+            )
+            array = view[offset : offset + size]
+            if array.nbytes != size:
+                return None
+
+            # Views with an empty dimension can't be shaped, so empty arrays are flat.
+            fmt = fmt.rstrip(b"\0").decode()
+            try:
+                arrays[name.rstrip(b"\0").decode()] = array.cast(fmt, shape[:ndim]) if size else array.cast(fmt)
+            except (ValueError, TypeError):
+                return None
+        return arrays
+
+    @staticmethod
+    def _write(file: Path, key: bytes, arrays: _Arrays) -> None:
+        # Arrays are laid out back to back after the table of contents, each aligned for direct use from the mapping.
+        table = bytearray(_DECODED_HEADER.pack(_DECODED_MAGIC, _DECODED_VERSION, key, len(arrays)))
+        offset = len(table) + len(arrays) * _DECODED_ARRAY.size
+        contents = []
+
+        for name, (fmt, shape, data) in arrays.items():
+            offset += -offset % _DECODED_ALIGNMENT
+            size = memoryview(data).nbytes
+            table += _DECODED_ARRAY.pack(
+                name.encode(), fmt.encode(), len(shape), offset, size, *shape, *(0,) * (3 - len(shape))
+            )
+            contents.append((offset, data))
+            offset += size
+
+        # Written next to the final file and moved into place, so concurrent readers never see a partial entry.
+        file.parent.mkdir(exist_ok=True)
+        temporary = file.with_suffix(f".{os.getpid()}.{get_ident()}.tmp")
+        with temporary.open("wb") as f:
+            f.write(table)
+            for position, data in contents:
+                f.write(bytes(position - f.tell()))
+                f.write(data)
+        temporary.replace(file)
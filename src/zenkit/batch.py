@@ -0,0 +1,95 @@
+__all__ = [
+    "load_many",
+]
+
+import os
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from os import PathLike
+
+from zenkit.asset_cache import _DECODERS
+from zenkit.asset_cache import DecodedAsset
+from zenkit.asset_cache import _decoded_asset
+from zenkit.asset_cache import _load
+from zenkit.stream import Read
+from zenkit.vfs import Vfs
+from zenkit.vfs import VfsIndexCache
+from zenkit.vfs import VfsOverwriteBehavior
+
+# The file system of a worker process, rebuilt from the archives mounted in the parent.
+_worker_vfs: Vfs | None = None
+
+
+def _initialize(mounts: list[tuple[str, VfsOverwriteBehavior]] | None, cache: VfsIndexCache | None) -> None:
+    global _worker_vfs  # noqa: PLW0603 / per-process worker state
+    if mounts is None:
+        return
+
+    _worker_vfs = Vfs()
+    for source, clobber in mounts:
+        _worker_vfs.mount_disk(source, clobber=clobber, cache=cache)
+
+
+def _decode(kind: str, path: str) -> DecodedAsset:
+    cls, _, decode = _DECODERS[kind]
+    if _worker_vfs is None:
+        source = Read(path)
+    else:
+        source = _worker_vfs.resolve(path)
+        if source is None or not source.handle.value:
+            error = f"File not found: {path}"
+            raise ValueError(error)
+
+    asset, _ = _load(cls, source, path)
+    return _decoded_asset(kind, path, decode(asset))
+
+
+def load_many(
+    kind: str,
+    paths: Iterable[str | PathLike],
+    *,
+    vfs: Vfs | None = None,
+    processes: int | None = None,
+    max_pending: int | None = None,
+) -> Iterator[DecodedAsset]:
+    if kind not in _DECODERS:
+        error = f"Unsupported asset kind: {kind!r}"
+        raise ValueError(error)
+
+    # Native objects can't be sent between processes, so every worker mounts the same archives itself. Through an
+    # index cache, workers only ever read the parts of the archives they need.
+    mounts = cache = None
+    if vfs is not None:
+        if vfs._mounts is None:  # noqa: SLF001 / same package
+            error = "Only file systems built by mounting archives can be shared with worker processes."
+            raise ValueError(error)
+        mounts = [(source, clobber) for source, clobber, _, _ in vfs._mounts]  # noqa: SLF001 / same package
+        cache = vfs._cache  # noqa: SLF001 / same package
+
+    processes = processes or os.cpu_count() or 1
+    max_pending = max_pending or 2 * processes
+
+    # Like `decode_all`, results are yielded as soon as they are ready. At most `max_pending` assets are queued, being
+    # decoded or waiting to be consumed at any time, which bounds the memory held by the pipeline.
+    pending: set[Future] = set()
+    with ProcessPoolExecutor(max_workers=processes, initializer=_initialize, initargs=(mounts, cache)) as executor:
+        try:
+            for path in paths:
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+                pending.add(executor.submit(_decode, kind, str(path)))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
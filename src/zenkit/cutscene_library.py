@@ -4,31 +4,26 @@ __all__ = [
     "CutsceneBlock",
 ]
 
-from ctypes import c_size_t
-from ctypes import c_uint
 from ctypes import c_void_p
 from typing import Any
 
 from zenkit import _native
 from zenkit._core import DLL
+from zenkit._core import Closeable
 from zenkit._core import PathOrFileLike
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
-
-DLL.ZkCutsceneMessage_getType.restype = c_uint
-DLL.ZkCutsceneMessage_getName.restype = ZkString
-DLL.ZkCutsceneMessage_getText.restype = ZkString
+from zenkit._core import depend
+from zenkit._core import release
 
 
 class CutsceneMessage:
-    __slots__ = ("_handle", "_keepalive")
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def type(self) -> int:
@@ -49,19 +44,15 @@ class CutsceneMessage:
         return f"<CutsceneMessage handle={self._handle} name={self.name!r}>"
 
 
-DLL.ZkCutsceneBlock_getName.restype = ZkString
-DLL.ZkCutsceneBlock_getMessage.restype = ZkPointer
-
-
 class CutsceneBlock:
-    __slots__ = ("_handle", "_keepalive")
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
-            self._keepalive = kwargs.pop("_keepalive")
+            self._keepalive = depend(self, kwargs.pop("_keepalive"))
 
     @property
     def name(self) -> str:
@@ -79,13 +70,8 @@ class CutsceneBlock:
         return f"<CutsceneBlock handle={self._handle} name={self.name!r}>"
 
 
-DLL.ZkCutsceneLibrary_getBlockCount.restype = c_size_t
-DLL.ZkCutsceneLibrary_getBlockByIndex.restype = ZkPointer
-DLL.ZkCutsceneLibrary_getBlock.restype = ZkPointer
-
-
-class CutsceneLibrary:
-    __slots__ = ("_handle", "_delete")
+class CutsceneLibrary(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -99,6 +85,10 @@ class CutsceneLibrary:
         handle = _native.load("ZkCutsceneLibrary_load", path_or_file_like)
         return CutsceneLibrary(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "CutsceneLibrary":
+        return await _native.load_async(CutsceneLibrary.load, path_or_file_like)
+
     @property
     def blocks(self) -> list[CutsceneBlock]:
         count = DLL.ZkCutsceneLibrary_getBlockCount(self._handle)
@@ -122,6 +112,9 @@ class CutsceneLibrary:
     def __contains__(self, name: str) -> bool:
         return self.get(name) is not None
 
+    def close(self) -> None:
+        release(self, DLL.ZkCutsceneLibrary_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkCutsceneLibrary_del(self._handle)
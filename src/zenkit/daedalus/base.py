@@ -3,13 +3,12 @@ __all__ = [
     "DaedalusInstanceType",
 ]
 
-from ctypes import c_int
-from ctypes import c_uint32
 from ctypes import c_void_p
 from enum import IntEnum
 from typing import Any
 
 from zenkit._core import DLL
+from zenkit._core import depend
 
 
 class DaedalusInstanceType(IntEnum):
@@ -38,26 +37,26 @@ class DaedalusInstanceType(IntEnum):
 
 
 class DaedalusInstance:
-    __slots__ = ("_handle",)
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = None
 
         if "_handle" in kwargs:
             self._handle = kwargs.pop("_handle")
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
-    def from_native(handle: c_void_p | None) -> "DaedalusInstance | None":
+    def from_native(handle: c_void_p | None, *, keepalive: Any = DLL) -> "DaedalusInstance | None":
         from zenkit.daedalus import _INSTANCES
 
         print(handle, handle.value if handle is not None else None)
         if handle is None or handle.value is None or handle.value == 0 or (isinstance(handle.value, c_void_p) and handle.value.value == None):
             return None
 
-        DLL.ZkDaedalusInstance_getType.restype = c_int
         typ = DaedalusInstanceType(DLL.ZkDaedalusInstance_getType(handle))
 
-        return _INSTANCES.get(typ, DaedalusInstance)(_handle=handle)
+        return _INSTANCES.get(typ, DaedalusInstance)(_handle=handle, _keepalive=keepalive)
 
     @property
     def handle(self) -> c_void_p:
@@ -65,10 +64,8 @@ class DaedalusInstance:
 
     @property
     def type(self) -> DaedalusInstanceType:
-        DLL.ZkDaedalusInstance_getType.restype = c_int
         return DaedalusInstanceType(DLL.ZkDaedalusInstance_getType(self._handle))
 
     @property
     def index(self) -> int:
-        DLL.ZkDaedalusInstance_getIndex.restype = c_uint32
         return DLL.ZkDaedalusInstance_getIndex(self._handle)
@@ -16,7 +16,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def best_range(self) -> float:
-        DLL.ZkCameraInstance_getBestRange.restype = c_float
         return DLL.ZkCameraInstance_getBestRange(self._handle)
 
     @best_range.setter
@@ -25,7 +24,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def min_range(self) -> float:
-        DLL.ZkCameraInstance_getMinRange.restype = c_float
         return DLL.ZkCameraInstance_getMinRange(self._handle)
 
     @min_range.setter
@@ -34,7 +32,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def max_range(self) -> float:
-        DLL.ZkCameraInstance_getMaxRange.restype = c_float
         return DLL.ZkCameraInstance_getMaxRange(self._handle)
 
     @max_range.setter
@@ -43,7 +40,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def best_elevation(self) -> float:
-        DLL.ZkCameraInstance_getBestElevation.restype = c_float
         return DLL.ZkCameraInstance_getBestElevation(self._handle)
 
     @best_elevation.setter
@@ -52,7 +48,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def min_elevation(self) -> float:
-        DLL.ZkCameraInstance_getMinElevation.restype = c_float
         return DLL.ZkCameraInstance_getMinElevation(self._handle)
 
     @min_elevation.setter
@@ -61,7 +56,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def max_elevation(self) -> float:
-        DLL.ZkCameraInstance_getMaxElevation.restype = c_float
         return DLL.ZkCameraInstance_getMaxElevation(self._handle)
 
     @max_elevation.setter
@@ -70,7 +64,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def best_azimuth(self) -> float:
-        DLL.ZkCameraInstance_getBestAzimuth.restype = c_float
         return DLL.ZkCameraInstance_getBestAzimuth(self._handle)
 
     @best_azimuth.setter
@@ -79,7 +72,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def min_azimuth(self) -> float:
-        DLL.ZkCameraInstance_getMinAzimuth.restype = c_float
         return DLL.ZkCameraInstance_getMinAzimuth(self._handle)
 
     @min_azimuth.setter
@@ -88,7 +80,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def max_azimuth(self) -> float:
-        DLL.ZkCameraInstance_getMaxAzimuth.restype = c_float
         return DLL.ZkCameraInstance_getMaxAzimuth(self._handle)
 
     @max_azimuth.setter
@@ -97,7 +88,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def best_rot_z(self) -> float:
-        DLL.ZkCameraInstance_getBestRotZ.restype = c_float
         return DLL.ZkCameraInstance_getBestRotZ(self._handle)
 
     @best_rot_z.setter
@@ -106,7 +96,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def min_rot_z(self) -> float:
-        DLL.ZkCameraInstance_getMinRotZ.restype = c_float
         return DLL.ZkCameraInstance_getMinRotZ(self._handle)
 
     @min_rot_z.setter
@@ -115,7 +104,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def max_rot_z(self) -> float:
-        DLL.ZkCameraInstance_getMaxRotZ.restype = c_float
         return DLL.ZkCameraInstance_getMaxRotZ(self._handle)
 
     @max_rot_z.setter
@@ -124,7 +112,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def rot_offset_x(self) -> float:
-        DLL.ZkCameraInstance_getRotOffsetX.restype = c_float
         return DLL.ZkCameraInstance_getRotOffsetX(self._handle)
 
     @rot_offset_x.setter
@@ -133,7 +120,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def rot_offset_y(self) -> float:
-        DLL.ZkCameraInstance_getRotOffsetY.restype = c_float
         return DLL.ZkCameraInstance_getRotOffsetY(self._handle)
 
     @rot_offset_y.setter
@@ -142,7 +128,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def rot_offset_z(self) -> float:
-        DLL.ZkCameraInstance_getRotOffsetZ.restype = c_float
         return DLL.ZkCameraInstance_getRotOffsetZ(self._handle)
 
     @rot_offset_z.setter
@@ -151,7 +136,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def target_offset_x(self) -> float:
-        DLL.ZkCameraInstance_getTargetOffsetX.restype = c_float
         return DLL.ZkCameraInstance_getTargetOffsetX(self._handle)
 
     @target_offset_x.setter
@@ -160,7 +144,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def target_offset_y(self) -> float:
-        DLL.ZkCameraInstance_getTargetOffsetY.restype = c_float
         return DLL.ZkCameraInstance_getTargetOffsetY(self._handle)
 
     @target_offset_y.setter
@@ -169,7 +152,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def target_offset_z(self) -> float:
-        DLL.ZkCameraInstance_getTargetOffsetZ.restype = c_float
         return DLL.ZkCameraInstance_getTargetOffsetZ(self._handle)
 
     @target_offset_z.setter
@@ -178,7 +160,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def velo_trans(self) -> float:
-        DLL.ZkCameraInstance_getVeloTrans.restype = c_float
         return DLL.ZkCameraInstance_getVeloTrans(self._handle)
 
     @velo_trans.setter
@@ -187,7 +168,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def velo_rot(self) -> float:
-        DLL.ZkCameraInstance_getVeloRot.restype = c_float
         return DLL.ZkCameraInstance_getVeloRot(self._handle)
 
     @velo_rot.setter
@@ -196,7 +176,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def translate(self) -> int:
-        DLL.ZkCameraInstance_getTranslate.restype = c_int32
         return DLL.ZkCameraInstance_getTranslate(self._handle)
 
     @translate.setter
@@ -205,7 +184,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def rotate(self) -> int:
-        DLL.ZkCameraInstance_getRotate.restype = c_int32
         return DLL.ZkCameraInstance_getRotate(self._handle)
 
     @rotate.setter
@@ -214,7 +192,6 @@ class CameraInstance(DaedalusInstance):
 
     @property
     def collision(self) -> int:
-        DLL.ZkCameraInstance_getCollision.restype = c_int32
         return DLL.ZkCameraInstance_getCollision(self._handle)
 
     @collision.setter
@@ -6,7 +6,6 @@ from ctypes import c_size_t
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 _USER_STRING_COUNT = 5
@@ -18,7 +17,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def vis_name_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getVisNameS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getVisNameS(self._handle).value
 
     @vis_name_s.setter
@@ -27,7 +25,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def vis_size_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getVisSizeS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getVisSizeS(self._handle).value
 
     @vis_size_s.setter
@@ -36,7 +33,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def vis_alpha(self) -> float:
-        DLL.ZkEffectBaseInstance_getVisAlpha.restype = c_float
         return DLL.ZkEffectBaseInstance_getVisAlpha(self._handle)
 
     @vis_alpha.setter
@@ -45,7 +41,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def vis_alpha_blend_func_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getVisAlphaBlendFuncS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getVisAlphaBlendFuncS(self._handle).value
 
     @vis_alpha_blend_func_s.setter
@@ -54,7 +49,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def vis_tex_ani_fps(self) -> float:
-        DLL.ZkEffectBaseInstance_getVisTexAniFps.restype = c_float
         return DLL.ZkEffectBaseInstance_getVisTexAniFps(self._handle)
 
     @vis_tex_ani_fps.setter
@@ -63,7 +57,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def vis_tex_ani_is_looping(self) -> int:
-        DLL.ZkEffectBaseInstance_getVisTexAniIsLooping.restype = c_int32
         return DLL.ZkEffectBaseInstance_getVisTexAniIsLooping(self._handle)
 
     @vis_tex_ani_is_looping.setter
@@ -72,7 +65,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_mode_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmTrjModeS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmTrjModeS(self._handle).value
 
     @em_trj_mode_s.setter
@@ -81,7 +73,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_origin_node(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmTrjOriginNode.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmTrjOriginNode(self._handle).value
 
     @em_trj_origin_node.setter
@@ -90,7 +81,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_target_node(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmTrjTargetNode.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmTrjTargetNode(self._handle).value
 
     @em_trj_target_node.setter
@@ -99,7 +89,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_target_range(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmTrjTargetRange.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmTrjTargetRange(self._handle)
 
     @em_trj_target_range.setter
@@ -108,7 +97,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_target_azi(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmTrjTargetAzi.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmTrjTargetAzi(self._handle)
 
     @em_trj_target_azi.setter
@@ -117,7 +105,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_target_elev(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmTrjTargetElev.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmTrjTargetElev(self._handle)
 
     @em_trj_target_elev.setter
@@ -126,7 +113,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_num_keys(self) -> int:
-        DLL.ZkEffectBaseInstance_getEmTrjNumKeys.restype = c_int32
         return DLL.ZkEffectBaseInstance_getEmTrjNumKeys(self._handle)
 
     @em_trj_num_keys.setter
@@ -135,7 +121,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_num_keys_var(self) -> int:
-        DLL.ZkEffectBaseInstance_getEmTrjNumKeysVar.restype = c_int32
         return DLL.ZkEffectBaseInstance_getEmTrjNumKeysVar(self._handle)
 
     @em_trj_num_keys_var.setter
@@ -144,7 +129,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_angle_elev_var(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmTrjAngleElevVar.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmTrjAngleElevVar(self._handle)
 
     @em_trj_angle_elev_var.setter
@@ -153,7 +137,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_angle_head_var(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmTrjAngleHeadVar.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmTrjAngleHeadVar(self._handle)
 
     @em_trj_angle_head_var.setter
@@ -162,7 +145,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_key_dist_var(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmTrjKeyDistVar.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmTrjKeyDistVar(self._handle)
 
     @em_trj_key_dist_var.setter
@@ -171,7 +153,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_loop_mode_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmTrjLoopModeS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmTrjLoopModeS(self._handle).value
 
     @em_trj_loop_mode_s.setter
@@ -180,7 +161,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_ease_func_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmTrjEaseFuncS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmTrjEaseFuncS(self._handle).value
 
     @em_trj_ease_func_s.setter
@@ -189,7 +169,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_ease_vel(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmTrjEaseVel.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmTrjEaseVel(self._handle)
 
     @em_trj_ease_vel.setter
@@ -198,7 +177,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_dyn_update_delay(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmTrjDynUpdateDelay.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmTrjDynUpdateDelay(self._handle)
 
     @em_trj_dyn_update_delay.setter
@@ -207,7 +185,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_trj_dyn_update_target_only(self) -> int:
-        DLL.ZkEffectBaseInstance_getEmTrjDynUpdateTargetOnly.restype = c_int32
         return DLL.ZkEffectBaseInstance_getEmTrjDynUpdateTargetOnly(self._handle)
 
     @em_trj_dyn_update_target_only.setter
@@ -216,7 +193,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_create_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmFxCreateS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmFxCreateS(self._handle).value
 
     @em_fx_create_s.setter
@@ -225,7 +201,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_invest_origin_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmFxInvestOriginS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmFxInvestOriginS(self._handle).value
 
     @em_fx_invest_origin_s.setter
@@ -234,7 +209,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_invest_target_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmFxInvestTargetS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmFxInvestTargetS(self._handle).value
 
     @em_fx_invest_target_s.setter
@@ -243,7 +217,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_trigger_delay(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmFxTriggerDelay.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmFxTriggerDelay(self._handle)
 
     @em_fx_trigger_delay.setter
@@ -252,7 +225,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_create_down_trj(self) -> int:
-        DLL.ZkEffectBaseInstance_getEmFxCreateDownTrj.restype = c_int32
         return DLL.ZkEffectBaseInstance_getEmFxCreateDownTrj(self._handle)
 
     @em_fx_create_down_trj.setter
@@ -261,7 +233,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_action_coll_dyn_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmActionCollDynS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmActionCollDynS(self._handle).value
 
     @em_action_coll_dyn_s.setter
@@ -270,7 +241,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_action_coll_stat_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmActionCollStatS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmActionCollStatS(self._handle).value
 
     @em_action_coll_stat_s.setter
@@ -279,7 +249,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_coll_stat_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmFxCollStatS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmFxCollStatS(self._handle).value
 
     @em_fx_coll_stat_s.setter
@@ -288,7 +257,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_coll_dyn_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmFxCollDynS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmFxCollDynS(self._handle).value
 
     @em_fx_coll_dyn_s.setter
@@ -297,7 +265,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_coll_stat_align_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmFxCollStatAlignS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmFxCollStatAlignS(self._handle).value
 
     @em_fx_coll_stat_align_s.setter
@@ -306,7 +273,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_coll_dyn_align_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmFxCollDynAlignS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmFxCollDynAlignS(self._handle).value
 
     @em_fx_coll_dyn_align_s.setter
@@ -315,7 +281,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_lifespan(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmFxLifespan.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmFxLifespan(self._handle)
 
     @em_fx_lifespan.setter
@@ -324,7 +289,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_check_collision(self) -> int:
-        DLL.ZkEffectBaseInstance_getEmCheckCollision.restype = c_int32
         return DLL.ZkEffectBaseInstance_getEmCheckCollision(self._handle)
 
     @em_check_collision.setter
@@ -333,7 +297,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_adjust_shp_to_origin(self) -> int:
-        DLL.ZkEffectBaseInstance_getEmAdjustShpToOrigin.restype = c_int32
         return DLL.ZkEffectBaseInstance_getEmAdjustShpToOrigin(self._handle)
 
     @em_adjust_shp_to_origin.setter
@@ -342,7 +305,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_invest_next_key_duration(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmInvestNextKeyDuration.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmInvestNextKeyDuration(self._handle)
 
     @em_invest_next_key_duration.setter
@@ -351,7 +313,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fly_gravity(self) -> float:
-        DLL.ZkEffectBaseInstance_getEmFlyGravity.restype = c_float
         return DLL.ZkEffectBaseInstance_getEmFlyGravity(self._handle)
 
     @em_fly_gravity.setter
@@ -360,7 +321,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_self_rot_vel_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmSelfRotVelS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmSelfRotVelS(self._handle).value
 
     @em_self_rot_vel_s.setter
@@ -369,7 +329,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def light_preset_name(self) -> str:
-        DLL.ZkEffectBaseInstance_getLightPresetName.restype = ZkString
         return DLL.ZkEffectBaseInstance_getLightPresetName(self._handle).value
 
     @light_preset_name.setter
@@ -378,7 +337,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def sfx_id(self) -> str:
-        DLL.ZkEffectBaseInstance_getSfxId.restype = ZkString
         return DLL.ZkEffectBaseInstance_getSfxId(self._handle).value
 
     @sfx_id.setter
@@ -387,7 +345,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def sfx_is_ambient(self) -> int:
-        DLL.ZkEffectBaseInstance_getSfxIsAmbient.restype = c_int32
         return DLL.ZkEffectBaseInstance_getSfxIsAmbient(self._handle)
 
     @sfx_is_ambient.setter
@@ -396,7 +353,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def send_assess_magic(self) -> int:
-        DLL.ZkEffectBaseInstance_getSendAssessMagic.restype = c_int32
         return DLL.ZkEffectBaseInstance_getSendAssessMagic(self._handle)
 
     @send_assess_magic.setter
@@ -405,7 +361,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def secs_per_damage(self) -> float:
-        DLL.ZkEffectBaseInstance_getSecsPerDamage.restype = c_float
         return DLL.ZkEffectBaseInstance_getSecsPerDamage(self._handle)
 
     @secs_per_damage.setter
@@ -414,7 +369,6 @@ class EffectBaseInstance(DaedalusInstance):
 
     @property
     def em_fx_coll_dyn_perc_s(self) -> str:
-        DLL.ZkEffectBaseInstance_getEmFxCollDynPercS.restype = ZkString
         return DLL.ZkEffectBaseInstance_getEmFxCollDynPercS(self._handle).value
 
     @em_fx_coll_dyn_perc_s.setter
@@ -425,7 +379,6 @@ class EffectBaseInstance(DaedalusInstance):
         if i < 0 or i >= _USER_STRING_COUNT:
             raise IndexError(i)
 
-        DLL.ZkEffectBaseInstance_getUserString.restype = ZkString
         return DLL.ZkEffectBaseInstance_getUserString(self._handle, c_size_t(i)).value
 
     def set_user_string(self, i: int, val: str) -> None:
@@ -1,6 +1,5 @@
 __all__ = ["FightAiInstance"]
 
-from ctypes import c_int
 from ctypes import c_size_t
 from enum import IntEnum
 from typing import Any
@@ -40,7 +39,6 @@ class FightAiInstance(DaedalusInstance):
         if i < 0 or i >= _FAI_MOVE_COUNT:
             raise IndexError(i)
 
-        DLL.ZkFightAiInstance_getMove.restype = c_int
         return FightAiMove(DLL.ZkFightAiInstance_getMove(self._handle, c_size_t(i)))
 
     def set_user_string(self, i: int, val: FightAiMove) -> None:
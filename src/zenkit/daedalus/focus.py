@@ -14,7 +14,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def npc_longrange(self) -> float:
-        DLL.ZkFocusInstance_getNpcLongrange.restype = c_float
         return DLL.ZkFocusInstance_getNpcLongrange(self._handle)
 
     @npc_longrange.setter
@@ -23,7 +22,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def npc_range1(self) -> float:
-        DLL.ZkFocusInstance_getNpcRange1.restype = c_float
         return DLL.ZkFocusInstance_getNpcRange1(self._handle)
 
     @npc_range1.setter
@@ -32,7 +30,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def npc_range2(self) -> float:
-        DLL.ZkFocusInstance_getNpcRange2.restype = c_float
         return DLL.ZkFocusInstance_getNpcRange2(self._handle)
 
     @npc_range2.setter
@@ -41,7 +38,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def npc_azi(self) -> float:
-        DLL.ZkFocusInstance_getNpcAzi.restype = c_float
         return DLL.ZkFocusInstance_getNpcAzi(self._handle)
 
     @npc_azi.setter
@@ -50,7 +46,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def npc_elevdo(self) -> float:
-        DLL.ZkFocusInstance_getNpcElevdo.restype = c_float
         return DLL.ZkFocusInstance_getNpcElevdo(self._handle)
 
     @npc_elevdo.setter
@@ -59,7 +54,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def npc_elevup(self) -> float:
-        DLL.ZkFocusInstance_getNpcElevup.restype = c_float
         return DLL.ZkFocusInstance_getNpcElevup(self._handle)
 
     @npc_elevup.setter
@@ -68,7 +62,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def npc_prio(self) -> int:
-        DLL.ZkFocusInstance_getNpcPrio.restype = c_int32
         return DLL.ZkFocusInstance_getNpcPrio(self._handle)
 
     @npc_prio.setter
@@ -77,7 +70,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def item_range1(self) -> float:
-        DLL.ZkFocusInstance_getItemRange1.restype = c_float
         return DLL.ZkFocusInstance_getItemRange1(self._handle)
 
     @item_range1.setter
@@ -86,7 +78,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def item_range2(self) -> float:
-        DLL.ZkFocusInstance_getItemRange2.restype = c_float
         return DLL.ZkFocusInstance_getItemRange2(self._handle)
 
     @item_range2.setter
@@ -95,7 +86,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def item_azi(self) -> float:
-        DLL.ZkFocusInstance_getItemAzi.restype = c_float
         return DLL.ZkFocusInstance_getItemAzi(self._handle)
 
     @item_azi.setter
@@ -104,7 +94,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def item_elevdo(self) -> float:
-        DLL.ZkFocusInstance_getItemElevdo.restype = c_float
         return DLL.ZkFocusInstance_getItemElevdo(self._handle)
 
     @item_elevdo.setter
@@ -113,7 +102,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def item_elevup(self) -> float:
-        DLL.ZkFocusInstance_getItemElevup.restype = c_float
         return DLL.ZkFocusInstance_getItemElevup(self._handle)
 
     @item_elevup.setter
@@ -122,7 +110,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def item_prio(self) -> int:
-        DLL.ZkFocusInstance_getItemPrio.restype = c_int32
         return DLL.ZkFocusInstance_getItemPrio(self._handle)
 
     @item_prio.setter
@@ -131,7 +118,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def mob_range1(self) -> float:
-        DLL.ZkFocusInstance_getMobRange1.restype = c_float
         return DLL.ZkFocusInstance_getMobRange1(self._handle)
 
     @mob_range1.setter
@@ -140,7 +126,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def mob_range2(self) -> float:
-        DLL.ZkFocusInstance_getMobRange2.restype = c_float
         return DLL.ZkFocusInstance_getMobRange2(self._handle)
 
     @mob_range2.setter
@@ -149,7 +134,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def mob_azi(self) -> float:
-        DLL.ZkFocusInstance_getMobAzi.restype = c_float
         return DLL.ZkFocusInstance_getMobAzi(self._handle)
 
     @mob_azi.setter
@@ -158,7 +142,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def mob_elevdo(self) -> float:
-        DLL.ZkFocusInstance_getMobElevdo.restype = c_float
         return DLL.ZkFocusInstance_getMobElevdo(self._handle)
 
     @mob_elevdo.setter
@@ -167,7 +150,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def mob_elevup(self) -> float:
-        DLL.ZkFocusInstance_getMobElevup.restype = c_float
         return DLL.ZkFocusInstance_getMobElevup(self._handle)
 
     @mob_elevup.setter
@@ -176,7 +158,6 @@ class FocusInstance(DaedalusInstance):
 
     @property
     def mob_prio(self) -> int:
-        DLL.ZkFocusInstance_getMobPrio.restype = c_int32
         return DLL.ZkFocusInstance_getMobPrio(self._handle)
 
     @mob_prio.setter
@@ -6,7 +6,6 @@ from ctypes import c_int32
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 
@@ -16,7 +15,6 @@ class InfoInstance(DaedalusInstance):
 
     @property
     def npc(self) -> int:
-        DLL.ZkInfoInstance_getNpc.restype = c_int32
         return DLL.ZkInfoInstance_getNpc(self._handle)
 
     @npc.setter
@@ -25,7 +23,6 @@ class InfoInstance(DaedalusInstance):
 
     @property
     def nr(self) -> int:
-        DLL.ZkInfoInstance_getNr.restype = c_int32
         return DLL.ZkInfoInstance_getNr(self._handle)
 
     @nr.setter
@@ -34,7 +31,6 @@ class InfoInstance(DaedalusInstance):
 
     @property
     def important(self) -> int:
-        DLL.ZkInfoInstance_getImportant.restype = c_int32
         return DLL.ZkInfoInstance_getImportant(self._handle)
 
     @important.setter
@@ -43,7 +39,6 @@ class InfoInstance(DaedalusInstance):
 
     @property
     def condition(self) -> int:
-        DLL.ZkInfoInstance_getCondition.restype = c_int32
         return DLL.ZkInfoInstance_getCondition(self._handle)
 
     @condition.setter
@@ -52,7 +47,6 @@ class InfoInstance(DaedalusInstance):
 
     @property
     def information(self) -> int:
-        DLL.ZkInfoInstance_getInformation.restype = c_int32
         return DLL.ZkInfoInstance_getInformation(self._handle)
 
     @information.setter
@@ -61,7 +55,6 @@ class InfoInstance(DaedalusInstance):
 
     @property
     def description(self) -> str:
-        DLL.ZkInfoInstance_getDescription.restype = ZkString
         return DLL.ZkInfoInstance_getDescription(self._handle).value
 
     @description.setter
@@ -70,7 +63,6 @@ class InfoInstance(DaedalusInstance):
 
     @property
     def trade(self) -> int:
-        DLL.ZkInfoInstance_getTrade.restype = c_int32
         return DLL.ZkInfoInstance_getTrade(self._handle)
 
     @trade.setter
@@ -79,7 +71,6 @@ class InfoInstance(DaedalusInstance):
 
     @property
     def permanent(self) -> int:
-        DLL.ZkInfoInstance_getPermanent.restype = c_int32
         return DLL.ZkInfoInstance_getPermanent(self._handle)
 
     @permanent.setter
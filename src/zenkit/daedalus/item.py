@@ -11,7 +11,6 @@ from enum import IntEnum
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 from zenkit.daedalus.npc import DamageType
 
@@ -58,7 +57,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def id(self) -> int:
-        DLL.ZkItemInstance_getId.restype = c_int32
         return DLL.ZkItemInstance_getId(self._handle)
 
     @id.setter
@@ -67,7 +65,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def name(self) -> str:
-        DLL.ZkItemInstance_getName.restype = ZkString
         return DLL.ZkItemInstance_getName(self._handle).value
 
     @name.setter
@@ -76,7 +73,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def name_id(self) -> str:
-        DLL.ZkItemInstance_getNameId.restype = ZkString
         return DLL.ZkItemInstance_getNameId(self._handle).value
 
     @name_id.setter
@@ -85,7 +81,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def hp(self) -> int:
-        DLL.ZkItemInstance_getHp.restype = c_int32
         return DLL.ZkItemInstance_getHp(self._handle)
 
     @hp.setter
@@ -94,7 +89,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def hp_max(self) -> int:
-        DLL.ZkItemInstance_getHpMax.restype = c_int32
         return DLL.ZkItemInstance_getHpMax(self._handle)
 
     @hp_max.setter
@@ -103,7 +97,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def main_flag(self) -> int:
-        DLL.ZkItemInstance_getMainFlag.restype = c_int32
         return DLL.ZkItemInstance_getMainFlag(self._handle)
 
     @main_flag.setter
@@ -112,7 +105,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def flags(self) -> int:
-        DLL.ZkItemInstance_getFlags.restype = c_int32
         return DLL.ZkItemInstance_getFlags(self._handle)
 
     @flags.setter
@@ -121,7 +113,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def weight(self) -> int:
-        DLL.ZkItemInstance_getWeight.restype = c_int32
         return DLL.ZkItemInstance_getWeight(self._handle)
 
     @weight.setter
@@ -130,7 +121,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def value(self) -> int:
-        DLL.ZkItemInstance_getValue.restype = c_int32
         return DLL.ZkItemInstance_getValue(self._handle)
 
     @value.setter
@@ -139,7 +129,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def damage_type(self) -> int:
-        DLL.ZkItemInstance_getDamageType.restype = c_int32
         return DLL.ZkItemInstance_getDamageType(self._handle)
 
     @damage_type.setter
@@ -148,7 +137,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def damage_total(self) -> int:
-        DLL.ZkItemInstance_getDamageTotal.restype = c_int32
         return DLL.ZkItemInstance_getDamageTotal(self._handle)
 
     @damage_total.setter
@@ -157,7 +145,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def wear(self) -> int:
-        DLL.ZkItemInstance_getWear.restype = c_int32
         return DLL.ZkItemInstance_getWear(self._handle)
 
     @wear.setter
@@ -166,7 +153,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def nutrition(self) -> int:
-        DLL.ZkItemInstance_getNutrition.restype = c_int32
         return DLL.ZkItemInstance_getNutrition(self._handle)
 
     @nutrition.setter
@@ -175,7 +161,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def magic(self) -> int:
-        DLL.ZkItemInstance_getMagic.restype = c_int32
         return DLL.ZkItemInstance_getMagic(self._handle)
 
     @magic.setter
@@ -184,7 +169,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def on_equip(self) -> int:
-        DLL.ZkItemInstance_getOnEquip.restype = c_int32
         return DLL.ZkItemInstance_getOnEquip(self._handle)
 
     @on_equip.setter
@@ -193,7 +177,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def on_unequip(self) -> int:
-        DLL.ZkItemInstance_getOnUnequip.restype = c_int32
         return DLL.ZkItemInstance_getOnUnequip(self._handle)
 
     @on_unequip.setter
@@ -202,7 +185,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def owner(self) -> int:
-        DLL.ZkItemInstance_getOwner.restype = c_int32
         return DLL.ZkItemInstance_getOwner(self._handle)
 
     @owner.setter
@@ -211,7 +193,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def owner_guild(self) -> int:
-        DLL.ZkItemInstance_getOwnerGuild.restype = c_int32
         return DLL.ZkItemInstance_getOwnerGuild(self._handle)
 
     @owner_guild.setter
@@ -220,7 +201,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def disguise_guild(self) -> int:
-        DLL.ZkItemInstance_getDisguiseGuild.restype = c_int32
         return DLL.ZkItemInstance_getDisguiseGuild(self._handle)
 
     @disguise_guild.setter
@@ -229,7 +209,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def visual(self) -> str:
-        DLL.ZkItemInstance_getVisual.restype = ZkString
         return DLL.ZkItemInstance_getVisual(self._handle).value
 
     @visual.setter
@@ -238,7 +217,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def visual_change(self) -> str:
-        DLL.ZkItemInstance_getVisualChange.restype = ZkString
         return DLL.ZkItemInstance_getVisualChange(self._handle).value
 
     @visual_change.setter
@@ -247,7 +225,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def effect(self) -> str:
-        DLL.ZkItemInstance_getEffect.restype = ZkString
         return DLL.ZkItemInstance_getEffect(self._handle).value
 
     @effect.setter
@@ -256,7 +233,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def visual_skin(self) -> int:
-        DLL.ZkItemInstance_getVisualSkin.restype = c_int32
         return DLL.ZkItemInstance_getVisualSkin(self._handle)
 
     @visual_skin.setter
@@ -265,7 +241,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def scheme_name(self) -> str:
-        DLL.ZkItemInstance_getSchemeName.restype = ZkString
         return DLL.ZkItemInstance_getSchemeName(self._handle).value
 
     @scheme_name.setter
@@ -274,7 +249,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def material(self) -> int:
-        DLL.ZkItemInstance_getMaterial.restype = c_int32
         return DLL.ZkItemInstance_getMaterial(self._handle)
 
     @material.setter
@@ -283,7 +257,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def munition(self) -> int:
-        DLL.ZkItemInstance_getMunition.restype = c_int32
         return DLL.ZkItemInstance_getMunition(self._handle)
 
     @munition.setter
@@ -292,7 +265,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def spell(self) -> int:
-        DLL.ZkItemInstance_getSpell.restype = c_int32
         return DLL.ZkItemInstance_getSpell(self._handle)
 
     @spell.setter
@@ -301,7 +273,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def range(self) -> int:
-        DLL.ZkItemInstance_getRange.restype = c_int32
         return DLL.ZkItemInstance_getRange(self._handle)
 
     @range.setter
@@ -310,7 +281,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def mag_circle(self) -> int:
-        DLL.ZkItemInstance_getMagCircle.restype = c_int32
         return DLL.ZkItemInstance_getMagCircle(self._handle)
 
     @mag_circle.setter
@@ -319,7 +289,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def description(self) -> str:
-        DLL.ZkItemInstance_getDescription.restype = ZkString
         return DLL.ZkItemInstance_getDescription(self._handle).value
 
     @description.setter
@@ -328,7 +297,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def inv_z_bias(self) -> int:
-        DLL.ZkItemInstance_getInvZBias.restype = c_int32
         return DLL.ZkItemInstance_getInvZBias(self._handle)
 
     @inv_z_bias.setter
@@ -337,7 +305,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def inv_rot_x(self) -> int:
-        DLL.ZkItemInstance_getInvRotX.restype = c_int32
         return DLL.ZkItemInstance_getInvRotX(self._handle)
 
     @inv_rot_x.setter
@@ -346,7 +313,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def inv_rot_y(self) -> int:
-        DLL.ZkItemInstance_getInvRotY.restype = c_int32
         return DLL.ZkItemInstance_getInvRotY(self._handle)
 
     @inv_rot_y.setter
@@ -355,7 +321,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def inv_rot_z(self) -> int:
-        DLL.ZkItemInstance_getInvRotZ.restype = c_int32
         return DLL.ZkItemInstance_getInvRotZ(self._handle)
 
     @inv_rot_z.setter
@@ -364,7 +329,6 @@ class ItemInstance(DaedalusInstance):
 
     @property
     def inv_animate(self) -> int:
-        DLL.ZkItemInstance_getInvAnimate.restype = c_int32
         return DLL.ZkItemInstance_getInvAnimate(self._handle)
 
     @inv_animate.setter
@@ -372,39 +336,30 @@ class ItemInstance(DaedalusInstance):
         DLL.ZkItemInstance_setInvAnimate(self._handle, c_int32(value))
 
     def get_damage(self, typ: DamageType) -> int:
-        DLL.ZkItemInstance_getDamage.restype = c_int32
         return DLL.ZkItemInstance_getDamage(self._handle, typ.value)
 
     def get_protection(self, typ: DamageType) -> int:
-        DLL.ZkItemInstance_getProtection.restype = c_int32
         return DLL.ZkItemInstance_getProtection(self._handle, typ.value)
 
     def get_cond_atr(self, slot: ItemInstanceConditionSlot) -> int:
-        DLL.ZkItemInstance_getCondAtr.restype = c_int32
         return DLL.ZkItemInstance_getCondAtr(self._handle, slot.value)
 
     def get_cond_value(self, slot: ItemInstanceConditionSlot) -> int:
-        DLL.ZkItemInstance_getCondValue.restype = c_int32
         return DLL.ZkItemInstance_getCondValue(self._handle, slot.value)
 
     def get_change_atr(self, slot: ItemInstanceConditionSlot) -> int:
-        DLL.ZkItemInstance_getChangeAtr.restype = c_int32
         return DLL.ZkItemInstance_getChangeAtr(self._handle, slot.value)
 
     def get_change_value(self, slot: ItemInstanceConditionSlot) -> int:
-        DLL.ZkItemInstance_getChangeValue.restype = c_int32
         return DLL.ZkItemInstance_getChangeValue(self._handle, slot.value)
 
     def get_on_state(self, slot: ItemInstanceStateSlot) -> int:
-        DLL.ZkItemInstance_getOnState.restype = c_int32
         return DLL.ZkItemInstance_getOnState(self._handle, slot.value)
 
     def get_count(self, slot: ItemInstanceTextSlot) -> int:
-        DLL.ZkItemInstance_getCount.restype = c_int32
         return DLL.ZkItemInstance_getCount(self._handle, slot.value)
 
     def get_text(self, slot: ItemInstanceTextSlot) -> str:
-        DLL.ZkItemInstance_getText.restype = ZkString
         return DLL.ZkItemInstance_getText(self._handle, slot.value)
 
     def set_damage(self, typ: DamageType, val: int) -> None:
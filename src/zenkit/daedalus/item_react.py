@@ -13,7 +13,6 @@ class ItemReactInstance(DaedalusInstance):
 
     @property
     def npc(self) -> int:
-        DLL.ZkItemReactInstance_getNpc.restype = c_int32
         return DLL.ZkItemReactInstance_getNpc(self._handle)
 
     @npc.setter
@@ -22,7 +21,6 @@ class ItemReactInstance(DaedalusInstance):
 
     @property
     def trade_item(self) -> int:
-        DLL.ZkItemReactInstance_getTradeItem.restype = c_int32
         return DLL.ZkItemReactInstance_getTradeItem(self._handle)
 
     @trade_item.setter
@@ -31,7 +29,6 @@ class ItemReactInstance(DaedalusInstance):
 
     @property
     def trade_amount(self) -> int:
-        DLL.ZkItemReactInstance_getTradeAmount.restype = c_int32
         return DLL.ZkItemReactInstance_getTradeAmount(self._handle)
 
     @trade_amount.setter
@@ -40,7 +37,6 @@ class ItemReactInstance(DaedalusInstance):
 
     @property
     def requested_category(self) -> int:
-        DLL.ZkItemReactInstance_getRequestedCategory.restype = c_int32
         return DLL.ZkItemReactInstance_getRequestedCategory(self._handle)
 
     @requested_category.setter
@@ -49,7 +45,6 @@ class ItemReactInstance(DaedalusInstance):
 
     @property
     def requested_item(self) -> int:
-        DLL.ZkItemReactInstance_getRequestedItem.restype = c_int32
         return DLL.ZkItemReactInstance_getRequestedItem(self._handle)
 
     @requested_item.setter
@@ -58,7 +53,6 @@ class ItemReactInstance(DaedalusInstance):
 
     @property
     def requested_amount(self) -> int:
-        DLL.ZkItemReactInstance_getRequestedAmount.restype = c_int32
         return DLL.ZkItemReactInstance_getRequestedAmount(self._handle)
 
     @requested_amount.setter
@@ -67,7 +61,6 @@ class ItemReactInstance(DaedalusInstance):
 
     @property
     def reaction(self) -> int:
-        DLL.ZkItemReactInstance_getReaction.restype = c_int32
         return DLL.ZkItemReactInstance_getReaction(self._handle)
 
     @reaction.setter
@@ -5,7 +5,6 @@ from ctypes import c_size_t
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 _MENU_ITEM_COUNT = 150
@@ -17,7 +16,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def back_pic(self) -> str:
-        DLL.ZkMenuInstance_getBackPic.restype = ZkString
         return DLL.ZkMenuInstance_getBackPic(self._handle).value
 
     @back_pic.setter
@@ -26,7 +24,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def back_world(self) -> str:
-        DLL.ZkMenuInstance_getBackWorld.restype = ZkString
         return DLL.ZkMenuInstance_getBackWorld(self._handle).value
 
     @back_world.setter
@@ -35,7 +32,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def pos_x(self) -> int:
-        DLL.ZkMenuInstance_getPosX.restype = c_int32
         return DLL.ZkMenuInstance_getPosX(self._handle)
 
     @pos_x.setter
@@ -44,7 +40,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def pos_y(self) -> int:
-        DLL.ZkMenuInstance_getPosY.restype = c_int32
         return DLL.ZkMenuInstance_getPosY(self._handle)
 
     @pos_y.setter
@@ -53,7 +48,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def dim_x(self) -> int:
-        DLL.ZkMenuInstance_getDimX.restype = c_int32
         return DLL.ZkMenuInstance_getDimX(self._handle)
 
     @dim_x.setter
@@ -62,7 +56,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def dim_y(self) -> int:
-        DLL.ZkMenuInstance_getDimY.restype = c_int32
         return DLL.ZkMenuInstance_getDimY(self._handle)
 
     @dim_y.setter
@@ -71,7 +64,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def alpha(self) -> int:
-        DLL.ZkMenuInstance_getAlpha.restype = c_int32
         return DLL.ZkMenuInstance_getAlpha(self._handle)
 
     @alpha.setter
@@ -80,7 +72,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def music_theme(self) -> str:
-        DLL.ZkMenuInstance_getMusicTheme.restype = ZkString
         return DLL.ZkMenuInstance_getMusicTheme(self._handle).value
 
     @music_theme.setter
@@ -89,7 +80,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def event_timer_msec(self) -> int:
-        DLL.ZkMenuInstance_getEventTimerMsec.restype = c_int32
         return DLL.ZkMenuInstance_getEventTimerMsec(self._handle)
 
     @event_timer_msec.setter
@@ -98,7 +88,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def flags(self) -> int:
-        DLL.ZkMenuInstance_getFlags.restype = c_int32
         return DLL.ZkMenuInstance_getFlags(self._handle)
 
     @flags.setter
@@ -107,7 +96,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def default_outgame(self) -> int:
-        DLL.ZkMenuInstance_getDefaultOutgame.restype = c_int32
         return DLL.ZkMenuInstance_getDefaultOutgame(self._handle)
 
     @default_outgame.setter
@@ -116,7 +104,6 @@ class MenuInstance(DaedalusInstance):
 
     @property
     def default_ingame(self) -> int:
-        DLL.ZkMenuInstance_getDefaultIngame.restype = c_int32
         return DLL.ZkMenuInstance_getDefaultIngame(self._handle)
 
     @default_ingame.setter
@@ -126,7 +113,6 @@ class MenuInstance(DaedalusInstance):
     def get_item(self, i: int) -> str:
         if i < 0 or i >= _MENU_ITEM_COUNT:
             raise IndexError(i)
-        DLL.ZkMenuInstance_getItem.restype = ZkString
         return DLL.ZkMenuInstance_getItem(self._handle, c_size_t(i))
 
     def set_item(self, i: int, val: str) -> None:
@@ -5,14 +5,12 @@ __all__ = [
 ]
 
 from ctypes import c_float
-from ctypes import c_int
 from ctypes import c_int32
 from ctypes import c_size_t
 from enum import IntEnum
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 _MENU_ITEM_TEXT_COUNT = 10
@@ -57,7 +55,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def font_name(self) -> str:
-        DLL.ZkMenuItemInstance_getFontName.restype = ZkString
         return DLL.ZkMenuItemInstance_getFontName(self._handle).value
 
     @font_name.setter
@@ -66,7 +63,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def backpic(self) -> str:
-        DLL.ZkMenuItemInstance_getBackpic.restype = ZkString
         return DLL.ZkMenuItemInstance_getBackpic(self._handle).value
 
     @backpic.setter
@@ -75,7 +71,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def alpha_mode(self) -> str:
-        DLL.ZkMenuItemInstance_getAlphaMode.restype = ZkString
         return DLL.ZkMenuItemInstance_getAlphaMode(self._handle).value
 
     @alpha_mode.setter
@@ -84,7 +79,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def alpha(self) -> int:
-        DLL.ZkMenuItemInstance_getAlpha.restype = c_int32
         return DLL.ZkMenuItemInstance_getAlpha(self._handle)
 
     @alpha.setter
@@ -93,7 +87,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def type(self) -> MenuItemType:
-        DLL.ZkMenuItemInstance_getType.restype = c_int
         return MenuItemType(DLL.ZkMenuItemInstance_getType(self._handle))
 
     @type.setter
@@ -102,7 +95,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def on_chg_set_option(self) -> str:
-        DLL.ZkMenuItemInstance_getOnChgSetOption.restype = ZkString
         return DLL.ZkMenuItemInstance_getOnChgSetOption(self._handle).value
 
     @on_chg_set_option.setter
@@ -111,7 +103,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def on_chg_set_option_section(self) -> str:
-        DLL.ZkMenuItemInstance_getOnChgSetOptionSection.restype = ZkString
         return DLL.ZkMenuItemInstance_getOnChgSetOptionSection(self._handle).value
 
     @on_chg_set_option_section.setter
@@ -120,7 +111,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def pos_x(self) -> int:
-        DLL.ZkMenuItemInstance_getPosX.restype = c_int32
         return DLL.ZkMenuItemInstance_getPosX(self._handle)
 
     @pos_x.setter
@@ -129,7 +119,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def pos_y(self) -> int:
-        DLL.ZkMenuItemInstance_getPosY.restype = c_int32
         return DLL.ZkMenuItemInstance_getPosY(self._handle)
 
     @pos_y.setter
@@ -138,7 +127,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def dim_x(self) -> int:
-        DLL.ZkMenuItemInstance_getDimX.restype = c_int32
         return DLL.ZkMenuItemInstance_getDimX(self._handle)
 
     @dim_x.setter
@@ -147,7 +135,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def dim_y(self) -> int:
-        DLL.ZkMenuItemInstance_getDimY.restype = c_int32
         return DLL.ZkMenuItemInstance_getDimY(self._handle)
 
     @dim_y.setter
@@ -156,7 +143,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def size_start_scale(self) -> float:
-        DLL.ZkMenuItemInstance_getSizeStartScale.restype = c_float
         return DLL.ZkMenuItemInstance_getSizeStartScale(self._handle)
 
     @size_start_scale.setter
@@ -165,7 +151,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def flags(self) -> int:
-        DLL.ZkMenuItemInstance_getFlags.restype = c_int32
         return DLL.ZkMenuItemInstance_getFlags(self._handle)
 
     @flags.setter
@@ -174,7 +159,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def open_delay_time(self) -> float:
-        DLL.ZkMenuItemInstance_getOpenDelayTime.restype = c_float
         return DLL.ZkMenuItemInstance_getOpenDelayTime(self._handle)
 
     @open_delay_time.setter
@@ -183,7 +167,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def open_duration(self) -> float:
-        DLL.ZkMenuItemInstance_getOpenDuration.restype = c_float
         return DLL.ZkMenuItemInstance_getOpenDuration(self._handle)
 
     @open_duration.setter
@@ -192,7 +175,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def frame_pos_x(self) -> int:
-        DLL.ZkMenuItemInstance_getFramePosX.restype = c_int32
         return DLL.ZkMenuItemInstance_getFramePosX(self._handle)
 
     @frame_pos_x.setter
@@ -201,7 +183,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def frame_pos_y(self) -> int:
-        DLL.ZkMenuItemInstance_getFramePosY.restype = c_int32
         return DLL.ZkMenuItemInstance_getFramePosY(self._handle)
 
     @frame_pos_y.setter
@@ -210,7 +191,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def frame_size_x(self) -> int:
-        DLL.ZkMenuItemInstance_getFrameSizeX.restype = c_int32
         return DLL.ZkMenuItemInstance_getFrameSizeX(self._handle)
 
     @frame_size_x.setter
@@ -219,7 +199,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def frame_size_y(self) -> int:
-        DLL.ZkMenuItemInstance_getFrameSizeY.restype = c_int32
         return DLL.ZkMenuItemInstance_getFrameSizeY(self._handle)
 
     @frame_size_y.setter
@@ -228,7 +207,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def hide_if_option_section_set(self) -> str:
-        DLL.ZkMenuItemInstance_getHideIfOptionSectionSet.restype = ZkString
         return DLL.ZkMenuItemInstance_getHideIfOptionSectionSet(self._handle).value
 
     @hide_if_option_section_set.setter
@@ -237,7 +215,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def hide_if_option_set(self) -> str:
-        DLL.ZkMenuItemInstance_getHideIfOptionSet.restype = ZkString
         return DLL.ZkMenuItemInstance_getHideIfOptionSet(self._handle).value
 
     @hide_if_option_set.setter
@@ -246,7 +223,6 @@ class MenuItemInstance(DaedalusInstance):
 
     @property
     def hide_on_value(self) -> int:
-        DLL.ZkMenuItemInstance_getHideOnValue.restype = c_int32
         return DLL.ZkMenuItemInstance_getHideOnValue(self._handle)
 
     @hide_on_value.setter
@@ -256,37 +232,31 @@ class MenuItemInstance(DaedalusInstance):
     def get_on_sel_action(self, i: int) -> int:
         if i < 0 or i >= _MENU_ITEM_SELECT_ACTION_COUNT:
             raise IndexError(i)
-        DLL.ZkMenuItemInstance_getOnSelAction.restype = c_int32
         return DLL.ZkMenuItemInstance_getOnSelAction(self._handle, c_size_t(i))
 
     def get_on_event_action(self, i: int) -> int:
         if i < 0 or i >= _MENU_ITEM_EVENT_ACTION_COUNT:
             raise IndexError(i)
-        DLL.ZkMenuItemInstance_getOnEventAction.restype = c_int32
         return DLL.ZkMenuItemInstance_getOnEventAction(self._handle, c_size_t(i))
 
     def get_user_float(self, i: int) -> float:
         if i < 0 or i >= _MENU_ITEM_USER_COUNT:
             raise IndexError(i)
-        DLL.ZkMenuItemInstance_getUserFloat.restype = float
         return DLL.ZkMenuItemInstance_getUserFloat(self._handle, c_size_t(i))
 
     def get_text(self, i: int) -> str:
         if i < 0 or i >= _MENU_ITEM_TEXT_COUNT:
             raise IndexError(i)
-        DLL.ZkMenuItemInstance_getText.restype = ZkString
         return DLL.ZkMenuItemInstance_getText(self._handle, c_size_t(i)).value
 
     def get_on_sel_action_s(self, i: int) -> str:
         if i < 0 or i >= _MENU_ITEM_SELECT_ACTION_COUNT:
             raise IndexError(i)
-        DLL.ZkMenuItemInstance_getOnSelActionS.restype = ZkString
         return DLL.ZkMenuItemInstance_getOnSelActionS(self._handle, c_size_t(i)).value
 
     def get_user_string(self, i: int) -> str:
         if i < 0 or i >= _MENU_ITEM_USER_COUNT:
             raise IndexError(i)
-        DLL.ZkMenuItemInstance_getUserString.restype = ZkString
         return DLL.ZkMenuItemInstance_getUserString(self._handle, c_size_t(i)).value
 
     def set_on_sel_action(self, i: int, val: int) -> None:
@@ -4,7 +4,6 @@ from ctypes import c_int32
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 
@@ -14,7 +13,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def name(self) -> str:
-        DLL.ZkMissionInstance_getName.restype = ZkString
         return DLL.ZkMissionInstance_getName(self._handle).value
 
     @name.setter
@@ -23,7 +21,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def description(self) -> str:
-        DLL.ZkMissionInstance_getDescription.restype = ZkString
         return DLL.ZkMissionInstance_getDescription(self._handle).value
 
     @description.setter
@@ -32,7 +29,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def duration(self) -> int:
-        DLL.ZkMissionInstance_getDuration.restype = c_int32
         return DLL.ZkMissionInstance_getDuration(self._handle)
 
     @duration.setter
@@ -41,7 +37,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def important(self) -> int:
-        DLL.ZkMissionInstance_getImportant.restype = c_int32
         return DLL.ZkMissionInstance_getImportant(self._handle)
 
     @important.setter
@@ -50,7 +45,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def offer_conditions(self) -> int:
-        DLL.ZkMissionInstance_getOfferConditions.restype = c_int32
         return DLL.ZkMissionInstance_getOfferConditions(self._handle)
 
     @offer_conditions.setter
@@ -59,7 +53,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def offer(self) -> int:
-        DLL.ZkMissionInstance_getOffer.restype = c_int32
         return DLL.ZkMissionInstance_getOffer(self._handle)
 
     @offer.setter
@@ -68,7 +61,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def success_conditions(self) -> int:
-        DLL.ZkMissionInstance_getSuccessConditions.restype = c_int32
         return DLL.ZkMissionInstance_getSuccessConditions(self._handle)
 
     @success_conditions.setter
@@ -77,7 +69,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def success(self) -> int:
-        DLL.ZkMissionInstance_getSuccess.restype = c_int32
         return DLL.ZkMissionInstance_getSuccess(self._handle)
 
     @success.setter
@@ -86,7 +77,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def failure_conditions(self) -> int:
-        DLL.ZkMissionInstance_getFailureConditions.restype = c_int32
         return DLL.ZkMissionInstance_getFailureConditions(self._handle)
 
     @failure_conditions.setter
@@ -95,7 +85,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def failure(self) -> int:
-        DLL.ZkMissionInstance_getFailure.restype = c_int32
         return DLL.ZkMissionInstance_getFailure(self._handle)
 
     @failure.setter
@@ -104,7 +93,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def obsolete_conditions(self) -> int:
-        DLL.ZkMissionInstance_getObsoleteConditions.restype = c_int32
         return DLL.ZkMissionInstance_getObsoleteConditions(self._handle)
 
     @obsolete_conditions.setter
@@ -113,7 +101,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def obsolete(self) -> int:
-        DLL.ZkMissionInstance_getObsolete.restype = c_int32
         return DLL.ZkMissionInstance_getObsolete(self._handle)
 
     @obsolete.setter
@@ -122,7 +109,6 @@ class MissionInstance(DaedalusInstance):
 
     @property
     def running(self) -> int:
-        DLL.ZkMissionInstance_getRunning.restype = c_int32
         return DLL.ZkMissionInstance_getRunning(self._handle)
 
     @running.setter
@@ -7,7 +7,6 @@ from ctypes import c_int32
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 
@@ -17,7 +16,6 @@ class MusicJingleInstance(DaedalusInstance):
 
     @property
     def name(self) -> str:
-        DLL.ZkMusicJingleInstance_getName.restype = ZkString
         return DLL.ZkMusicJingleInstance_getName(self._handle).value
 
     @name.setter
@@ -26,7 +24,6 @@ class MusicJingleInstance(DaedalusInstance):
 
     @property
     def loop(self) -> int:
-        DLL.ZkMusicJingleInstance_getLoop.restype = c_int32
         return DLL.ZkMusicJingleInstance_getLoop(self._handle)
 
     @loop.setter
@@ -35,7 +32,6 @@ class MusicJingleInstance(DaedalusInstance):
 
     @property
     def vol(self) -> float:
-        DLL.ZkMusicJingleInstance_getVol.restype = c_float
         return DLL.ZkMusicJingleInstance_getVol(self._handle)
 
     @vol.setter
@@ -44,7 +40,6 @@ class MusicJingleInstance(DaedalusInstance):
 
     @property
     def transsubtype(self) -> int:
-        DLL.ZkMusicJingleInstance_getTranssubtype.restype = c_int32
         return DLL.ZkMusicJingleInstance_getTranssubtype(self._handle)
 
     @transsubtype.setter
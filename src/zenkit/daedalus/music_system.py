@@ -16,7 +16,6 @@ class MusicSystemInstance(DaedalusInstance):
 
     @property
     def volume(self) -> float:
-        DLL.ZkMusicSystemInstance_getVolume.restype = c_float
         return DLL.ZkMusicSystemInstance_getVolume(self._handle)
 
     @volume.setter
@@ -25,7 +24,6 @@ class MusicSystemInstance(DaedalusInstance):
 
     @property
     def bit_resolution(self) -> int:
-        DLL.ZkMusicSystemInstance_getBitResolution.restype = c_int32
         return DLL.ZkMusicSystemInstance_getBitResolution(self._handle)
 
     @bit_resolution.setter
@@ -34,7 +32,6 @@ class MusicSystemInstance(DaedalusInstance):
 
     @property
     def global_reverb_enabled(self) -> int:
-        DLL.ZkMusicSystemInstance_getGlobalReverbEnabled.restype = c_int32
         return DLL.ZkMusicSystemInstance_getGlobalReverbEnabled(self._handle)
 
     @global_reverb_enabled.setter
@@ -43,7 +40,6 @@ class MusicSystemInstance(DaedalusInstance):
 
     @property
     def sample_rate(self) -> int:
-        DLL.ZkMusicSystemInstance_getSampleRate.restype = c_int32
         return DLL.ZkMusicSystemInstance_getSampleRate(self._handle)
 
     @sample_rate.setter
@@ -52,7 +48,6 @@ class MusicSystemInstance(DaedalusInstance):
 
     @property
     def num_channels(self) -> int:
-        DLL.ZkMusicSystemInstance_getNumChannels.restype = c_int32
         return DLL.ZkMusicSystemInstance_getNumChannels(self._handle)
 
     @num_channels.setter
@@ -61,7 +56,6 @@ class MusicSystemInstance(DaedalusInstance):
 
     @property
     def reverb_buffer_size(self) -> int:
-        DLL.ZkMusicSystemInstance_getReverbBufferSize.restype = c_int32
         return DLL.ZkMusicSystemInstance_getReverbBufferSize(self._handle)
 
     @reverb_buffer_size.setter
@@ -5,13 +5,11 @@ __all__ = [
 ]
 
 from ctypes import c_float
-from ctypes import c_int
 from ctypes import c_int32
 from enum import IntEnum
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 
@@ -39,7 +37,6 @@ class MusicThemeInstance(DaedalusInstance):
 
     @property
     def file(self) -> str:
-        DLL.ZkMusicThemeInstance_getFile.restype = ZkString
         return DLL.ZkMusicThemeInstance_getFile(self._handle).value
 
     @file.setter
@@ -48,7 +45,6 @@ class MusicThemeInstance(DaedalusInstance):
 
     @property
     def vol(self) -> float:
-        DLL.ZkMusicThemeInstance_getVol.restype = c_float
         return DLL.ZkMusicThemeInstance_getVol(self._handle)
 
     @vol.setter
@@ -57,7 +53,6 @@ class MusicThemeInstance(DaedalusInstance):
 
     @property
     def loop(self) -> int:
-        DLL.ZkMusicThemeInstance_getLoop.restype = c_int32
         return DLL.ZkMusicThemeInstance_getLoop(self._handle)
 
     @loop.setter
@@ -66,7 +61,6 @@ class MusicThemeInstance(DaedalusInstance):
 
     @property
     def reverbmix(self) -> float:
-        DLL.ZkMusicThemeInstance_getReverbmix.restype = c_float
         return DLL.ZkMusicThemeInstance_getReverbmix(self._handle)
 
     @reverbmix.setter
@@ -75,7 +69,6 @@ class MusicThemeInstance(DaedalusInstance):
 
     @property
     def reverbtime(self) -> float:
-        DLL.ZkMusicThemeInstance_getReverbtime.restype = c_float
         return DLL.ZkMusicThemeInstance_getReverbtime(self._handle)
 
     @reverbtime.setter
@@ -84,7 +77,6 @@ class MusicThemeInstance(DaedalusInstance):
 
     @property
     def transtype(self) -> MusicTransitionEffect:
-        DLL.ZkMusicThemeInstance_getTranstype.restype = c_int
         return MusicTransitionEffect(DLL.ZkMusicThemeInstance_getTranstype(self._handle))
 
     @transtype.setter
@@ -93,7 +85,6 @@ class MusicThemeInstance(DaedalusInstance):
 
     @property
     def transsubtype(self) -> MusicTransitionType:
-        DLL.ZkMusicThemeInstance_getTranssubtype.restype = c_int
         return MusicTransitionType(DLL.ZkMusicThemeInstance_getTranssubtype(self._handle))
 
     @transsubtype.setter
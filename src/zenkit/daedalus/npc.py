@@ -9,7 +9,6 @@ __all__ = [
     "NpcInstanceNameSlot",
 ]
 
-from ctypes import c_int
 from ctypes import c_int32
 from ctypes import c_size_t
 from ctypes import c_uint32
@@ -17,7 +16,6 @@ from enum import IntEnum
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 _NPC_AIVAR_COUNT = 100
@@ -103,7 +101,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def id(self) -> int:
-        DLL.ZkNpcInstance_getId.restype = c_int32
         return DLL.ZkNpcInstance_getId(self._handle)
 
     @id.setter
@@ -112,7 +109,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def slot(self) -> str:
-        DLL.ZkNpcInstance_getSlot.restype = ZkString
         return DLL.ZkNpcInstance_getSlot(self._handle).value
 
     @slot.setter
@@ -121,7 +117,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def effect(self) -> str:
-        DLL.ZkNpcInstance_getEffect.restype = ZkString
         return DLL.ZkNpcInstance_getEffect(self._handle).value
 
     @effect.setter
@@ -130,7 +125,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def type(self) -> NpcInstanceType:
-        DLL.ZkNpcInstance_getType.restype = c_int
         return NpcInstanceType(DLL.ZkNpcInstance_getType(self._handle))
 
     @type.setter
@@ -139,7 +133,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def flags(self) -> int:
-        DLL.ZkNpcInstance_getFlags.restype = c_uint32
         return DLL.ZkNpcInstance_getFlags(self._handle)
 
     @flags.setter
@@ -148,7 +141,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def damage_type(self) -> int:
-        DLL.ZkNpcInstance_getDamageType.restype = c_int32
         return DLL.ZkNpcInstance_getDamageType(self._handle)
 
     @damage_type.setter
@@ -157,7 +149,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def guild(self) -> int:
-        DLL.ZkNpcInstance_getGuild.restype = c_int32
         return DLL.ZkNpcInstance_getGuild(self._handle)
 
     @guild.setter
@@ -166,7 +157,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def level(self) -> int:
-        DLL.ZkNpcInstance_getLevel.restype = c_int32
         return DLL.ZkNpcInstance_getLevel(self._handle)
 
     @level.setter
@@ -175,7 +165,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def fight_tactic(self) -> int:
-        DLL.ZkNpcInstance_getFightTactic.restype = c_int32
         return DLL.ZkNpcInstance_getFightTactic(self._handle)
 
     @fight_tactic.setter
@@ -184,7 +173,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def weapon(self) -> int:
-        DLL.ZkNpcInstance_getWeapon.restype = c_int32
         return DLL.ZkNpcInstance_getWeapon(self._handle)
 
     @weapon.setter
@@ -193,7 +181,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def voice(self) -> int:
-        DLL.ZkNpcInstance_getVoice.restype = c_int32
         return DLL.ZkNpcInstance_getVoice(self._handle)
 
     @voice.setter
@@ -202,7 +189,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def voice_pitch(self) -> int:
-        DLL.ZkNpcInstance_getVoicePitch.restype = c_int32
         return DLL.ZkNpcInstance_getVoicePitch(self._handle)
 
     @voice_pitch.setter
@@ -211,7 +197,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def body_mass(self) -> int:
-        DLL.ZkNpcInstance_getBodyMass.restype = c_int32
         return DLL.ZkNpcInstance_getBodyMass(self._handle)
 
     @body_mass.setter
@@ -220,7 +205,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def daily_routine(self) -> int:
-        DLL.ZkNpcInstance_getDailyRoutine.restype = c_int32
         return DLL.ZkNpcInstance_getDailyRoutine(self._handle)
 
     @daily_routine.setter
@@ -229,7 +213,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def start_ai_state(self) -> int:
-        DLL.ZkNpcInstance_getStartAiState.restype = c_int32
         return DLL.ZkNpcInstance_getStartAiState(self._handle)
 
     @start_ai_state.setter
@@ -238,7 +221,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def spawn_point(self) -> str:
-        DLL.ZkNpcInstance_getSpawnPoint.restype = ZkString
         return DLL.ZkNpcInstance_getSpawnPoint(self._handle).value
 
     @spawn_point.setter
@@ -247,7 +229,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def spawn_delay(self) -> int:
-        DLL.ZkNpcInstance_getSpawnDelay.restype = c_int32
         return DLL.ZkNpcInstance_getSpawnDelay(self._handle)
 
     @spawn_delay.setter
@@ -256,7 +237,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def senses(self) -> int:
-        DLL.ZkNpcInstance_getSenses.restype = c_int32
         return DLL.ZkNpcInstance_getSenses(self._handle)
 
     @senses.setter
@@ -265,7 +245,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def senses_range(self) -> int:
-        DLL.ZkNpcInstance_getSensesRange.restype = c_int32
         return DLL.ZkNpcInstance_getSensesRange(self._handle)
 
     @senses_range.setter
@@ -274,7 +253,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def wp(self) -> str:
-        DLL.ZkNpcInstance_getWp.restype = ZkString
         return DLL.ZkNpcInstance_getWp(self._handle).value
 
     @wp.setter
@@ -283,7 +261,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def exp(self) -> int:
-        DLL.ZkNpcInstance_getExp.restype = c_int32
         return DLL.ZkNpcInstance_getExp(self._handle)
 
     @exp.setter
@@ -292,7 +269,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def exp_next(self) -> int:
-        DLL.ZkNpcInstance_getExpNext.restype = c_int32
         return DLL.ZkNpcInstance_getExpNext(self._handle)
 
     @exp_next.setter
@@ -301,7 +277,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def lp(self) -> int:
-        DLL.ZkNpcInstance_getLp.restype = c_int32
         return DLL.ZkNpcInstance_getLp(self._handle)
 
     @lp.setter
@@ -310,7 +285,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def body_state_interruptable_override(self) -> int:
-        DLL.ZkNpcInstance_getBodyStateInterruptableOverride.restype = c_int32
         return DLL.ZkNpcInstance_getBodyStateInterruptableOverride(self._handle)
 
     @body_state_interruptable_override.setter
@@ -319,7 +293,6 @@ class NpcInstance(DaedalusInstance):
 
     @property
     def no_focus(self) -> int:
-        DLL.ZkNpcInstance_getNoFocus.restype = c_int32
         return DLL.ZkNpcInstance_getNoFocus(self._handle)
 
     @no_focus.setter
@@ -327,33 +300,26 @@ class NpcInstance(DaedalusInstance):
         DLL.ZkNpcInstance_setNoFocus(self._handle, c_int32(value))
 
     def get_name(self, slot: NpcInstanceNameSlot) -> str:
-        DLL.ZkNpcInstance_getName.restype = ZkString
         return DLL.ZkNpcInstance_getName(self._handle, slot.value).value
 
     def get_mission(self, slot: NpcInstanceMissionSlot) -> int:
-        DLL.ZkNpcInstance_getMission.restype = c_int32
         return DLL.ZkNpcInstance_getMission(self._handle, slot.value)
 
     def get_attribute(self, attribute: NpcInstanceAttribute) -> int:
-        DLL.ZkNpcInstance_getAttribute.restype = c_int32
         return DLL.ZkNpcInstance_getAttribute(self._handle, attribute.value)
 
     def get_hit_chance(self, talent: NpcInstanceTalent) -> int:
-        DLL.ZkNpcInstance_getHitChance.restype = c_int32
         return DLL.ZkNpcInstance_getHitChance(self._handle, talent.value)
 
     def get_protection(self, typ: DamageType) -> int:
-        DLL.ZkNpcInstance_getProtection.restype = c_int32
         return DLL.ZkNpcInstance_getProtection(self._handle, typ.value)
 
     def get_damage(self, typ: DamageType) -> int:
-        DLL.ZkNpcInstance_getDamage.restype = c_int32
         return DLL.ZkNpcInstance_getDamage(self._handle, typ.value)
 
     def get_ai_var(self, i: int) -> int:
         if i < 0 or i >= _NPC_AIVAR_COUNT:
             raise IndexError(i)
-        DLL.ZkNpcInstance_getAiVar.restype = c_int32
         return DLL.ZkNpcInstance_getAiVar(self._handle, c_size_t(i))
 
     def set_name(self, slot: NpcInstanceNameSlot, val: str) -> None:
@@ -5,7 +5,6 @@ from ctypes import c_int32
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 
@@ -15,7 +14,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def pps_value(self) -> float:
-        DLL.ZkParticleEffectInstance_getPpsValue.restype = c_float
         return DLL.ZkParticleEffectInstance_getPpsValue(self._handle)
 
     @pps_value.setter
@@ -24,7 +22,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def pps_scale_keys_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getPpsScaleKeysS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getPpsScaleKeysS(self._handle).value
 
     @pps_scale_keys_s.setter
@@ -33,7 +30,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def pps_is_looping(self) -> int:
-        DLL.ZkParticleEffectInstance_getPpsIsLooping.restype = c_int32
         return DLL.ZkParticleEffectInstance_getPpsIsLooping(self._handle)
 
     @pps_is_looping.setter
@@ -42,7 +38,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def pps_is_smooth(self) -> int:
-        DLL.ZkParticleEffectInstance_getPpsIsSmooth.restype = c_int32
         return DLL.ZkParticleEffectInstance_getPpsIsSmooth(self._handle)
 
     @pps_is_smooth.setter
@@ -51,7 +46,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def pps_fps(self) -> float:
-        DLL.ZkParticleEffectInstance_getPpsFps.restype = c_float
         return DLL.ZkParticleEffectInstance_getPpsFps(self._handle)
 
     @pps_fps.setter
@@ -60,7 +54,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def pps_create_em_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getPpsCreateEmS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getPpsCreateEmS(self._handle).value
 
     @pps_create_em_s.setter
@@ -69,7 +62,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def pps_create_em_delay(self) -> float:
-        DLL.ZkParticleEffectInstance_getPpsCreateEmDelay.restype = c_float
         return DLL.ZkParticleEffectInstance_getPpsCreateEmDelay(self._handle)
 
     @pps_create_em_delay.setter
@@ -78,7 +70,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_type_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getShpTypeS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getShpTypeS(self._handle).value
 
     @shp_type_s.setter
@@ -87,7 +78,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_for_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getShpForS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getShpForS(self._handle).value
 
     @shp_for_s.setter
@@ -96,7 +86,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_offset_vec_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getShpOffsetVecS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getShpOffsetVecS(self._handle).value
 
     @shp_offset_vec_s.setter
@@ -105,7 +94,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_distrib_type_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getShpDistribTypeS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getShpDistribTypeS(self._handle).value
 
     @shp_distrib_type_s.setter
@@ -114,7 +102,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_distrib_walk_speed(self) -> float:
-        DLL.ZkParticleEffectInstance_getShpDistribWalkSpeed.restype = c_float
         return DLL.ZkParticleEffectInstance_getShpDistribWalkSpeed(self._handle)
 
     @shp_distrib_walk_speed.setter
@@ -123,7 +110,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_is_volume(self) -> int:
-        DLL.ZkParticleEffectInstance_getShpIsVolume.restype = c_int32
         return DLL.ZkParticleEffectInstance_getShpIsVolume(self._handle)
 
     @shp_is_volume.setter
@@ -132,7 +118,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_dim_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getShpDimS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getShpDimS(self._handle).value
 
     @shp_dim_s.setter
@@ -141,7 +126,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_mesh_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getShpMeshS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getShpMeshS(self._handle).value
 
     @shp_mesh_s.setter
@@ -150,7 +134,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_mesh_render_b(self) -> int:
-        DLL.ZkParticleEffectInstance_getShpMeshRenderB.restype = c_int32
         return DLL.ZkParticleEffectInstance_getShpMeshRenderB(self._handle)
 
     @shp_mesh_render_b.setter
@@ -159,7 +142,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_scale_keys_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getShpScaleKeysS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getShpScaleKeysS(self._handle).value
 
     @shp_scale_keys_s.setter
@@ -168,7 +150,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_scale_is_looping(self) -> int:
-        DLL.ZkParticleEffectInstance_getShpScaleIsLooping.restype = c_int32
         return DLL.ZkParticleEffectInstance_getShpScaleIsLooping(self._handle)
 
     @shp_scale_is_looping.setter
@@ -177,7 +158,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_scale_is_smooth(self) -> int:
-        DLL.ZkParticleEffectInstance_getShpScaleIsSmooth.restype = c_int32
         return DLL.ZkParticleEffectInstance_getShpScaleIsSmooth(self._handle)
 
     @shp_scale_is_smooth.setter
@@ -186,7 +166,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def shp_scale_fps(self) -> float:
-        DLL.ZkParticleEffectInstance_getShpScaleFps.restype = c_float
         return DLL.ZkParticleEffectInstance_getShpScaleFps(self._handle)
 
     @shp_scale_fps.setter
@@ -195,7 +174,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def dir_mode_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getDirModeS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getDirModeS(self._handle).value
 
     @dir_mode_s.setter
@@ -204,7 +182,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def dir_for_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getDirForS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getDirForS(self._handle).value
 
     @dir_for_s.setter
@@ -213,7 +190,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def dir_mode_target_for_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getDirModeTargetForS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getDirModeTargetForS(self._handle).value
 
     @dir_mode_target_for_s.setter
@@ -222,7 +198,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def dir_mode_target_pos_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getDirModeTargetPosS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getDirModeTargetPosS(self._handle).value
 
     @dir_mode_target_pos_s.setter
@@ -231,7 +206,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def dir_angle_head(self) -> float:
-        DLL.ZkParticleEffectInstance_getDirAngleHead.restype = c_float
         return DLL.ZkParticleEffectInstance_getDirAngleHead(self._handle)
 
     @dir_angle_head.setter
@@ -240,7 +214,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def dir_angle_head_var(self) -> float:
-        DLL.ZkParticleEffectInstance_getDirAngleHeadVar.restype = c_float
         return DLL.ZkParticleEffectInstance_getDirAngleHeadVar(self._handle)
 
     @dir_angle_head_var.setter
@@ -249,7 +222,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def dir_angle_elev(self) -> float:
-        DLL.ZkParticleEffectInstance_getDirAngleElev.restype = c_float
         return DLL.ZkParticleEffectInstance_getDirAngleElev(self._handle)
 
     @dir_angle_elev.setter
@@ -258,7 +230,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def dir_angle_elev_var(self) -> float:
-        DLL.ZkParticleEffectInstance_getDirAngleElevVar.restype = c_float
         return DLL.ZkParticleEffectInstance_getDirAngleElevVar(self._handle)
 
     @dir_angle_elev_var.setter
@@ -267,7 +238,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vel_avg(self) -> float:
-        DLL.ZkParticleEffectInstance_getVelAvg.restype = c_float
         return DLL.ZkParticleEffectInstance_getVelAvg(self._handle)
 
     @vel_avg.setter
@@ -276,7 +246,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vel_var(self) -> float:
-        DLL.ZkParticleEffectInstance_getVelVar.restype = c_float
         return DLL.ZkParticleEffectInstance_getVelVar(self._handle)
 
     @vel_var.setter
@@ -285,7 +254,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def lsp_part_avg(self) -> float:
-        DLL.ZkParticleEffectInstance_getLspPartAvg.restype = c_float
         return DLL.ZkParticleEffectInstance_getLspPartAvg(self._handle)
 
     @lsp_part_avg.setter
@@ -294,7 +262,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def lsp_part_var(self) -> float:
-        DLL.ZkParticleEffectInstance_getLspPartVar.restype = c_float
         return DLL.ZkParticleEffectInstance_getLspPartVar(self._handle)
 
     @lsp_part_var.setter
@@ -303,7 +270,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def fly_gravity_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getFlyGravityS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getFlyGravityS(self._handle).value
 
     @fly_gravity_s.setter
@@ -312,7 +278,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def fly_colldet_b(self) -> int:
-        DLL.ZkParticleEffectInstance_getFlyColldetB.restype = c_int32
         return DLL.ZkParticleEffectInstance_getFlyColldetB(self._handle)
 
     @fly_colldet_b.setter
@@ -321,7 +286,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_name_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getVisNameS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getVisNameS(self._handle).value
 
     @vis_name_s.setter
@@ -330,7 +294,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_orientation_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getVisOrientationS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getVisOrientationS(self._handle).value
 
     @vis_orientation_s.setter
@@ -339,7 +302,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_tex_is_quadpoly(self) -> int:
-        DLL.ZkParticleEffectInstance_getVisTexIsQuadpoly.restype = c_int32
         return DLL.ZkParticleEffectInstance_getVisTexIsQuadpoly(self._handle)
 
     @vis_tex_is_quadpoly.setter
@@ -348,7 +310,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_tex_ani_fps(self) -> float:
-        DLL.ZkParticleEffectInstance_getVisTexAniFps.restype = c_float
         return DLL.ZkParticleEffectInstance_getVisTexAniFps(self._handle)
 
     @vis_tex_ani_fps.setter
@@ -357,7 +318,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_tex_ani_is_looping(self) -> int:
-        DLL.ZkParticleEffectInstance_getVisTexAniIsLooping.restype = c_int32
         return DLL.ZkParticleEffectInstance_getVisTexAniIsLooping(self._handle)
 
     @vis_tex_ani_is_looping.setter
@@ -366,7 +326,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_tex_color_start_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getVisTexColorStartS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getVisTexColorStartS(self._handle).value
 
     @vis_tex_color_start_s.setter
@@ -375,7 +334,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_tex_color_end_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getVisTexColorEndS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getVisTexColorEndS(self._handle).value
 
     @vis_tex_color_end_s.setter
@@ -384,7 +342,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_size_start_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getVisSizeStartS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getVisSizeStartS(self._handle).value
 
     @vis_size_start_s.setter
@@ -393,7 +350,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_size_end_scale(self) -> float:
-        DLL.ZkParticleEffectInstance_getVisSizeEndScale.restype = c_float
         return DLL.ZkParticleEffectInstance_getVisSizeEndScale(self._handle)
 
     @vis_size_end_scale.setter
@@ -402,7 +358,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_alpha_func_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getVisAlphaFuncS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getVisAlphaFuncS(self._handle).value
 
     @vis_alpha_func_s.setter
@@ -411,7 +366,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_alpha_start(self) -> float:
-        DLL.ZkParticleEffectInstance_getVisAlphaStart.restype = c_float
         return DLL.ZkParticleEffectInstance_getVisAlphaStart(self._handle)
 
     @vis_alpha_start.setter
@@ -420,7 +374,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def vis_alpha_end(self) -> float:
-        DLL.ZkParticleEffectInstance_getVisAlphaEnd.restype = c_float
         return DLL.ZkParticleEffectInstance_getVisAlphaEnd(self._handle)
 
     @vis_alpha_end.setter
@@ -429,7 +382,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def trl_fade_speed(self) -> float:
-        DLL.ZkParticleEffectInstance_getTrlFadeSpeed.restype = c_float
         return DLL.ZkParticleEffectInstance_getTrlFadeSpeed(self._handle)
 
     @trl_fade_speed.setter
@@ -438,7 +390,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def trl_texture_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getTrlTextureS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getTrlTextureS(self._handle).value
 
     @trl_texture_s.setter
@@ -447,7 +398,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def trl_width(self) -> float:
-        DLL.ZkParticleEffectInstance_getTrlWidth.restype = c_float
         return DLL.ZkParticleEffectInstance_getTrlWidth(self._handle)
 
     @trl_width.setter
@@ -456,7 +406,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def mrk_fades_peed(self) -> float:
-        DLL.ZkParticleEffectInstance_getMrkFadesPeed.restype = c_float
         return DLL.ZkParticleEffectInstance_getMrkFadesPeed(self._handle)
 
     @mrk_fades_peed.setter
@@ -465,7 +414,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def mrkt_exture_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getMrktExtureS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getMrktExtureS(self._handle).value
 
     @mrkt_exture_s.setter
@@ -474,7 +422,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def mrk_size(self) -> float:
-        DLL.ZkParticleEffectInstance_getMrkSize.restype = c_float
         return DLL.ZkParticleEffectInstance_getMrkSize(self._handle)
 
     @mrk_size.setter
@@ -483,7 +430,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def flock_mode(self) -> str:
-        DLL.ZkParticleEffectInstance_getFlockMode.restype = ZkString
         return DLL.ZkParticleEffectInstance_getFlockMode(self._handle).value
 
     @flock_mode.setter
@@ -492,7 +438,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def flock_strength(self) -> float:
-        DLL.ZkParticleEffectInstance_getFlockStrength.restype = c_float
         return DLL.ZkParticleEffectInstance_getFlockStrength(self._handle)
 
     @flock_strength.setter
@@ -501,7 +446,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def use_emitters_for(self) -> int:
-        DLL.ZkParticleEffectInstance_getUseEmittersFor.restype = c_int32
         return DLL.ZkParticleEffectInstance_getUseEmittersFor(self._handle)
 
     @use_emitters_for.setter
@@ -510,7 +454,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def time_start_end_s(self) -> str:
-        DLL.ZkParticleEffectInstance_getTimeStartEndS.restype = ZkString
         return DLL.ZkParticleEffectInstance_getTimeStartEndS(self._handle).value
 
     @time_start_end_s.setter
@@ -519,7 +462,6 @@ class ParticleEffectInstance(DaedalusInstance):
 
     @property
     def m_bias_ambient_pfx(self) -> int:
-        DLL.ZkParticleEffectInstance_getMBiasAmbientPfx.restype = c_int32
         return DLL.ZkParticleEffectInstance_getMBiasAmbientPfx(self._handle)
 
     @m_bias_ambient_pfx.setter
@@ -7,7 +7,6 @@ from ctypes import c_int32
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 
@@ -17,7 +16,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def vis_name_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getVisNameS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getVisNameS(self._handle).value
 
     @vis_name_s.setter
@@ -26,7 +24,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def vis_size_scale(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getVisSizeScale.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getVisSizeScale(self._handle)
 
     @vis_size_scale.setter
@@ -35,7 +32,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def scale_duration(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getScaleDuration.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getScaleDuration(self._handle)
 
     @scale_duration.setter
@@ -44,7 +40,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_pps_value(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxPpsValue.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxPpsValue(self._handle)
 
     @pfx_pps_value.setter
@@ -53,7 +48,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_pps_is_smooth_chg(self) -> int:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxPpsIsSmoothChg.restype = c_int32
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxPpsIsSmoothChg(self._handle)
 
     @pfx_pps_is_smooth_chg.setter
@@ -62,7 +56,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_pps_is_looping_chg(self) -> int:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxPpsIsLoopingChg.restype = c_int32
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxPpsIsLoopingChg(self._handle)
 
     @pfx_pps_is_looping_chg.setter
@@ -71,7 +64,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_sc_time(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxScTime.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxScTime(self._handle)
 
     @pfx_sc_time.setter
@@ -80,7 +72,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_fly_gravity_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxFlyGravityS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxFlyGravityS(self._handle).value
 
     @pfx_fly_gravity_s.setter
@@ -89,7 +80,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_shp_dim_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxShpDimS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxShpDimS(self._handle).value
 
     @pfx_shp_dim_s.setter
@@ -98,7 +88,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_shp_is_volume_chg(self) -> int:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxShpIsVolumeChg.restype = c_int32
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxShpIsVolumeChg(self._handle)
 
     @pfx_shp_is_volume_chg.setter
@@ -107,7 +96,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_shp_scale_fps(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxShpScaleFps.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxShpScaleFps(self._handle)
 
     @pfx_shp_scale_fps.setter
@@ -116,7 +104,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_shp_distrib_walks_peed(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxShpDistribWalksPeed.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxShpDistribWalksPeed(self._handle)
 
     @pfx_shp_distrib_walks_peed.setter
@@ -125,7 +112,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_shp_offset_vec_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxShpOffsetVecS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxShpOffsetVecS(self._handle).value
 
     @pfx_shp_offset_vec_s.setter
@@ -134,7 +120,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_shp_distrib_type_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxShpDistribTypeS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxShpDistribTypeS(self._handle).value
 
     @pfx_shp_distrib_type_s.setter
@@ -143,7 +128,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_dir_mode_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxDirModeS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxDirModeS(self._handle).value
 
     @pfx_dir_mode_s.setter
@@ -152,7 +136,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_dir_for_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxDirForS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxDirForS(self._handle).value
 
     @pfx_dir_for_s.setter
@@ -161,7 +144,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_dir_mode_target_for_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxDirModeTargetForS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxDirModeTargetForS(self._handle).value
 
     @pfx_dir_mode_target_for_s.setter
@@ -170,7 +152,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_dir_mode_target_pos_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxDirModeTargetPosS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxDirModeTargetPosS(self._handle).value
 
     @pfx_dir_mode_target_pos_s.setter
@@ -179,7 +160,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_vel_avg(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxVelAvg.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxVelAvg(self._handle)
 
     @pfx_vel_avg.setter
@@ -188,7 +168,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_lsp_part_avg(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxLspPartAvg.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxLspPartAvg(self._handle)
 
     @pfx_lsp_part_avg.setter
@@ -197,7 +176,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def pfx_vis_alpha_start(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getPfxVisAlphaStart.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getPfxVisAlphaStart(self._handle)
 
     @pfx_vis_alpha_start.setter
@@ -206,7 +184,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def light_preset_name(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getLightPresetName.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getLightPresetName(self._handle).value
 
     @light_preset_name.setter
@@ -215,7 +192,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def light_range(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getLightRange.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getLightRange(self._handle)
 
     @light_range.setter
@@ -224,7 +200,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def sfx_id(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getSfxId.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getSfxId(self._handle).value
 
     @sfx_id.setter
@@ -233,7 +208,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def sfx_is_ambient(self) -> int:
-        DLL.ZkParticleEffectEmitKeyInstance_getSfxIsAmbient.restype = c_int32
         return DLL.ZkParticleEffectEmitKeyInstance_getSfxIsAmbient(self._handle)
 
     @sfx_is_ambient.setter
@@ -242,7 +216,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def em_create_fx_id(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getEmCreateFxId.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getEmCreateFxId(self._handle).value
 
     @em_create_fx_id.setter
@@ -251,7 +224,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def em_fly_gravity(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getEmFlyGravity.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getEmFlyGravity(self._handle)
 
     @em_fly_gravity.setter
@@ -260,7 +232,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def em_self_rot_vel_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getEmSelfRotVelS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getEmSelfRotVelS(self._handle).value
 
     @em_self_rot_vel_s.setter
@@ -269,7 +240,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def em_trj_mode_s(self) -> str:
-        DLL.ZkParticleEffectEmitKeyInstance_getEmTrjModeS.restype = ZkString
         return DLL.ZkParticleEffectEmitKeyInstance_getEmTrjModeS(self._handle).value
 
     @em_trj_mode_s.setter
@@ -278,7 +248,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def em_trj_ease_vel(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getEmTrjEaseVel.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getEmTrjEaseVel(self._handle)
 
     @em_trj_ease_vel.setter
@@ -287,7 +256,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def em_check_collision(self) -> int:
-        DLL.ZkParticleEffectEmitKeyInstance_getEmCheckCollision.restype = c_int32
         return DLL.ZkParticleEffectEmitKeyInstance_getEmCheckCollision(self._handle)
 
     @em_check_collision.setter
@@ -296,7 +264,6 @@ class ParticleEffectEmitKeyInstance(DaedalusInstance):
 
     @property
     def em_fx_lifespan(self) -> float:
-        DLL.ZkParticleEffectEmitKeyInstance_getEmFxLifespan.restype = c_float
         return DLL.ZkParticleEffectEmitKeyInstance_getEmFxLifespan(self._handle)
 
     @em_fx_lifespan.setter
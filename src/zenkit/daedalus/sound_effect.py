@@ -5,7 +5,6 @@ from ctypes import c_int32
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 
@@ -15,7 +14,6 @@ class SoundEffectInstance(DaedalusInstance):
 
     @property
     def file(self) -> str:
-        DLL.ZkSoundEffectInstance_getFile.restype = ZkString
         return DLL.ZkSoundEffectInstance_getFile(self._handle).value
 
     @file.setter
@@ -24,7 +22,6 @@ class SoundEffectInstance(DaedalusInstance):
 
     @property
     def pitch_off(self) -> int:
-        DLL.ZkSoundEffectInstance_getPitchOff.restype = c_int32
         return DLL.ZkSoundEffectInstance_getPitchOff(self._handle)
 
     @pitch_off.setter
@@ -33,7 +30,6 @@ class SoundEffectInstance(DaedalusInstance):
 
     @property
     def pitch_var(self) -> int:
-        DLL.ZkSoundEffectInstance_getPitchVar.restype = c_int32
         return DLL.ZkSoundEffectInstance_getPitchVar(self._handle)
 
     @pitch_var.setter
@@ -42,7 +38,6 @@ class SoundEffectInstance(DaedalusInstance):
 
     @property
     def volume(self) -> int:
-        DLL.ZkSoundEffectInstance_getVolume.restype = c_int32
         return DLL.ZkSoundEffectInstance_getVolume(self._handle)
 
     @volume.setter
@@ -51,7 +46,6 @@ class SoundEffectInstance(DaedalusInstance):
 
     @property
     def loop(self) -> int:
-        DLL.ZkSoundEffectInstance_getLoop.restype = c_int32
         return DLL.ZkSoundEffectInstance_getLoop(self._handle)
 
     @loop.setter
@@ -60,7 +54,6 @@ class SoundEffectInstance(DaedalusInstance):
 
     @property
     def loop_start_offset(self) -> int:
-        DLL.ZkSoundEffectInstance_getLoopStartOffset.restype = c_int32
         return DLL.ZkSoundEffectInstance_getLoopStartOffset(self._handle)
 
     @loop_start_offset.setter
@@ -69,7 +62,6 @@ class SoundEffectInstance(DaedalusInstance):
 
     @property
     def loop_end_offset(self) -> int:
-        DLL.ZkSoundEffectInstance_getLoopEndOffset.restype = c_int32
         return DLL.ZkSoundEffectInstance_getLoopEndOffset(self._handle)
 
     @loop_end_offset.setter
@@ -78,7 +70,6 @@ class SoundEffectInstance(DaedalusInstance):
 
     @property
     def reverb_level(self) -> float:
-        DLL.ZkSoundEffectInstance_getReverbLevel.restype = c_float
         return DLL.ZkSoundEffectInstance_getReverbLevel(self._handle)
 
     @reverb_level.setter
@@ -87,7 +78,6 @@ class SoundEffectInstance(DaedalusInstance):
 
     @property
     def pfx_name(self) -> str:
-        DLL.ZkSoundEffectInstance_getPfxName.restype = ZkString
         return DLL.ZkSoundEffectInstance_getPfxName(self._handle).value
 
     @pfx_name.setter
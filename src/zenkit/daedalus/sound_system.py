@@ -5,7 +5,6 @@ from ctypes import c_int32
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 
 
@@ -15,7 +14,6 @@ class SoundSystemInstance(DaedalusInstance):
 
     @property
     def volume(self) -> float:
-        DLL.ZkSoundSystemInstance_getVolume.restype = c_float
         return DLL.ZkSoundSystemInstance_getVolume(self._handle)
 
     @volume.setter
@@ -24,7 +22,6 @@ class SoundSystemInstance(DaedalusInstance):
 
     @property
     def bit_resolution(self) -> int:
-        DLL.ZkSoundSystemInstance_getBitResolution.restype = c_int32
         return DLL.ZkSoundSystemInstance_getBitResolution(self._handle)
 
     @bit_resolution.setter
@@ -33,7 +30,6 @@ class SoundSystemInstance(DaedalusInstance):
 
     @property
     def sample_rate(self) -> int:
-        DLL.ZkSoundSystemInstance_getSampleRate.restype = c_int32
         return DLL.ZkSoundSystemInstance_getSampleRate(self._handle)
 
     @sample_rate.setter
@@ -42,7 +38,6 @@ class SoundSystemInstance(DaedalusInstance):
 
     @property
     def use_stereo(self) -> int:
-        DLL.ZkSoundSystemInstance_getUseStereo.restype = c_int32
         return DLL.ZkSoundSystemInstance_getUseStereo(self._handle)
 
     @use_stereo.setter
@@ -51,7 +46,6 @@ class SoundSystemInstance(DaedalusInstance):
 
     @property
     def num_sfx_channels(self) -> int:
-        DLL.ZkSoundSystemInstance_getNumSfxChannels.restype = c_int32
         return DLL.ZkSoundSystemInstance_getNumSfxChannels(self._handle)
 
     @num_sfx_channels.setter
@@ -60,7 +54,6 @@ class SoundSystemInstance(DaedalusInstance):
 
     @property
     def used_3d_provider_name(self) -> str:
-        DLL.ZkSoundSystemInstance_getUsed3DProviderName.restype = ZkString
         return DLL.ZkSoundSystemInstance_getUsed3DProviderName(self._handle).value
 
     @used_3d_provider_name.setter
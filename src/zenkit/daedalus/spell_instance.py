@@ -14,7 +14,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def time_per_mana(self) -> float:
-        DLL.ZkSpellInstance_getTimePerMana.restype = c_float
         return DLL.ZkSpellInstance_getTimePerMana(self._handle)
 
     @time_per_mana.setter
@@ -23,7 +22,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def damage_per_level(self) -> int:
-        DLL.ZkSpellInstance_getDamagePerLevel.restype = c_int32
         return DLL.ZkSpellInstance_getDamagePerLevel(self._handle)
 
     @damage_per_level.setter
@@ -32,7 +30,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def damage_type(self) -> int:
-        DLL.ZkSpellInstance_getDamageType.restype = c_int32
         return DLL.ZkSpellInstance_getDamageType(self._handle)
 
     @damage_type.setter
@@ -41,7 +38,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def spell_type(self) -> int:
-        DLL.ZkSpellInstance_getSpellType.restype = c_int32
         return DLL.ZkSpellInstance_getSpellType(self._handle)
 
     @spell_type.setter
@@ -50,7 +46,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def can_turn_during_invest(self) -> int:
-        DLL.ZkSpellInstance_getCanTurnDuringInvest.restype = c_int32
         return DLL.ZkSpellInstance_getCanTurnDuringInvest(self._handle)
 
     @can_turn_during_invest.setter
@@ -59,7 +54,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def can_change_target_during_invest(self) -> int:
-        DLL.ZkSpellInstance_getCanChangeTargetDuringInvest.restype = c_int32
         return DLL.ZkSpellInstance_getCanChangeTargetDuringInvest(self._handle)
 
     @can_change_target_during_invest.setter
@@ -68,7 +62,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def is_multi_effect(self) -> int:
-        DLL.ZkSpellInstance_getIsMultiEffect.restype = c_int32
         return DLL.ZkSpellInstance_getIsMultiEffect(self._handle)
 
     @is_multi_effect.setter
@@ -77,7 +70,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def target_collect_algo(self) -> int:
-        DLL.ZkSpellInstance_getTargetCollectAlgo.restype = c_int32
         return DLL.ZkSpellInstance_getTargetCollectAlgo(self._handle)
 
     @target_collect_algo.setter
@@ -86,7 +78,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def target_collect_type(self) -> int:
-        DLL.ZkSpellInstance_getTargetCollectType.restype = c_int32
         return DLL.ZkSpellInstance_getTargetCollectType(self._handle)
 
     @target_collect_type.setter
@@ -95,7 +86,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def target_collect_range(self) -> int:
-        DLL.ZkSpellInstance_getTargetCollectRange.restype = c_int32
         return DLL.ZkSpellInstance_getTargetCollectRange(self._handle)
 
     @target_collect_range.setter
@@ -104,7 +94,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def target_collect_azi(self) -> int:
-        DLL.ZkSpellInstance_getTargetCollectAzi.restype = c_int32
         return DLL.ZkSpellInstance_getTargetCollectAzi(self._handle)
 
     @target_collect_azi.setter
@@ -113,7 +102,6 @@ class SpellInstance(DaedalusInstance):
 
     @property
     def target_collect_elevation(self) -> int:
-        DLL.ZkSpellInstance_getTargetCollectElevation.restype = c_int32
         return DLL.ZkSpellInstance_getTargetCollectElevation(self._handle)
 
     @target_collect_elevation.setter
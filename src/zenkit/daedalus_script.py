@@ -21,9 +21,10 @@ from typing import ClassVar
 
 from zenkit import _native
 from zenkit._core import DLL
+from zenkit._core import Closeable
 from zenkit._core import PathOrFileLike
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
+from zenkit._core import depend
+from zenkit._core import release
 from zenkit.daedalus.base import DaedalusInstance
 
 
@@ -83,34 +84,15 @@ class DaedalusDataType(IntEnum):
     INSTANCE = 7
 
 
-DLL.ZkDaedalusSymbol_getString.restype = ZkString
-DLL.ZkDaedalusSymbol_getInt.restype = c_int32
-DLL.ZkDaedalusSymbol_getFloat.restype = c_float
-DLL.ZkDaedalusSymbol_getInstance.restype = ZkPointer
-DLL.ZkDaedalusSymbol_getIsConst.restype = c_int
-DLL.ZkDaedalusSymbol_getIsMember.restype = c_int
-DLL.ZkDaedalusSymbol_getIsExternal.restype = c_int
-DLL.ZkDaedalusSymbol_getIsMerged.restype = c_int
-DLL.ZkDaedalusSymbol_getIsGenerated.restype = c_int
-DLL.ZkDaedalusSymbol_getHasReturn.restype = c_int
-DLL.ZkDaedalusSymbol_getName.restype = ZkString
-DLL.ZkDaedalusSymbol_getAddress.restype = c_int32
-DLL.ZkDaedalusSymbol_getParent.restype = c_int32
-DLL.ZkDaedalusSymbol_getSize.restype = c_int32
-DLL.ZkDaedalusSymbol_getType.restype = c_int
-DLL.ZkDaedalusSymbol_getIndex.restype = c_uint32
-DLL.ZkDaedalusSymbol_getReturnType.restype = c_int
-
-
 class DaedalusSymbol:
-    __slots__ = ("_handle", "_keepalive")
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def handle(self) -> c_void_p:
@@ -138,7 +120,7 @@ class DaedalusSymbol:
 
     def get_instance(self) -> DaedalusInstance:
         value = DLL.ZkDaedalusSymbol_getInstance(self._handle)
-        return DaedalusInstance.from_native(value)
+        return DaedalusInstance.from_native(value, keepalive=self._keepalive)
 
     @property
     def is_const(self) -> bool:
@@ -229,15 +211,8 @@ class DaedalusInstruction(Structure):
         return self._index
 
 
-DLL.ZkDaedalusScript_getInstruction.restype = DaedalusInstruction
-DLL.ZkDaedalusScript_getSymbolCount.restype = c_uint32
-DLL.ZkDaedalusScript_getSymbolByIndex.restype = ZkPointer
-DLL.ZkDaedalusScript_getSymbolByAddress.restype = ZkPointer
-DLL.ZkDaedalusScript_getSymbolByName.restype = ZkPointer
-
-
-class DaedalusScript:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class DaedalusScript(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -245,13 +220,17 @@ class DaedalusScript:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def load(path_or_file_like: PathOrFileLike) -> "DaedalusScript":
         handle = _native.load("ZkDaedalusScript_load", path_or_file_like)
         return DaedalusScript(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "DaedalusScript":
+        return await _native.load_async(DaedalusScript.load, path_or_file_like)
+
     @property
     def symbols(self) -> list[DaedalusSymbol]:
         count = DLL.ZkDaedalusScript_getSymbolCount(self._handle)
@@ -278,8 +257,11 @@ class DaedalusScript:
             return None
         return DaedalusSymbol(_handle=handle, _keepalive=self)
 
+    def close(self) -> None:
+        release(self, lambda _: self._deleter())
+
     def __del__(self) -> None:
-        self._deleter()
+        self.close()
 
     @abstractmethod
     def _deleter(self) -> None:
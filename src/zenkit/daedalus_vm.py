@@ -15,8 +15,6 @@ from typing import TypeVar
 from zenkit import _native
 from zenkit._core import DLL
 from zenkit._core import PathOrFileLike
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
 from zenkit.daedalus.base import DaedalusInstance
 from zenkit.daedalus.base import DaedalusInstanceType
 from zenkit.daedalus_script import DaedalusScript
@@ -30,7 +28,7 @@ DaedalusVmExternalDefaultCallback = CFUNCTYPE(None, c_void_p, c_void_p, c_void_p
 
 
 class DaedalusVm(DaedalusScript):
-    __slots__ = ("_handle", "_delete", "_keepalive", "_externals")
+    __slots__ = ("_delete", "_externals", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -42,35 +40,34 @@ class DaedalusVm(DaedalusScript):
         handle = _native.load("ZkDaedalusVm_load", path_or_file_like)
         return DaedalusVm(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "DaedalusVm":
+        return await _native.load_async(DaedalusVm.load, path_or_file_like)
+
     @property
     def global_self(self) -> DaedalusInstance:
-        DLL.ZkDaedalusVm_getGlobalSelf.restype = ZkPointer
         handle = DLL.ZkDaedalusVm_getGlobalSelf(self._handle).value
-        return DaedalusInstance.from_native(handle)
+        return DaedalusInstance.from_native(handle, keepalive=self)
 
     @property
     def global_other(self) -> DaedalusInstance:
-        DLL.ZkDaedalusVm_getGlobalOther.restype = ZkPointer
         handle = DLL.ZkDaedalusVm_getGlobalOther(self._handle).value
-        return DaedalusInstance.from_native(handle)
+        return DaedalusInstance.from_native(handle, keepalive=self)
 
     @property
     def global_victim(self) -> DaedalusInstance:
-        DLL.ZkDaedalusVm_getGlobalVictim.restype = ZkPointer
         handle = DLL.ZkDaedalusVm_getGlobalVictim(self._handle).value
-        return DaedalusInstance.from_native(handle)
+        return DaedalusInstance.from_native(handle, keepalive=self)
 
     @property
     def global_hero(self) -> DaedalusInstance:
-        DLL.ZkDaedalusVm_getGlobalHero.restype = ZkPointer
         handle = DLL.ZkDaedalusVm_getGlobalHero(self._handle).value
-        return DaedalusInstance.from_native(handle)
+        return DaedalusInstance.from_native(handle, keepalive=self)
 
     @property
     def global_item(self) -> DaedalusInstance:
-        DLL.ZkDaedalusVm_getGlobalItem.restype = ZkPointer
         handle = DLL.ZkDaedalusVm_getGlobalItem(self._handle).value
-        return DaedalusInstance.from_native(handle)
+        return DaedalusInstance.from_native(handle, keepalive=self)
 
     @global_self.setter
     def global_self(self, val: DaedalusInstance) -> None:
@@ -116,39 +113,31 @@ class DaedalusVm(DaedalusScript):
         raise ValueError("Unsupported type: " + typ)
 
     def pop_int(self) -> int:
-        DLL.ZkDaedalusVm_popInt.restype = c_int32
         return DLL.ZkDaedalusVm_popInt(self._handle)
 
     def pop_float(self) -> float:
-        DLL.ZkDaedalusVm_popFloat.restype = c_float
         return DLL.ZkDaedalusVm_popFloat(self._handle)
 
     def pop_string(self) -> str:
-        DLL.ZkDaedalusVm_popString.restype = ZkString
         return DLL.ZkDaedalusVm_popString(self._handle).value
 
     def pop_instance(self) -> DaedalusInstance:
-        DLL.ZkDaedalusVm_popInstance.restype = ZkPointer
         handle = DLL.ZkDaedalusVm_popInstance(self._handle).value
-        return DaedalusInstance.from_native(handle)
+        return DaedalusInstance.from_native(handle, keepalive=self)
 
     def alloc_instance(self, sym: DaedalusSymbol | str, typ: DaedalusInstanceType) -> DaedalusInstance:
-        DLL.ZkDaedalusVm_allocInstance.restype = ZkPointer
-
         if isinstance(sym, str):
             sym = self.get_symbol_by_name(sym)
 
         handle = DLL.ZkDaedalusVm_allocInstance(self._handle, sym.handle, typ.value).value
-        return DaedalusInstance.from_native(handle)
+        return DaedalusInstance.from_native(handle, keepalive=self)
 
     def init_instance(self, sym: DaedalusSymbol | str, typ: DaedalusInstanceType) -> DaedalusInstance:
-        DLL.ZkDaedalusVm_initInstance.restype = ZkPointer
-
         if isinstance(sym, str):
             sym = self.get_symbol_by_name(sym)
 
         handle = DLL.ZkDaedalusVm_initInstance(self._handle, sym.handle, typ.value).value
-        return DaedalusInstance.from_native(handle)
+        return DaedalusInstance.from_native(handle, keepalive=self)
 
     def init_instance_direct(self, sym: DaedalusInstance) -> None:
         DLL.ZkDaedalusVm_initInstanceDirect(self._handle, sym.handle)
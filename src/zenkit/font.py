@@ -2,7 +2,6 @@ __all__ = ["Font", "FontGlyph"]
 
 from ctypes import Structure
 from ctypes import c_size_t
-from ctypes import c_uint
 from ctypes import c_uint8
 from ctypes import c_void_p
 from typing import Any
@@ -10,9 +9,11 @@ from typing import ClassVar
 
 from zenkit import _native
 from zenkit._core import DLL
+from zenkit._core import Closeable
 from zenkit._core import PathOrFileLike
 from zenkit._core import Vec2f
-from zenkit._native import ZkString
+from zenkit._core import depend
+from zenkit._core import release
 
 
 class FontGlyph(Structure):
@@ -38,14 +39,8 @@ class FontGlyph(Structure):
         return f"<FontGlyph width={self.width} top_left={self.top_left} bottom_right={self.bottom_right}>"
 
 
-DLL.ZkFont_getName.restype = ZkString
-DLL.ZkFont_getHeight.restype = c_uint
-DLL.ZkFont_getGlyphCount.restype = c_size_t
-DLL.ZkFont_getGlyph.restype = FontGlyph
-
-
-class Font:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class Font(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -53,13 +48,17 @@ class Font:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def load(path_or_file_like: PathOrFileLike) -> "Font":
         handle = _native.load("ZkFont_load", path_or_file_like)
         return Font(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "Font":
+        return await _native.load_async(Font.load, path_or_file_like)
+
     @property
     def name(self) -> str:
         return DLL.ZkFont_getName(self._handle).value
@@ -73,6 +72,9 @@ class Font:
         count = DLL.ZkFont_getGlyphCount(self._handle)
         return [DLL.ZkFont_getGlyph(self._handle, c_size_t(i)) for i in range(count)]
 
+    def close(self) -> None:
+        release(self, DLL.ZkFont_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkFont_del(self._handle)
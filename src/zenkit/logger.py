@@ -33,10 +33,8 @@ def set_logger(level: LogLevel, cb: Callable[[LogLevel, str, str], None]) -> Non
     global _LOGGER  # noqa: PLW0603 / We need to keep a global reference to logger callbacks.
     _LOGGER = logger
 
-    DLL.ZkLogger_set.restype = None
     DLL.ZkLogger_set(c_int(level.value), _LOGGER, c_void_p(None))
 
 
 def set_logger_default(level: LogLevel) -> None:
-    DLL.ZkLogger_setDefault.restype = None
     DLL.ZkLogger_setDefault(c_int(level.value))
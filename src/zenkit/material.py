@@ -7,16 +7,14 @@ __all__ = [
     "WaveMode",
 ]
 
-from ctypes import c_float
-from ctypes import c_int
 from ctypes import c_void_p
 from enum import IntEnum
 from typing import Any
 
-from zenkit._core import Color
 from zenkit._core import DLL
+from zenkit._core import Color
 from zenkit._core import Vec2f
-from zenkit._native import ZkString
+from zenkit._core import depend
 
 
 class MaterialGroup(IntEnum):
@@ -62,41 +60,15 @@ class AlphaFunction(IntEnum):
     MULTIPLY_ALT = 6
 
 
-DLL.ZkMaterial_getName.restype = ZkString
-DLL.ZkMaterial_getGroup.restype = c_int
-DLL.ZkMaterial_getColor.restype = Color
-DLL.ZkMaterial_getSmoothAngle.restype = c_float
-DLL.ZkMaterial_getTexture.restype = ZkString
-DLL.ZkMaterial_getTextureScale.restype = Vec2f
-DLL.ZkMaterial_getTextureAnimationFps.restype = c_float
-DLL.ZkMaterial_getTextureAnimationMapping.restype = c_int
-DLL.ZkMaterial_getTextureAnimationMappingDirection.restype = Vec2f
-DLL.ZkMaterial_getDisableCollision.restype = c_int
-DLL.ZkMaterial_getDisableLightmap.restype = c_int
-DLL.ZkMaterial_getDontCollapse.restype = c_int
-DLL.ZkMaterial_getDetailObject.restype = ZkString
-DLL.ZkMaterial_getDetailObjectScale.restype = c_float
-DLL.ZkMaterial_getForceOccluder.restype = c_int
-DLL.ZkMaterial_getEnvironmentMapping.restype = c_int
-DLL.ZkMaterial_getEnvironmentMappingStrength.restype = c_float
-DLL.ZkMaterial_getWaveMode.restype = c_int
-DLL.ZkMaterial_getWaveSpeed.restype = c_int
-DLL.ZkMaterial_getWaveAmplitude.restype = c_float
-DLL.ZkMaterial_getWaveGridSize.restype = c_float
-DLL.ZkMaterial_getIgnoreSun.restype = c_int
-DLL.ZkMaterial_getAlphaFunction.restype = c_int
-DLL.ZkMaterial_getDefaultMapping.restype = Vec2f
-
-
 class Material:
-    __slots__ = ("_handle", "_keepalive")
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def name(self) -> str:
@@ -1,9 +1,14 @@
 __all__ = [
     "Mesh",
+    "PolygonFlag",
+    "PolygonTable",
+    "RenderBatch",
 ]
 
-from ctypes import POINTER
+from ctypes import CFUNCTYPE
+from ctypes import Array
 from ctypes import Structure
+from ctypes import addressof
 from ctypes import byref
 from ctypes import c_int
 from ctypes import c_int16
@@ -12,23 +17,32 @@ from ctypes import c_size_t
 from ctypes import c_uint8
 from ctypes import c_uint32
 from ctypes import c_void_p
+from ctypes import memmove
+from ctypes import sizeof
+from ctypes import string_at
+from dataclasses import dataclass
 from datetime import datetime
+from enum import IntFlag
+from itertools import pairwise
 from typing import Any
 from typing import ClassVar
 
 from zenkit import _native
 from zenkit._core import DLL
 from zenkit._core import AxisAlignedBoundingBox
-from zenkit._core import Date
+from zenkit._core import Closeable
 from zenkit._core import OrientedBoundingBox
 from zenkit._core import PathOrFileLike
 from zenkit._core import Vec2f
 from zenkit._core import Vec3f
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
+from zenkit._core import depend
+from zenkit._core import release
 from zenkit.material import Material
 from zenkit.texture import Texture
 
+_MeshFeatureEnumerator = CFUNCTYPE(c_int, c_void_p, c_void_p)
+_MeshPolygonEnumerator = CFUNCTYPE(c_int, c_void_p, c_void_p)
+
 
 class Feature(Structure):
     _fields_: ClassVar[tuple[str, Any]] = [
@@ -53,31 +67,15 @@ class Feature(Structure):
         return f"Feature(texture={self.texture!r}, light={self.light!r}, normal={self.normal!r})"
 
 
-DLL.ZkPolygon_getMaterialIndex.restype = c_uint32
-DLL.ZkPolygon_getLightMapIndex.restype = c_int32
-DLL.ZkPolygon_getPositionIndices.restype = POINTER(c_uint32)
-DLL.ZkPolygon_getFeatureIndices.restype = POINTER(c_uint32)
-DLL.ZkPolygon_getIsPortal.restype = c_int
-DLL.ZkPolygon_getIsOccluder.restype = c_int
-DLL.ZkPolygon_getIsSector.restype = c_int
-DLL.ZkPolygon_getShouldRelight.restype = c_int
-DLL.ZkPolygon_getIsOutdoor.restype = c_int
-DLL.ZkPolygon_getIsGhostOccluder.restype = c_int
-DLL.ZkPolygon_getIsDynamicallyLit.restype = c_int
-DLL.ZkPolygon_getIsLod.restype = c_int
-DLL.ZkPolygon_getNormalAxis.restype = c_uint8
-DLL.ZkPolygon_getSectorIndex.restype = c_int16
-
-
 class Polygon:
-    __slots__ = ("_handle", "_keepalive")
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def material_index(self) -> int:
@@ -146,20 +144,91 @@ class Polygon:
         return f"Polygon(position_indices={self.position_indices!r}, feature_indices={self.feature_indices!r}, material_index={self.material_index!r})"
 
 
-DLL.ZkLightMap_getImage.restype = ZkPointer
-DLL.ZkLightMap_getOrigin.restype = Vec3f
-DLL.ZkLightMap_getNormal.restype = Vec3f
+class PolygonFlag(IntFlag):
+    NONE = 0
+    PORTAL = 1
+    OCCLUDER = 2
+    SECTOR = 4
+    SHOULD_RELIGHT = 8
+    OUTDOOR = 16
+    GHOST_OCCLUDER = 32
+    DYNAMICALLY_LIT = 64
+    LOD = 128
+
+
+_POLYGON_FLAG_GETTERS = (
+    ("ZkPolygon_getIsPortal", PolygonFlag.PORTAL),
+    ("ZkPolygon_getIsOccluder", PolygonFlag.OCCLUDER),
+    ("ZkPolygon_getIsSector", PolygonFlag.SECTOR),
+    ("ZkPolygon_getShouldRelight", PolygonFlag.SHOULD_RELIGHT),
+    ("ZkPolygon_getIsOutdoor", PolygonFlag.OUTDOOR),
+    ("ZkPolygon_getIsGhostOccluder", PolygonFlag.GHOST_OCCLUDER),
+    ("ZkPolygon_getIsDynamicallyLit", PolygonFlag.DYNAMICALLY_LIT),
+    ("ZkPolygon_getIsLod", PolygonFlag.LOD),
+)
+
+
+@dataclass
+class PolygonTable:
+    material_indices: Array[c_uint32]
+    light_map_indices: Array[c_int32]
+    flags: Array[c_uint8]
+    sector_indices: Array[c_int16]
+    normal_axes: Array[c_uint8]
+    vertex_offsets: Array[c_uint32]
+    position_indices: Array[c_uint32]
+    feature_indices: Array[c_uint32]
+
+    def __len__(self) -> int:
+        return len(self.material_indices)
+
+    def vertex_range(self, i: int) -> range:
+        return range(self.vertex_offsets[i], self.vertex_offsets[i + 1])
+
+
+@dataclass
+class RenderBatch:
+    material_index: int
+    positions: Array[Vec3f]
+    features: Array[Feature]
+    indices: Array[c_uint32]
+
+
+def _gather_indices(ranges: list[tuple[int, int]], total: int) -> Array[c_uint32]:
+    items = (c_uint32 * total)()
+    if total == 0:
+        return items
+
+    # The native library keeps the indices of all polygons in one shared buffer, usually in polygon order,
+    # in which case a single copy suffices.
+    size = sizeof(c_uint32)
+    if all(a + n * size == b for (a, n), (b, _) in pairwise(ranges)):
+        memmove(items, ranges[0][0], total * size)
+        return items
+
+    target = addressof(items)
+    for address, count in ranges:
+        memmove(target, address, count * size)
+        target += count * size
+
+    return items
+
+
+def _split_items(items: Array[Any]) -> list[bytes]:
+    size = sizeof(items._type_)
+    data = string_at(items, sizeof(items))
+    return [data[i : i + size] for i in range(0, len(data), size)]
 
 
 class LightMap:
-    __slots__ = ("_handle", "_keepalive")
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def image(self) -> Texture:
@@ -177,24 +246,8 @@ class LightMap:
         self._keepalive = None
 
 
-DLL.ZkMesh_getSourceDate.restype = Date
-DLL.ZkMesh_getName.restype = ZkString
-DLL.ZkMesh_getBoundingBox.restype = AxisAlignedBoundingBox
-DLL.ZkMesh_getOrientedBoundingBox.restype = ZkPointer
-DLL.ZkMesh_getMaterialCount.restype = c_size_t
-DLL.ZkMesh_getMaterial.restype = ZkPointer
-DLL.ZkMesh_getPositionCount.restype = c_size_t
-DLL.ZkMesh_getPosition.restype = Vec3f
-DLL.ZkMesh_getVertexCount.restype = c_size_t
-DLL.ZkMesh_getVertex.restype = Feature
-DLL.ZkMesh_getPolygonCount.restype = c_size_t
-DLL.ZkMesh_getPolygon.restype = ZkPointer
-DLL.ZkMesh_getLightMapCount.restype = c_size_t
-DLL.ZkMesh_getLightMap.restype = ZkPointer
-
-
-class Mesh:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class Mesh(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -202,13 +255,17 @@ class Mesh:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def load(path_or_file_like: PathOrFileLike) -> "Mesh":
         handle = _native.load("ZkMesh_load", path_or_file_like)
         return Mesh(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "Mesh":
+        return await _native.load_async(Mesh.load, path_or_file_like)
+
     @property
     def handle(self) -> c_void_p:
         return self._handle
@@ -223,7 +280,7 @@ class Mesh:
 
     @property
     def oriented_bounding_box(self) -> OrientedBoundingBox:
-        return OrientedBoundingBox(_handle=DLL.ZkMesh_getOrientedBoundingBox(self._handle).value)
+        return OrientedBoundingBox(_handle=DLL.ZkMesh_getOrientedBoundingBox(self._handle).value, _keepalive=self)
 
     @property
     def materials(self) -> list[Material]:
@@ -246,6 +303,30 @@ class Mesh:
         count = DLL.ZkMesh_getVertexCount(self._handle)
         return [DLL.ZkMesh_getVertex(self._handle, i) for i in range(count)]
 
+    def positions_array(self) -> Array[Vec3f]:
+        count = DLL.ZkMesh_getPositionCount(self._handle)
+        items = (Vec3f * count)()
+
+        # ZkMesh_enumeratePositions passes each position by value, which costs more per element from Python than
+        # this getter loop. See benchmarks/mesh_arrays.py.
+        for i in range(count):
+            items[i] = DLL.ZkMesh_getPosition(self._handle, i)
+
+        return items
+
+    def features_array(self) -> Array[Feature]:
+        count = DLL.ZkMesh_getVertexCount(self._handle)
+        items = (Feature * count)()
+        size = sizeof(Feature)
+        targets = iter(range(addressof(items), addressof(items) + sizeof(items), size))
+
+        def _enumerate(_: Any, feature: int) -> int:
+            memmove(next(targets), feature, size)
+            return 0
+
+        DLL.ZkMesh_enumerateVertices(self._handle, _MeshFeatureEnumerator(_enumerate), None)
+        return items
+
     @property
     def light_maps(self) -> list[LightMap]:
         count = DLL.ZkMesh_getLightMapCount(self._handle)
@@ -268,10 +349,119 @@ class Mesh:
 
         return items
 
+    def polygon_table(self) -> PolygonTable:
+        polygons = []
+
+        def _enumerate(_: Any, polygon: int) -> int:
+            polygons.append(polygon)
+            return 0
+
+        DLL.ZkMesh_enumeratePolygons(self._handle, _MeshPolygonEnumerator(_enumerate), None)
+
+        count = len(polygons)
+        material_indices = (c_uint32 * count)()
+        light_map_indices = (c_int32 * count)()
+        flags = (c_uint8 * count)()
+        sector_indices = (c_int16 * count)()
+        normal_axes = (c_uint8 * count)()
+        vertex_offsets = (c_uint32 * (count + 1))()
+
+        flag_getters = [(getattr(DLL, name), flag) for name, flag in _POLYGON_FLAG_GETTERS]
+        position_ranges = []
+        feature_ranges = []
+        size = c_size_t(0)
+        offset = 0
+
+        for i, polygon in enumerate(polygons):
+            material_indices[i] = DLL.ZkPolygon_getMaterialIndex(polygon)
+            light_map_indices[i] = DLL.ZkPolygon_getLightMapIndex(polygon)
+            flags[i] = sum(flag for getter, flag in flag_getters if getter(polygon))
+            sector_indices[i] = DLL.ZkPolygon_getSectorIndex(polygon)
+            normal_axes[i] = DLL.ZkPolygon_getNormalAxis(polygon)
+
+            positions = DLL.ZkPolygon_getPositionIndices(polygon, self._handle, byref(size))
+            if size.value:
+                position_ranges.append((addressof(positions.contents), size.value))
+
+            offset += size.value
+            vertex_offsets[i + 1] = offset
+
+            features = DLL.ZkPolygon_getFeatureIndices(polygon, self._handle, byref(size))
+            if size.value:
+                feature_ranges.append((addressof(features.contents), size.value))
+
+        return PolygonTable(
+            material_indices=material_indices,
+            light_map_indices=light_map_indices,
+            flags=flags,
+            sector_indices=sector_indices,
+            normal_axes=normal_axes,
+            vertex_offsets=vertex_offsets,
+            position_indices=_gather_indices(position_ranges, offset),
+            feature_indices=_gather_indices(feature_ranges, offset),
+        )
+
+    def build_render_batches(
+        self,
+        *,
+        skip: PolygonFlag = PolygonFlag.NONE,
+        indexed: bool = True,
+    ) -> list[RenderBatch]:
+        table = self.polygon_table()
+        offsets = table.vertex_offsets[:]
+        flags = table.flags[:]
+        skip = int(skip)
+
+        # Fan-triangulate all polygons into lists of corners (indices into the table's vertex arrays) per material.
+        corners: dict[int, list[int]] = {}
+        for i, material in enumerate(table.material_indices):
+            if flags[i] & skip:
+                continue
+
+            start, end = offsets[i], offsets[i + 1]
+            items = corners.get(material)
+            if items is None:
+                items = corners[material] = []
+
+            for k in range(start + 1, end - 1):
+                items += (start, k, k + 1)
+
+        positions = _split_items(self.positions_array())
+        features = _split_items(self.features_array())
+        position_indices = table.position_indices[:]
+        feature_indices = table.feature_indices[:]
+        batches = []
+
+        for material, items in sorted(corners.items()):
+            indices = (c_uint32 * len(items))()
+
+            if indexed:
+                vertices: dict[tuple[int, int], int] = {}
+                for j, corner in enumerate(items):
+                    indices[j] = vertices.setdefault((position_indices[corner], feature_indices[corner]), len(vertices))
+                pairs = list(vertices)
+            else:
+                indices[:] = range(len(items))
+                pairs = [(position_indices[corner], feature_indices[corner]) for corner in items]
+
+            batches.append(
+                RenderBatch(
+                    material_index=material,
+                    positions=(Vec3f * len(pairs)).from_buffer_copy(b"".join([positions[p] for p, _ in pairs])),
+                    features=(Feature * len(pairs)).from_buffer_copy(b"".join([features[f] for _, f in pairs])),
+                    indices=indices,
+                )
+            )
+
+        return batches
+
     @property
     def source_date(self) -> datetime:
         return DLL.ZkMesh_getSourceDate(self._handle).to_datetime()
 
+    def close(self) -> None:
+        release(self, DLL.ZkMesh_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkMesh_del(self._handle)
@@ -7,17 +7,16 @@ from typing import Any
 
 from zenkit import _native
 from zenkit._core import DLL
+from zenkit._core import Closeable
 from zenkit._core import PathOrFileLike
-from zenkit._native import ZkPointer
+from zenkit._core import depend
+from zenkit._core import release
 from zenkit.model_hierarchy import ModelHierarchy
 from zenkit.model_mesh import ModelMesh
 
-DLL.ZkModel_getMesh.restype = ZkPointer
-DLL.ZkModel_getHierarchy.restype = ZkPointer
 
-
-class Model:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class Model(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -25,13 +24,17 @@ class Model:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def load(path_or_file_like: PathOrFileLike) -> "Model":
         handle = _native.load("ZkModel_load", path_or_file_like)
         return Model(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "Model":
+        return await _native.load_async(Model.load, path_or_file_like)
+
     @property
     def mesh(self) -> ModelMesh:
         return ModelMesh(_handle=DLL.ZkModel_getMesh(self._handle).value, _keepalive=self)
@@ -40,6 +43,9 @@ class Model:
     def hierarchy(self) -> ModelHierarchy:
         return ModelHierarchy(_handle=DLL.ZkModel_getHierarchy(self._handle).value, _keepalive=self)
 
+    def close(self) -> None:
+        release(self, DLL.ZkModel_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkModel_del(self._handle)
@@ -1,28 +1,30 @@
 __all__ = [
     "ModelAnimation",
+    "ModelAnimationInfo",
     "AnimationSample",
 ]
 
-from ctypes import POINTER
 from ctypes import Structure
 from ctypes import byref
-from ctypes import c_float
 from ctypes import c_size_t
-from ctypes import c_uint
-from ctypes import c_uint32
 from ctypes import c_void_p
+from dataclasses import dataclass
 from datetime import datetime
+from struct import Struct
+from struct import error as struct_error
+from struct import unpack_from
 from typing import Any
 from typing import ClassVar
 
 from zenkit import _native
 from zenkit._core import DLL
 from zenkit._core import AxisAlignedBoundingBox
-from zenkit._core import Date
+from zenkit._core import Closeable
 from zenkit._core import PathOrFileLike
 from zenkit._core import Quat
 from zenkit._core import Vec3f
-from zenkit._native import ZkString
+from zenkit._core import depend
+from zenkit._core import release
 
 
 class AnimationSample(Structure):
@@ -43,25 +45,63 @@ class AnimationSample(Structure):
         return f"<AnimationSample position={self.position} rotation={self.rotation}>"
 
 
-DLL.ZkModelAnimation_getName.restype = ZkString
-DLL.ZkModelAnimation_getNext.restype = ZkString
-DLL.ZkModelAnimation_getLayer.restype = c_uint
-DLL.ZkModelAnimation_getFrameCount.restype = c_uint
-DLL.ZkModelAnimation_getNodeCount.restype = c_uint
-DLL.ZkModelAnimation_getFps.restype = c_float
-DLL.ZkModelAnimation_getFpsSource.restype = c_float
-DLL.ZkModelAnimation_getChecksum.restype = c_uint
-DLL.ZkModelAnimation_getBbox.restype = AxisAlignedBoundingBox
-DLL.ZkModelAnimation_getSourcePath.restype = ZkString
-DLL.ZkModelAnimation_getSourceDate.restype = Date
-DLL.ZkModelAnimation_getSourceScript.restype = ZkString
-DLL.ZkModelAnimation_getSampleCount.restype = c_size_t
-DLL.ZkModelAnimation_getSample.restype = AnimationSample
-DLL.ZkModelAnimation_getNodeIndices.restype = POINTER(c_uint32)
+_CHUNK_HEADER = 0xA020
+_CHUNK_DATA = 0xA090
+_CHUNK = Struct("<HI")
+_HEADER_FIELDS = Struct("<3I2f")
 
 
-class ModelAnimation:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+@dataclass(slots=True)
+class ModelAnimationInfo:
+    name: str
+    next: str
+    layer: int
+    frame_count: int
+    node_count: int
+    fps: float
+    fps_source: float
+    checksum: int
+
+
+def _read_line(data: bytes, offset: int) -> tuple[str, int]:
+    end = data.index(b"\n", offset)
+    return data[offset:end].rstrip(b"\r").decode("windows-1252"), end + 1
+
+
+def _probe(data: bytes) -> ModelAnimationInfo | None:
+    header = None
+    offset = 0
+
+    # Walk the chunks until the header and the checksum at the start of the sample data have been seen. Returns
+    # None if `data` ends before that.
+    while offset + _CHUNK.size <= len(data):
+        kind, size = _CHUNK.unpack_from(data, offset)
+        offset += _CHUNK.size
+
+        if kind == _CHUNK_HEADER:
+            if offset + size > len(data):
+                return None
+
+            try:
+                name, position = _read_line(data, offset + 2)
+                layer, frame_count, node_count, fps, fps_source = _HEADER_FIELDS.unpack_from(data, position)
+                next_, _ = _read_line(data, position + _HEADER_FIELDS.size + 4 * 8)
+            except (ValueError, struct_error):
+                return None
+
+            header = (name, next_, layer, frame_count, node_count, fps, fps_source)
+        elif kind == _CHUNK_DATA:
+            if header is None or offset + 4 > len(data):
+                return None
+            return ModelAnimationInfo(*header, checksum=unpack_from("<I", data, offset)[0])
+
+        offset += size
+
+    return None
+
+
+class ModelAnimation(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -69,13 +109,33 @@ class ModelAnimation:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def load(path_or_file_like: PathOrFileLike) -> "ModelAnimation":
         handle = _native.load("ZkModelAnimation_load", path_or_file_like)
         return ModelAnimation(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "ModelAnimation":
+        return await _native.load_async(ModelAnimation.load, path_or_file_like)
+
+    @staticmethod
+    def probe(path_or_file_like: PathOrFileLike) -> ModelAnimationInfo:
+        size = 1024
+
+        while True:
+            data = _native.peek(path_or_file_like, size)
+            info = _probe(data)
+            if info is not None:
+                return info
+
+            if len(data) < size:
+                error = "Not a model animation"
+                raise ValueError(error)
+
+            size *= 8
+
     @property
     def name(self) -> str:
         return DLL.ZkModelAnimation_getName(self._handle).value
@@ -135,6 +195,9 @@ class ModelAnimation:
         handle = DLL.ZkModelAnimation_getNodeIndices(self._handle, byref(count))
         return [handle[i] for i in range(count.value)]
 
+    def close(self) -> None:
+        release(self, DLL.ZkModelAnimation_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkModelAnimation_del(self._handle)
@@ -5,8 +5,6 @@ __all__ = [
 
 from ctypes import Structure
 from ctypes import c_int16
-from ctypes import c_size_t
-from ctypes import c_uint
 from ctypes import c_void_p
 from datetime import datetime
 from typing import Any
@@ -15,10 +13,12 @@ from typing import ClassVar
 from zenkit import _native
 from zenkit._core import DLL
 from zenkit._core import AxisAlignedBoundingBox
-from zenkit._core import Date
+from zenkit._core import Closeable
 from zenkit._core import Mat4x4
 from zenkit._core import PathOrFileLike
 from zenkit._core import Vec3f
+from zenkit._core import depend
+from zenkit._core import release
 from zenkit._native import ZkString
 
 
@@ -45,18 +45,8 @@ class ModelHierarchyNode(Structure):
         return f"<ModelHierarchyNode name={self.name!r}>"
 
 
-DLL.ZkModelHierarchy_getNodeCount.restype = c_size_t
-DLL.ZkModelHierarchy_getNode.restype = ModelHierarchyNode
-DLL.ZkModelHierarchy_getBbox.restype = AxisAlignedBoundingBox
-DLL.ZkModelHierarchy_getCollisionBbox.restype = AxisAlignedBoundingBox
-DLL.ZkModelHierarchy_getRootTranslation.restype = Vec3f
-DLL.ZkModelHierarchy_getChecksum.restype = c_uint
-DLL.ZkModelHierarchy_getSourceDate.restype = Date
-DLL.ZkModelHierarchy_getSourcePath.restype = ZkString
-
-
-class ModelHierarchy:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class ModelHierarchy(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -64,13 +54,17 @@ class ModelHierarchy:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def load(path_or_file_like: PathOrFileLike) -> "ModelHierarchy":
         handle = _native.load("ZkModelHierarchy_load", path_or_file_like)
         return ModelHierarchy(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "ModelHierarchy":
+        return await _native.load_async(ModelHierarchy.load, path_or_file_like)
+
     @property
     def nodes(self) -> list[ModelHierarchyNode]:
         count = DLL.ZkModelHierarchy_getNodeCount(self._handle)
@@ -100,6 +94,9 @@ class ModelHierarchy:
     def source_path(self) -> str:
         return DLL.ZkModelHierarchy_getSourcePath(self._handle).value
 
+    def close(self) -> None:
+        release(self, DLL.ZkModelHierarchy_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkModelHierarchy_del(self._handle)
@@ -2,14 +2,15 @@ __all__ = ["ModelMesh"]
 
 from ctypes import CFUNCTYPE
 from ctypes import c_int
-from ctypes import c_size_t
-from ctypes import c_uint
 from ctypes import c_void_p
 from typing import Any
 
 from zenkit import _native
 from zenkit._core import DLL
+from zenkit._core import Closeable
 from zenkit._core import PathOrFileLike
+from zenkit._core import depend
+from zenkit._core import release
 from zenkit._native import ZkPointer
 from zenkit._native import ZkString
 from zenkit.multi_resolution_mesh import MultiResolutionMesh
@@ -17,13 +18,9 @@ from zenkit.soft_skin_mesh import SoftSkinMesh
 
 _ModelMeshAttachmentEnumerator = CFUNCTYPE(c_int, c_void_p, ZkString, ZkPointer)
 
-DLL.ZkModelMesh_getChecksum.restype = c_uint
-DLL.ZkModelMesh_getMeshCount.restype = c_size_t
-DLL.ZkModelMesh_getMesh.restype = ZkPointer
 
-
-class ModelMesh:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class ModelMesh(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -31,13 +28,17 @@ class ModelMesh:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def load(path_or_file_like: PathOrFileLike) -> "ModelMesh":
         handle = _native.load("ZkModelMesh_load", path_or_file_like)
         return ModelMesh(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "ModelMesh":
+        return await _native.load_async(ModelMesh.load, path_or_file_like)
+
     @property
     def checksum(self) -> int:
         return DLL.ZkModelMesh_getChecksum(self._handle)
@@ -65,6 +66,9 @@ class ModelMesh:
         DLL.ZkModelMesh_enumerateAttachments(self._handle, enumerator, c_void_p(None))
         return attachments
 
+    def close(self) -> None:
+        release(self, DLL.ZkModelMesh_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkModelMesh_del(self._handle)
@@ -17,13 +17,8 @@ __all__ = [
     "ModelScript",
 ]
 
-from ctypes import POINTER
 from ctypes import byref
-from ctypes import c_float
-from ctypes import c_int
-from ctypes import c_int32
 from ctypes import c_size_t
-from ctypes import c_uint32
 from ctypes import c_void_p
 from enum import IntEnum
 from enum import IntFlag
@@ -31,9 +26,10 @@ from typing import Any
 
 from zenkit import _native
 from zenkit._core import DLL
+from zenkit._core import Closeable
 from zenkit._core import PathOrFileLike
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
+from zenkit._core import depend
+from zenkit._core import release
 
 
 class AnimationFlags(IntFlag):
@@ -88,103 +84,8 @@ class FightMode(IntEnum):
     INVALID = (0xFF,)
 
 
-DLL.ZkModelScript_getSkeletonName.restype = ZkString
-DLL.ZkModelScript_getSkeletonMeshDisabled.restype = c_int
-DLL.ZkModelScript_getDisabledAnimationsCount.restype = c_size_t
-DLL.ZkModelScript_getDisabledAnimation.restype = ZkString
-DLL.ZkModelScript_getMeshCount.restype = c_size_t
-DLL.ZkModelScript_getMesh.restype = ZkString
-DLL.ZkModelScript_getModelTagCount.restype = c_size_t
-DLL.ZkModelScript_getModelTag.restype = ZkString
-DLL.ZkModelScript_getAnimationCombineCount.restype = c_size_t
-DLL.ZkModelScript_getAnimationCombine.restype = ZkPointer
-DLL.ZkModelScript_getAnimationBlendCount.restype = c_size_t
-DLL.ZkModelScript_getAnimationBlend.restype = ZkPointer
-DLL.ZkModelScript_getAnimationAliasCount.restype = c_size_t
-DLL.ZkModelScript_getAnimationAlias.restype = ZkPointer
-DLL.ZkModelScript_getAnimationCount.restype = c_size_t
-DLL.ZkModelScript_getAnimation.restype = ZkPointer
-DLL.ZkAnimation_getName.restype = ZkString
-DLL.ZkAnimation_getLayer.restype = c_uint32
-DLL.ZkAnimation_getNext.restype = ZkString
-DLL.ZkAnimation_getBlendIn.restype = c_float
-DLL.ZkAnimation_getBlendOut.restype = c_float
-DLL.ZkAnimation_getFlags.restype = c_int
-DLL.ZkAnimation_getModel.restype = ZkString
-DLL.ZkAnimation_getDirection.restype = c_int
-DLL.ZkAnimation_getFirstFrame.restype = c_int32
-DLL.ZkAnimation_getLastFrame.restype = c_int32
-DLL.ZkAnimation_getFps.restype = c_float
-DLL.ZkAnimation_getSpeed.restype = c_float
-DLL.ZkAnimation_getCollisionVolumeScale.restype = c_float
-DLL.ZkAnimation_getEventTagCount.restype = c_size_t
-DLL.ZkAnimation_getParticleEffectCount.restype = c_size_t
-DLL.ZkAnimation_getParticleEffectStopCount.restype = c_size_t
-DLL.ZkAnimation_getSoundEffectCount.restype = c_size_t
-DLL.ZkAnimation_getSoundEffectGroundCount.restype = c_size_t
-DLL.ZkAnimation_getMorphAnimationCount.restype = c_size_t
-DLL.ZkAnimation_getCameraTremorCount.restype = c_size_t
-DLL.ZkAnimation_getEventTag.restype = ZkPointer
-DLL.ZkAnimation_getParticleEffect.restype = ZkPointer
-DLL.ZkAnimation_getParticleEffectStop.restype = ZkPointer
-DLL.ZkAnimation_getSoundEffect.restype = ZkPointer
-DLL.ZkAnimation_getSoundEffectGround.restype = ZkPointer
-DLL.ZkAnimation_getMorphAnimation.restype = ZkPointer
-DLL.ZkAnimation_getCameraTremor.restype = ZkPointer
-DLL.ZkEventTag_getFrame.restype = c_int32
-DLL.ZkEventTag_getType.restype = c_int
-DLL.ZkEventTag_getSlot.restype = ZkString
-DLL.ZkEventTag_getItem.restype = ZkString
-DLL.ZkEventTag_getFrames.restype = POINTER(c_int32)
-DLL.ZkEventTag_getFightMode.restype = c_int
-DLL.ZkEventTag_getIsAttached.restype = c_int
-DLL.ZkEventParticleEffect_getFrame.restype = c_int32
-DLL.ZkEventParticleEffect_getIndex.restype = c_int32
-DLL.ZkEventParticleEffect_getName.restype = ZkString
-DLL.ZkEventParticleEffect_getPosition.restype = ZkString
-DLL.ZkEventParticleEffect_getIsAttached.restype = c_int
-DLL.ZkEventParticleEffectStop_getFrame.restype = c_int32
-DLL.ZkEventParticleEffectStop_getIndex.restype = c_int32
-DLL.ZkEventSoundEffect_getFrame.restype = c_int32
-DLL.ZkEventSoundEffect_getName.restype = ZkString
-DLL.ZkEventSoundEffect_getRange.restype = c_float
-DLL.ZkEventSoundEffect_getEmptySlot.restype = c_int
-DLL.ZkEventSoundEffectGround_getFrame.restype = c_int32
-DLL.ZkEventSoundEffectGround_getName.restype = ZkString
-DLL.ZkEventSoundEffectGround_getRange.restype = c_float
-DLL.ZkEventSoundEffectGround_getEmptySlot.restype = c_int
-DLL.ZkMorphAnimation_getFrame.restype = c_int32
-DLL.ZkMorphAnimation_getAnimation.restype = ZkString
-DLL.ZkMorphAnimation_getNode.restype = ZkString
-DLL.ZkEventCameraTremor_getFrame.restype = c_int32
-DLL.ZkEventCameraTremor_getField1.restype = c_int32
-DLL.ZkEventCameraTremor_getField2.restype = c_int32
-DLL.ZkEventCameraTremor_getField3.restype = c_int32
-DLL.ZkEventCameraTremor_getField4.restype = c_int32
-DLL.ZkAnimationCombine_getName.restype = ZkString
-DLL.ZkAnimationCombine_getLayer.restype = c_uint32
-DLL.ZkAnimationCombine_getNext.restype = ZkString
-DLL.ZkAnimationCombine_getBlendIn.restype = c_float
-DLL.ZkAnimationCombine_getBlendOut.restype = c_float
-DLL.ZkAnimationCombine_getFlags.restype = c_int
-DLL.ZkAnimationCombine_getModel.restype = ZkString
-DLL.ZkAnimationCombine_getLastFrame.restype = c_int32
-DLL.ZkAnimationBlend_getName.restype = ZkString
-DLL.ZkAnimationBlend_getNext.restype = ZkString
-DLL.ZkAnimationBlend_getBlendIn.restype = c_float
-DLL.ZkAnimationBlend_getBlendOut.restype = c_float
-DLL.ZkAnimationAlias_getName.restype = ZkString
-DLL.ZkAnimationAlias_getLayer.restype = c_uint32
-DLL.ZkAnimationAlias_getNext.restype = ZkString
-DLL.ZkAnimationAlias_getBlendIn.restype = c_float
-DLL.ZkAnimationAlias_getBlendOut.restype = c_float
-DLL.ZkAnimationAlias_getFlags.restype = c_int
-DLL.ZkAnimationAlias_getAlias.restype = ZkString
-DLL.ZkAnimationAlias_getDirection.restype = c_int
-
-
-class ModelScript:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class ModelScript(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -192,13 +93,17 @@ class ModelScript:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def load(path_or_file_like: PathOrFileLike) -> "ModelScript":
         handle = _native.load("ZkModelScript_load", path_or_file_like)
         return ModelScript(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "ModelScript":
+        return await _native.load_async(ModelScript.load, path_or_file_like)
+
     @property
     def skeleton_name(self) -> str:
         return DLL.ZkModelScript_getSkeletonName(self._handle).value
@@ -254,6 +159,9 @@ class ModelScript:
             for i in range(count)
         ]
 
+    def close(self) -> None:
+        release(self, DLL.ZkModelScript_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkModelScript_del(self._handle)
@@ -265,14 +173,14 @@ class ModelScript:
 
 
 class Animation:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return f"<Animation handle={self._handle} name={self.name!r} next={self.next!r} layer={self.layer}>"
@@ -388,7 +296,7 @@ class Animation:
 
 
 class AnimationCombine:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -396,7 +304,7 @@ class AnimationCombine:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return f"<AnimationCombine handle={self._handle} name={self.name!r} next={self.next!r} layer={self.layer}>"
@@ -435,7 +343,7 @@ class AnimationCombine:
 
 
 class AnimationBlend:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -443,7 +351,7 @@ class AnimationBlend:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return f"<AnimationCombine handle={self._handle} name={self.name!r} next={self.next!r}>"
@@ -466,7 +374,7 @@ class AnimationBlend:
 
 
 class AnimationAlias:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -474,7 +382,7 @@ class AnimationAlias:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return f"<AnimationAlias handle={self._handle} name={self.name!r} next={self.next!r} layer={self.layer}>"
@@ -513,7 +421,7 @@ class AnimationAlias:
 
 
 class EventTag:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -521,7 +429,7 @@ class EventTag:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return f"<EventTag handle={self._handle} frame={self.frame}>"
@@ -558,7 +466,7 @@ class EventTag:
 
 
 class EventParticleEffect:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -566,7 +474,7 @@ class EventParticleEffect:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return f"<EventParticleEffect handle={self._handle} frame={self.frame} name={self.name!r} index={self.index}>"
@@ -593,7 +501,7 @@ class EventParticleEffect:
 
 
 class EventParticleEffectStop:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -601,7 +509,7 @@ class EventParticleEffectStop:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return f"<EventParticleEffectStop handle={self._handle} frame={self.frame} index={self.index}>"
@@ -616,7 +524,7 @@ class EventParticleEffectStop:
 
 
 class EventSoundEffect:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -624,7 +532,7 @@ class EventSoundEffect:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return f"<EventSoundEffect handle={self._handle} frame={self.frame} name={self.name!r}>"
@@ -647,7 +555,7 @@ class EventSoundEffect:
 
 
 class EventSoundEffectGround:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -655,7 +563,7 @@ class EventSoundEffectGround:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return f"<EventSoundEffectGround handle={self._handle} frame={self.frame} name={self.name!r}>"
@@ -678,7 +586,7 @@ class EventSoundEffectGround:
 
 
 class EventMorphAnimation:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -686,7 +594,7 @@ class EventMorphAnimation:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return (
@@ -708,7 +616,7 @@ class EventMorphAnimation:
 
 
 class EventCameraTremor:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -716,7 +624,7 @@ class EventCameraTremor:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     def __repr__(self) -> str:
         return f"<EventCameraTremor handle={self._handle} frame={self.frame}>"
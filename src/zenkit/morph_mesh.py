@@ -4,13 +4,8 @@ __all__ = [
     "MorphAnimation",
 ]
 
-from ctypes import POINTER
 from ctypes import byref
-from ctypes import c_float
-from ctypes import c_int
 from ctypes import c_size_t
-from ctypes import c_uint8
-from ctypes import c_uint32
 from ctypes import c_void_p
 from datetime import datetime
 from datetime import timedelta
@@ -18,35 +13,23 @@ from typing import Any
 
 from zenkit import _native
 from zenkit._core import DLL
-from zenkit._core import Date
+from zenkit._core import Closeable
 from zenkit._core import PathOrFileLike
 from zenkit._core import Vec3f
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
+from zenkit._core import depend
+from zenkit._core import release
 from zenkit.multi_resolution_mesh import MultiResolutionMesh
 
-DLL.ZkMorphAnimation_getName.restype = ZkString
-DLL.ZkMorphAnimation_getLayer.restype = c_int
-DLL.ZkMorphAnimation_getBlendIn.restype = c_float
-DLL.ZkMorphAnimation_getBlendOut.restype = c_float
-DLL.ZkMorphAnimation_getDuration.restype = c_float
-DLL.ZkMorphAnimation_getSpeed.restype = c_float
-DLL.ZkMorphAnimation_getFlags.restype = c_uint8
-DLL.ZkMorphAnimation_getFrameCount.restype = c_size_t
-DLL.ZkMorphAnimation_getVertices.restype = POINTER(c_uint32)
-DLL.ZkMorphAnimation_getSampleCount.restype = c_size_t
-DLL.ZkMorphAnimation_getSample.restype = Vec3f
-
 
 class MorphAnimation:
-    __slots__ = ("_handle", "_keepalive")
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def name(self) -> str:
@@ -98,19 +81,15 @@ class MorphAnimation:
         return f"<MorphAnimation handle={self._handle} name={self.name!r}>"
 
 
-DLL.ZkMorphSource_getFileName.restype = ZkString
-DLL.ZkMorphSource_getFileDate.restype = Date
-
-
 class MorphSource:
-    __slots__ = ("_handle", "_keepalive")
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def file(self) -> str:
@@ -127,18 +106,8 @@ class MorphSource:
         return f"<MorphSource handle={self._handle}>"
 
 
-DLL.ZkMorphMesh_getName.restype = ZkString
-DLL.ZkMorphMesh_getMesh.restype = ZkPointer
-DLL.ZkMorphMesh_getMorphPositionCount.restype = c_size_t
-DLL.ZkMorphMesh_getMorphPosition.restype = Vec3f
-DLL.ZkMorphMesh_getAnimationCount.restype = c_size_t
-DLL.ZkMorphMesh_getAnimation.restype = ZkPointer
-DLL.ZkMorphMesh_getSourceCount.restype = c_size_t
-DLL.ZkMorphMesh_getSource.restype = ZkPointer
-
-
-class MorphMesh:
-    __slots__ = ("_handle", "_delete")
+class MorphMesh(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -152,6 +121,10 @@ class MorphMesh:
         handle = _native.load("ZkMorphMesh_load", path_or_file_like)
         return MorphMesh(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "MorphMesh":
+        return await _native.load_async(MorphMesh.load, path_or_file_like)
+
     @property
     def name(self) -> str:
         return DLL.ZkMorphMesh_getName(self._handle).value
@@ -187,6 +160,9 @@ class MorphMesh:
 
         return items
 
+    def close(self) -> None:
+        release(self, DLL.ZkMorphMesh_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkMorphMesh_del(self._handle)
@@ -1,5 +1,6 @@
 __all__ = [
     "MultiResolutionMesh",
+    "MultiResolutionMeshInfo",
     "SubMesh",
     "MeshEdge",
     "MeshPlane",
@@ -8,25 +9,26 @@ __all__ = [
     "MeshTriangleEdge",
 ]
 
-from ctypes import POINTER
 from ctypes import Structure
 from ctypes import byref
 from ctypes import c_float
-from ctypes import c_int
 from ctypes import c_size_t
 from ctypes import c_uint16
 from ctypes import c_void_p
+from dataclasses import dataclass
+from struct import Struct
 from typing import Any
 from typing import ClassVar
 
 from zenkit import _native
 from zenkit._core import DLL
-from zenkit._core import AxisAlignedBoundingBox
+from zenkit._core import Closeable
 from zenkit._core import OrientedBoundingBox
 from zenkit._core import PathOrFileLike
 from zenkit._core import Vec2f
 from zenkit._core import Vec3f
-from zenkit._native import ZkPointer
+from zenkit._core import depend
+from zenkit._core import release
 from zenkit.material import Material
 
 
@@ -104,29 +106,15 @@ class MeshPlane(Structure):
         return f"<MeshPlane distance={self.distance} normal={self.normal}>"
 
 
-DLL.ZkSubMesh_getMaterial.restype = ZkPointer
-DLL.ZkSubMesh_getTriangles.restype = POINTER(MeshTriangle)
-DLL.ZkSubMesh_getColors.restype = POINTER(c_float)
-DLL.ZkSubMesh_getTrianglePlaneIndices.restype = POINTER(c_uint16)
-DLL.ZkSubMesh_getWedgeCount.restype = c_size_t
-DLL.ZkSubMesh_getWedge.restype = MeshWedge
-DLL.ZkSubMesh_getTrianglePlaneCount.restype = c_size_t
-DLL.ZkSubMesh_getTrianglePlane.restype = MeshPlane
-DLL.ZkSubMesh_getTriangleEdges.restype = POINTER(MeshTriangleEdge)
-DLL.ZkSubMesh_getEdgeScores.restype = POINTER(c_float)
-DLL.ZkSubMesh_getWedgeMap.restype = POINTER(c_uint16)
-DLL.ZkSubMesh_getEdges.restype = POINTER(MeshEdge)
-
-
 class SubMesh:
-    __slots__ = ("_handle", "_keepalive")
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def material(self) -> Material:
@@ -191,21 +179,21 @@ class SubMesh:
         return f"<SubMesh handle={self._handle} material={self.material}>"
 
 
-DLL.ZkMultiResolutionMesh_getPositionCount.restype = c_size_t
-DLL.ZkMultiResolutionMesh_getPosition.restype = Vec3f
-DLL.ZkMultiResolutionMesh_getNormalCount.restype = c_size_t
-DLL.ZkMultiResolutionMesh_getNormal.restype = Vec3f
-DLL.ZkMultiResolutionMesh_getSubMeshCount.restype = c_size_t
-DLL.ZkMultiResolutionMesh_getSubMesh.restype = ZkPointer
-DLL.ZkMultiResolutionMesh_getMaterialCount.restype = c_size_t
-DLL.ZkMultiResolutionMesh_getMaterial.restype = ZkPointer
-DLL.ZkMultiResolutionMesh_getAlphaTest.restype = c_int
-DLL.ZkMultiResolutionMesh_getBbox.restype = AxisAlignedBoundingBox
-DLL.ZkMultiResolutionMesh_getOrientedBbox.restype = ZkPointer
+_CHUNK_MESH = 0xB100
+_MESH_HEADER = Struct("<HIHI")
+_MESH_OFFSETS = Struct("<B4I")
+
 
+@dataclass(slots=True)
+class MultiResolutionMeshInfo:
+    version: int
+    submesh_count: int
+    position_count: int
+    normal_count: int
 
-class MultiResolutionMesh:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+
+class MultiResolutionMesh(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -213,13 +201,41 @@ class MultiResolutionMesh:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def load(path_or_file_like: PathOrFileLike) -> "MultiResolutionMesh":
         handle = _native.load("ZkMultiResolutionMesh_load", path_or_file_like)
         return MultiResolutionMesh(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "MultiResolutionMesh":
+        return await _native.load_async(MultiResolutionMesh.load, path_or_file_like)
+
+    @staticmethod
+    def probe(path_or_file_like: PathOrFileLike) -> MultiResolutionMeshInfo:
+        # The vertex data precedes the submesh and position counts, so the prefix read has to span it.
+        data = _native.peek(path_or_file_like, _MESH_HEADER.size)
+        if len(data) < _MESH_HEADER.size or _MESH_HEADER.unpack(data)[0] != _CHUNK_MESH:
+            error = "Not a multi-resolution mesh"
+            raise ValueError(error)
+
+        _, _, version, content_size = _MESH_HEADER.unpack(data)
+        offset = _MESH_HEADER.size + content_size
+
+        data = _native.peek(path_or_file_like, offset + _MESH_OFFSETS.size)
+        if len(data) < offset + _MESH_OFFSETS.size:
+            error = "Not a multi-resolution mesh"
+            raise ValueError(error)
+
+        submesh_count, _, position_count, _, normal_count = _MESH_OFFSETS.unpack_from(data, offset)
+        return MultiResolutionMeshInfo(
+            version=version,
+            submesh_count=submesh_count,
+            position_count=position_count,
+            normal_count=normal_count,
+        )
+
     @property
     def positions(self) -> list[Vec3f]:
         count = DLL.ZkMultiResolutionMesh_getPositionCount(self._handle)
@@ -263,7 +279,10 @@ class MultiResolutionMesh:
     @property
     def oriented_bbox(self) -> OrientedBoundingBox:
         handle = DLL.ZkMultiResolutionMesh_getOrientedBbox(self._handle).value
-        return OrientedBoundingBox(_handle=handle)
+        return OrientedBoundingBox(_handle=handle, _keepalive=self)
+
+    def close(self) -> None:
+        release(self, DLL.ZkMultiResolutionMesh_del)
 
     def __del__(self) -> None:
         if self._delete:
@@ -1,10 +1,8 @@
 __all__ = ["SoftSkinMesh", "SoftSkinWeight", "SoftSkinWedgeNormal"]
 
-from ctypes import POINTER
 from ctypes import Structure
 from ctypes import byref
 from ctypes import c_float
-from ctypes import c_int
 from ctypes import c_size_t
 from ctypes import c_uint
 from ctypes import c_uint8
@@ -15,7 +13,7 @@ from typing import ClassVar
 from zenkit._core import DLL
 from zenkit._core import OrientedBoundingBox
 from zenkit._core import Vec3f
-from zenkit._native import ZkPointer
+from zenkit._core import depend
 from zenkit.multi_resolution_mesh import MultiResolutionMesh
 
 
@@ -60,26 +58,15 @@ class SoftSkinWedgeNormal(Structure):
         return f"<SoftSkinWedgeNormal normal={self.normal} index={self.index}>"
 
 
-DLL.ZkSoftSkinMesh_getMesh.restype = ZkPointer
-DLL.ZkSoftSkinMesh_getNodeCount.restype = c_size_t
-DLL.ZkSoftSkinMesh_getBbox.restype = ZkPointer
-DLL.ZkSoftSkinMesh_getWeightTotal.restype = c_size_t
-DLL.ZkSoftSkinMesh_getWeightCount.restype = c_size_t
-DLL.ZkSoftSkinMesh_getWeight.restype = SoftSkinWeight
-DLL.ZkSoftSkinMesh_getWedgeNormalCount.restype = c_size_t
-DLL.ZkSoftSkinMesh_getWedgeNormal.restype = SoftSkinWedgeNormal
-DLL.ZkSoftSkinMesh_getNodes.restype = POINTER(c_int)
-
-
 class SoftSkinMesh:
-    __slots__ = ("_handle", "_keepalive")
+    __slots__ = ("__weakref__", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def mesh(self) -> MultiResolutionMesh:
@@ -92,8 +79,8 @@ class SoftSkinMesh:
         items = []
 
         for i in range(count):
-            handle = DLL.ZkSoftSkinMesh_getMesh(self._handle, i).value
-            items.append(OrientedBoundingBox(_handle=handle))
+            handle = DLL.ZkSoftSkinMesh_getBbox(self._handle, i).value
+            items.append(OrientedBoundingBox(_handle=handle, _keepalive=self))
 
         return items
 
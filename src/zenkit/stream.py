@@ -3,41 +3,213 @@ __all__ = [
     "Write",
 ]
 
+from collections.abc import Iterator
+from ctypes import CFUNCTYPE
+from ctypes import POINTER
+from ctypes import Structure
+from ctypes import addressof
+from ctypes import byref
+from ctypes import c_char
 from ctypes import c_char_p
+from ctypes import c_int
+from ctypes import c_long
 from ctypes import c_size_t
+from ctypes import c_ssize_t
 from ctypes import c_void_p
+from ctypes import memmove
+from ctypes import py_object
+from ctypes import pythonapi
+from io import BufferedRandom
+from io import BufferedReader
+from io import FileIO
+from mmap import ACCESS_READ
+from mmap import mmap
+from os import SEEK_CUR
+from os import SEEK_END
+from os import SEEK_SET
 from os import PathLike
+from os import fstat
+from pathlib import Path
+from typing import Any
+from typing import BinaryIO
+from typing import ClassVar
 
 from zenkit._core import DLL
+from zenkit._core import Closeable
+from zenkit._core import release
 
-DLL.ZkRead_newMem.restype = c_void_p
-DLL.ZkRead_newPath.restype = c_void_p
-DLL.ZkRead_getSize.restype = c_size_t
-DLL.ZkRead_getBytes.restype = c_size_t
-DLL.ZkWrite_newPath.restype = c_void_p
 
+class _PyBuffer(Structure):
+    _fields_: ClassVar[tuple[str, Any]] = [
+        ("buf", c_void_p),
+        ("obj", c_void_p),
+        ("len", c_ssize_t),
+        ("itemsize", c_ssize_t),
+        ("readonly", c_int),
+        ("ndim", c_int),
+        ("format", c_char_p),
+        ("shape", c_void_p),
+        ("strides", c_void_p),
+        ("suboffsets", c_void_p),
+        ("internal", c_void_p),
+    ]
 
-class Read:
-    __slots__ = ("_handle", "_native", "_keepalive")
 
-    def __init__(self, source: str | PathLike | bytes | bytearray | c_void_p) -> None:
+# Private function pointers, so the argtypes don't leak into other users of `ctypes.pythonapi`.
+_PyObject_GetBuffer = pythonapi["PyObject_GetBuffer"]
+_PyObject_GetBuffer.argtypes = (py_object, POINTER(_PyBuffer), c_int)
+_PyObject_GetBuffer.restype = c_int
+
+_PyBuffer_Release = pythonapi["PyBuffer_Release"]
+_PyBuffer_Release.argtypes = (POINTER(_PyBuffer),)
+_PyBuffer_Release.restype = None
+
+_PyBUF_SIMPLE = 0
+
+
+_ReadExtRead = CFUNCTYPE(c_size_t, c_void_p, c_void_p, c_size_t)
+_ReadExtSeek = CFUNCTYPE(None, c_void_p, c_long, c_int)
+_ReadExtTell = CFUNCTYPE(c_size_t, c_void_p)
+_ReadExtEof = CFUNCTYPE(c_int, c_void_p)
+
+
+class _ReadExt(Structure):
+    _fields_: ClassVar[tuple[str, Any]] = [
+        ("read", _ReadExtRead),
+        ("seek", _ReadExtSeek),
+        ("tell", _ReadExtTell),
+        ("eof", _ReadExtEof),
+        ("delete", c_void_p),
+    ]
+
+
+class _FileObjectSource:
+    # Serves the native stream's many small reads from a chunk buffer, so the file object sees few large reads. The
+    # stream position is tracked here and only applied to the file object when the buffer is refilled.
+    __slots__ = ("_chunk", "_chunk_address", "_chunk_end", "_chunk_start", "_file", "_position", "_size", "ext")
+
+    def __init__(self, file: BinaryIO, chunk_size: int) -> None:
+        self._file = file
+        self._chunk = (c_char * chunk_size)()
+        self._chunk_address = addressof(self._chunk)
+        self._chunk_start = 0
+        self._chunk_end = 0
+        self._position = file.tell()
+        self._size = file.seek(0, SEEK_END)
+        file.seek(self._position)
+
+        self.ext = _ReadExt(
+            read=_ReadExtRead(self._read),
+            seek=_ReadExtSeek(self._seek),
+            tell=_ReadExtTell(self._tell),
+            eof=_ReadExtEof(self._eof),
+            delete=None,
+        )
+
+    def _read(self, _: Any, target: int, length: int) -> int:
+        chunk_size = len(self._chunk)
+        total = 0
+
+        while total < length:
+            if self._chunk_start <= self._position < self._chunk_end:
+                offset = self._position - self._chunk_start
+                count = min(self._chunk_end - self._position, length - total)
+                memmove(target + total, self._chunk_address + offset, count)
+            elif length - total >= chunk_size:
+                self._file.seek(self._position)
+                count = self._file.readinto((c_char * (length - total)).from_address(target + total)) or 0
+            else:
+                self._file.seek(self._position)
+                self._chunk_start = self._position
+                self._chunk_end = self._position + (self._file.readinto(self._chunk) or 0)
+                if self._chunk_end == self._chunk_start:
+                    break
+                continue
+
+            if count == 0:
+                break
+
+            self._position += count
+            total += count
+
+        return total
+
+    def _seek(self, _: Any, offset: int, whence: int) -> None:
+        if whence == SEEK_SET:
+            self._position = offset
+        elif whence == SEEK_CUR:
+            self._position += offset
+        elif whence == SEEK_END:
+            self._position = self._size + offset
+
+    def _tell(self, _: Any) -> int:
+        return self._position
+
+    def _eof(self, _: Any) -> int:
+        return self._position >= self._size
+
+    def readinto(self, target: memoryview, offset: int) -> int:
+        self._file.seek(offset)
+        return self._file.readinto(target) or 0
+
+
+class Read(Closeable):
+    __slots__ = ("__weakref__", "_buffer", "_handle", "_keepalive", "_native", "_view")
+
+    def __init__(self, source: str | PathLike | bytes | bytearray | memoryview | mmap | c_void_p) -> None:
         self._handle = c_void_p(None)
+        self._buffer = None
+        self._view = None
         self._keepalive = DLL
 
-        if isinstance(source, (bytes, bytearray)):  # noqa: UP038 / X|Y would degrade performance
+        if isinstance(source, bytes):
             self._native = source
-            self._handle = c_void_p(DLL.ZkRead_newMem(c_char_p(source), len(source)))
+            self._handle = c_void_p(DLL.ZkRead_newMem(source, len(source)))
         elif isinstance(source, c_void_p):
             self._native = None
             self._handle = source
-        else:
+        elif isinstance(source, str | PathLike):
             self._native = str(source)
             self._handle = c_void_p(DLL.ZkRead_newPath(self._native.encode("windows-1252")))
+        else:
+            # Any other object exporting a contiguous buffer is read in place. Holding the buffer export pins the
+            # memory (e.g. a bytearray can't be resized and an mmap can't be closed) until the stream is deleted.
+            buffer = _PyBuffer()
+            _PyObject_GetBuffer(source, byref(buffer), _PyBUF_SIMPLE)
+
+            self._native = source
+            self._buffer = buffer
+            self._handle = c_void_p(DLL.ZkRead_newMem(buffer.buf or b"", buffer.len))
 
         if self._handle.value is None or self._handle.value == 0:
             error = "Failed to create input stream, see logs."
             raise ValueError(error)
 
+    @staticmethod
+    def from_fileobj(file: BinaryIO, *, chunk_size: int = 64 * 1024) -> "Read":
+        if not file.seekable():
+            return Read(bytearray(file.read()))
+
+        # Plain files are mapped instead, which avoids calling back into Python for every read. Other file objects
+        # may hand out the descriptor of a file holding different bytes, like the compressed data of a `GzipFile`.
+        raw = file.raw if isinstance(file, BufferedReader | BufferedRandom) else file
+        if isinstance(raw, FileIO) and fstat(raw.fileno()).st_size > 0:
+            return Read(memoryview(mmap(raw.fileno(), 0, access=ACCESS_READ))[file.tell() :])
+
+        source = _FileObjectSource(file, chunk_size)
+
+        rd = Read(c_void_p(DLL.ZkRead_newExt(None, source.ext)))
+        rd._native = source
+        return rd
+
+    @staticmethod
+    def mmap(path: str | PathLike) -> "Read":
+        with Path(path).open("rb") as file:
+            if fstat(file.fileno()).st_size == 0:
+                return Read(b"")
+
+            return Read(mmap(file.fileno(), 0, access=ACCESS_READ))
+
     @property
     def handle(self) -> c_void_p:
         return self._handle
@@ -48,35 +220,252 @@ class Read:
 
     @property
     def data(self) -> bytes:
+        if not self._copied():
+            return bytes(self.view())
+
         data = bytes(self.size)
         DLL.ZkRead_getBytes(self._handle, data, len(data))
         return data
 
-    def __del__(self) -> None:
-        DLL.ZkRead_del(self._handle)
-        self._handle = None
+    def view(self) -> memoryview:
+        # Streams without a Python-side source can't be viewed in place. Their view is a copy of the whole stream,
+        # which is made again on every call instead of being kept alive along with the stream.
+        if self._copied():
+            data = bytearray(self.size)
+            self.readinto(data)
+            return memoryview(data).toreadonly()
+
+        if self._view is None:
+            self._view = self._create_view()
+        return self._view
+
+    def readinto(self, buffer: Any, offset: int = 0) -> int:
+        target = memoryview(buffer).cast("B")
+        if target.readonly:
+            error = "The target buffer must be writable."
+            raise ValueError(error)
+
+        if offset < 0:
+            error = f"Invalid offset: {offset}"
+            raise ValueError(error)
+
+        if isinstance(self._native, _FileObjectSource):
+            return self._native.readinto(target, offset)
+
+        if self._native is not None:
+            source = self.view()[offset : offset + len(target)]
+            target[: len(source)] = source
+            return len(source)
+
+        # `ZkRead_getBytes` always copies from the start of the stream, so only a read from the start can go straight
+        # into the target. Reads at an offset copy everything before it as well, into a temporary buffer which is
+        # dropped afterwards. They take O(offset + len(buffer)) time and memory.
+        end = min(offset + len(target), self.size)
+        if end <= offset:
+            return 0
+
+        if offset == 0:
+            DLL.ZkRead_getBytes(self._handle, (c_char * end).from_buffer(target), end)
+            return end
+
+        data = bytearray(end)
+        DLL.ZkRead_getBytes(self._handle, (c_char * end).from_buffer(data), end)
+        target[: end - offset] = memoryview(data)[offset:]
+        return end - offset
+
+    def _chunks(self, chunk_size: int) -> Iterator[memoryview]:
+        # File objects are read a chunk at a time. Everything else is sliced out of a view, so native streams are
+        # copied out once, rather than once per chunk.
+        size = self.size
+        if isinstance(self._native, _FileObjectSource):
+            buffer = memoryview(bytearray(min(chunk_size, size)))
+            for position in range(0, size, chunk_size):
+                yield buffer[: self.readinto(buffer[: size - position], position)]
+            return
+
+        view = self.view()
+        for position in range(0, size, chunk_size):
+            yield view[position : position + chunk_size]
+
+    def _copied(self) -> bool:
+        return self._native is None or isinstance(self._native, _FileObjectSource)
+
+    def _create_view(self) -> memoryview:
+        if isinstance(self._native, str):
+            with Path(self._native).open("rb") as file:
+                if fstat(file.fileno()).st_size == 0:
+                    return memoryview(b"")
+                return memoryview(mmap(file.fileno(), 0, access=ACCESS_READ))
+
+        return memoryview(self._native).cast("B").toreadonly()
+
+    def close(self) -> None:
+        release(self, DLL.ZkRead_del)
+        self._view = None
+
+        if self._buffer is not None:
+            _PyBuffer_Release(byref(self._buffer))
+            self._buffer = None
+
+        self._native = None
         self._keepalive = None
 
+    def __del__(self) -> None:
+        self.close()
+
+
+_WriteExtWrite = CFUNCTYPE(c_size_t, c_void_p, c_void_p, c_size_t)
+_WriteExtSeek = CFUNCTYPE(None, c_void_p, c_long, c_int)
+_WriteExtTell = CFUNCTYPE(c_size_t, c_void_p)
+
+
+class _WriteExt(Structure):
+    _fields_: ClassVar[tuple[str, Any]] = [
+        ("write", _WriteExtWrite),
+        ("seek", _WriteExtSeek),
+        ("tell", _WriteExtTell),
+        ("delete", c_void_p),
+    ]
+
+
+class _WriteSink:
+    # Collects the native stream's many small writes in a buffer. Without a file object, the buffer holds the whole
+    # output. With a seekable file object it is written out once it grows beyond `chunk_size`, or when the native
+    # side seeks outside of it. Non-seekable file objects only receive data on `flush()`. Positions are relative to
+    # where the file object was when the sink was created.
+    __slots__ = ("_base", "_chunk_size", "_end", "_position", "_start", "buffer", "ext", "file")
+
+    def __init__(self, file: BinaryIO | None, chunk_size: int | None) -> None:
+        seekable = file is not None and file.seekable()
+
+        self.file = file
+        self._base = file.tell() if seekable else 0
+        self._chunk_size = chunk_size if seekable else None
+        self._start = 0
+        self._position = 0
+        self._end = 0
+        self.buffer = bytearray()
+
+        self.ext = _WriteExt(
+            write=_WriteExtWrite(self._write),
+            seek=_WriteExtSeek(self._seek),
+            tell=_WriteExtTell(self._tell),
+            delete=None,
+        )
+
+    def flush(self) -> None:
+        if self.file is None or not self.buffer:
+            return
+
+        if self._chunk_size is not None:
+            self.file.seek(self._base + self._start)
+        self.file.write(self.buffer)
+        self._start += len(self.buffer)
+        self.buffer.clear()
+
+    def write(self, data: Any) -> int:
+        length = len(data)
+        offset = self._position - self._start
+        if offset < 0 or (offset > len(self.buffer) and self._chunk_size is not None):
+            self.flush()
+            self._start = self._position
+            offset = 0
+
+        if offset > len(self.buffer):
+            self.buffer.extend(bytes(offset - len(self.buffer)))
+
+        self.buffer[offset : offset + length] = data
+        self._position += length
+        self._end = max(self._end, self._position)
+
+        if self._chunk_size is not None and len(self.buffer) >= self._chunk_size:
+            self.flush()
+            self._start = self._position
+
+        return length
+
+    def _write(self, _: Any, data: int, length: int) -> int:
+        return self.write((c_char * length).from_address(data))
+
+    def _seek(self, _: Any, offset: int, whence: int) -> None:
+        if whence == SEEK_SET:
+            self._position = offset
+        elif whence == SEEK_CUR:
+            self._position += offset
+        elif whence == SEEK_END:
+            self._position = self._end + offset
 
-class Write:
-    __slots__ = ("_handle", "_native", "_keepalive")
+    def _tell(self, _: Any) -> int:
+        return self._position
 
-    def __init__(self, source: str | PathLike) -> None:
+
+class Write(Closeable):
+    __slots__ = ("__weakref__", "_handle", "_keepalive", "_native")
+
+    def __init__(self, source: str | PathLike | c_void_p) -> None:
         self._handle = c_void_p(None)
         self._keepalive = DLL
 
-        self._native = str(source)
-        self._handle = c_void_p(DLL.ZkWrite_newPath(self._native.encode("windows-1252")))
+        if isinstance(source, c_void_p):
+            self._native = None
+            self._handle = source
+        else:
+            self._native = str(source)
+            self._handle = c_void_p(DLL.ZkWrite_newPath(self._native.encode("windows-1252")))
 
         if self._handle.value is None or self._handle.value == 0:
-            error = "Failed to create input stream, see logs."
+            error = "Failed to create output stream, see logs."
             raise ValueError(error)
 
+    @staticmethod
+    def memory() -> "Write":
+        return Write._from_sink(_WriteSink(None, None))
+
+    @staticmethod
+    def from_fileobj(file: BinaryIO, *, chunk_size: int = 64 * 1024) -> "Write":
+        return Write._from_sink(_WriteSink(file, chunk_size))
+
+    @staticmethod
+    def _from_sink(sink: _WriteSink) -> "Write":
+        wr = Write(c_void_p(DLL.ZkWrite_newExt(None, sink.ext)))
+        wr._native = sink
+        return wr
+
     @property
     def handle(self) -> c_void_p:
         return self._handle
 
-    def __del__(self) -> None:
-        DLL.ZkWrite_del(self._handle)
-        self._handle = None
+    @property
+    def data(self) -> bytes:
+        return bytes(self._memory_sink().buffer)
+
+    def view(self) -> memoryview:
+        return memoryview(self._memory_sink().buffer).toreadonly()
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        if not isinstance(self._native, _WriteSink):
+            error = "Not a memory or file object backed output stream"
+            raise TypeError(error)
+        return self._native.write(memoryview(data).cast("B"))
+
+    def flush(self) -> None:
+        if isinstance(self._native, _WriteSink):
+            self._native.flush()
+
+    def _memory_sink(self) -> _WriteSink:
+        if not isinstance(self._native, _WriteSink) or self._native.file is not None:
+            error = "Not a memory-backed output stream"
+            raise ValueError(error)
+        return self._native
+
+    def close(self) -> None:
+        release(self, DLL.ZkWrite_del)
+
+        if isinstance(self._native, _WriteSink):
+            self._native.flush()
+
+        self._native = None
         self._keepalive = None
+
+    def __del__(self) -> None:
+        self.close()
@@ -2,22 +2,38 @@ __all__ = [
     "Texture",
     "TextureFormat",
     "TextureBuilder",
+    "TextureInfo",
+    "decode_all",
 ]
 
+import os
+import warnings
+from collections.abc import Callable
+from collections.abc import Iterator
+from ctypes import CFUNCTYPE
+from ctypes import Array
 from ctypes import byref
-from ctypes import c_char_p
+from ctypes import c_char
 from ctypes import c_int
 from ctypes import c_size_t
-from ctypes import c_uint
+from ctypes import c_uint32
 from ctypes import c_void_p
 from ctypes import string_at
+from dataclasses import dataclass
 from enum import IntEnum
+from struct import Struct
 from typing import Any
 
 from zenkit import _native
 from zenkit._core import DLL
+from zenkit._core import Closeable
 from zenkit._core import PathOrFileLike
-from zenkit._native import ZkPointer
+from zenkit._core import depend
+from zenkit._core import release
+from zenkit.vfs import Vfs
+from zenkit.vfs import VfsNode
+
+_TexturePaletteEnumerator = CFUNCTYPE(c_int, c_void_p, c_uint32)
 
 
 class TextureFormat(IntEnum):
@@ -38,49 +54,98 @@ class TextureFormat(IntEnum):
     DXT5 = 0xE
 
 
-DLL.ZkTexture_getFormat.restype = c_int
-DLL.ZkTexture_getPaletteSize.restype = c_size_t
-DLL.ZkTexture_getPaletteItem.restype = c_uint
-DLL.ZkTexture_getHeight.restype = c_uint
-DLL.ZkTexture_getWidth.restype = c_uint
-DLL.ZkTexture_getWidthRef.restype = c_uint
-DLL.ZkTexture_getHeightRef.restype = c_uint
-DLL.ZkTexture_getAverageColor.restype = c_uint
-DLL.ZkTexture_getMipmapCount.restype = c_size_t
-DLL.ZkTexture_getWidthMipmap.restype = c_uint
-DLL.ZkTexture_getHeightMipmap.restype = c_uint
-DLL.ZkTexture_getMipmapRaw.restype = c_char_p
-DLL.ZkTexture_getMipmapRgba.restype = c_size_t
+_TEXTURE_HEADER = Struct("<4s8I")
+
+
+@dataclass(slots=True)
+class TextureInfo:
+    format: TextureFormat
+    width: int
+    height: int
+    width_ref: int
+    height_ref: int
+    mipmap_count: int
+    average_color: int
 
 
-class Texture:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class _TextureStorage:
+    # Owns the native memory of a texture once mipmap views point into it. The texture and every view hold a
+    # reference, so the memory is freed once the texture was closed and the last view is gone.
+    __slots__ = ("_handle",)
+
+    def __init__(self, handle: c_void_p) -> None:
+        self._handle = handle
+
+    def __del__(self) -> None:
+        DLL.ZkTexture_del(self._handle)
+
+
+class Texture(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive", "_storage")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
+        self._storage: _TextureStorage | None = None
 
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def load(path_or_file_like: PathOrFileLike) -> "Texture":
         handle = _native.load("ZkTexture_load", path_or_file_like)
         return Texture(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike) -> "Texture":
+        return await _native.load_async(Texture.load, path_or_file_like)
+
+    @staticmethod
+    def probe(path_or_file_like: PathOrFileLike) -> TextureInfo:
+        data = _native.peek(path_or_file_like, _TEXTURE_HEADER.size)
+        if len(data) < _TEXTURE_HEADER.size or data[:4] != b"ZTEX":
+            error = "Not a texture"
+            raise ValueError(error)
+
+        _, _, fmt, width, height, mipmap_count, width_ref, height_ref, average_color = _TEXTURE_HEADER.unpack(data)
+        return TextureInfo(
+            format=TextureFormat(fmt),
+            width=width,
+            height=height,
+            width_ref=width_ref,
+            height_ref=height_ref,
+            mipmap_count=mipmap_count,
+            average_color=average_color,
+        )
+
     @property
     def format(self) -> TextureFormat:
         return TextureFormat(DLL.ZkTexture_getFormat(self._handle))
 
     @property
     def palette(self) -> list[int]:
+        return self.palette_array()[:]
+
+    def palette_array(self) -> Array[c_uint32]:
         if self.format != TextureFormat.P8:
             error = "Not a palette texture"
             raise ValueError(error)
 
-        size = DLL.ZkTexture_getPaletteSize(self._handle)
-        return [DLL.ZkTexture_getPaletteItem(self._handle, c_size_t(i)) for i in range(size)]
+        items = (c_uint32 * DLL.ZkTexture_getPaletteSize(self._handle))()
+        targets = iter(range(len(items)))
+
+        def _enumerate(_: Any, color: int) -> int:
+            items[next(targets)] = color
+            return 0
+
+        DLL.ZkTexture_enumeratePaletteItems(self._handle, _TexturePaletteEnumerator(_enumerate), None)
+        return items
+
+    def expand_palette(self, level: int) -> bytes:
+        data = bytearray(self._mipmap_rgba_size(level))
+        self._expand_palette_into(level, memoryview(data))
+        return bytes(data)
 
     @property
     def width(self) -> int:
@@ -113,36 +178,98 @@ class Texture:
         return DLL.ZkTexture_getHeightMipmap(self._handle, c_size_t(level))
 
     def mipmap_raw(self, level: int) -> bytes:
+        self._check_mipmap_level(level)
+
         size = c_size_t(0)
-        data = c_char_p(DLL.ZkTexture_getMipmapRaw(self._handle, c_size_t(level), byref(size)))
+        address = DLL.ZkTexture_getMipmapRaw(self._handle, c_size_t(level), byref(size))
+        if not address or size.value == 0:
+            return b""
+        return string_at(address, size.value)
+
+    def mipmap_raw_view(self, level: int) -> memoryview:
+        self._check_mipmap_level(level)
+        if not self._delete and self._storage is None:
+            error = "Only textures owning their storage can be viewed, use mipmap_raw() instead"
+            raise ValueError(error)
 
-        return bytes(string_at(data, size.value))
+        size = c_size_t(0)
+        address = DLL.ZkTexture_getMipmapRaw(self._handle, c_size_t(level), byref(size))
+        if not address or size.value == 0:
+            return memoryview(b"")
+
+        # Slices and exports of a view outlive `memoryview.release`, so views can't be revoked when the texture is
+        # closed. Instead, the storage is handed over to an owner shared with the views, which keeps it alive.
+        if self._storage is None:
+            self._storage = _TextureStorage(self._handle)
+            self._delete = False
+
+        data = (c_char * size.value).from_address(address)
+        data._storage = self._storage  # noqa: SLF001 / The view points into the texture's storage, keep it alive.
+        return memoryview(data).cast("B").toreadonly()
 
     def mipmap_rgba(self, level: int) -> bytes:
-        size = self.width_mipmap(level) * self.height_mipmap(level) * 4
-        data = bytes(size)
+        data = bytearray(self._mipmap_rgba_size(level))
+        self.mipmap_rgba_into(level, data)
+        return bytes(data)
+
+    def mipmap_rgba_into(self, level: int, buffer: Any) -> int:
+        size = self._mipmap_rgba_size(level)
+        view = memoryview(buffer)
+
+        if view.readonly:
+            error = "Buffer is not writable"
+            raise ValueError(error)
+        if not view.c_contiguous:
+            error = "Buffer is not contiguous"
+            raise ValueError(error)
+        if view.nbytes < size:
+            error = f"Buffer too small: need {size} bytes, got {view.nbytes}"
+            raise ValueError(error)
+
+        if self.format == TextureFormat.P8:
+            return self._expand_palette_into(level, view.cast("B"))
+
+        target = (c_char * view.nbytes).from_buffer(view.cast("B"))
+        return DLL.ZkTexture_getMipmapRgba(self._handle, c_size_t(level), target, c_size_t(size))
 
-        DLL.ZkTexture_getMipmapRgba(self._handle, c_size_t(level), data, c_size_t(size))
+    def _expand_palette_into(self, level: int, target: memoryview) -> int:
+        # Palette entries are packed as R, G, B, A bytes. Each channel is looked up for all pixels at once through a
+        # translation table and then interleaved into the target.
+        palette = bytes(self.palette_array())
+        indices = self.mipmap_raw(level)
+        size = len(indices) * 4
 
-        return data
+        for channel in range(4):
+            target[channel:size:4] = indices.translate(palette[channel::4])
+
+        return size
+
+    def _check_mipmap_level(self, level: int) -> None:
+        if not 0 <= level < self.mipmap_count:
+            error = f"Mipmap level {level} out of range"
+            raise ValueError(error)
+
+    def _mipmap_rgba_size(self, level: int) -> int:
+        self._check_mipmap_level(level)
+        return self.width_mipmap(level) * self.height_mipmap(level) * 4
+
+    def close(self) -> None:
+        release(self, DLL.ZkTexture_del)
+        self._storage = None
 
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkTexture_del(self._handle)
         self._handle = None
         self._keepalive = None
+        self._storage = None
 
     def __repr__(self) -> str:
         return f"<Texture handle={self._handle}>"
 
 
-DLL.ZkTextureBuilder_new.restype = ZkPointer
-DLL.ZkTextureBuilder_addMipmap.restype = c_int
-DLL.ZkTextureBuilder_build.restype = ZkPointer
-
-
-class TextureBuilder:
-    __slots__ = ("_handle",)
+class TextureBuilder(Closeable):
+    __slots__ = ("__weakref__", "_handle")
 
     def __init__(self, width: int, height: int) -> None:
         self._handle = DLL.ZkTextureBuilder_new(c_size_t(width), c_size_t(height)).value
@@ -158,6 +285,74 @@ class TextureBuilder:
         handle = DLL.ZkTextureBuilder_build(self._handle, fmt.value).value
         return Texture(_handle=handle, _delete=False)
 
+    def close(self) -> None:
+        release(self, DLL.ZkTextureBuilder_del)
+
     def __del__(self) -> None:
-        DLL.ZkTextureBuilder_del(self._handle)
-        self._handle = None
+        self.close()
+
+
+def _decode(path: str, node: VfsNode, level: int) -> tuple[str, int, int, bytearray]:
+    handle = _native.load("ZkTexture_load", node)
+    if not handle.value:
+        error = f"Failed to load texture {path!r}; see log"
+        raise ValueError(error)
+
+    # Textures without the requested mipmap level fail like any other texture that can't be decoded.
+    with Texture(_handle=handle, _delete=True) as texture:
+        data = bytearray(texture._mipmap_rgba_size(level))  # noqa: SLF001 / same module
+        texture.mipmap_rgba_into(level, data)
+        return path, texture.width_mipmap(level), texture.height_mipmap(level), data
+
+
+def decode_all(  # noqa: PLR0913 / keyword-only tuning options
+    vfs: Vfs,
+    pattern: str = "*-C.TEX",
+    *,
+    workers: int | None = None,
+    level: int = 0,
+    max_pending: int | None = None,
+    on_error: Callable[[str, Exception], None] | None = None,
+) -> Iterator[tuple[str, int, int, bytearray]]:
+    from concurrent.futures import FIRST_COMPLETED  # noqa: PLC0415 / lazy import
+    from concurrent.futures import Future  # noqa: PLC0415 / lazy import
+    from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415 / lazy import
+    from concurrent.futures import wait  # noqa: PLC0415 / lazy import
+
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    max_pending = max_pending or 2 * workers
+
+    # Native calls release the GIL, so loads and decodes run in parallel. At most `max_pending` textures are queued
+    # or decoded and not yet consumed at any time, which bounds the memory held by the pipeline.
+    files = ((path, vfs._node(key)) for key, path in vfs._glob(pattern))  # noqa: SLF001 / same package
+    pending: dict[Future, str] = {}
+
+    # A texture which fails to decode doesn't end the run. It is passed to `on_error`, or skipped with a warning.
+    def _collect(done: set[Future]) -> list[tuple[str, int, int, bytearray]]:
+        results = []
+        for future in done:
+            path = pending.pop(future)
+            error = future.exception()
+            if error is None:
+                results.append(future.result())
+            elif on_error is not None:
+                on_error(path, error)
+            else:
+                warnings.warn(f"Skipping texture {path!r}: {error}", RuntimeWarning, stacklevel=3)
+        return results
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zenkit-texture") as executor:
+        try:
+            for path, node in files:
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from _collect(done)
+
+                pending[executor.submit(_decode, path, node, level)] = path
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from _collect(done)
+        finally:
+            for future in pending:
+                future.cancel()
@@ -1,28 +1,65 @@
 __all__ = [
+    "VdfWriter",
     "Vfs",
+    "VfsConflict",
+    "VfsEntry",
+    "VfsFileHash",
+    "VfsIndexCache",
+    "VfsManifest",
     "VfsNode",
     "VfsOverwriteBehavior",
 ]
 
+import os
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Iterator
 from ctypes import CFUNCTYPE
-from ctypes import c_char_p
+from ctypes import c_char
 from ctypes import c_int
 from ctypes import c_long
 from ctypes import c_ulong
 from ctypes import c_void_p
+from dataclasses import dataclass
 from datetime import datetime
 from datetime import timezone
 from enum import IntEnum
+from fnmatch import fnmatchcase
 from os import PathLike
+from os import fstat
+from pathlib import Path
+from struct import Struct
+from threading import local
+from time import localtime
+from time import mktime
+from time import tzname
 from typing import Any
+from typing import BinaryIO
 from typing import overload
 
 from zenkit._core import DLL
+from zenkit._core import Closeable
 from zenkit._core import GameVersion
+from zenkit._core import depend
+from zenkit._core import release
 from zenkit.stream import Read
+from zenkit.stream import Write
 
 _VfsNodeEnumerator = CFUNCTYPE(c_int, c_void_p, c_void_p)
+_SAVE_CHUNK_SIZE = 1024 * 1024
+_PREFETCH_CHUNK_SIZE = 1024 * 1024
+
+_VDF_HEADER = Struct("<256s16s6I")
+_VDF_ENTRY = Struct("<64s4I")
+_VDF_SIGNATURES = (b"PSVDSC_V2.00\r\n\r\n", b"PSVDSC_V2.00\n\r\n\r")
+_VDF_ENTRY_DIRECTORY = 0x80000000
+_VDF_ENTRY_LAST = 0x40000000
+_VDF_COMMENT = "Created using ZenKit"
+_VDF_VERSION = 0x50
+
+_INDEX_CACHE_VERSION = 2
+_HASH_BATCH_SIZE = 256
 
 
 class VfsOverwriteBehavior(IntEnum):
@@ -32,27 +69,471 @@ class VfsOverwriteBehavior(IntEnum):
     OLDER = 3
 
 
-DLL.ZkVfsNode_getName.restype = c_char_p
-DLL.ZkVfsNode_enumerateChildren.restype = None
-DLL.ZkVfsNode_getChild.restype = c_void_p
-DLL.ZkVfsNode_isFile.restype = c_int
-DLL.ZkVfsNode_isDir.restype = c_int
-DLL.ZkVfsNode_open.restype = c_void_p
+@dataclass(slots=True)
+class VfsEntry:
+    name: str
+    path: str
+    is_dir: bool
+    size: int
+    timestamp: int
+    source: str | None
+
+
+@dataclass(slots=True)
+class VfsConflict:
+    path: str
+    winner: VfsEntry
+    shadowed: list[VfsEntry]
+
+
+@dataclass(slots=True)
+class VfsFileHash:
+    digest: str
+    size: int
+    source: str | None
+
+
+@dataclass(slots=True)
+class VfsManifest:
+    algorithm: str
+    files: dict[str, VfsFileHash]
+
+    # Size and modification time of every source archive when it was hashed.
+    archives: dict[str, tuple[int, int]]
+
+    def duplicates(self) -> dict[str, list[str]]:
+        paths = {}
+        for path, file in self.files.items():
+            paths.setdefault(file.digest, []).append(path)
+        return {digest: found for digest, found in paths.items() if len(found) > 1}
+
+    def _reusable(self, algorithm: str, stamps: dict[str, tuple[int, int]]) -> dict[str, VfsFileHash]:
+        # Files from archives which haven't changed since they were hashed don't need to be hashed again.
+        if algorithm != self.algorithm:
+            return {}
+
+        unchanged = {source for source, stamp in self.archives.items() if stamps.get(source) == stamp}
+        return {path: file for path, file in self.files.items() if file.source in unchanged}
+
+
+# A parsed archive catalog: the archive's DOS timestamp and (path, is_dir, size, offset) for every node.
+_Catalog = tuple[int, list[tuple[str, bool, int, int]]]
+
+# An archive mounted from disk: its path, overwrite behavior, size and modification time.
+_Mount = tuple[str, "VfsOverwriteBehavior", int, int]
+
+# A resolved node: its path, whether it is a directory, size, timestamp, source archive and offset in the archive.
+# Plain tuples keep large indices cheap to (un)pickle. Nodes indexed from the native tree have no size or source.
+_Entry = tuple[str, bool, int | None, int, str | None, int]
+
+# For every node, the candidates it replaced or kept out while mounting.
+_Conflicts = dict[str, list[_Entry]]
+
+# Contents of a file written to an archive: a host path, a stream, a buffer or an iterable of chunks.
+_VdfSource = str | PathLike | Read | bytes | bytearray | memoryview | Iterable[bytes]
+
+# A catalog entry being written: its name, source, type, offset, size and the path it was given as.
+_VdfRecord = list[Any]
+
+
+def _index_key(path: str | PathLike) -> str:
+    return str(path).replace("\\", "/").strip("/").upper()
+
+
+def _unix_to_dos_time(value: int) -> int:
+    local = localtime(value)
+    return (
+        ((local.tm_year - 1980) << 25)
+        | (local.tm_mon << 21)
+        | (local.tm_mday << 16)
+        | (local.tm_hour << 11)
+        | (local.tm_min << 5)
+        | (local.tm_sec // 2)
+    )
+
+
+def _dos_to_unix_time(value: int) -> int:
+    # Archive timestamps are stored in local time, which is how ZenKit converts them as well.
+    return int(
+        mktime(
+            (
+                (value >> 25) + 1980,
+                (value >> 21) & 0xF,
+                (value >> 16) & 0x1F,
+                (value >> 11) & 0x1F,
+                (value >> 5) & 0x3F,
+                (value & 0x1F) * 2,
+                0,
+                0,
+                -1,
+            )
+        )
+    )
+
+
+def _read_catalog(path: str | PathLike) -> _Catalog:
+    with Path(path).open("rb") as file:
+        header = file.read(_VDF_HEADER.size)
+        if len(header) != _VDF_HEADER.size:
+            error = f"Not a VDF archive: {path}"
+            raise ValueError(error)
+
+        _, signature, count, _, timestamp, _, catalog_offset, _ = _VDF_HEADER.unpack(header)
+        if signature not in _VDF_SIGNATURES:
+            error = f"Not a VDF archive: {path}"
+            raise ValueError(error)
+
+        file.seek(catalog_offset)
+        catalog = file.read(count * _VDF_ENTRY.size)
+
+    if len(catalog) != count * _VDF_ENTRY.size:
+        error = f"Truncated VDF catalog: {path}"
+        raise ValueError(error)
+
+    records = list(_VDF_ENTRY.iter_unpack(catalog))
+    entries = []
+    pending = deque([(0, "")])
+    visited = set()
+
+    # Breadth-first, so that every directory is listed before its contents.
+    while pending:
+        index, prefix = pending.popleft()
+        if index in visited:
+            continue
+        visited.add(index)
+
+        while index < count:
+            name, offset, size, kind, _ = records[index]
+            name = name.split(b"\0", 1)[0].rstrip(b" ").decode("windows-1252")
+            path_ = prefix + name
+
+            if kind & _VDF_ENTRY_DIRECTORY:
+                entries.append((path_, True, 0, 0))
+                pending.append((offset, path_ + "/"))
+            else:
+                entries.append((path_, False, size, offset))
+
+            if kind & _VDF_ENTRY_LAST:
+                break
+            index += 1
+
+    return timestamp, entries
+
+
+def _has_magic(pattern: str) -> bool:
+    return any(char in pattern for char in "*?[")
+
+
+def _match_components(names: list[str], patterns: list[str]) -> bool:
+    return len(names) == len(patterns) and all(map(fnmatchcase, names, patterns))
+
+
+def _find_order(key: str) -> tuple[tuple[int, ...], ...]:
+    # Native `find` searches depth-first, checking each directory's own children before descending into its
+    # subdirectories in reverse order. Negated, terminated code points sort names in that reverse order, while
+    # shorter parent paths (visited first) sort before longer ones.
+    parents = key.split("/")[:-1]
+    return tuple((*(-ord(char) for char in part.lower()), 0) for part in parents)
+
+
+def _child_handles(handle: int) -> list[int]:
+    nodes = []
+
+    def _enumerate(_: Any, node: int) -> int:
+        nodes.append(node)
+        return 0
+
+    DLL.ZkVfsNode_enumerateChildren(handle, _VfsNodeEnumerator(_enumerate), None)
+    return nodes
+
+
+def _file_size(handle: int) -> int:
+    stream = DLL.ZkVfsNode_open(handle)
+    try:
+        return DLL.ZkRead_getSize(stream)
+    finally:
+        DLL.ZkRead_del(stream)
+
+
+def _walk_native(root: int) -> tuple[dict[str, _Entry], dict[str, int]]:
+    entries = {}
+    handles = {}
+    pending = deque([(root, "")])
+
+    while pending:
+        handle, parent = pending.popleft()
+
+        for node in _child_handles(handle):
+            name = DLL.ZkVfsNode_getName(node).decode("windows-1252")
+            is_dir = DLL.ZkVfsNode_isDir(node) != 0
+            path = f"{parent}/{name}" if parent else name
+            key = path.upper()
+
+            entries[key] = (path, is_dir, None, DLL.ZkVfsNode_getTime(node), None, 0)
+            handles[key] = node
+            if is_dir:
+                pending.append((node, path))
+
+    return entries, handles
+
+
+def _map_archive(source: str, stamp: tuple[int, int]) -> memoryview | None:
+    from mmap import ACCESS_READ  # noqa: PLC0415 / lazy import
+    from mmap import mmap  # noqa: PLC0415 / lazy import
+
+    try:
+        with Path(source).open("rb") as file:
+            stat = fstat(file.fileno())
+            if (stat.st_size, stat.st_mtime_ns) != stamp or stat.st_size == 0:
+                return None
+            return memoryview(mmap(file.fileno(), 0, access=ACCESS_READ))
+    except OSError:
+        return None
 
 
-class VfsNode:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+def _read_node(handle: int, buffers: local) -> memoryview:
+    # `ZkRead_getBytes` can only copy whole streams, so every thread keeps a buffer as large as its largest file.
+    stream = DLL.ZkVfsNode_open(handle)
+    try:
+        size = DLL.ZkRead_getSize(stream)
+        buffer = getattr(buffers, "buffer", None)
+        if buffer is None or len(buffer) < size:
+            buffer = buffers.buffer = bytearray(size)
+        DLL.ZkRead_getBytes(stream, (c_char * size).from_buffer(buffer), size)
+    finally:
+        DLL.ZkRead_del(stream)
+    return memoryview(buffer)[:size]
+
+
+def _prefetch_catalog(path: str) -> None:
+    # Reads the header and catalog of an archive, so that the native mount finds them in the OS page cache. Reading
+    # releases the GIL, which lets the I/O of many archives overlap. Unreadable archives are left to the native mount.
+    try:
+        with Path(path).open("rb") as file:
+            header = file.read(_VDF_HEADER.size)
+            if len(header) == _VDF_HEADER.size:
+                _, _, count, _, _, _, catalog_offset, _ = _VDF_HEADER.unpack(header)
+                file.seek(catalog_offset)
+
+                remaining = count * _VDF_ENTRY.size
+                while remaining > 0 and (chunk := file.read(min(remaining, _PREFETCH_CHUNK_SIZE))):
+                    remaining -= len(chunk)
+    except OSError:
+        pass
+
+
+def _read_catalog_checked(source: str, size: int, mtime: int) -> _Catalog:
+    stat = Path(source).stat()
+    if (stat.st_size, stat.st_mtime_ns) != (size, mtime):
+        error = f"Archive changed since it was mounted: {source}"
+        raise ValueError(error)
+    return _read_catalog(source)
+
+
+def _overwrites(clobber: VfsOverwriteBehavior, existing: int, timestamp: int) -> bool:
+    if clobber == VfsOverwriteBehavior.ALL:
+        return True
+    if clobber == VfsOverwriteBehavior.NEWER:
+        return existing > timestamp
+    if clobber == VfsOverwriteBehavior.OLDER:
+        return existing < timestamp
+    return False
+
+
+def _merge_catalog(
+    index: dict[str, _Entry],
+    conflicts: _Conflicts,
+    catalog: _Catalog,
+    source: str,
+    clobber: VfsOverwriteBehavior,
+) -> None:
+    # Mirrors the native merge: directories are merged into existing ones and every other conflict replaces or
+    # keeps the whole existing node, depending on the overwrite behavior. The losing node is recorded either way.
+    timestamp = _dos_to_unix_time(catalog[0])
+    skipped = set()
+
+    for path, is_dir, size, offset in catalog[1]:
+        parent, _, name = path.rpartition("/")
+        parent_key = parent.upper()
+        if parent_key in skipped:
+            if is_dir:
+                skipped.add(path.upper())
+            continue
+
+        key = f"{parent_key}/{name.upper()}" if parent else name.upper()
+        full_path = f"{index[parent_key][0]}/{name}" if parent else name
+        entry = (full_path, is_dir, size, timestamp, source, offset)
+
+        existing = index.get(key)
+        if existing is not None:
+            if existing[1] and is_dir:
+                continue
+            if not _overwrites(clobber, existing[3], timestamp):
+                conflicts.setdefault(key, []).append(entry)
+                if is_dir:
+                    skipped.add(key)
+                continue
+            if existing[1]:
+                prefix = key + "/"
+                for child in [child for child in index if child.startswith(prefix)]:
+                    del index[child]
+                    conflicts.pop(child, None)
+            conflicts.setdefault(key, []).append(existing)
+            del index[key]
+
+        index[key] = entry
+
+
+def _resolve_mounts(
+    mounts: list[_Mount], catalog: Callable[[str, int, int], _Catalog]
+) -> tuple[dict[str, _Entry], _Conflicts]:
+    index = {}
+    conflicts = {}
+    for source, clobber, size, mtime in mounts:
+        _merge_catalog(index, conflicts, catalog(source, size, mtime), source, clobber)
+    return index, conflicts
+
+
+def _vdf_tree(entries: Iterable[tuple[str | PathLike, _VdfSource]]) -> dict[bytes, tuple[bytes, Any]]:
+    root = {}
+    for path, source in entries:
+        names = [name.encode("windows-1252") for name in str(path).replace("\\", "/").split("/") if name]
+        if not names:
+            error = f"Invalid archive path: {path!r}"
+            raise ValueError(error)
+        if any(len(name) > _VDF_ENTRY.size - 16 for name in names):
+            error = f"Archive path component too long: {path}"
+            raise ValueError(error)
+
+        # Names are matched case-insensitively, keeping the casing they were first given in.
+        directory = root
+        for name in names[:-1]:
+            _, directory = directory.setdefault(name.lower(), (name, {}))
+            if not isinstance(directory, dict):
+                error = f"Archive path is below a file: {path}"
+                raise ValueError(error)  # noqa: TRY004 / not a type check
+
+        if names[-1].lower() in directory:
+            error = f"Duplicate archive path: {path}"
+            raise ValueError(error)
+        directory[names[-1].lower()] = (names[-1], (source, str(path)))
+    return root
+
+
+def _vdf_catalog(entries: Iterable[tuple[str | PathLike, _VdfSource]]) -> list[_VdfRecord]:
+    # Like ZenKit, the children of every directory are listed together, followed by those of its subdirectories in
+    # order, depth-first. Directories point to the index of their first child.
+    records = []
+    pending = [(None, _vdf_tree(entries))]
+    while pending:
+        parent, directory = pending.pop()
+        if parent is not None:
+            records[parent][3] = len(records)
+
+        subdirectories = []
+        for i, key in enumerate(sorted(directory)):
+            name, child = directory[key]
+            kind = _VDF_ENTRY_LAST if i == len(directory) - 1 else 0
+            if isinstance(child, dict):
+                subdirectories.append((len(records), child))
+                records.append([name, None, kind | _VDF_ENTRY_DIRECTORY, 0, 0, None])
+            else:
+                source, path = child
+                records.append([name, source, kind, 0, _vdf_source_size(source), path])
+        pending.extend(reversed(subdirectories))
+    return records
+
+
+def _vdf_source_size(source: _VdfSource) -> int | None:
+    if isinstance(source, str | PathLike):
+        return Path(source).stat().st_size
+    if isinstance(source, Read):
+        return source.size
+    if isinstance(source, bytes | bytearray | memoryview):
+        return memoryview(source).nbytes
+    return None
+
+
+def _read_range(path: str | PathLike, offset: int, size: int) -> bytes:
+    with Path(path).open("rb") as file:
+        file.seek(offset)
+        return file.read(size)
+
+
+class VfsIndexCache:
+    __slots__ = ("_directory",)
+
+    def __init__(self, directory: str | PathLike) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def clear(self) -> None:
+        for file in [*self._directory.glob("*.catalog"), *self._directory.glob("*.tree")]:
+            file.unlink(missing_ok=True)
+
+    def _catalog(self, source: str, size: int, mtime: int) -> _Catalog:
+        from hashlib import sha256  # noqa: PLC0415 / lazy import
+
+        path = str(Path(source).resolve())
+        file = self._directory / f"{sha256(path.encode()).hexdigest()}.catalog"
+        key = (path, size, mtime)
+
+        catalog = self._read(file, key)
+        if catalog is None:
+            catalog = _read_catalog_checked(source, size, mtime)
+            self._write(file, key, catalog)
+        return catalog
+
+    def _resolve(self, mounts: list[_Mount]) -> tuple[dict[str, _Entry], _Conflicts]:
+        from hashlib import sha256  # noqa: PLC0415 / lazy import
+
+        # Timestamps are converted from local time, so the resolved tree also depends on the time zone.
+        key = (tzname, [(str(Path(source).resolve()), *rest) for source, *rest in mounts])
+        file = self._directory / f"{sha256(repr(key).encode()).hexdigest()}.tree"
+
+        tree = self._read(file, key)
+        if tree is None:
+            tree = _resolve_mounts(mounts, self._catalog)
+            self._write(file, key, tree)
+        return tree
+
+    @staticmethod
+    def _read(file: Path, key: Any) -> Any:
+        import pickle  # noqa: PLC0415 / lazy import
+
+        try:
+            with file.open("rb") as f:
+                version, cached_key, value = pickle.load(f)  # noqa: S301 / only ever written by `_write` below
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            return None
+
+        if version != _INDEX_CACHE_VERSION or cached_key != key:
+            return None
+        return value
+
+    @staticmethod
+    def _write(file: Path, key: Any, value: Any) -> None:
+        import pickle  # noqa: PLC0415 / lazy import
+
+        # Written next to the final file and moved into place, so concurrent readers never see a partial index.
+        temporary = file.with_suffix(f".{os.getpid()}.tmp")
+        with temporary.open("wb") as f:
+            pickle.dump((_INDEX_CACHE_VERSION, key, value), f, pickle.HIGHEST_PROTOCOL)
+        temporary.replace(file)
+
+
+class VfsNode(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive", "_key")
 
     def __init__(self, **kwargs: Any) -> None:
         if "_handle" in kwargs:
             self._handle = kwargs.pop("_handle")
             self._delete = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
+            self._key = kwargs.pop("_key", None)
 
     @staticmethod
     def new_file(name: str, content: bytes | bytearray, *, timestamp: datetime | float | None = None) -> "VfsNode":
-        DLL.ZkVfsNode_newFile.restype = c_void_p
-
         if timestamp is None:
             timestamp = datetime.now(tz=timezone.utc)
         if isinstance(timestamp, datetime):
@@ -65,8 +546,6 @@ class VfsNode:
 
     @staticmethod
     def new_dir(name: str, *, timestamp: datetime | float | None = None) -> "VfsNode":
-        DLL.ZkVfsNode_newDir.restype = c_void_p
-
         if timestamp is None:
             timestamp = datetime.now(tz=timezone.utc)
         if isinstance(timestamp, datetime):
@@ -84,25 +563,43 @@ class VfsNode:
         rd = self.open()
         return rd.data
 
+    def view(self) -> memoryview:
+        # The node's stream has no Python-side source, so the view owns a single copy of the contents which outlives
+        # the stream it was read from.
+        return self.open().view()
+
     @property
     def handle(self) -> c_void_p:
         return self._handle
 
+    @property
+    def source(self) -> str | None:
+        owner, key = self._owner(), self._index_key()
+        if owner is None or key is None:
+            return None
+
+        entry = owner._index().get(key)  # noqa: SLF001 / same module
+        return entry[4] if entry is not None else None
+
     @property
     def children(self) -> list["VfsNode"]:
         if not self.is_dir():
             error = "Not a directory node"
             raise ValueError(error)
 
-        def _enumerate(_: Any, node: int) -> int:
-            nodes.append(VfsNode(_handle=c_void_p(node), _keepalive=self))
-            return 0
+        return [VfsNode(_handle=c_void_p(node), _keepalive=self) for node in _child_handles(self._handle)]
 
-        nodes = []
-        enum = _VfsNodeEnumerator(_enumerate)
-        DLL.ZkVfsNode_enumerateChildren(self._handle, enum, c_void_p(None))
+    def iter_children(self) -> Iterator[VfsEntry]:
+        if not self.is_dir():
+            error = "Not a directory node"
+            raise ValueError(error)
 
-        return nodes
+        # Paths are relative to this node. Only the file system knows where nodes came from, see `Vfs.walk`.
+        for node in _child_handles(self._handle):
+            name = DLL.ZkVfsNode_getName(node).decode("windows-1252")
+            is_dir = DLL.ZkVfsNode_isDir(node) != 0
+            size = 0 if is_dir else _file_size(node)
+            yield VfsEntry(name, name, is_dir, size, DLL.ZkVfsNode_getTime(node), None)
 
     def get_child(self, name: str) -> "VfsNode | None":
         handle = DLL.ZkVfsNode_getChild(self._handle, name.encode("windows-1252"))
@@ -119,8 +616,10 @@ class VfsNode:
             error = "Not a file node"
             raise ValueError(error)
 
-        handle = DLL.ZkVfsNode_open(self._handle)
-        return Read(c_void_p(handle))
+        # The stream reads from the node's memory, so it is closed along with the node.
+        rd = Read(c_void_p(DLL.ZkVfsNode_open(self._handle)))
+        rd._keepalive = depend(rd, self)  # noqa: SLF001 / same package
+        return rd
 
     @overload
     def create(
@@ -133,8 +632,6 @@ class VfsNode:
     ) -> "VfsNode": ...
 
     def create(self, *args: Any, **kwargs: Any) -> "VfsNode":
-        DLL.ZkVfsNode_create.restype = c_void_p
-
         if len(args) == 1:
             if isinstance(args[0], VfsNode):
                 handle = DLL.ZkVfsNode_create(self._handle, args[0].handle)
@@ -155,11 +652,35 @@ class VfsNode:
 
         if handle is None or handle == 0:
             return None
+
+        self._changed()
         return VfsNode(_handle=c_void_p(handle), _keepalive=self)
 
     def remove(self, name: str) -> bool:
-        DLL.ZkVfsNode_remove.restype = c_int
-        return DLL.ZkVfsNode_remove(self._handle, name.encode("windows-1252")) != 0
+        removed = DLL.ZkVfsNode_remove(self._handle, name.encode("windows-1252")) != 0
+        if removed:
+            self._changed()
+        return removed
+
+    def _owner(self) -> "Vfs | None":
+        # Nodes keep their parent alive, so the chain ends at the file system the node belongs to, if any.
+        owner = self._keepalive
+        while isinstance(owner, VfsNode):
+            owner = owner._keepalive  # noqa: SLF001 / same class
+        return owner if isinstance(owner, Vfs) else None
+
+    def _index_key(self) -> str | None:
+        # Only nodes handed out by a file system know their path. Their descendants derive it on demand.
+        if self._key is None and isinstance(self._keepalive, VfsNode):
+            parent = self._keepalive._index_key()  # noqa: SLF001 / same class
+            if parent is not None:
+                self._key = f"{parent}/{self.name.upper()}" if parent else self.name.upper()
+        return self._key
+
+    def _changed(self) -> None:
+        owner = self._owner()
+        if owner is not None:
+            owner._invalidate()  # noqa: SLF001 / same module
 
     def __iter__(self) -> Iterator["VfsNode"]:
         return iter(self.children)
@@ -167,6 +688,9 @@ class VfsNode:
     def __getitem__(self, item: str) -> "VfsNode | None":
         return self.get_child(item)
 
+    def close(self) -> None:
+        release(self, DLL.ZkVfsNode_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkVfsNode_del(self._handle)
@@ -175,18 +699,53 @@ class VfsNode:
 
     def __repr__(self) -> str:
         if self.is_dir():
-            return f"VfsNode(name={self.name!r}, children={len(self.children)})"
+            return f"VfsNode(name={self.name!r}, children={len(_child_handles(self._handle))})"
         return f"VfsNode(name={self.name!r})"
 
 
-class Vfs:
-    __slots__ = ("_handle", "_delete")
+class Vfs(Closeable):
+    __slots__ = (
+        "__weakref__",
+        "_archives",
+        "_cache",
+        "_children",
+        "_conflicts",
+        "_delete",
+        "_entries",
+        "_extensions",
+        "_generation",
+        "_handle",
+        "_handles",
+        "_mounts",
+        "_names",
+        "_pending",
+    )
 
     def __init__(self) -> None:
-        DLL.ZkVfs_new.restype = c_void_p
         self._handle = c_void_p(DLL.ZkVfs_new())
         self._delete = True
 
+        # As long as the tree is only built by mounting archives, the index is resolved from their catalogs, which
+        # records where every node came from. Archives mounted through an index cache are only mounted natively
+        # once the native tree is needed. Until then, single files are resolved through the cached index and served
+        # from per-archive file systems. The index is built from the native tree once it is changed in any other way.
+        self._cache: VfsIndexCache | None = None
+        self._mounts: list[_Mount] | None = []
+        self._entries: dict[str, _Entry] | None = None
+        self._conflicts: _Conflicts | None = None
+
+        # Lookups derived from the index: native handles (when it was built from the native tree), the node native
+        # `find` returns for each name, files by extension and the children of every directory.
+        self._handles: dict[str, int] = {}
+        self._names: dict[str, str] | None = None
+        self._extensions: dict[str, list[str]] | None = None
+        self._children: dict[str, list[str]] | None = None
+        self._pending: list[tuple[str, VfsOverwriteBehavior]] = []
+        self._archives: dict[str, Vfs] = {}
+
+        # Bumped whenever previously resolved nodes may have been replaced or freed.
+        self._generation = 0
+
     def mount_path(
         self,
         path: str | PathLike,
@@ -194,7 +753,7 @@ class Vfs:
         *,
         clobber: VfsOverwriteBehavior = VfsOverwriteBehavior.OLDER,
     ) -> None:
-        DLL.ZkVfs_mountHost.restype = None
+        self._invalidate()
         DLL.ZkVfs_mountHost(
             self._handle,
             str(path).encode("windows-1252"),
@@ -207,42 +766,534 @@ class Vfs:
         path: str | PathLike,
         *,
         clobber: VfsOverwriteBehavior = VfsOverwriteBehavior.OLDER,
+        cache: VfsIndexCache | None = None,
     ) -> None:
-        DLL.ZkVfs_mountDiskHost.restype = None
+        try:
+            stat = Path(path).stat() if self._mounts is not None else None
+        except OSError:
+            stat = None
+
+        if stat is None:
+            self._invalidate()
+        else:
+            self._mounts.append((str(path), clobber, stat.st_size, stat.st_mtime_ns))
+            self._reset_index()
+
+            if cache is not None:
+                self._cache = cache
+                self._pending.append((str(path), clobber))
+                return
+
         DLL.ZkVfs_mountDiskHost(self._handle, str(path).encode("windows-1252"), c_int(clobber.value))
 
+    def mount_many(
+        self,
+        paths: Iterable[str | PathLike],
+        *,
+        clobber: VfsOverwriteBehavior = VfsOverwriteBehavior.OLDER,
+        workers: int | None = None,
+        cache: VfsIndexCache | None = None,
+    ) -> None:
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415 / lazy import
+
+        paths = [str(path) for path in paths]
+
+        # Cached mounts don't touch the archives until the tree is needed, so there is nothing to overlap.
+        if cache is None or self._mounts is None:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for _ in executor.map(_prefetch_catalog, paths):
+                    pass
+
+        for path in paths:
+            self.mount_disk(path, clobber=clobber, cache=cache)
+
     def find(self, name: str | PathLike) -> "VfsNode | None":
-        DLL.ZkVfs_findNode.restype = c_void_p
-        handle = DLL.ZkVfs_findNode(self._handle, str(name).encode("windows-1252"))
-        return VfsNode(_handle=c_void_p(handle), _keepalive=self) if handle is not None else None
+        self._lookups()
+        key = self._names.get(str(name).upper())
+        return self._node(key) if key is not None else None
 
     def resolve(self, path: str | PathLike) -> "VfsNode | None":
-        DLL.ZkVfs_resolvePath.restype = c_void_p
+        if self._pending or self._entries is not None:
+            key = _index_key(path)
+            entry = self._index().get(key)
+            if entry is not None and (key in self._handles or (self._pending and not entry[1])):
+                return self._node(key)
+
+        self._mount_pending()
         handle = DLL.ZkVfs_resolvePath(self._handle, str(path).encode("windows-1252"))
-        return VfsNode(_handle=c_void_p(handle), _keepalive=self) if handle is not None else None
+        return VfsNode(_handle=c_void_p(handle), _keepalive=self, _key=_index_key(path)) if handle is not None else None
+
+    def glob(self, pattern: str) -> list[VfsNode]:
+        return [self._node(key) for key, _ in self._glob(pattern)]
+
+    def by_extension(self, extension: str) -> list[VfsNode]:
+        self._lookups()
+        keys = self._extensions.get(extension.lstrip(".").upper(), [])
+        return [self._node(key) for key in sorted(keys)]
+
+    def walk(self, path: str | PathLike = "") -> Iterator[VfsEntry]:
+        top = _index_key(path)
+        entries = self._index()
+        self._lookups()
+        children = self._children
+
+        if top and (top not in entries or not entries[top][1]):
+            error = f"Not a directory: {path!r}"
+            raise ValueError(error)
+
+        # Depth-first, so every directory is followed by its contents.
+        pending = list(reversed(children.get(top, [])))
+        while pending:
+            if self._entries is not entries:
+                error = "Vfs changed during iteration"
+                raise RuntimeError(error)
+
+            key = pending.pop()
+            path_, is_dir, size, timestamp, source, _ = entries[key]
+
+            if is_dir:
+                size = 0
+                pending.extend(reversed(children[key]))
+            elif size is None:
+                size = self._size(key)
+
+            yield VfsEntry(path_.rpartition("/")[2], path_, is_dir, size, timestamp, source)
+
+    def hash_all(
+        self,
+        algorithm: str = "sha256",
+        *,
+        workers: int | None = None,
+        previous: VfsManifest | None = None,
+    ) -> VfsManifest:
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415 / lazy import
+        from hashlib import new as new_hash  # noqa: PLC0415 / lazy import
+
+        entries = self._index()
+        stamps = {source: (size, mtime) for source, _, size, mtime in self._mounts or []}
+
+        reusable = previous._reusable(algorithm, stamps) if previous is not None else {}  # noqa: SLF001 / same module
+
+        files = {}
+        todo = []
+        for key, (path, is_dir, size, _, source, offset) in entries.items():
+            if is_dir:
+                continue
+
+            file = reusable.get(path)
+            if file is not None and file.source == source and (size is None or file.size == size):
+                files[path] = file
+            else:
+                files[path] = None
+                todo.append((key, path, size, source, offset))
+
+        # Archives that are unchanged since they were mounted are hashed straight from a mapping of the archive.
+        # Everything else is copied out of its native stream into a per-thread buffer.
+        archives = {source: _map_archive(source, stamp) for source, stamp in stamps.items()}
+        archives = {source: archive for source, archive in archives.items() if archive is not None}
+        buffers = local()
+
+        def _hash(batch: list[tuple[str, str, int | None, str | None, int]]) -> list[tuple[str, VfsFileHash]]:
+            hashes = []
+            for key, path, size, source, offset in batch:
+                archive = archives.get(source)
+                if archive is not None:
+                    digest = new_hash(algorithm, archive[offset : offset + size]).hexdigest()
+                    hashes.append((path, VfsFileHash(digest, size, source)))
+                    continue
+
+                handle = self._handles.get(key)
+                data = _read_node(handle if handle is not None else self._node(key).handle, buffers)
+                hashes.append((path, VfsFileHash(new_hash(algorithm, data).hexdigest(), len(data), source)))
+            return hashes
+
+        # Nodes of pending archives would be served from file systems created on demand, which isn't thread-safe.
+        if self._pending and any(item[3] not in archives for item in todo):
+            self._mount_pending()
+
+        batches = [todo[i : i + _HASH_BATCH_SIZE] for i in range(0, len(todo), _HASH_BATCH_SIZE)]
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for hashes in executor.map(_hash, batches):
+                    files.update(hashes)
+        finally:
+            for archive in archives.values():
+                archive.release()
+
+        sources = {file.source for file in files.values()}
+        return VfsManifest(algorithm, files, {source: stamp for source, stamp in stamps.items() if source in sources})
 
     def mkdir(self, path: str | PathLike) -> VfsNode:
-        DLL.ZkVfs_mkdir.restype = c_void_p
+        self._invalidate()
         handle = DLL.ZkVfs_mkdir(self._handle, str(path).encode("windows-1252"))
         if handle is None or handle == 0:
             return None
-        return VfsNode(_handle=c_void_p(handle), _keepalive=self)
+        return VfsNode(_handle=c_void_p(handle), _keepalive=self, _key=_index_key(path))
 
     def remove(self, path: str | PathLike) -> bool:
-        DLL.ZkVfs_remove.restype = c_int
+        self._invalidate()
         return DLL.ZkVfs_remove(self._handle, str(path).encode("windows-1252")) != 0
 
-    def save(self, path: str | PathLike, version: GameVersion, time: int | datetime) -> None:
+    def save(self, target: str | PathLike | Write | BinaryIO, version: GameVersion, time: int | datetime) -> None:
+        self._mount_pending()
         timestamp = int(time.timestamp()) if isinstance(time, datetime) else time
-        DLL.ZkVfs_save(self._handle, str(path).encode("windows-1252"), c_int(version.value), c_int(timestamp))
+        if isinstance(target, str | PathLike):
+            DLL.ZkVfs_save(self._handle, str(target).encode("windows-1252"), c_int(version.value), c_int(timestamp))
+            return
+
+        from shutil import copyfileobj  # noqa: PLC0415 / lazy import
+        from tempfile import TemporaryDirectory  # noqa: PLC0415 / lazy import
+
+        # Archives can only be saved to a path natively, so other targets receive a copy of a temporary file.
+        with TemporaryDirectory(prefix="zenkit-") as directory:
+            path = Path(directory) / "archive.vdf"
+            DLL.ZkVfs_save(self._handle, str(path).encode("windows-1252"), c_int(version.value), c_int(timestamp))
+
+            with path.open("rb") as file:
+                if isinstance(target, Write):
+                    while chunk := file.read(_SAVE_CHUNK_SIZE):
+                        target.write(chunk)
+                    target.flush()
+                else:
+                    copyfileobj(file, target, _SAVE_CHUNK_SIZE)
 
     @property
     def root(self) -> VfsNode:
-        DLL.ZkVfs_getRoot.restype = c_void_p
+        self._mount_pending()
         handle = c_void_p(DLL.ZkVfs_getRoot(self._handle))
-        return VfsNode(_handle=handle, _keepalive=self)
+        return VfsNode(_handle=handle, _keepalive=self, _key="")
+
+    def conflicts(self) -> list[VfsConflict]:
+        entries = self._index()
+        if self._conflicts is None:
+            error = "Conflicts are only recorded while the file system is built by mounting archives."
+            raise ValueError(error)
+
+        def _record(entry: _Entry) -> VfsEntry:
+            path, is_dir, size, timestamp, source, _ = entry
+            return VfsEntry(path.rpartition("/")[2], path, is_dir, 0 if is_dir else size, timestamp, source)
+
+        return [
+            VfsConflict(entries[key][0], _record(entries[key]), [_record(entry) for entry in shadowed])
+            for key, shadowed in sorted(self._conflicts.items())
+            if key in entries
+        ]
+
+    def _glob(self, pattern: str) -> list[tuple[str, str]]:
+        # Patterns without a slash match file names anywhere. Others match whole paths, one component at a time like
+        # `fnmatch` over the components of a `PurePosixPath`, so `*` never matches across a slash. Returns the key and
+        # path of every matching file, ordered by key.
+        pattern = _index_key(pattern)
+        entries = self._index()
+        self._lookups()
+
+        directory, _, name = pattern.rpartition("/")
+        _, dot, extension = name.rpartition(".")
+
+        if directory and not _has_magic(directory):
+            candidates = [key for key in self._children.get(directory, []) if not entries[key][1]]
+        elif dot and not _has_magic(extension):
+            candidates = self._extensions.get(extension, [])
+        else:
+            candidates = [key for key, entry in entries.items() if not entry[1]]
+
+        if not directory:
+            matches = [key for key in candidates if fnmatchcase(key.rpartition("/")[2], pattern)]
+        else:
+            # Only files below the directory named by the pattern's literal leading components can match.
+            prefix = []
+            for component in directory.split("/"):
+                if _has_magic(component):
+                    break
+                prefix.append(component)
+
+            prefix = "/".join(prefix)
+            if prefix:
+                prefix += "/"
+
+            components = pattern.split("/")
+            matches = [
+                key for key in candidates if key.startswith(prefix) and _match_components(key.split("/"), components)
+            ]
+
+        return [(key, entries[key][0]) for key in sorted(matches)]
+
+    def _index(self) -> dict[str, _Entry]:
+        if self._entries is not None:
+            return self._entries
+
+        if self._mounts:
+            try:
+                if self._cache is not None:
+                    tree = self._cache._resolve(self._mounts)  # noqa: SLF001 / same module
+                else:
+                    tree = _resolve_mounts(self._mounts, _read_catalog_checked)
+            except (OSError, ValueError):
+                # An archive which can't be read in Python (anymore), so only the native tree can be trusted.
+                self._invalidate()
+            else:
+                self._entries, self._conflicts = tree
+                return self._entries
+
+        self._entries, self._handles = _walk_native(DLL.ZkVfs_getRoot(self._handle))
+        self._conflicts = {} if self._mounts is not None else None
+        return self._entries
+
+    def _lookups(self) -> None:
+        if self._names is not None:
+            return
+
+        names = {}
+        extensions = {}
+        children = {}
+
+        for key, entry in self._index().items():
+            parent, _, name = key.rpartition("/")
+            children.setdefault(parent, []).append(key)
+            if entry[1]:
+                children.setdefault(key, [])
+            else:
+                _, dot, extension = name.rpartition(".")
+                if dot:
+                    extensions.setdefault(extension, []).append(key)
+
+            # Native `find` only returns one node per name, picking it by the order of its search.
+            current = names.get(name)
+            if current is None or _find_order(key) < _find_order(current):
+                names[name] = key
+
+        self._names, self._extensions, self._children = names, extensions, children
+
+    def _node(self, key: str) -> VfsNode | None:
+        handle = self._handles.get(key)
+        if handle is not None:
+            return VfsNode(_handle=c_void_p(handle), _keepalive=self, _key=key)
+
+        path, is_dir, _, _, source, _ = self._entries[key]
+        if self._pending and not is_dir:
+            return self._archive(source).resolve(path)
+
+        self._mount_pending()
+        handle = DLL.ZkVfs_resolvePath(self._handle, path.encode("windows-1252"))
+        return VfsNode(_handle=c_void_p(handle), _keepalive=self, _key=key) if handle is not None else None
+
+    def _size(self, key: str) -> int:
+        # Sizes of natively indexed files are only looked up when asked for, then kept in the index.
+        handle = self._handles.get(key)
+        size = _file_size(handle) if handle is not None else _file_size(self._node(key).handle)
+
+        path, is_dir, _, timestamp, source, offset = self._entries[key]
+        self._entries[key] = (path, is_dir, size, timestamp, source, offset)
+        return size
+
+    def _archive(self, source: str) -> "Vfs":
+        archive = self._archives.get(source)
+        if archive is None:
+            archive = Vfs()
+            archive.mount_disk(source, clobber=VfsOverwriteBehavior.ALL)
+            self._archives[source] = archive
+        return archive
+
+    def _mount_pending(self) -> None:
+        if self._pending:
+            self._generation += 1
+        for source, clobber in self._pending:
+            DLL.ZkVfs_mountDiskHost(self._handle, source.encode("windows-1252"), c_int(clobber.value))
+        self._pending.clear()
+        self._archives.clear()
+
+    def _invalidate(self) -> None:
+        self._mount_pending()
+        self._mounts = None
+        self._reset_index()
+
+    def _reset_index(self) -> None:
+        self._generation += 1
+        self._entries = None
+        self._conflicts = None
+        self._handles = {}
+        self._names = None
+        self._extensions = None
+        self._children = None
+
+    def close(self) -> None:
+        # Files served from the per-archive file systems before the archives were mounted point into those.
+        for archive in self._archives.values():
+            archive.close()
+
+        self._pending.clear()
+        self._archives.clear()
+        self._mounts = None
+        self._reset_index()
+        release(self, DLL.ZkVfs_del)
 
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkVfs_del(self._handle)
         self._handle = None
+
+
+class VdfWriter:
+    __slots__ = ("_chunk_size", "_comment", "_timestamp", "_version", "_workers")
+
+    def __init__(
+        self,
+        version: GameVersion,
+        time: int | datetime,
+        *,
+        comment: str = _VDF_COMMENT,
+        workers: int | None = 1,
+        chunk_size: int = _SAVE_CHUNK_SIZE,
+    ) -> None:
+        comment = comment.encode("windows-1252")
+        if len(comment) > _VDF_HEADER.size - 40:
+            error = "Archive comments are limited to 256 bytes."
+            raise ValueError(error)
+        if chunk_size <= 0:
+            error = "The chunk size must be positive."
+            raise ValueError(error)
+
+        # Like ZenKit, a timestamp of zero stands for the time the archive is written.
+        timestamp = int(time.timestamp()) if isinstance(time, datetime) else time
+        if timestamp != 0 and localtime(timestamp).tm_year < 1980:  # noqa: PLR2004 / epoch of DOS timestamps
+            error = "Archive timestamps can't predate 1980."
+            raise ValueError(error)
+
+        self._version = version
+        self._timestamp = timestamp
+        self._comment = comment.ljust(_VDF_HEADER.size - 40, b"\x1a")
+        self._workers = workers
+        self._chunk_size = chunk_size
+
+    def write(
+        self,
+        target: str | PathLike | Write | BinaryIO,
+        entries: Iterable[tuple[str | PathLike, _VdfSource]],
+    ) -> None:
+        records = _vdf_catalog(entries)
+
+        if isinstance(target, str | PathLike):
+            with Path(target).open("wb") as file:
+                self._write(file, records)
+            return
+
+        # Sizes of iterated sources are only known once they are written, after which the catalog is filled in. If
+        # the target can't seek back to it, the archive is written to a temporary file first.
+        sized = all(record[1] is None or record[4] is not None for record in records)
+        if sized or (not isinstance(target, Write) and target.seekable()):
+            self._write(target, records)
+            return
+
+        from tempfile import TemporaryDirectory  # noqa: PLC0415 / lazy import
+
+        with TemporaryDirectory(prefix="zenkit-") as directory:
+            path = Path(directory) / "archive.vdf"
+            with path.open("w+b") as file:
+                self._write(file, records)
+                file.seek(0)
+
+                while chunk := file.read(self._chunk_size):
+                    target.write(chunk)
+        target.flush()
+
+    def _write(self, file: Write | BinaryIO, records: list[_VdfRecord]) -> None:
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415 / lazy import
+
+        offset = _VDF_HEADER.size + len(records) * _VDF_ENTRY.size
+        files = [record for record in records if record[1] is not None]
+
+        sized = all(record[4] is not None for record in files)
+        start = file.tell() if not sized else 0
+        if sized:
+            for record in files:
+                record[3] = offset
+                offset += record[4]
+            file.write(self._catalog(records, offset))
+        else:
+            file.write(bytes(offset))
+
+        # Only host files are read ahead in parallel, a bounded number of chunks at a time. Everything else is
+        # streamed in order as it is written.
+        executor = ThreadPoolExecutor(max_workers=self._workers) if self._workers != 1 else None
+        window = 2 * (self._workers or os.cpu_count() or 1)
+        ahead = deque()
+        ranges = (
+            (record[1], position, min(self._chunk_size, record[4] - position))
+            for record in files
+            if isinstance(record[1], str | PathLike)
+            for position in range(0, record[4], self._chunk_size)
+        )
+
+        def _next_range() -> bytes:
+            while len(ahead) < window and (item := next(ranges, None)) is not None:
+                ahead.append(executor.submit(_read_range, *item))
+            return ahead.popleft().result()
+
+        position = _VDF_HEADER.size + len(records) * _VDF_ENTRY.size
+        try:
+            for record in files:
+                record[3] = position
+                size = 0
+                for chunk in self._chunks(record[1], record[4], _next_range if executor is not None else None):
+                    file.write(chunk)
+                    size += len(chunk)
+                position += size
+
+                if record[4] is not None and size != record[4]:
+                    error = f"Source changed while it was written: {record[5]}"
+                    raise ValueError(error)
+                record[4] = size
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        if not sized:
+            file.seek(start)
+            file.write(self._catalog(records, position))
+            file.seek(start + position)
+        file.flush()
+
+    def _chunks(
+        self, source: _VdfSource, size: int | None, next_range: Callable[[], bytes] | None
+    ) -> Iterator[bytes | memoryview]:
+        if isinstance(source, str | PathLike):
+            if next_range is not None:
+                for _ in range(0, size, self._chunk_size):
+                    yield next_range()
+                return
+
+            with Path(source).open("rb") as file:
+                remaining = size
+                while remaining > 0 and (chunk := file.read(min(self._chunk_size, remaining))):
+                    remaining -= len(chunk)
+                    yield chunk
+        elif isinstance(source, Read):
+            yield from source._chunks(self._chunk_size)  # noqa: SLF001 / same package
+        elif isinstance(source, bytes | bytearray | memoryview):
+            view = memoryview(source).cast("B")
+            for position in range(0, size, self._chunk_size):
+                yield view[position : position + self._chunk_size]
+        else:
+            for chunk in source:
+                yield memoryview(chunk).cast("B")
+
+    def _catalog(self, records: list[_VdfRecord], end: int) -> bytes:
+        signature = _VDF_SIGNATURES[0 if self._version == GameVersion.GOTHIC1 else 1]
+        files = sum(1 for record in records if record[1] is not None)
+
+        # The size is recorded just like ZenKit does, which counts the catalog twice.
+        catalog = bytearray(
+            _VDF_HEADER.pack(
+                self._comment,
+                signature,
+                len(records),
+                files,
+                _unix_to_dos_time(self._timestamp or int(datetime.now(timezone.utc).timestamp())),
+                end + len(records) * _VDF_ENTRY.size,
+                _VDF_HEADER.size,
+                _VDF_VERSION,
+            )
+        )
+        for name, _, kind, offset, size, _ in records:
+            catalog += _VDF_ENTRY.pack(name.ljust(_VDF_ENTRY.size - 16, b" "), offset, size, kind, 0)
+        return bytes(catalog)
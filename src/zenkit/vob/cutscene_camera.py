@@ -9,15 +9,11 @@ __all__ = [
 
 from ctypes import c_float
 from ctypes import c_int
-from ctypes import c_int32
-from ctypes import c_size_t
 from enum import IntEnum
 from typing import Any
 
 from zenkit._core import DLL
 from zenkit._core import Mat4x4
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
 from zenkit.vob.virtual_object import VirtualObject
 
 
@@ -49,21 +45,6 @@ class CameraMotion(IntEnum):
     CUSTOM = 6
 
 
-DLL.ZkCameraTrajectoryFrame_getTime.restype = c_float
-DLL.ZkCameraTrajectoryFrame_getRollAngle.restype = c_float
-DLL.ZkCameraTrajectoryFrame_getFovScale.restype = c_float
-DLL.ZkCameraTrajectoryFrame_getMotionType.restype = c_int
-DLL.ZkCameraTrajectoryFrame_getMotionTypeFov.restype = c_int
-DLL.ZkCameraTrajectoryFrame_getMotionTypeRoll.restype = c_int
-DLL.ZkCameraTrajectoryFrame_getMotionTypeTimeScale.restype = c_int
-DLL.ZkCameraTrajectoryFrame_getTension.restype = c_float
-DLL.ZkCameraTrajectoryFrame_getCamBias.restype = c_float
-DLL.ZkCameraTrajectoryFrame_getContinuity.restype = c_float
-DLL.ZkCameraTrajectoryFrame_getTimeScale.restype = c_float
-DLL.ZkCameraTrajectoryFrame_getTimeFixed.restype = c_int
-DLL.ZkCameraTrajectoryFrame_getOriginalPose.restype = Mat4x4
-
-
 class CameraTrajectoryFrame(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -170,31 +151,7 @@ class CameraTrajectoryFrame(VirtualObject):
 
     @original_pose.setter
     def original_pose(self, value: Mat4x4) -> None:
-        DLL.ZkCameraTrajectoryFrame_setOriginalPose(self._handle, Mat4x4(value))
-
-
-DLL.ZkCutsceneCamera_getTrajectoryFOR.restype = c_int
-DLL.ZkCutsceneCamera_getTargetTrajectoryFOR.restype = c_int
-DLL.ZkCutsceneCamera_getLoopMode.restype = c_int
-DLL.ZkCutsceneCamera_getLerpMode.restype = c_int
-DLL.ZkCutsceneCamera_getIgnoreFORVobRotation.restype = c_int
-DLL.ZkCutsceneCamera_getIgnoreFORVobRotationTarget.restype = c_int
-DLL.ZkCutsceneCamera_getAdapt.restype = c_int
-DLL.ZkCutsceneCamera_getEaseFirst.restype = c_int
-DLL.ZkCutsceneCamera_getEaseLast.restype = c_int
-DLL.ZkCutsceneCamera_getTotalDuration.restype = c_float
-DLL.ZkCutsceneCamera_getAutoFocusVob.restype = ZkString
-DLL.ZkCutsceneCamera_getAutoPlayerMovable.restype = c_int
-DLL.ZkCutsceneCamera_getAutoUntriggerLast.restype = c_int
-DLL.ZkCutsceneCamera_getAutoUntriggerLastDelay.restype = c_float
-DLL.ZkCutsceneCamera_getPositionCount.restype = c_int32
-DLL.ZkCutsceneCamera_getTargetCount.restype = c_int32
-DLL.ZkCutsceneCamera_getIsPaused.restype = c_int
-DLL.ZkCutsceneCamera_getIsStarted.restype = c_int
-DLL.ZkCutsceneCamera_getGotoTimeMode.restype = c_int
-DLL.ZkCutsceneCamera_getTime.restype = c_float
-DLL.ZkCutsceneCamera_getFrameCount.restype = c_size_t
-DLL.ZkCutsceneCamera_getFrame.restype = ZkPointer
+        DLL.ZkCameraTrajectoryFrame_setOriginalPose(self._handle, value)
 
 
 class CutsceneCamera(VirtualObject):
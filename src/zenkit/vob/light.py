@@ -4,7 +4,6 @@ __all__ = [
     "LightType",
 ]
 
-from ctypes import POINTER
 from ctypes import byref
 from ctypes import c_float
 from ctypes import c_int
@@ -14,7 +13,6 @@ from typing import Any
 
 from zenkit._core import DLL
 from zenkit._core import Color
-from zenkit._native import ZkString
 from zenkit.vob.virtual_object import VirtualObject
 
 
@@ -31,25 +29,6 @@ class LightQuality(IntEnum):
     LOW = 2
 
 
-DLL.ZkLight_getPreset.restype = ZkString
-DLL.ZkLight_getLightType.restype = c_int
-DLL.ZkLight_getRange.restype = c_float
-DLL.ZkLight_getColor.restype = Color
-DLL.ZkLight_getConeAngle.restype = c_float
-DLL.ZkLight_getIsStatic.restype = c_int
-DLL.ZkLight_getQuality.restype = c_int
-DLL.ZkLight_getLensflareFx.restype = ZkString
-DLL.ZkLight_getOn.restype = c_int
-DLL.ZkLight_getRangeAnimationScale.restype = POINTER(c_float)
-DLL.ZkLight_getRangeAnimationFps.restype = c_float
-DLL.ZkLight_getRangeAnimationSmooth.restype = c_int
-DLL.ZkLight_getColorAnimationFps.restype = c_float
-DLL.ZkLight_getColorAnimationSmooth.restype = c_int
-DLL.ZkLight_getCanMove.restype = c_int
-DLL.ZkLight_getColorAnimationCount.restype = c_int
-DLL.ZkLight_getColorAnimationItem.restype = Color
-
-
 class Light(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -134,7 +113,7 @@ class Light(VirtualObject):
 
     @range_animation_scale.setter
     def range_animation_scale(self, value: list[float]) -> None:
-        DLL.ZkLight_setRangeAnimationScale(self._handle, POINTER(value))
+        DLL.ZkLight_setRangeAnimationScale(self._handle, (c_float * len(value))(*value), c_size_t(len(value)))
 
     @property
     def range_animation_fps(self) -> float:
@@ -16,13 +16,11 @@ __all__ = [
 from ctypes import c_float
 from ctypes import c_int
 from ctypes import c_int32
-from ctypes import c_size_t
 from enum import IntEnum
 from typing import Any
 
 from zenkit._core import DLL
 from zenkit._core import Vec3f
-from zenkit._native import ZkString
 from zenkit.vob.virtual_object import VirtualObject
 
 
@@ -48,10 +46,6 @@ class TouchCollisionType(IntEnum):
     POINT = 2
 
 
-DLL.ZkAnimate_getStartOn.restype = c_int
-DLL.ZkAnimate_getIsRunning.restype = c_int
-
-
 class Animate(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -73,11 +67,6 @@ class Animate(VirtualObject):
         DLL.ZkAnimate_setIsRunning(self._handle, c_int(value))
 
 
-DLL.ZkItem_getInstance.restype = ZkString
-DLL.ZkItem_getAmount.restype = int
-DLL.ZkItem_getFlags.restype = int
-
-
 class Item(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -107,9 +96,6 @@ class Item(VirtualObject):
         DLL.ZkItem_setFlags(self._handle, int(value))
 
 
-DLL.ZkLensFlare_getEffect.restype = ZkString
-
-
 class LensFlare(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -123,11 +109,6 @@ class LensFlare(VirtualObject):
         DLL.ZkLensFlare_setEffect(self._handle, value.encode("windows-1252"))
 
 
-DLL.ZkParticleEffectController_getEffectName.restype = ZkString
-DLL.ZkParticleEffectController_getKillWhenDone.restype = c_int
-DLL.ZkParticleEffectController_getInitiallyRunning.restype = c_int
-
-
 class ParticleEffectController(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -157,11 +138,6 @@ class ParticleEffectController(VirtualObject):
         DLL.ZkParticleEffectController_setInitiallyRunning(self._handle, c_int(value))
 
 
-DLL.ZkMessageFilter_getTarget.restype = ZkString
-DLL.ZkMessageFilter_getOnTrigger.restype = c_int
-DLL.ZkMessageFilter_getOnUntrigger.restype = c_int
-
-
 class MessageFilter(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -191,15 +167,6 @@ class MessageFilter(VirtualObject):
         DLL.ZkMessageFilter_setOnUntrigger(self._handle, value.value)
 
 
-DLL.ZkCodeMaster_getTarget.restype = ZkString
-DLL.ZkCodeMaster_getOrdered.restype = c_int
-DLL.ZkCodeMaster_getFirstFalseIsFailure.restype = c_int
-DLL.ZkCodeMaster_getFailureTarget.restype = ZkString
-DLL.ZkCodeMaster_getUntriggeredCancels.restype = c_int
-DLL.ZkCodeMaster_getSlaveCount.restype = c_size_t
-DLL.ZkCodeMaster_getSlave.restype = ZkString
-
-
 class CodeMaster(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -259,11 +226,6 @@ class CodeMaster(VirtualObject):
             DLL.ZkCodeMaster_addSlave(self._handle, v.encode("windows-1252"))
 
 
-DLL.ZkMoverController_getTarget.restype = ZkString
-DLL.ZkMoverController_getMessage.restype = c_int
-DLL.ZkMoverController_getKey.restype = c_int32
-
-
 class MoverController(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -293,20 +255,6 @@ class MoverController(VirtualObject):
         DLL.ZkMoverController_setKey(self._handle, c_int32(value))
 
 
-DLL.ZkTouchDamage_getDamage.restype = c_float
-DLL.ZkTouchDamage_getIsBarrier.restype = c_int
-DLL.ZkTouchDamage_getIsBlunt.restype = c_int
-DLL.ZkTouchDamage_getIsEdge.restype = c_int
-DLL.ZkTouchDamage_getIsFire.restype = c_int
-DLL.ZkTouchDamage_getIsFly.restype = c_int
-DLL.ZkTouchDamage_getIsMagic.restype = c_int
-DLL.ZkTouchDamage_getIsPoint.restype = c_int
-DLL.ZkTouchDamage_getIsFall.restype = c_int
-DLL.ZkTouchDamage_getRepeatDelaySeconds.restype = c_float
-DLL.ZkTouchDamage_getVolumeScale.restype = c_float
-DLL.ZkTouchDamage_getCollisionType.restype = c_int
-
-
 class TouchDamage(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -408,11 +356,6 @@ class TouchDamage(VirtualObject):
         DLL.ZkTouchDamage_setCollisionType(self._handle, value.value)
 
 
-DLL.ZkEarthquake_getRadius.restype = c_float
-DLL.ZkEarthquake_getDuration.restype = c_float
-DLL.ZkEarthquake_getAmplitude.restype = Vec3f
-
-
 class Earthquake(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -439,4 +382,4 @@ class Earthquake(VirtualObject):
 
     @amplitude.setter
     def amplitude(self, value: Vec3f) -> None:
-        DLL.ZkEarthquake_setAmplitude(self._handle, Vec3f(value))
+        DLL.ZkEarthquake_setAmplitude(self._handle, value)
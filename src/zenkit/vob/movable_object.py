@@ -9,13 +9,10 @@ __all__ = [
 
 from ctypes import c_int
 from ctypes import c_int32
-from ctypes import c_size_t
 from enum import IntEnum
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
 from zenkit.vob.misc import Item
 from zenkit.vob.virtual_object import VirtualObject
 
@@ -29,19 +26,6 @@ class SoundMaterialType(IntEnum):
     GLASS = 5
 
 
-DLL.ZkMovableObject_getName.restype = ZkString
-DLL.ZkMovableObject_getHp.restype = c_int32
-DLL.ZkMovableObject_getDamage.restype = c_int32
-DLL.ZkMovableObject_getMovable.restype = c_int
-DLL.ZkMovableObject_getTakable.restype = c_int
-DLL.ZkMovableObject_getFocusOverride.restype = c_int
-DLL.ZkMovableObject_getMaterial.restype = c_int
-DLL.ZkMovableObject_getVisualDestroyed.restype = ZkString
-DLL.ZkMovableObject_getOwner.restype = ZkString
-DLL.ZkMovableObject_getOwnerGuild.restype = ZkString
-DLL.ZkMovableObject_getDestroyed.restype = c_int
-
-
 class MovableObject(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -135,14 +119,6 @@ class MovableObject(VirtualObject):
         DLL.ZkMovableObject_setDestroyed(self._handle, c_int(value))
 
 
-DLL.ZkInteractiveObject_getState.restype = c_int32
-DLL.ZkInteractiveObject_getTarget.restype = ZkString
-DLL.ZkInteractiveObject_getItem.restype = ZkString
-DLL.ZkInteractiveObject_getConditionFunction.restype = ZkString
-DLL.ZkInteractiveObject_getOnStateChangeFunction.restype = ZkString
-DLL.ZkInteractiveObject_getRewind.restype = c_int
-
-
 class InteractiveObject(MovableObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -196,10 +172,6 @@ class InteractiveObject(MovableObject):
         DLL.ZkInteractiveObject_setRewind(self._handle, c_int(value))
 
 
-DLL.ZkFire_getSlot.restype = ZkString
-DLL.ZkFire_getVobTree.restype = ZkString
-
-
 class Fire(InteractiveObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -221,14 +193,6 @@ class Fire(InteractiveObject):
         DLL.ZkFire_setVobTree(self._handle, value.encode("windows-1252"))
 
 
-DLL.ZkContainer_getIsLocked.restype = c_int
-DLL.ZkContainer_getKey.restype = ZkString
-DLL.ZkContainer_getPickString.restype = ZkString
-DLL.ZkContainer_getContents.restype = ZkString
-DLL.ZkContainer_getItemCount.restype = c_size_t
-DLL.ZkContainer_getItem.restype = ZkPointer
-
-
 class Container(InteractiveObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -286,11 +250,6 @@ class Container(InteractiveObject):
             DLL.ZkContainer_addItem(self._handle, v.handle)
 
 
-DLL.ZkDoor_getIsLocked.restype = c_int
-DLL.ZkDoor_getKey.restype = ZkString
-DLL.ZkDoor_getPickString.restype = ZkString
-
-
 class Door(InteractiveObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -11,7 +11,6 @@ from enum import IntEnum
 from typing import Any
 
 from zenkit._core import DLL
-from zenkit._native import ZkString
 from zenkit.vob.virtual_object import VirtualObject
 
 
@@ -26,21 +25,6 @@ class SoundTriggerVolumeType(IntEnum):
     ELLIPSOIDAL = 1
 
 
-DLL.ZkSound_getVolume.restype = c_float
-DLL.ZkSound_getMode.restype = c_int
-DLL.ZkSound_getRandomDelay.restype = c_float
-DLL.ZkSound_getRandomDelayVar.restype = c_float
-DLL.ZkSound_getInitiallyPlaying.restype = c_int
-DLL.ZkSound_getAmbient3d.restype = c_int
-DLL.ZkSound_getObstruction.restype = c_int
-DLL.ZkSound_getConeAngle.restype = c_float
-DLL.ZkSound_getVolumeType.restype = c_int
-DLL.ZkSound_getRadius.restype = c_float
-DLL.ZkSound_getSoundName.restype = ZkString
-DLL.ZkSound_getIsRunning.restype = c_int
-DLL.ZkSound_getIsAllowedToRun.restype = c_int
-
-
 class Sound(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -150,11 +134,6 @@ class Sound(VirtualObject):
         DLL.ZkSound_setIsAllowedToRun(self._handle, c_int(value))
 
 
-DLL.ZkSoundDaytime_getStartTime.restype = c_float
-DLL.ZkSoundDaytime_getEndTime.restype = c_float
-DLL.ZkSoundDaytime_getSoundNameDaytime.restype = ZkString
-
-
 class SoundDaytime(Sound):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
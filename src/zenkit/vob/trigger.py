@@ -16,18 +16,15 @@ __all__ = [
 from ctypes import c_float
 from ctypes import c_int
 from ctypes import c_int32
-from ctypes import c_size_t
 from ctypes import c_uint8
 from ctypes import c_uint32
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import Any
 
-from zenkit import AnimationSample
 from zenkit._core import DLL
 from zenkit._core import Vec3f
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
+from zenkit.model_animation import AnimationSample
 from zenkit.vob.virtual_object import VirtualObject
 
 
@@ -60,26 +57,6 @@ class TriggerBatchMode(IntEnum):
     RANDOM = 2
 
 
-DLL.ZkTrigger_getTarget.restype = ZkString
-DLL.ZkTrigger_getStartEnabled.restype = c_int
-DLL.ZkTrigger_getSendUntrigger.restype = c_int
-DLL.ZkTrigger_getReactToOnTrigger.restype = c_int
-DLL.ZkTrigger_getReactToOnTouch.restype = c_int
-DLL.ZkTrigger_getReactToOnDamage.restype = c_int
-DLL.ZkTrigger_getRespondToObject.restype = c_int
-DLL.ZkTrigger_getRespondToPC.restype = c_int
-DLL.ZkTrigger_getRespondToNPC.restype = c_int
-DLL.ZkTrigger_getVobTarget.restype = ZkString
-DLL.ZkTrigger_getMaxActivationCount.restype = c_int32
-DLL.ZkTrigger_getRetriggerDelaySeconds.restype = c_float
-DLL.ZkTrigger_getDamageThreshold.restype = c_float
-DLL.ZkTrigger_getFireDelaySeconds.restype = c_float
-DLL.ZkTrigger_getNextTimeTriggerable.restype = c_float
-DLL.ZkTrigger_getOtherVob.restype = ZkPointer
-DLL.ZkTrigger_getCountCanBeActivated.restype = c_int
-DLL.ZkTrigger_getIsEnabled.restype = c_int
-
-
 class Trigger(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -229,36 +206,6 @@ class Trigger(VirtualObject):
         DLL.ZkTrigger_setIsEnabled(self._handle, c_int(value))
 
 
-DLL.ZkMover_getBehavior.restype = c_int
-DLL.ZkMover_getTouchBlockerDamage.restype = c_float
-DLL.ZkMover_getStayOpenTimeSeconds.restype = c_float
-DLL.ZkMover_getIsLocked.restype = c_int
-DLL.ZkMover_getAutoLink.restype = c_int
-DLL.ZkMover_getAutoRotate.restype = c_int
-DLL.ZkMover_getSpeed.restype = c_float
-DLL.ZkMover_getLerpType.restype = c_int
-DLL.ZkMover_getSpeedType.restype = c_int
-DLL.ZkMover_getActKeyPosDelta.restype = Vec3f
-DLL.ZkMover_getActKeyframeF.restype = c_float
-DLL.ZkMover_getActKeyframe.restype = c_int
-DLL.ZkMover_getNextKeyframe.restype = c_int
-DLL.ZkMover_getMoveSpeedUnit.restype = c_float
-DLL.ZkMover_getAdvanceDir.restype = c_float
-DLL.ZkMover_getMoverState.restype = c_uint32
-DLL.ZkMover_getTriggerEventCount.restype = c_int
-DLL.ZkMover_getStayOpenTimeDest.restype = c_float
-DLL.ZkMover_getSfxOpenStart.restype = ZkString
-DLL.ZkMover_getSfxOpenEnd.restype = ZkString
-DLL.ZkMover_getSfxTransitioning.restype = ZkString
-DLL.ZkMover_getSfxCloseStart.restype = ZkString
-DLL.ZkMover_getSfxCloseEnd.restype = ZkString
-DLL.ZkMover_getSfxLock.restype = ZkString
-DLL.ZkMover_getSfxUnlock.restype = ZkString
-DLL.ZkMover_getSfxUseLocked.restype = ZkString
-DLL.ZkMover_getKeyframeCount.restype = c_size_t
-DLL.ZkMover_getKeyframe.restype = AnimationSample
-
-
 class Mover(Trigger):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -373,7 +320,7 @@ class Mover(Trigger):
 
     @act_key_pos_delta.setter
     def act_key_pos_delta(self, value: Vec3f) -> None:
-        DLL.ZkMover_setActKeyPosDelta(self._handle, Vec3f(value))
+        DLL.ZkMover_setActKeyPosDelta(self._handle, value)
 
     @act_keyframe_f.setter
     def act_keyframe_f(self, value: float) -> None:
@@ -483,15 +430,6 @@ class TriggerListTarget:
     delay_seconds: float
 
 
-DLL.ZkTriggerList_getMode.restype = c_int
-DLL.ZkTriggerList_getActTarget.restype = c_uint8
-DLL.ZkTriggerList_getSendOnTrigger.restype = c_int
-DLL.ZkTriggerList_getTargetCount.restype = c_size_t
-DLL.ZkTriggerList_getTarget.restype = ZkPointer
-DLL.ZkTriggerListTarget_getName.restype = ZkString
-DLL.ZkTriggerListTarget_getDelaySeconds.restype = c_float
-
-
 class TriggerList(Trigger):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -537,9 +475,6 @@ class TriggerList(Trigger):
         return items
 
 
-DLL.ZkTriggerScript_getFunction.restype = ZkString
-
-
 class TriggerScript(Trigger):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -553,10 +488,6 @@ class TriggerScript(Trigger):
         DLL.ZkTriggerScript_setFunction(self._handle, value.encode("windows-1252"))
 
 
-DLL.ZkTriggerChangeLevel_getLevelName.restype = ZkString
-DLL.ZkTriggerChangeLevel_getStartVob.restype = ZkString
-
-
 class TriggerChangeLevel(Trigger):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -578,11 +509,6 @@ class TriggerChangeLevel(Trigger):
         DLL.ZkTriggerChangeLevel_setStartVob(self._handle, value.encode("windows-1252"))
 
 
-DLL.ZkTriggerWorldStart_getTarget.restype = ZkString
-DLL.ZkTriggerWorldStart_getFireOnce.restype = c_int
-DLL.ZkTriggerWorldStart_getHasFired.restype = c_int
-
-
 class TriggerWorldStart(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -612,9 +538,6 @@ class TriggerWorldStart(VirtualObject):
         DLL.ZkTriggerWorldStart_setHasFired(self._handle, c_int(value))
 
 
-DLL.ZkTriggerUntouch_getTarget.restype = ZkString
-
-
 class TriggerUntouch(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
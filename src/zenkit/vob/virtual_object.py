@@ -20,21 +20,21 @@ from ctypes import c_int
 from ctypes import c_int32
 from ctypes import c_size_t
 from ctypes import c_uint8
-from ctypes import c_uint32
 from ctypes import c_void_p
 from enum import IntEnum
 from typing import Any
 from typing import Final
 from typing import cast
 
-from zenkit import AlphaFunction
 from zenkit._core import DLL
 from zenkit._core import AxisAlignedBoundingBox
+from zenkit._core import Closeable
 from zenkit._core import Mat3x3
 from zenkit._core import Vec2f
 from zenkit._core import Vec3f
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
+from zenkit._core import depend
+from zenkit._core import release
+from zenkit.material import AlphaFunction
 
 
 class VobType(IntEnum):
@@ -119,13 +119,8 @@ class AiType(IntEnum):
     MOVE = 1
 
 
-DLL.ZkVisual_getName.restype = ZkString
-DLL.ZkVisual_getType.restype = c_int
-DLL.ZkVisual_new.restype = ZkPointer
-
-
-class Visual:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class Visual(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -133,7 +128,7 @@ class Visual:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def new(fmt: VisualType) -> "Visual":
@@ -166,6 +161,9 @@ class Visual:
     def type(self) -> VisualType:
         return VisualType(DLL.ZkVisual_getType(self._handle))
 
+    def close(self) -> None:
+        release(self, DLL.ZkVisual_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkVisual_del(self._handle)
@@ -176,16 +174,6 @@ class Visual:
         return f"<{self.__class__} handle={self.handle} name={self.name} type={self.type.name}>"
 
 
-DLL.ZkVisualDecal_getName.restype = ZkString
-DLL.ZkVisualDecal_getDimension.restype = Vec2f
-DLL.ZkVisualDecal_getOffset.restype = Vec2f
-DLL.ZkVisualDecal_getTwoSided.restype = c_int
-DLL.ZkVisualDecal_getAlphaFunc.restype = c_int
-DLL.ZkVisualDecal_getTextureAnimFps.restype = c_float
-DLL.ZkVisualDecal_getAlphaWeight.restype = c_uint8
-DLL.ZkVisualDecal_getIgnoreDaylight.restype = c_int
-
-
 class VisualDecal(Visual):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -270,12 +258,9 @@ _VISUALS: Final[dict[VisualType, type[Visual]]] = {
     VisualType.UNKNOWN: Visual,
 }
 
-DLL.ZkAi_new.restype = ZkPointer
-DLL.ZkAi_getType.restype = c_int
-
 
-class Ai:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class Ai(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -283,7 +268,7 @@ class Ai:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def new(fmt: AiType) -> "Ai":
@@ -308,6 +293,9 @@ class Ai:
     def type(self) -> AiType:
         return AiType(DLL.ZkAi_getType(self._handle))
 
+    def close(self) -> None:
+        release(self, DLL.ZkAi_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkAi_del(self._handle)
@@ -318,23 +306,6 @@ class Ai:
         return f"<{self.__class__.__name__} handle={self._handle} type={self.type.name}>"
 
 
-DLL.ZkAiHuman_getWaterLevel.restype = int
-DLL.ZkAiHuman_getFloorY.restype = c_float
-DLL.ZkAiHuman_getWaterY.restype = c_float
-DLL.ZkAiHuman_getCeilY.restype = c_float
-DLL.ZkAiHuman_getFeetY.restype = c_float
-DLL.ZkAiHuman_getHeadY.restype = c_float
-DLL.ZkAiHuman_getFallDistY.restype = c_float
-DLL.ZkAiHuman_getFallStartY.restype = c_float
-DLL.ZkAiHuman_getNpc.restype = ZkPointer
-DLL.ZkAiHuman_getWalkMode.restype = int
-DLL.ZkAiHuman_getWeaponMode.restype = int
-DLL.ZkAiHuman_getWmodeAst.restype = int
-DLL.ZkAiHuman_getWmodeSelect.restype = int
-DLL.ZkAiHuman_getChangeWeapon.restype = c_int
-DLL.ZkAiHuman_getActionMode.restype = int
-
-
 class AiHuman(Ai):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -468,10 +439,6 @@ class AiHuman(Ai):
         DLL.ZkAiHuman_setActionMode(self._handle, int(value))
 
 
-DLL.ZkAiMove_getVob.restype = ZkPointer
-DLL.ZkAiMove_getOwner.restype = ZkPointer
-
-
 class AiMove(Ai):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -504,12 +471,8 @@ class AiMove(Ai):
 _AIS: Final[dict[AiType, type[Ai]]] = {AiType.HUMAN: AiHuman, AiType.MOVE: AiMove}
 
 
-DLL.ZkEventManager_getCleared.restype = c_int
-DLL.ZkEventManager_getActive.restype = c_int
-
-
-class EventManager:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class EventManager(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -517,7 +480,7 @@ class EventManager:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def new() -> "EventManager":
@@ -547,6 +510,9 @@ class EventManager:
     def active(self, value: bool) -> None:
         DLL.ZkEventManager_setActive(self._handle, c_int(value))
 
+    def close(self) -> None:
+        release(self, DLL.ZkEventManager_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkEventManager_del(self._handle)
@@ -557,38 +523,8 @@ class EventManager:
         return f"<{self.__class__.__name__} handle={self._handle}>"
 
 
-DLL.ZkVirtualObject_getType.restype = c_int
-DLL.ZkVirtualObject_getId.restype = c_uint32
-DLL.ZkVirtualObject_getBbox.restype = AxisAlignedBoundingBox
-DLL.ZkVirtualObject_getPosition.restype = Vec3f
-DLL.ZkVirtualObject_getRotation.restype = Mat3x3
-DLL.ZkVirtualObject_getShowVisual.restype = c_int
-DLL.ZkVirtualObject_getSpriteCameraFacingMode.restype = c_int
-DLL.ZkVirtualObject_getCdStatic.restype = c_int
-DLL.ZkVirtualObject_getCdDynamic.restype = c_int
-DLL.ZkVirtualObject_getVobStatic.restype = c_int
-DLL.ZkVirtualObject_getDynamicShadows.restype = c_int
-DLL.ZkVirtualObject_getPhysicsEnabled.restype = c_int
-DLL.ZkVirtualObject_getAnimMode.restype = c_int
-DLL.ZkVirtualObject_getBias.restype = c_int32
-DLL.ZkVirtualObject_getAmbient.restype = c_int
-DLL.ZkVirtualObject_getAnimStrength.restype = c_float
-DLL.ZkVirtualObject_getFarClipScale.restype = c_float
-DLL.ZkVirtualObject_getPresetName.restype = ZkString
-DLL.ZkVirtualObject_getName.restype = ZkString
-DLL.ZkVirtualObject_getVisual.restype = ZkPointer
-DLL.ZkVirtualObject_getSleepMode.restype = c_uint8
-DLL.ZkVirtualObject_getNextOnTimer.restype = c_float
-DLL.ZkVirtualObject_getAi.restype = ZkPointer
-DLL.ZkVirtualObject_getEventManager.restype = ZkPointer
-DLL.ZkVirtualObject_getChildCount.restype = c_size_t
-DLL.ZkVirtualObject_getChild.restype = ZkPointer
-DLL.ZkVirtualObject_new.restype = ZkPointer
-DLL.ZkObject_takeRef.restype = ZkPointer
-
-
-class VirtualObject:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+class VirtualObject(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -596,7 +532,7 @@ class VirtualObject:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @staticmethod
     def new(typ: VobType) -> "VirtualObject":
@@ -637,7 +573,7 @@ class VirtualObject:
 
     @bbox.setter
     def bbox(self, value: AxisAlignedBoundingBox) -> None:
-        DLL.ZkVirtualObject_setBbox(self._handle, AxisAlignedBoundingBox(value))
+        DLL.ZkVirtualObject_setBbox(self._handle, value)
 
     @property
     def position(self) -> Vec3f:
@@ -645,7 +581,7 @@ class VirtualObject:
 
     @position.setter
     def position(self, value: Vec3f) -> None:
-        DLL.ZkVirtualObject_setPosition(self._handle, Vec3f(value))
+        DLL.ZkVirtualObject_setPosition(self._handle, value)
 
     @property
     def rotation(self) -> Mat3x3:
@@ -653,7 +589,7 @@ class VirtualObject:
 
     @rotation.setter
     def rotation(self, value: Mat3x3) -> None:
-        DLL.ZkVirtualObject_setRotation(self._handle, Mat3x3(value))
+        DLL.ZkVirtualObject_setRotation(self._handle, value)
 
     @property
     def show_visual(self) -> bool:
@@ -835,6 +771,9 @@ class VirtualObject:
     def remove_child(self, i: int) -> None:
         DLL.ZkVirtualObject_removeChild(self._handle, c_size_t(i))
 
+    def close(self) -> None:
+        release(self, DLL.ZkVirtualObject_del)
+
     def __del__(self) -> None:
         if self._delete:
             DLL.ZkVirtualObject_del(self._handle)
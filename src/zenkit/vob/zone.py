@@ -13,16 +13,6 @@ from zenkit._core import DLL
 from zenkit._core import Color
 from zenkit.vob.virtual_object import VirtualObject
 
-DLL.ZkZoneMusic_getIsEnabled.restype = c_int
-DLL.ZkZoneMusic_getPriority.restype = c_int32
-DLL.ZkZoneMusic_getIsEllipsoid.restype = c_int
-DLL.ZkZoneMusic_getReverb.restype = c_float
-DLL.ZkZoneMusic_getVolume.restype = c_float
-DLL.ZkZoneMusic_getIsLoop.restype = c_int
-DLL.ZkZoneMusic_getLocalEnabled.restype = c_int
-DLL.ZkZoneMusic_getDayEntranceDone.restype = c_int
-DLL.ZkZoneMusic_getNightEntranceDone.restype = c_int
-
 
 class ZoneMusic(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
@@ -101,10 +91,6 @@ class ZoneMusic(VirtualObject):
         DLL.ZkZoneMusic_setNightEntranceDone(self._handle, c_int(value))
 
 
-DLL.ZkZoneFarPlane_getVobFarPlaneZ.restype = c_float
-DLL.ZkZoneFarPlane_getInnerRangePercentage.restype = c_float
-
-
 class ZoneFarPlane(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -126,13 +112,6 @@ class ZoneFarPlane(VirtualObject):
         DLL.ZkZoneFarPlane_setInnerRangePercentage(self._handle, c_float(value))
 
 
-DLL.ZkZoneFog_getRangeCenter.restype = c_float
-DLL.ZkZoneFog_getInnerRangePercentage.restype = c_float
-DLL.ZkZoneFog_getColor.restype = Color
-DLL.ZkZoneFog_getFadeOutSky.restype = c_int
-DLL.ZkZoneFog_getOverrideColor.restype = c_int
-
-
 class ZoneFog(VirtualObject):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
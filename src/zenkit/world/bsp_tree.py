@@ -1,9 +1,7 @@
 __all__ = ["BspTree", "BspNode", "BspSector", "BspTreeType"]
 
-from ctypes import POINTER
 from ctypes import Structure
 from ctypes import byref
-from ctypes import c_int
 from ctypes import c_int32
 from ctypes import c_size_t
 from ctypes import c_uint32
@@ -16,8 +14,7 @@ from zenkit._core import DLL
 from zenkit._core import AxisAlignedBoundingBox
 from zenkit._core import Vec3f
 from zenkit._core import Vec4f
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
+from zenkit._core import depend
 
 
 class BspTreeType(IntEnum):
@@ -65,13 +62,8 @@ class BspNode(Structure):
         return self._parent_index
 
 
-DLL.ZkBspSector_getName.restype = ZkString
-DLL.ZkBspSector_getNodeIndices.restype = POINTER(c_uint32)
-DLL.ZkBspSector_getPortalPolygonIndices.restype = POINTER(c_uint32)
-
-
 class BspSector:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -79,7 +71,7 @@ class BspSector:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def name(self) -> str:
@@ -105,20 +97,8 @@ class BspSector:
         return f"<BspSector handle={self._handle} name={self.name!r}>"
 
 
-DLL.ZkBspTree_getType.restype = c_int
-DLL.ZkBspTree_getPolygonIndices.restype = POINTER(c_uint32)
-DLL.ZkBspTree_getLeafPolygonIndices.restype = POINTER(c_uint32)
-DLL.ZkBspTree_getPortalPolygonIndices.restype = POINTER(c_uint32)
-DLL.ZkBspTree_getLightPointCount.restype = c_size_t
-DLL.ZkBspTree_getLightPoint.restype = Vec3f
-DLL.ZkBspTree_getNodeCount.restype = c_size_t
-DLL.ZkBspTree_getNode.restype = BspNode
-DLL.ZkBspTree_getSectorCount.restype = c_size_t
-DLL.ZkBspTree_getSector.restype = ZkPointer
-
-
 class BspTree:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -126,7 +106,7 @@ class BspTree:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def type(self) -> BspTreeType:
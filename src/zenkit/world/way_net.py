@@ -4,10 +4,8 @@ __all__ = [
     "WayPoint",
 ]
 
-from ctypes import POINTER
 from ctypes import Structure
 from ctypes import byref
-from ctypes import c_int
 from ctypes import c_size_t
 from ctypes import c_uint32
 from ctypes import c_void_p
@@ -16,8 +14,7 @@ from typing import ClassVar
 
 from zenkit._core import DLL
 from zenkit._core import Vec3f
-from zenkit._native import ZkPointer
-from zenkit._native import ZkString
+from zenkit._core import depend
 
 
 class WayEdge(Structure):
@@ -38,16 +35,8 @@ class WayEdge(Structure):
         return f"<WayEdge a={self.a} b={self.b}>"
 
 
-DLL.ZkWayPoint_getName.restype = ZkString
-DLL.ZkWayPoint_getWaterDepth.restype = c_int
-DLL.ZkWayPoint_getUnderWater.restype = c_int
-DLL.ZkWayPoint_getPosition.restype = Vec3f
-DLL.ZkWayPoint_getDirection.restype = Vec3f
-DLL.ZkWayPoint_getFreePoint.restype = c_int
-
-
 class WayPoint:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -55,7 +44,7 @@ class WayPoint:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def name(self) -> str:
@@ -88,13 +77,8 @@ class WayPoint:
         return f"<WayPoint handle={self._handle} name={self.name!r}>"
 
 
-DLL.ZkWayNet_getEdges.restype = POINTER(WayEdge)
-DLL.ZkWayNet_getPointCount.restype = c_size_t
-DLL.ZkWayNet_getPoint.restype = ZkPointer
-
-
 class WayNet:
-    __slots__ = ("_handle", "_delete", "_keepalive")
+    __slots__ = ("__weakref__", "_delete", "_handle", "_keepalive")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -102,7 +86,7 @@ class WayNet:
         if "_handle" in kwargs:
             self._handle: c_void_p = kwargs.pop("_handle")
             self._delete: bool = kwargs.pop("_delete", False)
-            self._keepalive = kwargs.pop("_keepalive", DLL)
+            self._keepalive = depend(self, kwargs.pop("_keepalive", DLL))
 
     @property
     def edges(self) -> list[WayEdge]:
@@ -3,31 +3,27 @@ __all__ = [
 ]
 
 from collections.abc import Sequence
-from ctypes import c_size_t
 from ctypes import c_void_p
+from io import IOBase
 from os import PathLike
 from typing import Any
+from typing import BinaryIO
 
-from zenkit import Mesh
-from zenkit import Write
 from zenkit import _native
 from zenkit._core import DLL
+from zenkit._core import Closeable
 from zenkit._core import GameVersion
 from zenkit._core import PathOrFileLike
-from zenkit._native import ZkPointer
+from zenkit._core import release
+from zenkit.mesh import Mesh
+from zenkit.stream import Write
 from zenkit.vob.virtual_object import VirtualObject
 from zenkit.world.bsp_tree import BspTree
 from zenkit.world.way_net import WayNet
 
-DLL.ZkWorld_getMesh.restype = ZkPointer
-DLL.ZkWorld_getWayNet.restype = ZkPointer
-DLL.ZkWorld_getBspTree.restype = ZkPointer
-DLL.ZkWorld_getRootObjectCount.restype = c_size_t
-DLL.ZkWorld_getRootObject.restype = ZkPointer
 
-
-class World:
-    __slots__ = ("_handle", "_delete")
+class World(Closeable):
+    __slots__ = ("__weakref__", "_delete", "_handle")
 
     def __init__(self, **kwargs: Any) -> None:
         self._handle = c_void_p(None)
@@ -44,6 +40,10 @@ class World:
             handle = _native.load("ZkWorld_loadVersioned", path_or_file_like, version.value)
         return World(_handle=handle, _delete=True)
 
+    @staticmethod
+    async def load_async(path_or_file_like: PathOrFileLike, version: GameVersion | None = None) -> "World":
+        return await _native.load_async(World.load, path_or_file_like, version)
+
     @property
     def mesh(self) -> Mesh:
         return Mesh(_handle=DLL.ZkWorld_getMesh(self._handle).value, _delete=False, _keepalive=self)
@@ -77,9 +77,24 @@ class World:
     def add_root_object(self, obj: VirtualObject) -> None:
         DLL.ZkWorld_addRootObject(self._handle, obj.handle)
 
-    def save(self, path: str | PathLike, version: GameVersion | None = None) -> None:
-        w = Write(path)
-        DLL.ZkWorld_save(self._handle, w.handle, version)
+    def save(self, target: str | PathLike | Write | BinaryIO, version: GameVersion | None = None) -> None:
+        if isinstance(target, Write):
+            w = target
+        elif isinstance(target, IOBase):
+            w = Write.from_fileobj(target)
+        else:
+            w = Write(target)
+
+        DLL.ZkWorld_save(self._handle, w.handle, (version or GameVersion.GOTHIC1).value)
+        w.flush()
+
+    def save_bytes(self, version: GameVersion | None = None) -> bytes:
+        w = Write.memory()
+        self.save(w, version)
+        return w.data
+
+    def close(self) -> None:
+        release(self, DLL.ZkWorld_del)
 
     def __del__(self) -> None:
         if self._delete:
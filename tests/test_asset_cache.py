@@ -0,0 +1,45 @@
+import os
+from pathlib import Path
+from struct import pack
+
+from zenkit import DecodedAssetCache
+from zenkit import GameVersion
+from zenkit import VdfWriter
+from zenkit import Vfs
+
+
+def _chunk(kind: int, data: bytes) -> bytes:
+    return pack("<HI", kind, len(data)) + data
+
+
+def _animation(fill: int, *, checksum: int = 0xDEADBEEF, nodes: int = 2, frames: int = 4) -> bytes:
+    header = pack("<H", 12) + b"S_RUN\n" + pack("<III4f", 1, frames, nodes, 25.0, 30.0, -1.0, 2.0)
+    header += pack("<6f", 0, 1, 2, 3, 4, 5) + b"S_NEXT\n"
+    samples = pack("<I", checksum) + pack(f"<{nodes}I", *range(nodes)) + bytes([fill]) * (12 * nodes * frames)
+    return (
+        _chunk(0xA000, b"")
+        + _chunk(0xA010, pack("<IHHHHHH", 2001, 2, 3, 4, 5, 6, 0) + b"S_RUN.ASC\n" + b'ANI "S_RUN"\n')
+        + _chunk(0xA020, header)
+        + _chunk(0xA030, pack("<I", 0))
+        + _chunk(0xA090, samples)
+    )
+
+
+def _decode(cache: Path, archive: Path) -> bytes:
+    vfs = Vfs()
+    vfs.mount_disk(archive)
+    return DecodedAssetCache(cache, vfs).animation("ANIMS/S_RUN.MAN")["samples"].tobytes()
+
+
+def test_edited_animation_is_decoded_again(tmp_path: Path) -> None:
+    archive = tmp_path / "anims.vdf"
+    writer = VdfWriter(GameVersion.GOTHIC2, 1_000_000_000)
+
+    writer.write(archive, [("ANIMS/S_RUN.MAN", _animation(0x11))])
+    first = _decode(tmp_path / "cache", archive)
+    assert _decode(tmp_path / "cache", archive) == first
+
+    # The edited animation still animates the same model hierarchy, so the checksum in its header is unchanged.
+    writer.write(archive, [("ANIMS/S_RUN.MAN", _animation(0x22))])
+    os.utime(archive, ns=(archive.stat().st_atime_ns, archive.stat().st_mtime_ns + 1_000_000_000))
+    assert _decode(tmp_path / "cache", archive) != first
@@ -0,0 +1,118 @@
+import io
+from ctypes import ArgumentError
+from pathlib import Path
+
+import pytest
+
+from zenkit import GameVersion
+from zenkit import Read
+from zenkit import TextureBuilder
+from zenkit import TextureFormat
+from zenkit import VdfWriter
+from zenkit import Vfs
+from zenkit import Write
+
+# Closed objects refuse to hand their handle to native functions, which ctypes reports as an `ArgumentError`.
+CLOSED = (ValueError, ArgumentError)
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    path = tmp_path / "archive.vdf"
+    VdfWriter(GameVersion.GOTHIC2, 1_000_000_000).write(path, [("DIR/FILE.BIN", b"content")])
+    return path
+
+
+def test_vfs(archive: Path) -> None:
+    with Vfs() as vfs:
+        vfs.mount_disk(archive)
+        root = vfs.root
+        directory = vfs.resolve("DIR")
+        node = vfs.resolve("DIR/FILE.BIN")
+        assert node.data == b"content"
+
+    # Nodes point into the file system's tree, so they are closed along with it.
+    for call in (
+        lambda: vfs.root,
+        lambda: vfs.resolve("DIR/FILE.BIN"),
+        lambda: root.children,
+        lambda: directory.name,
+        lambda: node.data,
+    ):
+        with pytest.raises(CLOSED, match="closed object"):
+            call()
+
+    vfs.close()
+
+
+def test_vfs_node(archive: Path) -> None:
+    vfs = Vfs()
+    vfs.mount_disk(archive)
+    directory = vfs.resolve("DIR")
+    node = directory.get_child("FILE.BIN")
+
+    with directory:
+        assert node.name == "FILE.BIN"
+
+    # Children of a closed node are closed as well, while the file system stays usable.
+    with pytest.raises(CLOSED, match="closed object"):
+        _ = directory.children
+    with pytest.raises(CLOSED, match="closed object"):
+        node.open()
+    assert vfs.resolve("DIR/FILE.BIN").data == b"content"
+
+
+def test_read(archive: Path) -> None:
+    with Read(b"abc") as rd:
+        assert rd.data == b"abc"
+
+    with pytest.raises(CLOSED, match="closed object"):
+        _ = rd.size
+    with pytest.raises(CLOSED, match="closed object"):
+        _ = rd.data
+
+    # Streams of a node read from the node's memory, so they are closed along with it.
+    vfs = Vfs()
+    vfs.mount_disk(archive)
+    node = vfs.resolve("DIR/FILE.BIN")
+    rd = node.open()
+    node.close()
+
+    with pytest.raises(CLOSED, match="closed object"):
+        _ = rd.size
+
+
+def test_write() -> None:
+    with Write.memory() as wr:
+        wr.write(b"xy")
+        assert wr.data == b"xy"
+
+    with pytest.raises(CLOSED, match="closed object"):
+        _ = wr.handle.value
+    with pytest.raises(ValueError, match="Not a memory-backed output stream"):
+        _ = wr.data
+    with pytest.raises(TypeError, match="Not a memory or file object backed output stream"):
+        wr.write(b"z")
+
+
+def test_write_data_of_file_object_stream() -> None:
+    file = io.BytesIO()
+    with Write.from_fileobj(file) as wr:
+        wr.write(b"xy")
+        with pytest.raises(ValueError, match="Not a memory-backed output stream"):
+            _ = wr.data
+
+    # Closing flushes everything written so far.
+    assert file.getvalue() == b"xy"
+
+
+def test_texture_builder() -> None:
+    with TextureBuilder(1, 1) as builder:
+        builder.add_mipmap(bytes(4), TextureFormat.R8G8B8A8)
+
+    with pytest.raises(CLOSED, match="closed object"):
+        builder.add_mipmap(bytes(4), TextureFormat.R8G8B8A8)
+    with pytest.raises(CLOSED, match="closed object"):
+        builder.build(TextureFormat.R8G8B8A8)
+
+    builder.close()
@@ -0,0 +1,37 @@
+import re
+from pathlib import Path
+
+import pytest
+
+import zenkit
+from zenkit._core import DLL
+from zenkit._signatures import SIGNATURES
+
+# Native functions are named in the wrappers either as attributes of `DLL` or as strings passed to `getattr(DLL, ...)`.
+NATIVE_NAME = re.compile(r"\bZk[A-Za-z0-9]+_\w+\b")
+
+
+def _used_names() -> set[str]:
+    names = set()
+    for path in Path(zenkit.__file__).parent.rglob("*.py"):
+        if path.name != "_signatures.py":
+            names.update(NATIVE_NAME.findall(path.read_text(encoding="utf-8")))
+    return names
+
+
+def test_every_used_function_has_a_signature() -> None:
+    names = _used_names()
+    assert names
+    assert sorted(names - SIGNATURES.keys()) == []
+
+
+def test_every_signature_is_exported() -> None:
+    for name in SIGNATURES:
+        assert DLL[name] is not None, name
+
+
+def test_unknown_function_is_not_bound() -> None:
+    # Exported by the native library, but not used by the wrappers.
+    assert "ZkAnimate_del" not in SIGNATURES
+    with pytest.raises(AttributeError, match="No signature for native function 'ZkAnimate_del'"):
+        _ = DLL.ZkAnimate_del
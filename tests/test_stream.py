@@ -0,0 +1,74 @@
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from zenkit import Read
+from zenkit import Vfs
+
+CONTENT = b"".join(f"line {i}\n".encode() for i in range(128))
+
+
+def test_from_fileobj_plain_file(tmp_path: Path) -> None:
+    path = tmp_path / "plain.bin"
+    path.write_bytes(CONTENT)
+
+    with path.open("rb") as file:
+        file.seek(5)
+        rd = Read.from_fileobj(file)
+        assert rd.size == len(CONTENT) - 5
+        assert rd.data == CONTENT[5:]
+
+
+@pytest.mark.parametrize("module", [gzip, bz2, lzma])
+def test_from_fileobj_compressed_file(tmp_path: Path, module: ModuleType) -> None:
+    path = tmp_path / "compressed.bin"
+    with module.open(path, "wb") as file:
+        file.write(CONTENT)
+
+    # Compressed files expose the descriptor of the underlying file, which must not be mapped in their place.
+    with module.open(path, "rb") as file:
+        rd = Read.from_fileobj(file)
+        assert rd.size == len(CONTENT)
+        assert rd.data == CONTENT
+
+
+def _native_stream() -> Read:
+    vfs = Vfs()
+    return vfs.root.create("file.bin", CONTENT).open()
+
+
+@pytest.mark.parametrize("offset", [0, 1, 100, len(CONTENT) - 1, len(CONTENT), len(CONTENT) + 5])
+@pytest.mark.parametrize("length", [1, 64, 10_000])
+def test_readinto_native_stream(offset: int, length: int) -> None:
+    rd = _native_stream()
+    buffer = bytearray(length)
+
+    count = rd.readinto(buffer, offset)
+    assert buffer[:count] == CONTENT[offset : offset + length]
+
+
+def test_view_of_native_stream_is_not_kept() -> None:
+    rd = _native_stream()
+    rd.readinto(bytearray(8), 16)
+
+    # Every view of a native stream is a separate copy, so none of them keeps the whole stream alive.
+    first = rd.view()
+    assert first == CONTENT
+    assert first.readonly
+    assert rd.view().obj is not first.obj
+
+
+def test_view_of_buffer_is_shared() -> None:
+    data = bytearray(CONTENT)
+    rd = Read(data)
+
+    assert rd.view() is rd.view()
+    assert rd.view().obj is data
+
+    buffer = bytearray(10)
+    assert rd.readinto(buffer, 20) == len(buffer)
+    assert buffer == CONTENT[20:30]
@@ -0,0 +1,133 @@
+import gc
+from ctypes import ArgumentError
+from ctypes import addressof
+from struct import pack
+
+import pytest
+
+from zenkit import Texture
+from zenkit import TextureBuilder
+from zenkit import TextureFormat
+from zenkit import Vfs
+from zenkit._core import DLL
+from zenkit.texture import decode_all
+
+
+def _texture(width: int = 8, height: int = 8, mipmaps: int = 2) -> bytes:
+    data = b"ZTEX" + pack("<8I", 0, TextureFormat.R8G8B8A8, width, height, mipmaps, width, height, 0)
+
+    # Mipmaps are stored smallest first.
+    for level in reversed(range(mipmaps)):
+        size = max(1, width >> level) * max(1, height >> level) * 4
+        data += bytes((level + i) % 251 for i in range(size))
+    return data
+
+
+def test_mipmap_raw_view_points_into_texture() -> None:
+    with Texture.load(_texture()) as texture:
+        view = texture.mipmap_raw_view(0)
+        assert view.readonly
+        assert view == texture.mipmap_raw(0)
+        assert texture.mipmap_raw_view(1) == texture.mipmap_raw(1)
+
+        # Views of the same mipmap share the texture's storage instead of copying it.
+        assert addressof(view.obj) == addressof(texture.mipmap_raw_view(0).obj)
+
+
+def test_mipmap_raw_view_outlives_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    freed = []
+    delete = DLL.ZkTexture_del
+    monkeypatch.setattr(DLL, "ZkTexture_del", lambda handle: freed.append(handle) or delete(handle))
+
+    texture = Texture.load(_texture())
+    expected = texture.mipmap_raw(0)
+    view = texture.mipmap_raw_view(0)
+    part = view[4:12]
+
+    texture.close()
+    with pytest.raises((ValueError, ArgumentError), match="closed object"):
+        texture.mipmap_raw_view(0)
+
+    # The storage is only freed once the last view and slice of it are gone.
+    del view
+    gc.collect()
+    assert not freed
+    assert part == expected[4:12]
+
+    del part
+    gc.collect()
+    assert len(freed) == 1
+
+
+def test_mipmap_raw_view_of_borrowed_texture() -> None:
+    with TextureBuilder(1, 1) as builder:
+        texture = builder.add_mipmap(bytes(4), TextureFormat.R8G8B8A8).build(TextureFormat.R8G8B8A8)
+
+        with pytest.raises(ValueError, match="mipmap_raw"):
+            texture.mipmap_raw_view(0)
+        assert texture.mipmap_raw(0) == bytes(4)
+
+
+def test_mipmap_rgba_into() -> None:
+    with Texture.load(_texture()) as texture:
+        buffer = bytearray(texture.width * texture.height * 4 + 1)
+        assert texture.mipmap_rgba_into(0, buffer) == len(buffer) - 1
+        assert bytes(buffer[:-1]) == texture.mipmap_rgba(0)
+
+        with pytest.raises(ValueError, match="Buffer too small"):
+            texture.mipmap_rgba_into(0, bytearray(4))
+        with pytest.raises(ValueError, match="not writable"):
+            texture.mipmap_rgba_into(0, bytes(len(buffer)))
+        with pytest.raises(ValueError, match="out of range"):
+            texture.mipmap_rgba_into(2, buffer)
+
+
+@pytest.fixture
+def textures() -> Vfs:
+    vfs = Vfs()
+    compiled = vfs.mkdir("TEXTURES/_COMPILED")
+    compiled.create("A-C.TEX", _texture(8, 8, 2))
+    compiled.create("B-C.TEX", _texture(4, 4, 1))
+    compiled.create("IGNORED.TEX", _texture())
+    compiled.create("BROKEN-C.TEX", b"BROKEN")
+    vfs.root.create("ROOT-C.TEX", _texture(2, 2, 2))
+    return vfs
+
+
+def _expected(vfs: Vfs, path: str, level: int) -> tuple[str, int, int, bytes]:
+    with Texture.load(vfs.resolve(path)) as texture:
+        return path, texture.width_mipmap(level), texture.height_mipmap(level), texture.mipmap_rgba(level)
+
+
+def test_decode_all(textures: Vfs) -> None:
+    errors = {}
+    results = decode_all(textures, workers=2, on_error=errors.__setitem__)
+
+    assert sorted((path, width, height, bytes(data)) for path, width, height, data in results) == [
+        _expected(textures, path, 0)
+        for path in ["ROOT-C.TEX", "TEXTURES/_COMPILED/A-C.TEX", "TEXTURES/_COMPILED/B-C.TEX"]
+    ]
+    assert list(errors) == ["TEXTURES/_COMPILED/BROKEN-C.TEX"]
+
+
+def test_decode_all_reports_missing_levels(textures: Vfs) -> None:
+    errors = {}
+    results = list(decode_all(textures, "textures/_compiled/*-c.tex", level=1, on_error=errors.__setitem__))
+
+    assert [result[:3] for result in results] == [("TEXTURES/_COMPILED/A-C.TEX", 4, 4)]
+    assert sorted(errors) == ["TEXTURES/_COMPILED/B-C.TEX", "TEXTURES/_COMPILED/BROKEN-C.TEX"]
+    assert "out of range" in str(errors["TEXTURES/_COMPILED/B-C.TEX"])
+
+    with pytest.warns(RuntimeWarning, match="B-C.TEX"):
+        list(decode_all(textures, "*/*/B-C.TEX", level=1))
+
+
+def test_decode_all_closes_textures(textures: Vfs, monkeypatch: pytest.MonkeyPatch) -> None:
+    freed = []
+    delete = DLL.ZkTexture_del
+    monkeypatch.setattr(DLL, "ZkTexture_del", lambda handle: freed.append(handle) or delete(handle))
+
+    # Every texture that was loaded is freed, whether its mipmap level could be decoded or not.
+    results = list(decode_all(textures, workers=1, level=1, on_error=lambda *_: None))
+    assert sorted(path for path, *_ in results) == ["ROOT-C.TEX", "TEXTURES/_COMPILED/A-C.TEX"]
+    assert len(freed) == len(["ROOT-C.TEX", "A-C.TEX", "B-C.TEX"])
@@ -0,0 +1,141 @@
+import io
+from collections.abc import Iterator
+from pathlib import Path
+from random import Random
+
+import pytest
+
+from zenkit import GameVersion
+from zenkit import Read
+from zenkit import VdfWriter
+from zenkit import Vfs
+from zenkit import Write
+
+TIME = 1_000_000_000
+CHUNK_SIZE = 64
+
+# Sizes below, at and above the chunk size, including empty files.
+FILES = {
+    path: Random(path).randbytes(size)  # noqa: S311 / test data
+    for path, size in [
+        ("ROOT.TEX", 10),
+        ("_WORLDS/NEWWORLD.ZEN", 3000),
+        ("_Worlds/Empty.zen", 0),
+        ("Textures/_compiled/A-C.TEX", CHUNK_SIZE),
+        ("textures/_COMPILED/b.tex", CHUNK_SIZE + 1),
+        ("Textures/[x]/~1.tex", 777),
+        ("anims/mds/Humans.MDS", 1),
+    ]
+}
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        return len(data)
+
+
+def _chunks(data: bytes) -> Iterator[bytes]:
+    for position in range(0, len(data), 100):
+        yield data[position : position + 100]
+
+
+def _entries(tmp_path: Path, kind: str) -> list[tuple[str, object]]:
+    entries = []
+    for i, (path, data) in enumerate(FILES.items()):
+        source = ["path", "read", "bytes", "iterable", "stream"][i % 5] if kind == "mixed" else kind
+        if source == "path":
+            host = tmp_path / f"file{i}.bin"
+            host.write_bytes(data)
+            entries.append((path, host))
+        elif source == "read":
+            entries.append((path, Read(data)))
+        elif source == "stream":
+            # Streams of a node are native and can only be copied from their start.
+            entries.append((path, Vfs().root.create("file", data).open()))
+        elif source == "bytes":
+            entries.append((path, data))
+        else:
+            entries.append((path, _chunks(data)))
+    return entries
+
+
+@pytest.fixture(params=[GameVersion.GOTHIC1, GameVersion.GOTHIC2], ids=lambda version: version.name)
+def expected(request: pytest.FixtureRequest, tmp_path: Path) -> tuple[GameVersion, bytes]:
+    vfs = Vfs()
+    for path, data in FILES.items():
+        directory, _, name = path.rpartition("/")
+        node = vfs.mkdir(directory) if directory else vfs.root
+        node.create(name, data)
+
+    target = tmp_path / "native.vdf"
+    vfs.save(target, request.param, TIME)
+    return request.param, target.read_bytes()
+
+
+def _check(archive: bytes, expected: bytes, tmp_path: Path) -> None:
+    assert archive == expected
+
+    path = tmp_path / "remounted.vdf"
+    path.write_bytes(archive)
+
+    vfs = Vfs()
+    vfs.mount_disk(path)
+    for name, data in FILES.items():
+        assert vfs.resolve(name).data == data
+
+
+@pytest.mark.parametrize("kind", ["path", "read", "stream", "bytes", "iterable", "mixed"])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_matches_native_save(tmp_path: Path, expected: tuple[GameVersion, bytes], kind: str, workers: int) -> None:
+    version, archive = expected
+    target = tmp_path / "written.vdf"
+
+    VdfWriter(version, TIME, workers=workers, chunk_size=CHUNK_SIZE).write(target, _entries(tmp_path, kind))
+    _check(target.read_bytes(), archive, tmp_path)
+
+
+@pytest.mark.parametrize("kind", ["bytes", "mixed"])
+def test_file_object_targets(tmp_path: Path, expected: tuple[GameVersion, bytes], kind: str) -> None:
+    version, archive = expected
+    writer = VdfWriter(version, TIME, workers=3, chunk_size=CHUNK_SIZE)
+
+    seekable = io.BytesIO()
+    writer.write(seekable, _entries(tmp_path, kind))
+    _check(seekable.getvalue(), archive, tmp_path)
+
+    unseekable = _Unseekable()
+    writer.write(unseekable, _entries(tmp_path, kind))
+    _check(bytes(unseekable.buffer), archive, tmp_path)
+
+
+@pytest.mark.parametrize("kind", ["bytes", "mixed"])
+def test_write_target(tmp_path: Path, expected: tuple[GameVersion, bytes], kind: str) -> None:
+    version, archive = expected
+
+    with Write.memory() as target:
+        VdfWriter(version, TIME, chunk_size=CHUNK_SIZE).write(target, _entries(tmp_path, kind))
+        _check(target.data, archive, tmp_path)
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        [("a", b"x"), ("A", b"y")],
+        [("a", b"x"), ("a/b", b"y")],
+        [("", b"")],
+        [("x" * 65, b"")],
+    ],
+)
+def test_invalid_paths(entries: list[tuple[str, bytes]]) -> None:
+    with pytest.raises(ValueError, match=r"(?i)archive path"):
+        VdfWriter(GameVersion.GOTHIC2, TIME).write(io.BytesIO(), entries)
@@ -0,0 +1,259 @@
+from ctypes import c_void_p
+from datetime import datetime
+from datetime import timezone
+from fnmatch import fnmatchcase
+from pathlib import Path
+from pathlib import PurePosixPath
+
+import pytest
+
+from zenkit import GameVersion
+from zenkit import VdfWriter
+from zenkit import Vfs
+from zenkit import VfsEntry
+from zenkit import VfsIndexCache
+from zenkit import VfsNode
+from zenkit import VfsOverwriteBehavior
+from zenkit._core import DLL
+
+# Archives in mounting order. Every file's contents name the archive it came from, so that the winner of a conflict
+# can be told apart. Names differ in case between archives and some paths are files in one archive and directories in
+# another.
+ARCHIVES = {
+    "base": (
+        datetime(2001, 5, 5, 12, tzinfo=timezone.utc),
+        [
+            "A/B/T1.TEX",
+            "A/B/T2.TEX",
+            "A/README.TXT",
+            "A/C/T1.TEX",
+            "X/T1.TEX",
+            "ROOT.TEX",
+            "DUP/FILE.TEX",
+            "Z/Y/X/DEEP.TEX",
+        ],
+    ),
+    "patch": (
+        datetime(2003, 5, 5, 12, tzinfo=timezone.utc),
+        [
+            "A/B/T1.TEX",
+            "a/b/t3.tex",
+            "A/C/T1.TEX/INNER.TEX",
+            "DUP/FILE.TEX/INNER.TEX",
+            "Z/Y",
+            "X/B/T1.TEX",
+        ],
+    ),
+    "old": (
+        datetime(1999, 5, 5, 12, tzinfo=timezone.utc),
+        [
+            "A/B/T2.TEX",
+            "A/D/T1.TEX",
+            "NEW/ONLY.TEX",
+            "ROOT.TEX",
+        ],
+    ),
+}
+
+PATTERNS = [
+    "*.TEX",
+    "T1.TEX",
+    "t?.tex",
+    "*",
+    "A/B/*.TEX",
+    "a/b/T[13].TEX",
+    "A/*",
+    "X/B/*",
+    "NEW/ONLY.TEX",
+    "*/*.TEX",
+    "*/B/*.TEX",
+    "?/*/T1.TEX",
+    "*/*/*/*",
+]
+
+
+def _content(archive: str, path: str) -> bytes:
+    return f"{archive}:{path}".encode()
+
+
+@pytest.fixture
+def archives(tmp_path: Path) -> list[Path]:
+    paths = []
+    for archive, (time, files) in ARCHIVES.items():
+        path = tmp_path / f"{archive}.vdf"
+        VdfWriter(GameVersion.GOTHIC2, time).write(path, [(file, _content(archive, file)) for file in files])
+        paths.append(path)
+    return paths
+
+
+def _mount(paths: list[Path], clobber: VfsOverwriteBehavior, cache: VfsIndexCache | None = None) -> Vfs:
+    vfs = Vfs()
+    for path in paths:
+        vfs.mount_disk(path, clobber=clobber, cache=cache)
+    return vfs
+
+
+def _native_tree(node: VfsNode, parent: str = "") -> dict[str, VfsEntry]:
+    # Only uses the native tree, so it serves as the reference for the Python index.
+    entries = {}
+    for child, entry in zip(node.children, node.iter_children(), strict=True):
+        path = f"{parent}/{entry.name}" if parent else entry.name
+        entries[path.upper()] = VfsEntry(entry.name, path, entry.is_dir, entry.size, entry.timestamp, None)
+        if entry.is_dir:
+            entries.update(_native_tree(child, path))
+    return entries
+
+
+def _native_find(vfs: Vfs, name: str) -> VfsNode | None:
+    handle = DLL.ZkVfs_findNode(vfs._handle, name.encode("windows-1252"))  # noqa: SLF001 / reference lookup
+    return VfsNode(_handle=c_void_p(handle), _keepalive=vfs) if handle is not None else None
+
+
+def _describe(node: VfsNode | None) -> tuple | None:
+    if node is None:
+        return None
+    if node.is_dir():
+        return node.name.upper(), sorted(child.name.upper() for child in node.children)
+    return node.name.upper(), node.data
+
+
+@pytest.fixture(params=list(VfsOverwriteBehavior), ids=lambda clobber: clobber.name)
+def clobber(request: pytest.FixtureRequest) -> VfsOverwriteBehavior:
+    return request.param
+
+
+@pytest.fixture(params=[False, True], ids=["uncached", "cached"])
+def cache(request: pytest.FixtureRequest, tmp_path: Path) -> VfsIndexCache | None:
+    return VfsIndexCache(tmp_path / "cache") if request.param else None
+
+
+def test_walk_matches_native_tree(archives: list[Path], clobber: VfsOverwriteBehavior, cache: VfsIndexCache) -> None:
+    expected = _native_tree(_mount(archives, clobber).root)
+
+    # A second file system reads the index written to the cache by the first one.
+    for _ in range(2):
+        walked = list(_mount(archives, clobber, cache).walk())
+        assert {_index_key(entry.path): (*_fields(entry)[:-1], None) for entry in walked} == {
+            key: _fields(entry) for key, entry in expected.items()
+        }
+
+        # Depth-first: every entry follows its parent directory.
+        seen = set()
+        for entry in walked:
+            parent = entry.path.rpartition("/")[0].upper()
+            assert not parent or parent in seen
+            seen.add(entry.path.upper())
+
+
+def test_walk_below_directory(archives: list[Path], clobber: VfsOverwriteBehavior, cache: VfsIndexCache) -> None:
+    vfs = _mount(archives, clobber, cache)
+    paths = {entry.path.upper() for entry in vfs.walk()}
+
+    assert {entry.path.upper() for entry in vfs.walk("a\\b")} == {path for path in paths if path.startswith("A/B/")}
+    with pytest.raises(ValueError, match="Not a directory"):
+        list(vfs.walk("ROOT.TEX"))
+
+
+def test_find_matches_native(archives: list[Path], clobber: VfsOverwriteBehavior, cache: VfsIndexCache) -> None:
+    native = _mount(archives, clobber)
+    names = {name for _, files in ARCHIVES.values() for file in files for name in file.split("/")}
+
+    vfs = _mount(archives, clobber, cache)
+    for name in sorted(names | {"missing.tex"}):
+        for variant in (name, name.lower()):
+            assert _describe(vfs.find(variant)) == _describe(_native_find(native, variant)), variant
+
+
+def test_glob_matches_native_tree(archives: list[Path], clobber: VfsOverwriteBehavior, cache: VfsIndexCache) -> None:
+    files = [entry.path for entry in _native_tree(_mount(archives, clobber).root).values() if not entry.is_dir]
+
+    vfs = _mount(archives, clobber, cache)
+    for pattern in PATTERNS:
+        key = pattern.upper()
+        if "/" in key:
+            expected = [path for path in files if PurePosixPath(path.upper()).match(key)]
+            expected = [path for path in expected if path.count("/") == key.count("/")]
+        else:
+            expected = [path for path in files if fnmatchcase(path.rpartition("/")[2].upper(), key)]
+
+        found = vfs.glob(pattern)
+        assert [node.name.upper() for node in found] == [path.rpartition("/")[2].upper() for path in sorted(expected)]
+        assert sorted(node.data for node in found) == sorted(_resolve(vfs, path).data for path in expected)
+
+
+def test_glob_matches_one_component_per_wildcard(archives: list[Path]) -> None:
+    vfs = _mount(archives, VfsOverwriteBehavior.OLDER)
+
+    def _paths(pattern: str) -> list[str]:
+        return [path.upper() for _, path in vfs._glob(pattern)]  # noqa: SLF001 / paths of the matched nodes
+
+    # `*` doesn't match across a slash, whether the directory part of the pattern is literal or not.
+    assert _paths("A/*") == ["A/README.TXT"]
+    assert _paths("*/*.TEX") == ["NEW/ONLY.TEX", "X/T1.TEX"]
+    assert _paths("*/B/*.TEX") == ["A/B/T1.TEX", "A/B/T2.TEX", "A/B/T3.TEX", "X/B/T1.TEX"]
+    assert _paths("*/*/T1.TEX") == ["A/B/T1.TEX", "A/D/T1.TEX", "X/B/T1.TEX"]
+
+    # Without a slash, file names are matched anywhere.
+    assert _paths("T3.TEX") == ["A/B/T3.TEX"]
+    assert _paths("T?.TEX") == ["A/B/T1.TEX", "A/B/T2.TEX", "A/B/T3.TEX", "A/D/T1.TEX", "X/B/T1.TEX", "X/T1.TEX"]
+
+
+def test_conflicts_match_native_tree(archives: list[Path], clobber: VfsOverwriteBehavior, cache: VfsIndexCache) -> None:
+    native = _mount(archives, clobber)
+    tree = _native_tree(native.root)
+    sources = {str(path): name for path, name in zip(archives, ARCHIVES, strict=True)}
+
+    conflicts = _mount(archives, clobber, cache).conflicts()
+    assert conflicts
+
+    for conflict in conflicts:
+        key = conflict.path.upper()
+        assert (*_fields(conflict.winner)[:-1], None) == _fields(tree[key])
+
+        winner = sources[conflict.winner.source]
+        if not conflict.winner.is_dir:
+            assert native.resolve(conflict.path).data == _content(winner, _original(winner, key))
+
+        for shadowed in conflict.shadowed:
+            assert shadowed.path.upper() == key
+            assert _has_path(sources[shadowed.source], key, is_dir=shadowed.is_dir)
+
+
+def test_conflicts_by_overwrite_behavior(archives: list[Path], clobber: VfsOverwriteBehavior) -> None:
+    conflicts = {conflict.path.upper(): conflict for conflict in _mount(archives, clobber).conflicts()}
+    base, patch, old = (str(path) for path in archives)
+
+    winners = {
+        VfsOverwriteBehavior.NONE: (base, base),
+        VfsOverwriteBehavior.ALL: (patch, old),
+        VfsOverwriteBehavior.NEWER: (base, old),
+        VfsOverwriteBehavior.OLDER: (patch, base),
+    }[clobber]
+
+    assert conflicts["A/B/T1.TEX"].winner.source == winners[0]
+    assert conflicts["ROOT.TEX"].winner.source == winners[1]
+
+
+def _index_key(path: str) -> str:
+    return path.replace("\\", "/").strip("/").upper()
+
+
+def _fields(entry: VfsEntry) -> tuple:
+    return entry.name, entry.path, entry.is_dir, entry.size, entry.timestamp, entry.source
+
+
+def _resolve(vfs: Vfs, path: str) -> VfsNode:
+    node = vfs.resolve(path)
+    assert node is not None
+    return node
+
+
+def _original(archive: str, key: str) -> str:
+    return next(file for file in ARCHIVES[archive][1] if file.upper() == key)
+
+
+def _has_path(archive: str, key: str, *, is_dir: bool) -> bool:
+    files = [file.upper() for file in ARCHIVES[archive][1]]
+    if is_dir:
+        return any(file.startswith(key + "/") for file in files)
+    return key in files